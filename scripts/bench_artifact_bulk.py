@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Benchmark bulk artifact import and verification (files/second, MB/second).
+
+Generates random files, imports them into a temporary ArtifactManager with
+`store_files`, then compares one-at-a-time `ArtifactStore.validate` calls
+with the thread-pooled `ArtifactManager.verify` and `ArtifactStore.validate_all`.
+
+Usage:
+    python scripts/bench_artifact_bulk.py [--files 10000] [--size 65536] [--workers 8]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from monoco.core.artifacts import ArtifactManager
+from monoco.features.artifact.store import ArtifactStore
+
+
+def report_line(label: str, count: int, size: int, elapsed: float) -> str:
+    return f"{label:>26}: {count / elapsed:9.1f} files/s {count * size / elapsed / 1024**2:8.1f} MB/s"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--files", type=int, default=10000)
+    parser.add_argument("--size", type=int, default=64 * 1024, help="Bytes per file")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        sources = root / "sources"
+        sources.mkdir()
+        files = []
+        for i in range(args.files):
+            path = sources / f"{i:06d}.bin"
+            path.write_bytes(os.urandom(args.size))
+            files.append(path)
+
+        manager = ArtifactManager(project_dir=root / "project", global_store=root / "cas")
+        imported = manager.store_files(files, workers=args.workers)
+        verified = manager.verify(workers=args.workers)
+
+        store = ArtifactStore(root / "attachments")
+        store.import_files(files, message_id="bench", provider="local", workers=args.workers)
+        ids = [entry.hash for entry in store._read_manifest()]
+        start = time.perf_counter()
+        for artifact_id in ids:
+            store.validate(artifact_id)
+        sequential = time.perf_counter() - start
+        bulk = store.validate_all(workers=args.workers)
+
+    print(f"{args.files} files of {args.size} bytes, {args.workers} workers")
+    print(report_line("store_files", imported.processed, args.size, imported.elapsed))
+    print(report_line("verify", verified.processed, args.size, verified.elapsed))
+    print(report_line("validate (sequential)", len(ids), args.size, sequential))
+    print(report_line("validate_all", bulk.processed, args.size, bulk.elapsed))
+    print(f"speedup: {sequential / bulk.elapsed:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Import-time regression benchmark for `monoco issue list`.
+
+Runs the command under `python -X importtime` in a throwaway project and
+reports the cumulative import time, the slowest top-level imports, and any
+heavy server/network dependencies that leaked into the startup path. Exits
+non-zero when the budget is exceeded or a forbidden module is imported.
+
+Usage:
+    python scripts/bench_cli_import.py [--budget-ms 600] [--rounds 3] [--top 10]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+# Modules that must never be imported by `monoco issue list`
+FORBIDDEN = ["fastapi", "uvicorn", "aiohttp", "httpx", "dingtalk_stream", "starlette"]
+
+
+def parse_importtime(stderr: str):
+    """Parse `-X importtime` output into (module, self_us, cumulative_us, depth)."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # header line
+        name = parts[2].rstrip()
+        depth = (len(name) - len(name.lstrip())) // 2
+        rows.append((name.strip(), int(parts[0]), int(parts[1]), depth))
+    return rows
+
+
+def run_once(project: Path, env: dict):
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "monoco", "issue", "list"],
+        cwd=project,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        raise SystemExit(f"`monoco issue list` failed:\n{proc.stderr[-2000:]}")
+    return parse_importtime(proc.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--budget-ms", type=float, default=600.0)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        home = Path(tmp) / "home"
+        project = Path(tmp) / "project"
+        home.mkdir()
+        project.mkdir()
+        env = {**os.environ, "HOME": str(home)}
+        subprocess.run(["git", "init", "-q"], cwd=project, check=True)
+        subprocess.run(
+            [
+                sys.executable, "-m", "monoco", "init", "--project",
+                "--name", "Bench", "--key", "BENCH", "--author", "bench",
+                "--no-telemetry",
+            ],
+            cwd=project,
+            env=env,
+            check=True,
+            capture_output=True,
+        )
+
+        best_total = None
+        best_rows = []
+        for _ in range(args.rounds):
+            rows = run_once(project, env)
+            total = sum(cum for _, _, cum, depth in rows if depth == 0)
+            if best_total is None or total < best_total:
+                best_total, best_rows = total, rows
+
+    total_ms = best_total / 1000
+    print(f"monoco issue list: {total_ms:.1f} ms cumulative import time (budget {args.budget_ms:.0f} ms)")
+    top = sorted((r for r in best_rows if r[3] == 0), key=lambda r: r[2], reverse=True)
+    for name, _, cum, _ in top[: args.top]:
+        print(f"  {cum / 1000:8.1f} ms  {name}")
+
+    imported = {name.split(".")[0] for name, _, _, _ in best_rows}
+    leaked = [m for m in FORBIDDEN if m in imported]
+    failed = False
+    if leaked:
+        print(f"FAIL: heavy dependencies imported: {', '.join(leaked)}")
+        failed = True
+    if total_ms > args.budget_ms:
+        print(f"FAIL: import time {total_ms:.1f} ms exceeds budget {args.budget_ms:.0f} ms")
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
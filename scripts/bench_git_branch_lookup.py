@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Benchmark cross-branch issue lookups.
+
+Compares the legacy implementation (one `git ls-tree` / `git show` process
+per branch x directory) against the persistent `git cat-file` session and the
+branch tip index used by `monoco.features.issue.core`.
+
+Usage:
+    python scripts/bench_git_branch_lookup.py [--branches 100] [--rounds 3]
+"""
+
+import argparse
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+
+from monoco.core import git
+from monoco.features.issue import core
+from monoco.features.issue.branch_index import BranchIssueIndex
+
+STATUS_DIRS = ["open", "backlog", "closed", "archived"]
+
+
+def _git(repo: Path, *args: str):
+    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+
+
+def build_repo(root: Path, branches: int) -> Path:
+    _git(root, "init", "-q")
+    _git(root, "config", "user.email", "bench@example.com")
+    _git(root, "config", "user.name", "Bench")
+    _git(root, "checkout", "-q", "-b", "main")
+    core.init(root / "Issues")
+    for status in ["open", "backlog", "closed"]:
+        keep = root / "Issues" / "Fixes" / status / ".keep"
+        keep.parent.mkdir(parents=True, exist_ok=True)
+        keep.write_text("")
+    _git(root, "add", ".")
+    _git(root, "commit", "-q", "-m", "init")
+    for i in range(branches):
+        _git(root, "branch", f"feature/fix-{i:04d}")
+    # The target issue lives on the last branch only
+    last = f"feature/fix-{branches - 1:04d}"
+    _git(root, "checkout", "-q", last)
+    issue = root / "Issues" / "Fixes" / "open" / "FIX-0999-target.md"
+    issue.write_text("---\nid: FIX-0999\n---\n")
+    _git(root, "add", ".")
+    _git(root, "commit", "-q", "-m", "target")
+    _git(root, "checkout", "-q", "main")
+    issue.unlink(missing_ok=True)
+    return root
+
+
+def legacy_search(root: Path, rel_base: str, issue_id: str):
+    """Pre-session implementation: one ls-tree per branch x status dir."""
+    found = []
+    _, stdout, _ = git._run_git(["branch", "--format=%(refname:short)"], root)
+    for branch in [b.strip() for b in stdout.splitlines() if b.strip()]:
+        for status_dir in STATUS_DIRS:
+            code, out, _ = git._run_git(
+                ["ls-tree", "-r", "--name-only", branch, f"{rel_base}/{status_dir}"], root
+            )
+            if code != 0:
+                continue
+            for line in out.splitlines():
+                if f"{issue_id}-" in line and line.endswith(".md"):
+                    found.append((branch, line))
+    return found
+
+
+def session_search(root: Path, rel_base: str, issue_id: str):
+    found = []
+    session = git.get_cat_file_session(root)
+    for branch in git.get_local_branches(root):
+        for status_dir in STATUS_DIRS:
+            for path in session.list_tree(branch, f"{rel_base}/{status_dir}", recursive=True):
+                if path.rsplit("/", 1)[-1].startswith(f"{issue_id}-"):
+                    found.append((branch, path))
+    return found
+
+
+def index_search(root: Path, rel_base: str, issue_id: str):
+    """Warm lookup through the tip-SHA index (one for-each-ref per call)."""
+    index = _INDEXES.setdefault(root, BranchIssueIndex(root))
+    index.refresh()
+    return [(b, p) for b, p in index.lookup(issue_id) if p.startswith(f"{rel_base}/")]
+
+
+_INDEXES = {}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--branches", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = build_repo(Path(tmp), args.branches)
+        results = {}
+        for name, func in [
+            ("legacy", legacy_search),
+            ("cat-file", session_search),
+            ("tip-index", index_search),
+        ]:
+            best = float("inf")
+            for _ in range(args.rounds):
+                start = time.perf_counter()
+                found = func(root, "Issues/Fixes", "FIX-0999")
+                best = min(best, time.perf_counter() - start)
+            assert len(found) == 1, found
+            results[name] = best
+            print(f"{name:>9}: {best * 1000:8.1f} ms  ({args.branches} branches)")
+        git.close_cat_file_sessions()
+        for name in ("cat-file", "tip-index"):
+            print(f"{name:>9} speedup: {results['legacy'] / results[name]:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
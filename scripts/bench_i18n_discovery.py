@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Benchmark markdown discovery for `monoco i18n scan`.
+
+Compares the legacy per-entry `fnmatch` exclusion check against the compiled
+gitignore matcher (`monoco.core.ignore`) on a synthetic monorepo.
+
+Usage:
+    python scripts/bench_i18n_discovery.py [--files 20000] [--patterns 60]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from monoco.features.i18n import core
+
+
+def build_tree(root: Path, files: int, patterns: int):
+    lines = [f"*.gen{i}.md" for i in range(patterns // 2)]
+    lines += [f"vendor{i}/" for i in range(patterns // 2)]
+    lines += ["!keep.gen0.md"]
+    (root / ".gitignore").write_text("\n".join(lines) + "\n")
+    per_dir = 50
+    for i in range(files):
+        pkg = root / "packages" / f"pkg{i // 1000:02d}" / "docs" / f"section{(i // per_dir) % 20:02d}"
+        pkg.mkdir(parents=True, exist_ok=True)
+        (pkg / f"page{i}.md").write_text("x")
+    for i in range(patterns // 2):
+        vendor = root / f"vendor{i}" / "deep"
+        vendor.mkdir(parents=True, exist_ok=True)
+        for j in range(20):
+            (vendor / f"{j}.md").write_text("x")
+
+
+def legacy_discover(root: Path):
+    patterns = core.load_gitignore_patterns(root)
+    excludes_set = {e.lower() for e in core.DEFAULT_EXCLUDES + ["Issues"]}
+    found = []
+    for current_root, dirs, files in os.walk(root):
+        current = Path(current_root)
+        dirs[:] = [d for d in dirs if not core.is_excluded(current / d, root, patterns, excludes_set)]
+        for file in files:
+            if file.endswith(".md") and not core.is_excluded(current / file, root, patterns, excludes_set):
+                found.append(current / file)
+    return sorted(found)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--files", type=int, default=20000)
+    parser.add_argument("--patterns", type=int, default=60)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        build_tree(root, args.files, args.patterns)
+        results = {}
+        for name, func in [("legacy", legacy_discover), ("compiled", core.discover_markdown_files)]:
+            best = float("inf")
+            for _ in range(args.rounds):
+                start = time.perf_counter()
+                found = func(root)
+                best = min(best, time.perf_counter() - start)
+            results[name] = best
+            print(f"{name:>8}: {best * 1000:8.1f} ms  ({len(found)} files)")
+        print(f"speedup: {results['legacy'] / results['compiled']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Benchmark the `monoco i18n scan` coverage pipeline.
+
+Compares the legacy sequential scan (one `exists()` per target, two reads
+per source file for the language check) against
+`core.build_coverage_report` on a synthetic documentation tree.
+
+Usage:
+    python scripts/bench_i18n_scan.py [--files 5000] [--translated 0.5] [--workers 8]
+"""
+
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from monoco.features.i18n import core
+
+EN = "The daemon refreshes its caches periodically to avoid extra git calls. " * 20
+ZH = "守护进程会定期刷新缓存，以减少 git 调用次数。" * 20
+
+
+def build_tree(root: Path, files: int, translated: float, seed: int = 7):
+    rng = random.Random(seed)
+    for i in range(files):
+        section = root / "docs" / f"area{i // 500:02d}" / f"section{(i // 50) % 10:02d}"
+        section.mkdir(parents=True, exist_ok=True)
+        (section / f"page{i}.md").write_text(EN)
+        if rng.random() < translated:
+            (section / "zh").mkdir(exist_ok=True)
+            (section / "zh" / f"page{i}.md").write_text(ZH)
+
+
+def legacy_scan(root: Path, target_langs, source_lang):
+    files = core.discover_markdown_files(root)
+    source_files = [f for f in files if not core.is_translation_file(f, target_langs)]
+    missing, mismatches = {}, []
+    for f in source_files:
+        langs = core.check_translation_exists(f, root, target_langs, source_lang)
+        if langs:
+            missing[f] = langs
+        if not core.is_content_source_language(f, source_lang):
+            mismatches.append((f, core.detect_language(f.read_text(encoding="utf-8"))))
+    return missing, mismatches
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--files", type=int, default=5000)
+    parser.add_argument("--translated", type=float, default=0.5)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    target_langs, source_lang = ["zh", "ja"], "en"
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        build_tree(root, args.files, args.translated)
+
+        def pipeline():
+            return core.build_coverage_report(
+                root, target_langs, source_lang, check_source_lang=True, workers=args.workers
+            )
+
+        results = {}
+        for name, func in [("legacy", lambda: legacy_scan(root, target_langs, source_lang)),
+                           ("pipeline", pipeline)]:
+            best = float("inf")
+            for _ in range(args.rounds):
+                # Measure detection work, not the in-process cache
+                core.clear_language_cache()
+                start = time.perf_counter()
+                func()
+                best = min(best, time.perf_counter() - start)
+            results[name] = best
+            print(f"{name:>8}: {best * 1000:8.1f} ms")
+
+        missing, _ = legacy_scan(root, target_langs, source_lang)
+        report = pipeline()
+        assert [(f, langs) for f, langs in sorted(missing.items(), key=lambda x: str(x[0]))] == report.missing
+        print(f"{len(report.source_files)} source files, coverage {report.coverage:.1f}%")
+        print(f"speedup: {results['legacy'] / results['pipeline']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
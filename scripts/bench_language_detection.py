@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Benchmark i18n language detection on a mixed zh/en corpus.
+
+Builds a deterministic corpus of issue-like documents (front matter, Chinese
+and English paragraphs, code blocks, URLs, issue IDs), checks that the
+single-pass detector agrees with the legacy per-character implementation,
+and times legacy, uncached and cached detection.
+
+Usage:
+    python scripts/bench_language_detection.py [--docs 2000] [--rounds 3] [--seed 7]
+"""
+
+import argparse
+import random
+import re
+import time
+
+from monoco.features.i18n import core
+
+ZH_SENTENCES = [
+    "这个功能用于在多个分支之间同步议题状态。",
+    "我们需要在提交之前运行 lint 检查，并确保 CI 通过。",
+    "该模块负责解析 Markdown 文档并提取内容块。",
+    "守护进程会定期刷新缓存，以减少 git 调用次数。",
+    "请在评审之后更新验收标准，并记录相关决策。",
+    "部署流程依赖 Docker 镜像和 Kubernetes 集群。",
+]
+EN_SENTENCES = [
+    "This feature keeps issue state in sync across branches.",
+    "Run the linter before committing and make sure the pipeline passes.",
+    "The parser extracts content blocks from markdown documents.",
+    "The daemon refreshes its caches periodically to avoid extra git calls.",
+    "Update the acceptance criteria after review and record the decision.",
+    "Deployment depends on container images and a running cluster.",
+]
+CODE = "```python\ndef handler(event):\n    return event.payload\n```"
+
+
+def build_corpus(docs: int, seed: int):
+    rng = random.Random(seed)
+    corpus = []
+    for i in range(docs):
+        zh_share = rng.choice([0.0, 0.1, 0.5, 0.9, 1.0])
+        parts = [f"---\nid: FEAT-{i:04d}\ntype: feature\n---\n", f"## FEAT-{i:04d}: Title\n"]
+        for _ in range(rng.randint(3, 30)):
+            pool = ZH_SENTENCES if rng.random() < zh_share else EN_SENTENCES
+            parts.append(" ".join(rng.choice(pool) for _ in range(rng.randint(1, 4))))
+            if rng.random() < 0.15:
+                parts.append(CODE)
+            if rng.random() < 0.1:
+                parts.append(f"See https://example.com/docs/{i} and `monoco issue lint`.")
+        corpus.append("\n\n".join(parts))
+    return corpus
+
+
+def legacy_detect(content: str) -> str:
+    """Pre-optimisation implementation (per-character generator loops)."""
+    if not content:
+        return "unknown"
+    content = re.compile(r"^---\n.*?\n---\n", re.DOTALL).sub("", content)
+    if not content.strip():
+        return "unknown"
+    content = re.compile(r"```[\s\S]*?```", re.MULTILINE).sub("", content)
+    content = re.compile(r"`[^`]+`").sub("", content)
+    content = re.compile(r"https?://\S+|www\.\S+|").sub("", content)
+    content = re.compile(r"\b(EPIC|FEAT|CHORE|FIX)-\d{4}\b").sub("", content)
+    if not content.strip():
+        return "unknown"
+    total = len(content)
+    cjk = sum(1 for c in content if "一" <= c <= "鿿")
+    other = sum(1 for c in content if ord(c) > 127 and not ("一" <= c <= "鿿"))
+    words = re.findall(r"\b[a-zA-Z][a-zA-Z0-9]*\b", content)
+    technical = sum(1 for w in words if w.lower() in core.TECHNICAL_TERMS_ALLOWLIST)
+    cjk_ratio = cjk / total
+    if cjk_ratio > 0.03:
+        return "zh"
+    if cjk_ratio > 0.01 and technical > 0:
+        return "zh"
+    if other / total < 0.15 and len(words) - technical >= 10:
+        return "en"
+    if cjk_ratio < 0.01 and len(words) > 20:
+        return "en"
+    return "unknown"
+
+
+def _time(func, corpus, rounds):
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for doc in corpus:
+            func(doc)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--docs", type=int, default=2000)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.docs, args.seed)
+    mismatches = [d for d in corpus if legacy_detect(d) != core._detect_language_uncached(d)]
+    if mismatches:
+        raise SystemExit(f"{len(mismatches)} documents disagree with the legacy detector")
+
+    size_mb = sum(len(d.encode("utf-8")) for d in corpus) / 1e6
+    print(f"corpus: {len(corpus)} documents, {size_mb:.1f} MB")
+    legacy = _time(legacy_detect, corpus, args.rounds)
+    uncached = _time(core._detect_language_uncached, corpus, args.rounds)
+    core.clear_language_cache()
+    for doc in corpus:
+        core.detect_language(doc)
+    cached = _time(core.detect_language, corpus, args.rounds)
+    print(f"  legacy:   {legacy * 1000:8.1f} ms")
+    print(f"  uncached: {uncached * 1000:8.1f} ms  ({legacy / uncached:.1f}x)")
+    print(f"  cached:   {cached * 1000:8.1f} ms  ({legacy / cached:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -44,6 +44,7 @@ echo "Using local cache at $(pwd)/build"
 
 # Run PyInstaller via uv
 # We use --clean to ensure fresh build and avoid stale cache issues
+# Subcommands are imported lazily by name, so collect all monoco submodules explicitly
 uv run --with pyinstaller pyinstaller \
     --name monoco \
     --onefile \
@@ -51,6 +52,7 @@ uv run --with pyinstaller pyinstaller \
     --distpath ./dist \
     --workpath ./build \
     --specpath ./build \
+    --collect-submodules monoco \
     src/monoco/main.py
 
 echo "Build complete. Binary is at Toolkit/dist/monoco"
@@ -0,0 +1,102 @@
+"""
+Lazy subcommand registration for the `monoco` CLI.
+
+Feature command modules pull in heavy dependencies (FastAPI, uvicorn, aiohttp,
+httpx, dingtalk-stream, ...). Importing all of them on every invocation
+dominates the runtime of short commands like `monoco issue list`, which agents
+run hundreds of times per session.
+
+`LazyTyperGroup` registers subcommand names and help text from a static table
+and imports a command module only when its subcommand is actually invoked.
+"""
+
+import importlib
+from dataclasses import dataclass
+from typing import Dict, List
+
+import typer
+from typer.core import TyperCommand, TyperGroup
+
+
+@dataclass(frozen=True)
+class LazyCommand:
+    """
+    Static registration of a lazily imported subcommand.
+
+    Attributes:
+        target: "module:attribute" pointing to a Typer app (group) or a
+            plain command function.
+        help: Short help shown in `monoco --help` without importing the target.
+        hidden: Hide from help output.
+    """
+
+    target: str
+    help: str = ""
+    hidden: bool = False
+
+
+class LazyTyperGroup(TyperGroup):
+    """
+    Typer group that resolves subcommands from a `LazyCommand` table on demand.
+
+    Eagerly registered commands (via `@app.command()`) keep working; lazy
+    entries are imported and converted to click commands the first time
+    `get_command` is asked for them. While rendering help, placeholder
+    commands carrying the static help text are returned instead so that
+    `monoco --help` stays cheap as well.
+    """
+
+    lazy_commands: Dict[str, LazyCommand] = {}
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._loaded: Dict[str, object] = {}
+        self._rendering_help = False
+
+    def list_commands(self, ctx) -> List[str]:
+        names = set(super().list_commands(ctx)) | set(self.lazy_commands)
+        return sorted(names)
+
+    def get_command(self, ctx, cmd_name: str):
+        command = super().get_command(ctx, cmd_name)
+        if command is not None:
+            return command
+        spec = self.lazy_commands.get(cmd_name)
+        if spec is None:
+            return None
+        if cmd_name in self._loaded:
+            return self._loaded[cmd_name]
+        if self._rendering_help:
+            return TyperCommand(name=cmd_name, help=spec.help, hidden=spec.hidden)
+        command = self._load(cmd_name, spec)
+        self._loaded[cmd_name] = command
+        return command
+
+    def format_help(self, ctx, formatter) -> None:
+        self._rendering_help = True
+        try:
+            super().format_help(ctx, formatter)
+        finally:
+            self._rendering_help = False
+
+    @staticmethod
+    def _load(cmd_name: str, spec: LazyCommand):
+        module_name, _, attr = spec.target.partition(":")
+        target = getattr(importlib.import_module(module_name), attr)
+        if isinstance(target, typer.Typer):
+            if target.info.help is None and spec.help:
+                target.info.help = spec.help
+            command = typer.main.get_group(target)
+        else:
+            # Plain function: wrap in a single-command Typer app
+            wrapper = typer.Typer(add_completion=False)
+            wrapper.command(name=cmd_name, hidden=spec.hidden)(target)
+            command = typer.main.get_command(wrapper)
+        command.name = cmd_name
+        command.hidden = spec.hidden
+        return command
+
+
+def lazy_group(table: Dict[str, LazyCommand]) -> type:
+    """Create a `LazyTyperGroup` subclass bound to a command table."""
+    return type("MonocoLazyGroup", (LazyTyperGroup,), {"lazy_commands": dict(table)})
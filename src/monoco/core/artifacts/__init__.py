@@ -5,12 +5,17 @@ Provides content-addressable storage for multi-modal assets with project-local
 metadata tracking via manifest.jsonl.
 """
 
+from .bulk import ImportReport, VerifyReport
+from .content import ArtifactContent
 from .models import ArtifactMetadata, ArtifactSourceType, ArtifactStatus
 from .manager import ArtifactManager
 
 __all__ = [
+    "ArtifactContent",
     "ArtifactMetadata",
     "ArtifactSourceType",
     "ArtifactStatus",
     "ArtifactManager",
+    "ImportReport",
+    "VerifyReport",
 ]
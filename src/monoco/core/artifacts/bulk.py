@@ -0,0 +1,119 @@
+"""
+Bulk import and verification helpers.
+
+Hashing dominates both operations and hashlib releases the GIL on large
+buffers, so files are processed on a thread pool; callers collect the
+results and write manifest lines in one batch.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, Iterator, Optional, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+# Upper bound for items handled by one pool task
+MAX_BATCH = 64
+
+
+def _apply_batch(fn: Callable[[T], R], batch: list[T]) -> list[tuple[Optional[R], Optional[Exception]]]:
+    results = []
+    for item in batch:
+        try:
+            results.append((fn(item), None))
+        except Exception as e:
+            results.append((None, e))
+    return results
+
+
+def run_parallel(
+    fn: Callable[[T], R], items: Iterable[T], workers: Optional[int] = None
+) -> Iterator[tuple[T, Optional[R], Optional[Exception]]]:
+    """
+    Apply fn to items on a thread pool, yielding (item, result, error) in input order.
+
+    Items are handed out in small batches so per-task overhead does not
+    dominate when there are many small files.
+    """
+    items = list(items)
+    # ThreadPoolExecutor's default pool size
+    workers = workers or min(32, (os.cpu_count() or 1) + 4)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="monoco-artifact-bulk") as executor:
+        size = min(MAX_BATCH, max(1, len(items) // (workers * 4)))
+        batches = [items[i : i + size] for i in range(0, len(items), size)]
+        futures = [executor.submit(_apply_batch, fn, batch) for batch in batches]
+        for batch, future in zip(batches, futures):
+            for item, (result, error) in zip(batch, future.result()):
+                yield item, result, error
+
+
+@dataclass
+class BulkReport:
+    """Outcome and throughput of a bulk operation."""
+
+    processed: int = 0
+    """Items handled successfully."""
+
+    bytes: int = 0
+    """Content bytes read."""
+
+    elapsed: float = 0.0
+    """Wall-clock seconds."""
+
+    failed: dict[str, str] = field(default_factory=dict)
+    """Item (path or artifact id) -> error message."""
+
+    _started: float = field(default_factory=time.perf_counter, repr=False)
+
+    def finish(self) -> None:
+        self.elapsed = time.perf_counter() - self._started
+
+    @property
+    def items_per_second(self) -> float:
+        return self.processed / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def mb_per_second(self) -> float:
+        return self.bytes / self.elapsed / 1024**2 if self.elapsed else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "processed": self.processed,
+            "bytes": self.bytes,
+            "elapsed_s": round(self.elapsed, 3),
+            "items_per_s": round(self.items_per_second, 1),
+            "mb_per_s": round(self.mb_per_second, 1),
+            "failed": self.failed,
+        }
+
+
+@dataclass
+class ImportReport(BulkReport):
+    """Result of a bulk import."""
+
+    stored: list[Any] = field(default_factory=list)
+    """Records of the stored artifacts, in input order."""
+
+
+@dataclass
+class VerifyReport(BulkReport):
+    """Result of a bulk verification (ids are grouped by outcome)."""
+
+    ok: list[str] = field(default_factory=list)
+    missing: list[str] = field(default_factory=list)
+    corrupted: list[str] = field(default_factory=list)
+
+    @property
+    def valid(self) -> bool:
+        return not (self.missing or self.corrupted or self.failed)
+
+    def to_dict(self) -> dict[str, Any]:
+        data = super().to_dict()
+        data.update(ok=len(self.ok), missing=self.missing, corrupted=self.corrupted)
+        return data
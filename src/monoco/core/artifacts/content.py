@@ -0,0 +1,135 @@
+"""
+Read-only, memory-mapped access to stored artifact content.
+
+``ArtifactContent`` maps a CAS file instead of reading it into memory, so
+hashing, range requests and streaming consumers keep a flat memory profile
+regardless of artifact size: the page cache backs the mapping and slices
+are zero-copy ``memoryview``s.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import mmap
+import os
+from pathlib import Path
+from typing import BinaryIO, Iterator, Optional
+
+# Default chunk size for iterating over mapped content
+READ_CHUNK = 1024 * 1024
+
+
+class ArtifactContent:
+    """
+    Read-only view of a content file.
+
+    Use as a context manager; views returned by ``buffer``/``read_range``
+    are only valid until the content is closed.
+
+    Args:
+        path: File to map
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._file: BinaryIO = open(self.path, "rb")
+        try:
+            self.size = os.fstat(self._file.fileno()).st_size
+            # Zero-length files cannot be mapped
+            self._map: Optional[mmap.mmap] = (
+                mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if self.size else None
+            )
+        except Exception:
+            self._file.close()
+            raise
+        self._view = memoryview(self._map) if self._map is not None else memoryview(b"")
+
+    @property
+    def closed(self) -> bool:
+        return self._file.closed
+
+    @property
+    def buffer(self) -> memoryview:
+        """The whole content as a read-only buffer (no copy)."""
+        self._check_open()
+        return self._view
+
+    @property
+    def file(self) -> BinaryIO:
+        """Underlying binary file handle (for APIs that want a file object)."""
+        self._check_open()
+        return self._file
+
+    def read_range(self, start: int = 0, end: Optional[int] = None) -> memoryview:
+        """
+        Bytes ``[start, end)`` as a read-only buffer (no copy).
+
+        Args:
+            start: First byte offset
+            end: Offset after the last byte (None: end of content)
+
+        Returns:
+            Buffer clamped to the content size
+
+        Raises:
+            ValueError: If the range is negative or inverted
+        """
+        self._check_open()
+        end = self.size if end is None else min(end, self.size)
+        if start < 0 or end < start:
+            raise ValueError(f"Invalid byte range: {start}-{end}")
+        return self._view[start:end]
+
+    def iter_chunks(
+        self, chunk_size: int = READ_CHUNK, start: int = 0, end: Optional[int] = None
+    ) -> Iterator[memoryview]:
+        """Iterate over a byte range in buffers of at most ``chunk_size`` bytes."""
+        window = self.read_range(start, end)
+        for offset in range(0, len(window), chunk_size):
+            yield window[offset : offset + chunk_size]
+
+    def digest(self, algorithm: str = "sha256") -> str:
+        """Hex digest of the content, hashed straight from the mapping."""
+        hasher = hashlib.new(algorithm)
+        for chunk in self.iter_chunks():
+            hasher.update(chunk)
+        return hasher.hexdigest()
+
+    def close(self) -> None:
+        """Unmap and close the file."""
+        if self.closed:
+            return
+        self._view.release()
+        if self._map is not None:
+            try:
+                self._map.close()
+            except BufferError:
+                # Slices are still referenced; the mapping goes away with them
+                pass
+        self._file.close()
+
+    def _check_open(self) -> None:
+        if self.closed:
+            raise ValueError("Artifact content is closed")
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __enter__(self) -> "ArtifactContent":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def hash_file(path: Path, algorithm: str = "sha256") -> str:
+    """Hex digest of a file via a read-only mapping.
+
+    Files up to ``READ_CHUNK`` are read in one call instead: setting up a
+    mapping costs more than the copy for them.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size <= READ_CHUNK:
+            return hashlib.new(algorithm, f.read()).hexdigest()
+    with ArtifactContent(path) as content:
+        return content.digest(algorithm)
@@ -7,16 +7,21 @@ and manifest.jsonl registry operations.
 
 from __future__ import annotations
 
+import functools
+import hashlib
 import json
 import os
 import shutil
 import tempfile
 import threading
+import time
 import uuid
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
 
+from .bulk import ImportReport, VerifyReport, run_parallel
+from .content import ArtifactContent, hash_file
 from .models import (
     ArtifactMetadata,
     ArtifactSourceType,
@@ -25,6 +30,36 @@ from .models import (
     compute_file_hash,
 )
 
+# Chunk size for streaming file ingestion
+COPY_CHUNK = 1024 * 1024
+
+# ioctl request cloning one file's extents into another (linux/fs.h)
+FICLONE = 0x40049409
+
+
+def _reflink(src_fd: int, dst_fd: int) -> bool:
+    """Copy-on-write clone src into dst (btrfs, XFS, ...). False if unsupported."""
+    try:
+        import fcntl
+
+        fcntl.ioctl(dst_fd, FICLONE, src_fd)
+        return True
+    except (ImportError, OSError):
+        return False
+
+
+def _touch(path: Path) -> None:
+    """Mark a CAS object as just used (atime only; keeps mtime for shared inodes).
+
+    Reused objects then fall inside the garbage collector's grace period until
+    the referencing manifest line is written.
+    """
+    try:
+        st = path.stat()
+        os.utime(path, ns=(time.time_ns(), st.st_mtime_ns))
+    except OSError:
+        pass
+
 
 class ArtifactManager:
     """
@@ -96,24 +131,28 @@ class ArtifactManager:
                         # Skip corrupted lines, could log warning
                         continue
 
-    def _atomic_append_manifest(self, metadata: ArtifactMetadata) -> None:
-        """Atomically append a metadata entry to manifest.jsonl."""
+    def _append_manifest(self, entries: list[ArtifactMetadata]) -> None:
+        """
+        Append metadata entries to manifest.jsonl with a single O_APPEND write.
+
+        Batching several entries into one call keeps bulk imports to one
+        write; concurrent writers never interleave within a batch.
+        """
+        data = "".join(m.to_jsonl_line() for m in entries).encode("utf-8")
+        if not data:
+            return
         with self._lock:
-            # Write to temp file first, then rename for atomicity
-            fd, temp_path = tempfile.mkstemp(
-                dir=self.local_artifacts_dir, suffix=".tmp"
-            )
+            fd = os.open(self.manifest_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
             try:
-                with os.fdopen(fd, "w", encoding="utf-8") as f:
-                    f.write(metadata.to_jsonl_line())
-
-                # Append temp content to manifest atomically
-                with open(temp_path, "r", encoding="utf-8") as src:
-                    with open(self.manifest_path, "a", encoding="utf-8") as dst:
-                        dst.write(src.read())
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(fd, view):]
             finally:
-                if os.path.exists(temp_path):
-                    os.unlink(temp_path)
+                os.close(fd)
+
+    def _atomic_append_manifest(self, metadata: ArtifactMetadata) -> None:
+        """Atomically append a metadata entry to manifest.jsonl."""
+        self._append_manifest([metadata])
 
     def _rewrite_manifest(self) -> None:
         """Rewrite entire manifest from cache (for deletes/updates)."""
@@ -151,6 +190,7 @@ class ArtifactManager:
 
         if cas_path.exists():
             # Content already stored (deduplication)
+            _touch(cas_path)
             return cas_path
 
         # Ensure parent directories exist
@@ -169,6 +209,107 @@ class ArtifactManager:
 
         return cas_path
 
+    def _ingest_file(self, file_path: Path, allow_hardlink: bool = False) -> tuple[str, int, Path]:
+        """
+        Move a file's content into CAS without loading it into memory.
+
+        The content lands in a private temp file inside the global store
+        first, so the hash always describes exactly what gets stored:
+        - hardlink (only with `allow_hardlink`; CAS then shares the source's
+          inode, so the source must never be modified in place)
+        - reflink (copy-on-write clone, same filesystem only)
+        - otherwise a chunked copy that hashes while it writes
+
+        Returns:
+            (content_hash, size_bytes, cas_path)
+        """
+        incoming = self.global_store / ".incoming"
+        incoming.mkdir(parents=True, exist_ok=True)
+        temp_path = incoming / f"{uuid.uuid4().hex}.tmp"
+        try:
+            linked = False
+            if allow_hardlink:
+                try:
+                    os.link(file_path, temp_path)
+                    linked = True
+                except OSError:
+                    pass
+
+            if linked:
+                content_hash = compute_file_hash(temp_path)
+            else:
+                with open(file_path, "rb") as src, open(temp_path, "wb") as dst:
+                    if _reflink(src.fileno(), dst.fileno()):
+                        content_hash = None
+                    else:
+                        hasher = hashlib.sha256()
+                        for chunk in iter(lambda: src.read(COPY_CHUNK), b""):
+                            hasher.update(chunk)
+                            dst.write(chunk)
+                        content_hash = hasher.hexdigest()
+                if content_hash is None:
+                    content_hash = compute_file_hash(temp_path)
+
+            size = temp_path.stat().st_size
+            cas_path = self._get_cas_path(content_hash)
+            if cas_path.exists():
+                # Content already stored (deduplication)
+                temp_path.unlink()
+                _touch(cas_path)
+            else:
+                cas_path.parent.mkdir(parents=True, exist_ok=True)
+                os.replace(temp_path, cas_path)
+            return content_hash, size, cas_path
+        except BaseException:
+            if temp_path.exists():
+                temp_path.unlink()
+            raise
+
+    def _register(
+        self,
+        content_hash: str,
+        size_bytes: int,
+        source_type: ArtifactSourceType,
+        content_type: str,
+        original_filename: Optional[str] = None,
+        expires_at: Optional[datetime] = None,
+        tags: Optional[list[str]] = None,
+        metadata: Optional[dict[str, Any]] = None,
+        source_url: Optional[str] = None,
+        parent_artifact_id: Optional[str] = None,
+        append: bool = True,
+    ) -> ArtifactMetadata:
+        """
+        Create metadata for stored content and add it to the registry.
+
+        With ``append=False`` only the in-memory registry is updated; the
+        caller writes the manifest lines in one batch.
+        """
+        artifact_meta = ArtifactMetadata(
+            artifact_id=str(uuid.uuid4()),
+            content_hash=content_hash,
+            source_type=source_type,
+            status=ArtifactStatus.ACTIVE,
+            created_at=datetime.now(timezone.utc),
+            updated_at=datetime.now(timezone.utc),
+            expires_at=expires_at,
+            content_type=content_type,
+            size_bytes=size_bytes,
+            original_filename=original_filename,
+            source_url=source_url,
+            parent_artifact_id=parent_artifact_id,
+            tags=tags or [],
+            metadata=metadata or {},
+        )
+
+        # Update cache and manifest
+        with self._lock:
+            self._metadata_cache[artifact_meta.artifact_id] = artifact_meta
+            if append:
+                self._append_manifest([artifact_meta])
+
+        return artifact_meta
+
     def store(
         self,
         content: bytes,
@@ -202,33 +343,21 @@ class ArtifactManager:
         content_hash = compute_content_hash(content)
 
         # Store in CAS (deduplication happens automatically)
-        cas_path = self._store_in_cas(content, content_hash)
+        self._store_in_cas(content, content_hash)
 
-        # Create metadata
-        artifact_meta = ArtifactMetadata(
-            artifact_id=str(uuid.uuid4()),
-            content_hash=content_hash,
+        return self._register(
+            content_hash,
+            len(content),
             source_type=source_type,
-            status=ArtifactStatus.ACTIVE,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc),
-            expires_at=expires_at,
             content_type=content_type,
-            size_bytes=len(content),
             original_filename=original_filename,
+            expires_at=expires_at,
+            tags=tags,
+            metadata=metadata,
             source_url=source_url,
             parent_artifact_id=parent_artifact_id,
-            tags=tags or [],
-            metadata=metadata or {},
         )
 
-        # Update cache and manifest
-        with self._lock:
-            self._metadata_cache[artifact_meta.artifact_id] = artifact_meta
-            self._atomic_append_manifest(artifact_meta)
-
-        return artifact_meta
-
     def store_file(
         self,
         file_path: Path,
@@ -237,10 +366,15 @@ class ArtifactManager:
         expires_at: Optional[datetime] = None,
         tags: Optional[list[str]] = None,
         metadata: Optional[dict[str, Any]] = None,
+        allow_hardlink: bool = False,
     ) -> ArtifactMetadata:
         """
         Store a file as an artifact.
 
+        The file is streamed into CAS (hashed while copied in chunks, or
+        cloned/linked on the same filesystem), so memory use does not
+        depend on its size.
+
         Args:
             file_path: Path to the file to store
             source_type: How the artifact was created
@@ -248,18 +382,21 @@ class ArtifactManager:
             expires_at: Optional expiration timestamp
             tags: User-defined tags
             metadata: Additional metadata
+            allow_hardlink: Hardlink into CAS when possible; only for
+                sources that are never modified in place
 
         Returns:
             ArtifactMetadata for the stored artifact
         """
         file_path = Path(file_path)
-        content = file_path.read_bytes()
+        content_hash, size, _ = self._ingest_file(file_path, allow_hardlink=allow_hardlink)
 
         if content_type is None:
             content_type = self._detect_content_type(file_path)
 
-        return self.store(
-            content=content,
+        return self._register(
+            content_hash,
+            size,
             source_type=source_type,
             content_type=content_type,
             original_filename=file_path.name,
@@ -268,6 +405,108 @@ class ArtifactManager:
             metadata=metadata,
         )
 
+    def store_files(
+        self,
+        file_paths: Iterable[Path],
+        source_type: ArtifactSourceType = ArtifactSourceType.UPLOADED,
+        tags: Optional[list[str]] = None,
+        metadata: Optional[dict[str, Any]] = None,
+        allow_hardlink: bool = False,
+        workers: Optional[int] = None,
+    ) -> ImportReport:
+        """
+        Store many files as artifacts.
+
+        Files are streamed into CAS on a thread pool and all manifest lines
+        are appended with a single write. A failing file is reported in
+        ``failed`` and does not abort the others.
+
+        Args:
+            file_paths: Files to store
+            source_type: How the artifacts were created
+            tags: User-defined tags for every artifact
+            metadata: Additional metadata for every artifact
+            allow_hardlink: See ``store_file``
+            workers: Thread pool size (default: executor default)
+
+        Returns:
+            ImportReport with the ArtifactMetadata of stored files in ``stored``
+        """
+        report = ImportReport()
+        ingest = functools.partial(self._ingest_file, allow_hardlink=allow_hardlink)
+        for path, ingested, error in run_parallel(ingest, map(Path, file_paths), workers):
+            if error is not None:
+                report.failed[str(path)] = str(error)
+                continue
+            content_hash, size, _ = ingested
+            report.stored.append(
+                self._register(
+                    content_hash,
+                    size,
+                    source_type=source_type,
+                    content_type=self._detect_content_type(path),
+                    original_filename=path.name,
+                    tags=list(tags) if tags else None,
+                    metadata=dict(metadata) if metadata else None,
+                    append=False,
+                )
+            )
+            report.processed += 1
+            report.bytes += size
+
+        self._append_manifest(report.stored)
+        report.finish()
+        return report
+
+    def verify(
+        self, artifact_ids: Optional[Iterable[str]] = None, workers: Optional[int] = None
+    ) -> VerifyReport:
+        """
+        Check that artifact content exists in CAS and matches its hash.
+
+        Each distinct content hash is read once, on a thread pool.
+
+        Args:
+            artifact_ids: Artifacts to check (default: all active artifacts)
+            workers: Thread pool size (default: executor default)
+
+        Returns:
+            VerifyReport with artifact ids grouped by outcome
+        """
+        report = VerifyReport()
+        if artifact_ids is None:
+            selected = self.list()
+        else:
+            selected = []
+            for artifact_id in artifact_ids:
+                meta = self.get(artifact_id)
+                if meta is None:
+                    report.missing.append(artifact_id)
+                else:
+                    selected.append(meta)
+
+        by_hash: dict[str, list[str]] = {}
+        for meta in selected:
+            by_hash.setdefault(meta.content_hash, []).append(meta.artifact_id)
+
+        def check(content_hash: str) -> tuple[str, int]:
+            cas_path = self._get_cas_path(content_hash)
+            return hash_file(cas_path), cas_path.stat().st_size
+
+        for content_hash, result, error in run_parallel(check, by_hash, workers):
+            ids = by_hash[content_hash]
+            if isinstance(error, FileNotFoundError):
+                report.missing.extend(ids)
+            elif error is not None:
+                report.failed.update((i, str(error)) for i in ids)
+            else:
+                digest, size = result
+                report.bytes += size
+                (report.ok if digest == content_hash else report.corrupted).extend(ids)
+        report.processed = len(report.ok) + len(report.corrupted)
+        report.finish()
+        return report
+
     def _detect_content_type(self, file_path: Path) -> str:
         """Detect MIME type from file extension."""
         suffix = file_path.suffix.lower()
@@ -316,6 +555,9 @@ class ArtifactManager:
         """
         Get artifact content by ID.
 
+        Loads the whole content into memory; prefer ``open_content`` for
+        large artifacts.
+
         Args:
             artifact_id: The unique artifact identifier
 
@@ -332,6 +574,28 @@ class ArtifactManager:
 
         return cas_path.read_bytes()
 
+    def open_content(self, artifact_id: str) -> Optional[ArtifactContent]:
+        """
+        Open artifact content as a read-only, memory-mapped view.
+
+        The view supports zero-copy byte ranges (``read_range``), chunked
+        iteration and hashing without loading the content into memory.
+        Close it (or use it as a context manager) when done.
+
+        Args:
+            artifact_id: The unique artifact identifier
+
+        Returns:
+            ArtifactContent if found, None otherwise
+        """
+        cas_path = self.get_content_path(artifact_id)
+        if cas_path is None:
+            return None
+        try:
+            return ArtifactContent(cas_path)
+        except FileNotFoundError:
+            return None
+
     def get_content_path(self, artifact_id: str) -> Optional[Path]:
         """
         Get the filesystem path to artifact content (read-only access).
@@ -15,6 +15,8 @@ from typing import Any, Optional
 
 from pydantic import BaseModel, Field, field_validator
 
+from .content import hash_file
+
 
 class ArtifactSourceType(str, Enum):
     """Source type of the artifact."""
@@ -154,8 +156,4 @@ def compute_file_hash(file_path: Path) -> str:
     Returns:
         64-character lowercase hex string of the SHA256 hash
     """
-    hasher = hashlib.sha256()
-    with open(file_path, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            hasher.update(chunk)
-    return hasher.hexdigest()
+    return hash_file(file_path)
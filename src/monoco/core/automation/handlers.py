@@ -32,7 +32,7 @@ from monoco.core.scheduler import (
 )
 from monoco.core.router import ActionResult
 from monoco.features.memo.models import Memo
-from monoco.features.memo.core import load_memos, get_inbox_path
+from monoco.features.memo.core import consume_memos, get_inbox_path
 
 logger = logging.getLogger(__name__)
 
@@ -503,10 +503,8 @@ class MemoThresholdHandler:
         # Load memos directly from inbox path
         # inbox_path is Memos/inbox.md, issues_root is sibling: Issues/
         issues_root = inbox_path.parent.parent / "Issues"
-        memos = load_memos(issues_root)
-        
-        # Clear inbox (atomic write)
-        inbox_path.write_text("# Monoco Memos Inbox\n\n", encoding="utf-8")
+        # Clear inbox (atomic replace)
+        memos = consume_memos(issues_root)
         logger.info(f"Inbox cleared after consuming {len(memos)} memos")
         
         return memos
@@ -76,6 +76,15 @@ class TelemetryConfig(BaseModel):
     )
 
 
+class MemoConfig(BaseModel):
+    """Configuration for the memo inbox."""
+
+    append_only: bool = Field(
+        default=False,
+        description="Delete memos by appending tombstones instead of rewriting Memos/inbox.md",
+    )
+
+
 class HooksConfig(BaseModel):
     """Configuration for git hooks management."""
 
@@ -92,6 +101,18 @@ class HooksConfig(BaseModel):
         },
         description="Per-hook-type enable/disable (hook_type -> enabled)"
     )
+    issue_max_workers: int = Field(
+        default=4, ge=1, description="Maximum independent issue hooks run concurrently"
+    )
+    issue_stop_on_deny: bool = Field(
+        default=False,
+        description="Skip remaining issue hooks once one returns DENY",
+    )
+    issue_cache_ttl: int = Field(
+        default=0,
+        ge=0,
+        description="Seconds to reuse verdicts of cacheable issue hooks (0 disables)",
+    )
 
 
 class IssueTypeConfig(BaseModel):
@@ -271,6 +292,7 @@ class MonocoConfig(BaseModel):
     ui: UIConfig = Field(default_factory=UIConfig)
     telemetry: TelemetryConfig = Field(default_factory=TelemetryConfig)
     hooks: HooksConfig = Field(default_factory=HooksConfig)
+    memo: MemoConfig = Field(default_factory=MemoConfig)
     session_hooks: Dict[str, Any] = Field(
         default_factory=dict,
         description="Session lifecycle hooks configuration (hook_name -> config)",
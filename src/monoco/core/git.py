@@ -1,9 +1,14 @@
-from typing import List, Tuple, Optional, Dict, Callable, Awaitable
+from typing import List, Tuple, Optional, Dict, Callable, Awaitable, TYPE_CHECKING
 import asyncio
+import atexit
 import logging
 import subprocess
+import threading
 from pathlib import Path
 
+if TYPE_CHECKING:
+    from watchdog.observers.api import BaseObserver
+
 logger = logging.getLogger("monoco.core.git")
 
 
@@ -18,6 +23,220 @@ def _run_git(args: List[str], cwd: Path) -> Tuple[int, str, str]:
         return 1, "", "Git executable not found"
 
 
+class GitCatFileSession:
+    """
+    Long-lived `git cat-file` worker for object lookups.
+
+    Spawning `git` for every query dominates cross-branch lookups (one
+    process per branch x directory). A session keeps a `--batch-check`
+    process for existence checks and a `--batch` process for reading
+    trees, both started lazily and reused for every request.
+
+    Object specs use the usual `<rev>:<path>` syntax. Sessions are
+    thread-safe; use `get_cat_file_session()` to share one per repository.
+    """
+
+    def __init__(self, cwd: Path):
+        self.cwd = Path(cwd)
+        self._check_proc: Optional[subprocess.Popen] = None
+        self._batch_proc: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+
+    def _spawn(self, mode: str) -> subprocess.Popen:
+        return subprocess.Popen(
+            ["git", "cat-file", mode],
+            cwd=self.cwd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+
+    def _request(self, proc: subprocess.Popen, spec: str) -> Optional[Tuple[str, str, int]]:
+        """Send one object spec and parse the `<sha> <type> <size>` header."""
+        proc.stdin.write(spec.encode("utf-8") + b"\n")
+        proc.stdin.flush()
+        header = proc.stdout.readline()
+        if not header:
+            raise RuntimeError("git cat-file session terminated unexpectedly")
+        parts = header.decode("utf-8", "replace").rstrip("\n").split(" ")
+        if len(parts) != 3 or parts[-1] in ("missing", "ambiguous"):
+            return None
+        sha, obj_type, size = parts
+        return sha, obj_type, int(size)
+
+    def _with_proc(self, mode: str, func):
+        attr = "_check_proc" if mode == "--batch-check" else "_batch_proc"
+        with self._lock:
+            proc = getattr(self, attr)
+            if proc is None or proc.poll() is not None:
+                proc = self._spawn(mode)
+                setattr(self, attr, proc)
+            try:
+                return func(proc)
+            except (BrokenPipeError, RuntimeError):
+                # Worker died (e.g. repository removed); drop it so the next
+                # request restarts a fresh process.
+                self._terminate(proc)
+                setattr(self, attr, None)
+                raise
+
+    def object_info(self, spec: str) -> Optional[Tuple[str, str, int]]:
+        """Return (sha, type, size) for an object spec, or None if missing."""
+        if "\n" in spec:
+            return None
+        return self._with_proc("--batch-check", lambda proc: self._request(proc, spec))
+
+    def exists(self, spec: str) -> bool:
+        """Check whether an object spec (e.g. `branch:path/to/file`) resolves."""
+        try:
+            return self.object_info(spec) is not None
+        except (OSError, RuntimeError):
+            return False
+
+    def read_object(self, spec: str) -> Optional[Tuple[str, bytes]]:
+        """Return (type, raw content) for an object spec, or None if missing."""
+        obj = self._read_object(spec)
+        return None if obj is None else obj[1:]
+
+    def _read_object(self, spec: str) -> Optional[Tuple[str, str, bytes]]:
+        """Return (object id, type, raw content) for an object spec, or None if missing."""
+        if "\n" in spec:
+            return None
+
+        def _read(proc):
+            info = self._request(proc, spec)
+            if info is None:
+                return None
+            sha, obj_type, size = info
+            data = proc.stdout.read(size)
+            proc.stdout.read(1)  # trailing LF
+            return sha, obj_type, data
+
+        return self._with_proc("--batch", _read)
+
+    def list_tree(self, rev: str, path: str = "", recursive: bool = False) -> List[str]:
+        """
+        List file paths under `path` in `rev`, like `ls-tree --name-only`.
+
+        Returned paths are relative to the repository root. Missing trees
+        yield an empty list.
+        """
+        path = path.strip("/")
+        try:
+            obj = self._read_object(f"{rev}:{path}")
+        except (OSError, RuntimeError):
+            return []
+        if obj is None or obj[1] != "tree":
+            return []
+        sha, _, data = obj
+
+        files: List[str] = []
+        prefix = f"{path}/" if path else ""
+        # Entries embed raw object ids: 20 bytes for SHA-1, 32 for SHA-256
+        for mode, name in _parse_tree(data, len(sha) // 2):
+            full = prefix + name
+            if mode == b"40000":
+                if recursive:
+                    files.extend(self.list_tree(rev, full, recursive=True))
+            elif mode != b"160000":  # skip submodule commits
+                files.append(full)
+        return files
+
+    @staticmethod
+    def _terminate(proc: Optional[subprocess.Popen]):
+        if proc is None:
+            return
+        try:
+            proc.stdin.close()
+        except OSError:
+            pass
+        try:
+            proc.wait(timeout=1)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+
+    def close(self):
+        with self._lock:
+            self._terminate(self._check_proc)
+            self._terminate(self._batch_proc)
+            self._check_proc = None
+            self._batch_proc = None
+
+    def __enter__(self) -> "GitCatFileSession":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _parse_tree(data: bytes, oid_len: int = 20) -> List[Tuple[bytes, str]]:
+    """
+    Parse a raw tree object into (mode, name) entries.
+
+    `oid_len` is the raw object id size of the repository's hash (20 for
+    SHA-1, 32 for SHA-256). Raises ValueError on a truncated tree.
+    """
+    entries = []
+    pos = 0
+    while pos < len(data):
+        space = data.index(b" ", pos)
+        nul = data.index(b"\0", space)
+        mode = data[pos:space]
+        name = data[space + 1 : nul].decode("utf-8", "surrogateescape")
+        entries.append((mode, name))
+        pos = nul + 1 + oid_len
+    if pos != len(data):
+        raise ValueError("Truncated git tree object")
+    return entries
+
+
+_cat_file_sessions: Dict[Path, GitCatFileSession] = {}
+_cat_file_sessions_lock = threading.Lock()
+
+
+def get_cat_file_session(path: Path) -> GitCatFileSession:
+    """Get the shared cat-file session for a repository."""
+    key = Path(path).resolve()
+    with _cat_file_sessions_lock:
+        session = _cat_file_sessions.get(key)
+        if session is None:
+            session = GitCatFileSession(key)
+            _cat_file_sessions[key] = session
+        return session
+
+
+@atexit.register
+def close_cat_file_sessions():
+    """Terminate all shared cat-file sessions."""
+    with _cat_file_sessions_lock:
+        for session in _cat_file_sessions.values():
+            session.close()
+        _cat_file_sessions.clear()
+
+
+def get_git_common_dir(path: Path) -> Optional[Path]:
+    """
+    Absolute path of the git common directory (shared by all worktrees).
+
+    Good place for caches that must never show up in `git status`.
+    """
+    code, stdout, _ = _run_git(["rev-parse", "--git-common-dir"], path)
+    if code != 0 or not stdout.strip():
+        return None
+    git_dir = Path(stdout.strip())
+    if not git_dir.is_absolute():
+        git_dir = Path(path) / git_dir
+    return git_dir
+
+
+def get_local_branches(path: Path) -> List[str]:
+    """List local branch names."""
+    code, stdout, _ = _run_git(["branch", "--format=%(refname:short)"], path)
+    if code != 0:
+        return []
+    return [b.strip() for b in stdout.splitlines() if b.strip()]
+
+
 def is_git_repo(path: Path) -> bool:
     code, _, _ = _run_git(["rev-parse", "--is-inside-work-tree"], path)
     return code == 0
@@ -320,9 +539,124 @@ def git_reset_hard(path: Path, ref: str):
         raise RuntimeError(f"Git reset --hard to {ref} failed: {stderr}")
 
 
+def find_git_dirs(path: Path) -> Optional[Tuple[Path, Path]]:
+    """
+    Locate (git_dir, common_dir) for a work tree without spawning git.
+
+    Handles regular repositories (`.git/` directory) and linked worktrees or
+    submodules (`.git` file containing `gitdir: ...`).
+    """
+    for candidate in [path, *path.parents]:
+        dot_git = candidate / ".git"
+        if dot_git.is_dir():
+            git_dir = dot_git
+        elif dot_git.is_file():
+            try:
+                content = dot_git.read_text(encoding="utf-8").strip()
+            except OSError:
+                return None
+            if not content.startswith("gitdir:"):
+                return None
+            git_dir = Path(content[len("gitdir:"):].strip())
+            if not git_dir.is_absolute():
+                git_dir = (candidate / git_dir).resolve()
+        else:
+            continue
+
+        common_dir = git_dir
+        commondir_file = git_dir / "commondir"
+        if commondir_file.is_file():
+            try:
+                common = Path(commondir_file.read_text(encoding="utf-8").strip())
+                common_dir = common if common.is_absolute() else (git_dir / common).resolve()
+            except OSError:
+                pass
+        return git_dir, common_dir
+    return None
+
+
+def _read_ref(common_dir: Path, ref: str) -> Optional[str]:
+    """Resolve a ref from loose ref files, then packed-refs."""
+    loose = common_dir / ref
+    try:
+        value = loose.read_text(encoding="utf-8").strip()
+        if value.startswith("ref:"):
+            return _read_ref(common_dir, value[4:].strip())
+        if value:
+            return value
+    except (OSError, UnicodeDecodeError):
+        pass
+
+    try:
+        with open(common_dir / "packed-refs", "r", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith(("#", "^")):
+                    continue
+                parts = line.strip().split(" ", 1)
+                if len(parts) == 2 and parts[1] == ref:
+                    return parts[0]
+    except OSError:
+        pass
+    return None
+
+
+def resolve_head(path: Path) -> Optional[str]:
+    """
+    Resolve HEAD to a commit hash by reading ref files directly.
+
+    Returns None when HEAD cannot be resolved this way (e.g. unborn branch,
+    reftable backend); callers should fall back to `git rev-parse HEAD`.
+    """
+    dirs = find_git_dirs(Path(path).resolve())
+    if dirs is None:
+        return None
+    git_dir, common_dir = dirs
+    try:
+        head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+    except (OSError, UnicodeDecodeError):
+        return None
+    if head.startswith("ref:"):
+        # Branch refs are shared by all worktrees and live in the common dir
+        return _read_ref(common_dir, head[4:].strip())
+    return head or None
+
+
+class _GitRefEventHandler:
+    """
+    Wakes the GitMonitor when HEAD, packed-refs or anything under refs/ changes.
+
+    Observers only call `dispatch`, so this does not subclass watchdog's
+    FileSystemEventHandler and importing this module does not import watchdog.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, wake: asyncio.Event):
+        self.loop = loop
+        self.wake = wake
+
+    @staticmethod
+    def _is_ref_path(path_str: str) -> bool:
+        path = Path(path_str)
+        return (
+            path.name in ("HEAD", "packed-refs")
+            or "refs" in path.parts
+        ) and not path.name.endswith(".lock")
+
+    def dispatch(self, event):
+        paths = [event.src_path, getattr(event, "dest_path", "") or ""]
+        if any(p and self._is_ref_path(p) for p in paths):
+            self.loop.call_soon_threadsafe(self.wake.set)
+
+
 class GitMonitor:
     """
-    Polls the Git repository for HEAD changes and triggers updates.
+    Watches the Git repository for HEAD changes and triggers updates.
+
+    By default the monitor subscribes to filesystem events on `.git/HEAD`,
+    `.git/refs/**` and `packed-refs`, and resolves HEAD by reading the ref
+    files directly, so an idle daemon spawns no processes. Polling every
+    `poll_interval` is only used when the filesystem observer is unavailable;
+    while watching, a slow `fallback_interval` poll guards against missed
+    events.
     """
 
     def __init__(
@@ -330,14 +664,24 @@ class GitMonitor:
         path: Path,
         on_head_change: Callable[[str], Awaitable[None]],
         poll_interval: float = 2.0,
+        use_fs_events: bool = True,
+        fallback_interval: float = 60.0,
     ):
         self.path = path
         self.on_head_change = on_head_change
         self.poll_interval = poll_interval
+        self.use_fs_events = use_fs_events
+        self.fallback_interval = fallback_interval
         self.last_head_hash: Optional[str] = None
         self.is_running = False
+        self.mode = "stopped"
+        self._observer: Optional["BaseObserver"] = None
+        self._wake: Optional[asyncio.Event] = None
 
     async def get_head_hash(self) -> Optional[str]:
+        head = resolve_head(self.path)
+        if head:
+            return head
         try:
             process = await asyncio.create_subprocess_exec(
                 "git",
@@ -355,23 +699,76 @@ class GitMonitor:
             logger.error(f"Git polling error: {e}")
             return None
 
+    def _start_observer(self) -> bool:
+        dirs = find_git_dirs(Path(self.path).resolve())
+        if dirs is None:
+            return False
+        git_dir, common_dir = dirs
+        from watchdog.observers import Observer
+
+        handler = _GitRefEventHandler(asyncio.get_running_loop(), self._wake)
+        observer = Observer()
+        try:
+            # HEAD (and per-worktree refs) + packed-refs; refs/ recursively
+            observer.schedule(handler, str(git_dir), recursive=False)
+            if common_dir != git_dir:
+                observer.schedule(handler, str(common_dir), recursive=False)
+            refs_dir = common_dir / "refs"
+            if refs_dir.is_dir():
+                observer.schedule(handler, str(refs_dir), recursive=True)
+            observer.start()
+        except Exception as e:
+            logger.warning(f"Git ref watching unavailable for {self.path}, polling instead: {e}")
+            return False
+        self._observer = observer
+        return True
+
+    async def _check(self):
+        current_hash = await self.get_head_hash()
+        if current_hash and current_hash != self.last_head_hash:
+            logger.info(
+                f"Git HEAD changed: {self.last_head_hash} -> {current_hash}"
+            )
+            self.last_head_hash = current_hash
+            await self.on_head_change(current_hash)
+
     async def start(self):
         self.is_running = True
-        logger.info(f"Git Monitor started for {self.path}.")
+        self._wake = asyncio.Event()
 
         self.last_head_hash = await self.get_head_hash()
 
-        while self.is_running:
-            await asyncio.sleep(self.poll_interval)
-            current_hash = await self.get_head_hash()
+        watching = self.use_fs_events and self._start_observer()
+        self.mode = "events" if watching else "polling"
+        logger.info(f"Git Monitor started for {self.path} ({self.mode}).")
+        timeout = self.fallback_interval if watching else self.poll_interval
 
-            if current_hash and current_hash != self.last_head_hash:
-                logger.info(
-                    f"Git HEAD changed: {self.last_head_hash} -> {current_hash}"
-                )
-                self.last_head_hash = current_hash
-                await self.on_head_change(current_hash)
+        try:
+            while self.is_running:
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    pass
+                if not self.is_running:
+                    break
+                self._wake.clear()
+                await self._check()
+        finally:
+            await self._stop_observer()
+
+    async def _stop_observer(self):
+        if self._observer is not None:
+            try:
+                if self._observer.is_alive():
+                    self._observer.stop()
+                    # Joining waits for the emitter threads; keep the loop free
+                    await asyncio.to_thread(self._observer.join)
+            except Exception as e:
+                logger.warning(f"Error stopping git ref observer: {e}")
+            self._observer = None
 
     def stop(self):
         self.is_running = False
+        if self._wake is not None:
+            self._wake.set()
         logger.info(f"Git Monitor stopping for {self.path}...")
@@ -0,0 +1,240 @@
+"""
+Compiled `.gitignore` matching.
+
+Patterns are translated to regular expressions once. Consecutive rules with
+the same polarity are folded into a single regex per anchoring class
+(basename vs. path, any entry vs. directory-only), so matching an entry costs
+a few regex calls instead of one `fnmatch` per pattern. Negation (`!pattern`),
+anchoring (`/pattern`, `a/b`), `**` and nested `.gitignore` files follow git
+semantics; `IgnoreMatcher.walk` prunes ignored directories before descending.
+"""
+
+import itertools
+import os
+import re
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Pattern, Set, Tuple
+
+
+def translate_pattern(pattern: str) -> str:
+    """Translate a gitignore glob (without `!` and trailing `/`) to a regex."""
+    i, n = 0, len(pattern)
+    out: List[str] = []
+    while i < n:
+        c = pattern[i]
+        if c == "*":
+            if pattern.startswith("**", i) and (i == 0 or pattern[i - 1] == "/"):
+                end = i + 2
+                if end == n:
+                    out.append(".*")  # "a/**": everything inside a/
+                    i = end
+                    continue
+                if pattern[end] == "/":
+                    out.append("(?:.*/)?")  # "**/": zero or more directories
+                    i = end + 1
+                    continue
+            while i + 1 < n and pattern[i + 1] == "*":
+                i += 1
+            out.append("[^/]*")
+        elif c == "?":
+            out.append("[^/]")
+        elif c == "[":
+            j = i + 1
+            if j < n and pattern[j] in "!^":
+                j += 1
+            if j < n and pattern[j] == "]":
+                j += 1
+            while j < n and pattern[j] != "]":
+                j += 1
+            if j >= n:
+                out.append(re.escape(c))
+            else:
+                body = pattern[i + 1 : j]
+                if body[0] in "!^":
+                    body = "^" + body[1:]
+                out.append("[" + body.replace("\\", "\\\\") + "]")
+                i = j
+        elif c == "\\" and i + 1 < n:
+            i += 1
+            out.append(re.escape(pattern[i]))
+        else:
+            out.append(re.escape(c))
+        i += 1
+    return "".join(out)
+
+
+def parse_line(line: str) -> Optional[Tuple[bool, bool, bool, str]]:
+    """
+    Parse one `.gitignore` line.
+
+    Returns:
+        (negate, dir_only, anchored, regex) or None for blanks and comments.
+        Unanchored regexes match the entry's basename, anchored ones the
+        path relative to the `.gitignore` directory.
+    """
+    line = line.rstrip("\r\n")
+    if not line or line.startswith("#"):
+        return None
+    stripped = line.rstrip(" ")
+    if stripped.endswith("\\") and len(stripped) < len(line):
+        stripped += " "  # Escaped trailing space
+    line = stripped
+
+    negate = False
+    if line.startswith("!"):
+        negate = True
+        line = line[1:]
+    elif line.startswith(("\\!", "\\#")):
+        line = line[1:]
+
+    dir_only = line.endswith("/")
+    line = line.rstrip("/")
+    if not line:
+        return None
+
+    # A slash anywhere but the end anchors the pattern to its .gitignore
+    anchored = "/" in line
+    return negate, dir_only, anchored, translate_pattern(line.lstrip("/"))
+
+
+def _compile(regexes: List[str]) -> Optional[Pattern]:
+    if not regexes:
+        return None
+    return re.compile("|".join(f"(?:{r})" for r in regexes), re.DOTALL)
+
+
+class IgnoreRules:
+    """Compiled rules of a single `.gitignore` (paths relative to its directory)."""
+
+    def __init__(self, lines: List[str]):
+        parsed = [rule for rule in map(parse_line, lines) if rule]
+        groups = []
+        for negate, chunk in itertools.groupby(parsed, key=lambda rule: rule[0]):
+            chunk = list(chunk)
+
+            def select(dir_only: bool, anchored: bool) -> Optional[Pattern]:
+                return _compile([r for _, d, a, r in chunk if d == dir_only and a == anchored])
+
+            groups.append(
+                (
+                    negate,
+                    select(False, False),  # basename, any entry
+                    select(True, False),  # basename, directories only
+                    select(False, True),  # anchored path, any entry
+                    select(True, True),  # anchored path, directories only
+                )
+            )
+        # The last matching rule wins, so evaluate groups back to front
+        self._groups = list(reversed(groups))
+
+    def __bool__(self) -> bool:
+        return bool(self._groups)
+
+    def match(self, rel_path: str, is_dir: bool) -> Optional[bool]:
+        """True if ignored, False if re-included by a negation, None if no rule matches."""
+        name = rel_path.rsplit("/", 1)[-1]
+        for negate, name_any, name_dir, path_any, path_dir in self._groups:
+            if (
+                (name_any is not None and name_any.fullmatch(name))
+                or (path_any is not None and path_any.fullmatch(rel_path))
+                or (is_dir and name_dir is not None and name_dir.fullmatch(name))
+                or (is_dir and path_dir is not None and path_dir.fullmatch(rel_path))
+            ):
+                return not negate
+        return None
+
+
+def _read_lines(path: Path) -> List[str]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return f.readlines()
+    except (OSError, UnicodeDecodeError):
+        return []
+
+
+class IgnoreMatcher:
+    """
+    Gitignore matcher for a directory tree.
+
+    Args:
+        root: Tree root; its `.gitignore` is loaded immediately.
+        extra_patterns: Additional root-level patterns, evaluated before the
+            root `.gitignore` (so the latter can negate them).
+        nested: Honour `.gitignore` files in subdirectories.
+    """
+
+    def __init__(self, root: Path, extra_patterns: Optional[List[str]] = None, nested: bool = True):
+        self.root = Path(root)
+        self.nested = nested
+        self._rules: Dict[str, IgnoreRules] = {}
+        self._loaded: Set[str] = {""}
+        rules = IgnoreRules(list(extra_patterns or []) + _read_lines(self.root / ".gitignore"))
+        if rules:
+            self._rules[""] = rules
+
+    def load_directory(self, rel_dir: str):
+        """Load the `.gitignore` of a directory (relative to root) once."""
+        if rel_dir in self._loaded:
+            return
+        self._loaded.add(rel_dir)
+        if not self.nested:
+            return
+        rules = IgnoreRules(_read_lines(self.root / rel_dir / ".gitignore"))
+        if rules:
+            self._rules[rel_dir] = rules
+
+    def _chain(self, rel_dir: str) -> List[Tuple[IgnoreRules, str]]:
+        """Rules applying inside rel_dir, deepest first, with the sub-path prefix."""
+        chain = []
+        parts = rel_dir.split("/") if rel_dir else []
+        for depth in range(len(parts), -1, -1):
+            rules = self._rules.get("/".join(parts[:depth]))
+            if rules is not None:
+                chain.append((rules, "/".join(parts[depth:])))
+        return chain
+
+    @staticmethod
+    def _match_chain(chain: List[Tuple[IgnoreRules, str]], name: str, is_dir: bool) -> bool:
+        for rules, prefix in chain:
+            result = rules.match(f"{prefix}/{name}" if prefix else name, is_dir)
+            if result is not None:
+                return result
+        return False
+
+    def is_ignored(self, rel_path: str, is_dir: bool = False) -> bool:
+        """
+        Check a path relative to root, including its parent directories
+        (an entry inside an ignored directory is always ignored).
+        """
+        parts = rel_path.replace(os.sep, "/").strip("/").split("/")
+        for depth in range(len(parts)):
+            parent = "/".join(parts[:depth])
+            self.load_directory(parent)
+            entry_is_dir = is_dir if depth == len(parts) - 1 else True
+            if self._match_chain(self._chain(parent), parts[depth], entry_is_dir):
+                return True
+        return False
+
+    def walk(self) -> Iterator[Tuple[str, str, List[str], List[str]]]:
+        """
+        Walk the tree like `os.walk`, skipping ignored entries.
+
+        Ignored directories are pruned before descent. Callers may prune
+        further by editing the yielded directory list in place.
+
+        Yields:
+            (dirpath, rel_dir, dirnames, filenames)
+        """
+        root = str(self.root)
+        for dirpath, dirnames, filenames in os.walk(root):
+            rel_dir = os.path.relpath(dirpath, root).replace(os.sep, "/")
+            if rel_dir == ".":
+                rel_dir = ""
+            if ".gitignore" in filenames:
+                self.load_directory(rel_dir)
+            chain = self._chain(rel_dir)
+            dirnames[:] = [
+                d for d in dirnames if d != ".git" and not self._match_chain(chain, d, True)
+            ]
+            files = [f for f in filenames if not self._match_chain(chain, f, False)]
+            yield dirpath, rel_dir, dirnames, files
@@ -21,6 +21,7 @@ from enum import Enum
 from rich.console import Console
 
 from monoco.core.config import get_config
+from monoco.core.resource.sync import sync_tree
 
 console = Console()
 
@@ -231,10 +232,11 @@ def _install_skills(
             
             target_skill = target_dir / skill_dir.name
             try:
-                if target_skill.exists():
-                    shutil.rmtree(target_skill)
-                shutil.copytree(skill_dir, target_skill)
-                console.print(f"[dim]  ✓ Installed skill: {skill_dir.name}[/dim]")
+                result = sync_tree(skill_dir, target_skill, force=force)
+                if result.changed:
+                    console.print(f"[dim]  ✓ Installed skill: {skill_dir.name} ({len(result.written)} files updated)[/dim]")
+                else:
+                    console.print(f"[dim]  = Skill up to date: {skill_dir.name}[/dim]")
                 installed += 1
             except Exception as e:
                 console.print(f"[red]  Failed to install {skill_dir.name}: {e}[/red]")
@@ -275,10 +277,11 @@ def _install_hooks(
             
             target_hook = target_dir / hook_dir.name
             try:
-                if target_hook.exists():
-                    shutil.rmtree(target_hook)
-                shutil.copytree(hook_dir, target_hook)
-                console.print(f"[dim]  ✓ Installed hook: {hook_dir.name}[/dim]")
+                result = sync_tree(hook_dir, target_hook, force=force)
+                if result.changed:
+                    console.print(f"[dim]  ✓ Installed hook: {hook_dir.name} ({len(result.written)} files updated)[/dim]")
+                else:
+                    console.print(f"[dim]  = Hook up to date: {hook_dir.name}[/dim]")
                 installed += 1
             except Exception as e:
                 console.print(f"[red]  Failed to install {hook_dir.name}: {e}[/red]")
@@ -10,7 +10,11 @@ and lazy loading for improved startup performance.
 import importlib
 import importlib.util
 import inspect
+import json
+import os
 import pkgutil
+import tempfile
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -47,6 +51,7 @@ class FeatureMetadata:
     tags: List[str] = field(default_factory=list)
     lazy: bool = False  # Whether this feature supports lazy loading
     priority: int = 100  # Lower values = higher priority for loading order
+    commands: List[str] = field(default_factory=list)  # CLI subcommands served (none: every command)
 
 
 class FeatureModule(MonocoFeature, ABC):
@@ -365,6 +370,7 @@ class FeatureLoader:
     FEATURES_PACKAGE = "monoco.features"
     ADAPTER_MODULE = "adapter"
     FEATURE_CLASS_NAME = "Feature"
+    MANIFEST_VERSION = 1
 
     def __init__(
         self,
@@ -378,6 +384,9 @@ class FeatureLoader:
         self._lazy_queue: Set[str] = set()
         self._load_hooks: List[Callable[[FeatureModule], None]] = []
         self._mount_hooks: List[Callable[[FeatureModule], None]] = []
+        self._manifest: Optional[Dict[str, Dict[str, Any]]] = None
+        # Per-feature timings in seconds: {"issue": {"load": 0.01, "mount": 0.002}}
+        self.timings: Dict[str, Dict[str, float]] = {}
 
     def add_load_hook(self, hook: Callable[[FeatureModule], None]) -> None:
         """Add a hook to be called after a feature is loaded."""
@@ -445,6 +454,7 @@ class FeatureLoader:
             self._lazy_queue.add(name)
             return None
 
+        started = time.perf_counter()
         try:
             module_path = f"{self.FEATURES_PACKAGE}.{name}.{self.ADAPTER_MODULE}"
             module = importlib.import_module(module_path)
@@ -483,6 +493,7 @@ class FeatureLoader:
             instance._state = LifecycleState.LOADED
             self._loaded[name] = instance
             self.registry.register(instance)
+            self.timings.setdefault(name, {})["load"] = time.perf_counter() - started
 
             # Call load hooks
             for hook in self._load_hooks:
@@ -541,7 +552,11 @@ class FeatureLoader:
         if feature is None:
             raise FeatureError(f"Feature '{name}' is not loaded")
 
-        feature.mount(context)
+        started = time.perf_counter()
+        try:
+            feature.mount(context)
+        finally:
+            self.timings.setdefault(name, {})["mount"] = time.perf_counter() - started
 
         for hook in self._mount_hooks:
             hook(feature)
@@ -563,6 +578,143 @@ class FeatureLoader:
 
         return self.registry.mount_all(context)
 
+    @staticmethod
+    def default_manifest_path() -> Path:
+        return Path.home() / ".monoco" / "cache" / "feature-manifest.json"
+
+    def _adapter_fingerprint(self) -> Dict[str, List[int]]:
+        """Stat every discovered adapter; any change invalidates the manifest."""
+        import monoco.features as features_pkg
+
+        package_path = Path(features_pkg.__file__).parent
+        fingerprint = {}
+        for name in sorted(self._discovered):
+            try:
+                stat = (package_path / name / f"{self.ADAPTER_MODULE}.py").stat()
+                fingerprint[name] = [stat.st_mtime_ns, stat.st_size]
+            except OSError:
+                fingerprint[name] = []
+        return fingerprint
+
+    def build_manifest(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Import every discovered adapter and record the metadata needed to
+        route CLI commands to features.
+        """
+        manifest = {}
+        for name in self._discovered:
+            try:
+                feature = self.load(name)
+            except FeatureLoadError as e:
+                print(f"Warning: {e}")
+                continue
+            meta = feature.metadata
+            manifest[name] = {
+                "dependencies": list(meta.dependencies),
+                "commands": list(meta.commands),
+                "priority": meta.priority,
+                "lazy": meta.lazy,
+            }
+        return manifest
+
+    def get_manifest(self, cache_path: Optional[Path] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the feature manifest (dependencies and served subcommands).
+
+        The manifest is cached on disk and rebuilt only when an adapter
+        module changes, so routing a command does not import any adapter.
+
+        Args:
+            cache_path: Manifest location (defaults to ~/.monoco/cache).
+
+        Returns:
+            Dictionary mapping feature names to manifest entries.
+        """
+        if self._manifest is not None:
+            return self._manifest
+        if not self._discovered:
+            self.discover()
+
+        path = cache_path or self.default_manifest_path()
+        fingerprint = self._adapter_fingerprint()
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            if (
+                data.get("version") == self.MANIFEST_VERSION
+                and data.get("fingerprint") == fingerprint
+            ):
+                self._manifest = data["features"]
+                return self._manifest
+        except (OSError, ValueError, KeyError):
+            pass
+
+        self._manifest = self.build_manifest()
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}-", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(
+                        {
+                            "version": self.MANIFEST_VERSION,
+                            "fingerprint": fingerprint,
+                            "features": self._manifest,
+                        },
+                        f,
+                        indent=2,
+                    )
+                os.replace(tmp, path)
+            except BaseException:
+                Path(tmp).unlink(missing_ok=True)
+                raise
+        except OSError:
+            pass
+        return self._manifest
+
+    def features_for_command(self, command: str) -> List[str]:
+        """
+        Resolve the features a CLI subcommand needs, including their
+        (transitive) feature dependencies, in mount priority order.
+
+        Features that declare no commands are not tied to a subcommand
+        (e.g. agent integrations) and are mounted for every command.
+        """
+        manifest = self.get_manifest()
+        selected: List[str] = []
+        pending = [
+            name
+            for name, entry in manifest.items()
+            if not entry.get("commands") or command in entry["commands"]
+        ]
+        while pending:
+            name = pending.pop()
+            if name in selected or name not in manifest:
+                continue  # Non-feature dependencies such as "core"
+            selected.append(name)
+            pending.extend(manifest[name].get("dependencies", []))
+        return sorted(selected, key=lambda n: manifest[n].get("priority", 100))
+
+    def mount_for_command(self, command: str, context: FeatureContext) -> Dict[str, Exception]:
+        """
+        Load and mount only the features serving a CLI subcommand.
+
+        Args:
+            command: Invoked subcommand name (e.g. "issue").
+            context: Feature context for mounting.
+
+        Returns:
+            Dictionary of errors keyed by feature name.
+        """
+        errors = {}
+        for name in self.features_for_command(command):
+            try:
+                if self.registry.get(name) is None:
+                    self.load(name)
+                self.mount(name, context)
+            except Exception as e:
+                errors[name] = e
+        return errors
+
     def unmount(self, name: str) -> None:
         """Unmount a specific feature."""
         feature = self.registry.get(name)
@@ -575,6 +727,8 @@ class FeatureLoader:
 
     def _is_lazy_feature(self, name: str) -> bool:
         """Check if a feature supports lazy loading."""
+        if self._manifest is not None and name in self._manifest:
+            return bool(self._manifest[name].get("lazy"))
         # For now, use a simple heuristic based on known non-critical features
         # In the future, this could be determined from metadata
         lazy_features = {"glossary", "i18n"}
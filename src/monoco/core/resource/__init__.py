@@ -1,5 +1,13 @@
 from .models import ResourceNode, ResourceType
 from .finder import ResourceFinder
 from .manager import ResourceManager
+from .sync import SyncResult, sync_tree
 
-__all__ = ["ResourceNode", "ResourceType", "ResourceFinder", "ResourceManager"]
+__all__ = [
+    "ResourceNode",
+    "ResourceType",
+    "ResourceFinder",
+    "ResourceManager",
+    "SyncResult",
+    "sync_tree",
+]
@@ -0,0 +1,284 @@
+"""
+Content-hash incremental sync for packaged resources.
+
+Skill and hook packages are copied into many projects and agent directories.
+Instead of deleting and re-copying every directory on each run, `sync_tree`
+compares a content-hash manifest of the source directory against what the
+previous sync wrote into the target, and writes only files whose hash changed
+(or that went missing or were edited in place).
+
+What each target received is recorded in one state file,
+`~/.monoco/resource-sync.json`, so installed skill and hook directories
+contain only the packaged files.
+
+Source manifests are cached per package version in
+`~/.monoco/cache/resources-<version>.json`; cached hashes are reused while a
+file's size and mtime are unchanged, so editable installs stay correct.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# Per-directory stamp written by earlier versions; read once and removed
+LEGACY_STAMP_FILE = ".monoco-sync.json"
+MANIFEST_VERSION = 1
+STATE_VERSION = 1
+
+
+@dataclass
+class SyncResult:
+    """Outcome of a `sync_tree` call (relative file paths)."""
+
+    written: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    unchanged: int = 0
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.written or self.removed)
+
+
+def _package_version() -> str:
+    import importlib.metadata
+
+    try:
+        return importlib.metadata.version("monoco-toolkit")
+    except importlib.metadata.PackageNotFoundError:
+        return "dev"
+
+
+def _hash_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ResourceManifestCache:
+    """
+    Per-version cache of source directory manifests.
+
+    Entries are `{relative_path: [size, mtime_ns, sha256]}` per source dir.
+    """
+
+    def __init__(self, cache_path: Optional[Path] = None):
+        self.cache_path = cache_path or (
+            Path.home() / ".monoco" / "cache" / f"resources-{_package_version()}.json"
+        )
+        self._dirs: Optional[Dict[str, Dict[str, list]]] = None
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def _load(self):
+        self._dirs = {}
+        try:
+            data = json.loads(self.cache_path.read_text(encoding="utf-8"))
+            if data.get("version") == MANIFEST_VERSION:
+                self._dirs = data.get("dirs", {})
+        except (OSError, ValueError):
+            pass
+
+    def save(self):
+        with self._lock:
+            if not self._dirty or self._dirs is None:
+                return
+            try:
+                self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp = tempfile.mkstemp(
+                    dir=self.cache_path.parent, prefix=f".{self.cache_path.name}-", suffix=".tmp"
+                )
+                try:
+                    with os.fdopen(fd, "w", encoding="utf-8") as f:
+                        json.dump({"version": MANIFEST_VERSION, "dirs": self._dirs}, f)
+                    os.replace(tmp, self.cache_path)
+                except BaseException:
+                    Path(tmp).unlink(missing_ok=True)
+                    raise
+                self._dirty = False
+            except OSError:
+                pass
+
+    def manifest(self, source_dir: Path) -> Dict[str, str]:
+        """Return `{relative_path: sha256}` for every file under source_dir."""
+        source_dir = Path(source_dir).resolve()
+        key = str(source_dir)
+        with self._lock:
+            if self._dirs is None:
+                self._load()
+            cached = self._dirs.get(key, {})
+            entries: Dict[str, list] = {}
+            for path in sorted(source_dir.rglob("*")):
+                if not path.is_file() or "__pycache__" in path.parts or path.name == LEGACY_STAMP_FILE:
+                    continue
+                rel = path.relative_to(source_dir).as_posix()
+                stat = path.stat()
+                previous = cached.get(rel)
+                if previous and previous[0] == stat.st_size and previous[1] == stat.st_mtime_ns:
+                    entries[rel] = previous
+                else:
+                    entries[rel] = [stat.st_size, stat.st_mtime_ns, _hash_file(path)]
+            if entries != cached:
+                self._dirs[key] = entries
+                self._dirty = True
+            return {rel: entry[2] for rel, entry in entries.items()}
+
+
+_manifest_cache: Optional[ResourceManifestCache] = None
+
+
+def get_manifest_cache() -> ResourceManifestCache:
+    global _manifest_cache
+    if _manifest_cache is None:
+        _manifest_cache = ResourceManifestCache()
+    return _manifest_cache
+
+
+class SyncState:
+    """
+    What `sync_tree` last wrote into each target directory.
+
+    Entries are `{target_dir: {relative_path: [sha256, size, mtime_ns]}}`;
+    size and mtime are those of the installed copy, so a file edited or
+    replaced in the target is rewritten on the next sync.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = path or Path.home() / ".monoco" / "resource-sync.json"
+        self._targets: Optional[Dict[str, Dict[str, list]]] = None
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def _load(self) -> Dict[str, Dict[str, list]]:
+        if self._targets is None:
+            self._targets = {}
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+                if data.get("version") == STATE_VERSION:
+                    self._targets = data.get("targets", {})
+            except (OSError, ValueError):
+                pass
+        return self._targets
+
+    def get(self, target_dir: Path) -> Dict[str, list]:
+        with self._lock:
+            return dict(self._load().get(str(Path(target_dir).resolve()), {}))
+
+    def set(self, target_dir: Path, files: Dict[str, list]) -> None:
+        key = str(Path(target_dir).resolve())
+        with self._lock:
+            targets = self._load()
+            if targets.get(key) != files:
+                targets[key] = files
+                self._dirty = True
+
+    def save(self) -> None:
+        with self._lock:
+            if not self._dirty or self._targets is None:
+                return
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp = tempfile.mkstemp(dir=self.path.parent, prefix=f".{self.path.name}-", suffix=".tmp")
+                try:
+                    with os.fdopen(fd, "w", encoding="utf-8") as f:
+                        json.dump({"version": STATE_VERSION, "targets": self._targets}, f, sort_keys=True)
+                    os.replace(tmp, self.path)
+                except BaseException:
+                    Path(tmp).unlink(missing_ok=True)
+                    raise
+                self._dirty = False
+            except OSError:
+                pass
+
+
+_sync_state: Optional[SyncState] = None
+
+
+def get_sync_state() -> SyncState:
+    global _sync_state
+    if _sync_state is None:
+        _sync_state = SyncState()
+    return _sync_state
+
+
+def _read_legacy_stamp(target_dir: Path) -> Dict[str, str]:
+    try:
+        data = json.loads((target_dir / LEGACY_STAMP_FILE).read_text(encoding="utf-8"))
+        return data.get("files", {})
+    except (OSError, ValueError):
+        return {}
+
+
+def _installed(dest: Path, entry: Optional[list], digest: str) -> bool:
+    """Whether dest still is the copy of `digest` recorded in entry."""
+    if not entry or entry[0] != digest:
+        return False
+    try:
+        stat = dest.stat()
+    except OSError:
+        return False
+    return stat.st_size == entry[1] and stat.st_mtime_ns == entry[2]
+
+
+def sync_tree(
+    source_dir: Path,
+    target_dir: Path,
+    force: bool = False,
+    cache: Optional[ResourceManifestCache] = None,
+    state: Optional[SyncState] = None,
+) -> SyncResult:
+    """
+    Make target_dir mirror source_dir, writing only changed files.
+
+    Files written by a previous sync but no longer in the source are
+    removed; files the user added to target_dir are left alone.
+
+    Args:
+        source_dir: Packaged resource directory (e.g. a skill folder).
+        target_dir: Installed copy.
+        force: Rewrite every file regardless of the recorded state.
+        cache: Manifest cache (defaults to the shared per-version cache).
+        state: Sync state (defaults to ~/.monoco/resource-sync.json).
+
+    Returns:
+        SyncResult listing written and removed files.
+    """
+    cache = cache or get_manifest_cache()
+    state = state or get_sync_state()
+    manifest = cache.manifest(source_dir)
+    previous = state.get(target_dir)
+    legacy_stamp = target_dir / LEGACY_STAMP_FILE
+    owned = set(previous) | set(_read_legacy_stamp(target_dir))
+    result = SyncResult()
+    files: Dict[str, list] = {}
+
+    for rel, digest in manifest.items():
+        dest = target_dir / rel
+        if not force and _installed(dest, previous.get(rel), digest):
+            files[rel] = previous[rel]
+            result.unchanged += 1
+            continue
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        if dest.is_dir():
+            shutil.rmtree(dest)
+        shutil.copy2(source_dir / rel, dest)
+        stat = dest.stat()
+        files[rel] = [digest, stat.st_size, stat.st_mtime_ns]
+        result.written.append(rel)
+
+    for rel in sorted(owned - set(manifest)):
+        (target_dir / rel).unlink(missing_ok=True)
+        result.removed.append(rel)
+
+    legacy_stamp.unlink(missing_ok=True)
+    state.set(target_dir, files)
+    state.save()
+    cache.save()
+    return result
@@ -8,6 +8,8 @@ Agent lifecycle management.
 import asyncio
 import inspect
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum, auto
 from typing import Dict, List, Callable, Any, Optional, Union
 from dataclasses import dataclass, field
@@ -77,6 +79,119 @@ class AgentEvent:
 
 EventHandler = Callable[[AgentEvent], Any]
 
+# Upper bounds (seconds) of the handler latency histogram buckets.
+# The last bucket counts everything slower than the largest bound.
+LATENCY_BUCKETS = (0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0)
+
+
+def _handler_name(handler: Callable) -> str:
+    """Stable, human readable name for a handler (used as metrics key)."""
+    name = getattr(handler, "__qualname__", None)
+    if name is None:
+        name = type(handler).__qualname__
+    module = getattr(handler, "__module__", None) or type(handler).__module__
+    return f"{module}.{name}" if module else name
+
+
+@dataclass
+class HandlerMetrics:
+    """Latency histogram and error counters for a single handler."""
+    calls: int = 0
+    errors: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    buckets: List[int] = field(
+        default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1)
+    )
+
+    def observe(self, seconds: float, failed: bool = False):
+        self.calls += 1
+        if failed:
+            self.errors += 1
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+        for i, bound in enumerate(LATENCY_BUCKETS):
+            if seconds <= bound:
+                self.buckets[i] += 1
+                break
+        else:
+            self.buckets[-1] += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        labels = [f"le_{bound}" for bound in LATENCY_BUCKETS] + ["le_inf"]
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "avg_ms": round(self.total_seconds / self.calls * 1000, 3) if self.calls else 0.0,
+            "max_ms": round(self.max_seconds * 1000, 3),
+            "histogram": dict(zip(labels, self.buckets)),
+        }
+
+
+@dataclass
+class LaneMetrics:
+    """Counters for a per-event-type dispatch lane."""
+    published: int = 0
+    dispatched: int = 0
+    errors: int = 0
+    max_queue_depth: int = 0
+
+
+class _DispatchLane:
+    """
+    Dispatch lane for a single event type.
+
+    Each lane owns its queue and worker, so a slow handler for one event
+    type never delays events of another type. Within a lane, at most
+    ``max_concurrency`` events are dispatched at the same time; the limit is
+    a plain counter, so it can be changed while events are in flight.
+    """
+
+    def __init__(self, event_type: AgentEventType, max_concurrency: int):
+        self.event_type = event_type
+        self.max_concurrency = max(1, max_concurrency)
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.metrics = LaneMetrics()
+        self.worker: Optional[asyncio.Task] = None
+        self.in_flight: set = set()
+        self.active = 0
+        self._slot_freed: Optional[asyncio.Event] = None
+
+    @property
+    def slot_freed(self) -> asyncio.Event:
+        # Created lazily so it binds to the running loop
+        if self._slot_freed is None:
+            self._slot_freed = asyncio.Event()
+        return self._slot_freed
+
+    async def acquire(self):
+        """Wait for a dispatch slot (only the lane worker waits here)."""
+        while self.active >= self.max_concurrency:
+            self.slot_freed.clear()
+            await self.slot_freed.wait()
+        self.active += 1
+
+    def release(self):
+        self.active -= 1
+        self.slot_freed.set()
+
+    def resize(self, max_concurrency: int):
+        self.max_concurrency = max(1, max_concurrency)
+        # Wake the worker in case the new limit frees a slot
+        if self._slot_freed is not None:
+            self._slot_freed.set()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "queue_depth": self.queue.qsize(),
+            "max_queue_depth": self.metrics.max_queue_depth,
+            "in_flight": len(self.in_flight),
+            "max_concurrency": self.max_concurrency,
+            "published": self.metrics.published,
+            "dispatched": self.metrics.dispatched,
+            "errors": self.metrics.errors,
+        }
+
 
 class EventBus:
     """
@@ -86,73 +201,144 @@ class EventBus:
     - Subscribe/unsubscribe handlers for specific event types
     - Publish events to all subscribed handlers
     - Async handler execution
+    - Per-event-type dispatch lanes; events of one type are dispatched in
+      publish order unless a lane opts into concurrency
+    - Sync handlers offloaded to a thread pool
+    - Queue depth, handler latency and error metrics via get_stats()
     """
     
-    def __init__(self):
+    def __init__(self, max_concurrency_per_lane: int = 1, sync_workers: int = 4):
         self._handlers: Dict[AgentEventType, List[EventHandler]] = {
             event_type: [] for event_type in AgentEventType
         }
         self._lock = asyncio.Lock()
-        self._event_queue: asyncio.Queue = asyncio.Queue()
-        self._dispatch_task: Optional[asyncio.Task] = None
+        self._max_concurrency_per_lane = max_concurrency_per_lane
+        self._sync_workers = sync_workers
+        self._lanes: Dict[AgentEventType, _DispatchLane] = {}
+        self._handler_metrics: Dict[AgentEventType, Dict[str, HandlerMetrics]] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
         self._running = False
     
     async def start(self):
-        """Start the event dispatch loop."""
+        """Start the event dispatch lanes."""
         if self._running:
             return
         self._running = True
-        self._dispatch_task = asyncio.create_task(self._dispatch_loop())
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._sync_workers,
+                thread_name_prefix="monoco-eventbus",
+            )
+        # Events published before start() are drained now
+        for lane in self._lanes.values():
+            self._start_lane(lane)
         logger.info("EventBus started")
     
     async def stop(self):
-        """Stop the event dispatch loop."""
+        """Stop all dispatch lanes and the sync handler pool."""
         if not self._running:
             return
         self._running = False
-        if self._dispatch_task:
-            self._dispatch_task.cancel()
-            try:
-                await self._dispatch_task
-            except asyncio.CancelledError:
-                pass
+        tasks = []
+        for lane in self._lanes.values():
+            if lane.worker:
+                lane.worker.cancel()
+                tasks.append(lane.worker)
+                lane.worker = None
+            for task in list(lane.in_flight):
+                task.cancel()
+                tasks.append(task)
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        if self._executor:
+            self._executor.shutdown(wait=False)
+            self._executor = None
         logger.info("EventBus stopped")
+
+    def set_lane_concurrency(self, event_type: AgentEventType, max_concurrency: int):
+        """
+        Override the concurrency limit of a single lane.
+
+        Lanes default to ``1`` (strict publish order); raise it only for event
+        types whose handlers do not depend on ordering. Takes effect
+        immediately: after lowering the limit, no new event is dispatched
+        until the in-flight count drops below it.
+        """
+        self._get_lane(event_type).resize(max_concurrency)
+
+    def _get_lane(self, event_type: AgentEventType) -> _DispatchLane:
+        lane = self._lanes.get(event_type)
+        if lane is None:
+            lane = _DispatchLane(event_type, self._max_concurrency_per_lane)
+            self._lanes[event_type] = lane
+            if self._running:
+                self._start_lane(lane)
+        return lane
+
+    def _start_lane(self, lane: _DispatchLane):
+        if lane.worker is None or lane.worker.done():
+            lane.worker = asyncio.create_task(self._lane_loop(lane))
     
-    async def _dispatch_loop(self):
-        """Background loop to dispatch events."""
+    async def _lane_loop(self, lane: _DispatchLane):
+        """Background loop dispatching the events of a single lane."""
         while self._running:
             try:
-                event = await asyncio.wait_for(self._event_queue.get(), timeout=1.0)
-                await self._dispatch_event(event)
-            except asyncio.TimeoutError:
-                continue
+                event = await lane.queue.get()
+                await lane.acquire()
+                task = asyncio.create_task(self._run_in_lane(lane, event))
+                lane.in_flight.add(task)
+                task.add_done_callback(lane.in_flight.discard)
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 logger.error(f"Error dispatching event: {e}")
+
+    async def _run_in_lane(self, lane: _DispatchLane, event: AgentEvent):
+        try:
+            lane.metrics.errors += await self._dispatch_event(event)
+            lane.metrics.dispatched += 1
+        except Exception as e:
+            lane.metrics.errors += 1
+            logger.error(f"Error dispatching event {event.type.value}: {e}")
+        finally:
+            lane.release()
     
-    async def _dispatch_event(self, event: AgentEvent):
-        """Dispatch event to all subscribed handlers."""
-        handlers = self._handlers.get(event.type, [])
+    async def _dispatch_event(self, event: AgentEvent) -> int:
+        """Dispatch event to all subscribed handlers. Returns the number of failures."""
+        handlers = list(self._handlers.get(event.type, []))
         if not handlers:
             logger.debug(f"No handlers for event {event.type.value}")
-            return
+            return 0
         
         logger.debug(f"Dispatching {event.type.value} to {len(handlers)} handlers")
         
         # Execute handlers concurrently
-        tasks = []
-        for handler in handlers:
-            try:
-                if _is_async_handler(handler):
-                    tasks.append(asyncio.create_task(handler(event)))
-                else:
-                    handler(event)
-            except Exception as e:
-                logger.error(f"Handler error for {event.type.value}: {e}")
-        
-        if tasks:
-            await asyncio.gather(*tasks, return_exceptions=True)
+        results = await asyncio.gather(
+            *(self._invoke_handler(handler, event) for handler in handlers)
+        )
+        return sum(1 for ok in results if not ok)
+
+    async def _invoke_handler(self, handler: EventHandler, event: AgentEvent) -> bool:
+        """Run one handler, recording its latency and failures."""
+        metrics = self._handler_metrics.setdefault(event.type, {}).setdefault(
+            _handler_name(handler), HandlerMetrics()
+        )
+        started = time.perf_counter()
+        failed = False
+        try:
+            if _is_async_handler(handler):
+                await handler(event)
+            else:
+                loop = asyncio.get_running_loop()
+                await loop.run_in_executor(self._executor, handler, event)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            failed = True
+            logger.error(f"Handler error for {event.type.value}: {e}")
+        finally:
+            metrics.observe(time.perf_counter() - started, failed)
+        return not failed
     
     def subscribe(self, event_type: AgentEventType, handler: EventHandler):
         """Subscribe a handler to an event type."""
@@ -169,7 +355,10 @@ class EventBus:
     async def publish(self, event_type: AgentEventType, payload: Dict[str, Any], source: str = None):
         """Publish an event to the bus."""
         event = AgentEvent(type=event_type, payload=payload, source=source)
-        await self._event_queue.put(event)
+        lane = self._get_lane(event_type)
+        await lane.queue.put(event)
+        lane.metrics.published += 1
+        lane.metrics.max_queue_depth = max(lane.metrics.max_queue_depth, lane.queue.qsize())
         logger.debug(f"Published event {event_type.value}")
     
     def get_subscriber_count(self, event_type: AgentEventType) -> int:
@@ -180,12 +369,22 @@ class EventBus:
         """Get event bus statistics."""
         return {
             "running": self._running,
-            "queue_size": self._event_queue.qsize(),
+            "queue_size": sum(lane.queue.qsize() for lane in self._lanes.values()),
             "subscribers": {
                 event_type.value: len(handlers)
                 for event_type, handlers in self._handlers.items()
                 if handlers
-            }
+            },
+            "lanes": {
+                event_type.value: lane.to_dict()
+                for event_type, lane in self._lanes.items()
+            },
+            "handlers": {
+                event_type.value: {
+                    name: metrics.to_dict() for name, metrics in by_handler.items()
+                }
+                for event_type, by_handler in self._handler_metrics.items()
+            },
         }
 
 
@@ -1,19 +1,243 @@
-import os
-import uuid
-import json
+"""
+Anonymous usage telemetry.
+
+Capturing an event is a single append to a local spool
+(`~/.monoco/telemetry/spool.jsonl`); nothing touches the network on the CLI
+hot path. Spooled events are delivered in batches by `flush_spool`, which runs
+either in a detached `python -m monoco.core.telemetry` process spawned at most
+once per `FLUSH_INTERVAL`, or periodically inside the daemon.
 
+Delivery goes through a `TelemetrySink` so the flusher can be pointed at a
+local stub server in tests.
+"""
+
+import json
+import logging
+import os
+import subprocess
+import sys
 import time
+import uuid
+from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Any, Dict, List, Optional, Tuple
+
 from monoco.core.config import get_config
 
+logger = logging.getLogger("monoco.core.telemetry")
+
 POSTHOG_API_KEY = "phc_MndV8H8v0W3P7Yv1P7Z8X7X7X7X7X7X7X7X7"
 POSTHOG_HOST = "https://app.posthog.com"
 
+# Spool limits
+MAX_SPOOL_BYTES = 1024 * 1024  # New events are dropped beyond this size
+MAX_EVENT_AGE = 7 * 24 * 3600  # Events older than this are discarded on flush
+BATCH_SIZE = 100
+FLUSH_INTERVAL = 300  # Minimum seconds between background flushes
+STALE_CLAIM_AGE = 600  # Reclaim batches left behind by a crashed flusher
+
+
+def get_spool_dir() -> Path:
+    return Path.home() / ".monoco" / "telemetry"
+
+
+def is_enabled() -> bool:
+    """Telemetry is opt-in: nothing is sent unless `telemetry.enabled` is true."""
+    try:
+        return get_config().telemetry.enabled is True
+    except Exception:
+        return False
+
+
+class TelemetrySink(ABC):
+    """Destination for batches of spooled events."""
+
+    @abstractmethod
+    def send(self, events: List[Dict[str, Any]]) -> None:
+        """Deliver a batch. Raise on failure so the batch is kept for retry."""
+
+
+class PostHogSink(TelemetrySink):
+    """Sends batches to the PostHog `/batch/` endpoint."""
+
+    def __init__(self, host: str = POSTHOG_HOST, api_key: str = POSTHOG_API_KEY, timeout: float = 5.0):
+        self.host = host.rstrip("/")
+        self.api_key = api_key
+        self.timeout = timeout
+
+    def send(self, events: List[Dict[str, Any]]) -> None:
+        import httpx
+
+        response = httpx.post(
+            f"{self.host}/batch/",
+            json={"api_key": self.api_key, "batch": events},
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+
+
+class TelemetrySpool:
+    """
+    Append-only JSONL event spool.
+
+    Writers append one line per event. A flusher claims the whole spool by
+    renaming it, so appends that race with a flush simply land in a fresh
+    spool file. Claim files carry their claim time in the name; stale ones
+    are taken over by renaming them to a fresh claim, so only one flusher
+    can win each.
+    """
+
+    def __init__(self, directory: Optional[Path] = None, max_bytes: int = MAX_SPOOL_BYTES):
+        self.directory = Path(directory) if directory else get_spool_dir()
+        self.max_bytes = max_bytes
+
+    @property
+    def path(self) -> Path:
+        return self.directory / "spool.jsonl"
+
+    @property
+    def marker_path(self) -> Path:
+        return self.directory / "last_flush"
+
+    def size(self) -> int:
+        try:
+            return self.path.stat().st_size
+        except OSError:
+            return 0
+
+    def append(self, record: Dict[str, Any]) -> bool:
+        """Append an event. Returns False if the spool is full."""
+        if self.size() >= self.max_bytes:
+            return False
+        line = json.dumps(record, separators=(",", ":")) + "\n"
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(line)
+        return True
+
+    def _claim_path(self) -> Path:
+        return self.directory / f"flushing-{int(time.time())}-{os.getpid()}-{uuid.uuid4().hex[:8]}.jsonl"
+
+    @staticmethod
+    def _claimed_at(path: Path) -> float:
+        try:
+            return float(path.name.split("-")[1])
+        except (IndexError, ValueError):
+            return 0.0
+
+    def claim(self) -> List[Path]:
+        """Move the spool (and stale claims) aside for flushing."""
+        claimed: List[Path] = []
+        now = time.time()
+        for stale in self.directory.glob("flushing-*.jsonl"):
+            if now - self._claimed_at(stale) <= STALE_CLAIM_AGE:
+                continue
+            target = self._claim_path()
+            try:
+                stale.rename(target)
+                claimed.append(target)
+            except OSError:
+                pass  # Taken over by another flusher
+        target = self._claim_path()
+        try:
+            self.path.rename(target)
+            claimed.append(target)
+        except OSError:
+            pass
+        return claimed
+
+    @staticmethod
+    def read(path: Path) -> List[Dict[str, Any]]:
+        records = []
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        records.append(json.loads(line))
+                    except ValueError:
+                        continue  # Torn write
+        except OSError:
+            pass
+        return records
+
+    def requeue(self, records: List[Dict[str, Any]]):
+        """Put undelivered records back into the spool."""
+        if not records:
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            for record in records:
+                f.write(json.dumps(record, separators=(",", ":")) + "\n")
+
+    def flush_due(self, interval: float = FLUSH_INTERVAL) -> bool:
+        if self.size() == 0:
+            return False
+        try:
+            return time.time() - self.marker_path.stat().st_mtime >= interval
+        except OSError:
+            return True
+
+    def touch_marker(self):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.marker_path.touch()
+
+
+def flush_spool(
+    sink: Optional[TelemetrySink] = None,
+    spool: Optional[TelemetrySpool] = None,
+    batch_size: int = BATCH_SIZE,
+    max_age: float = MAX_EVENT_AGE,
+) -> Tuple[int, int]:
+    """
+    Deliver spooled events in batches.
+
+    Events older than `max_age` are dropped. If the sink fails, the current
+    and remaining batches are written back to the spool for the next flush.
+
+    Returns:
+        (sent, dropped) event counts.
+    """
+    sink = sink or PostHogSink()
+    spool = spool or TelemetrySpool()
+    spool.touch_marker()
+
+    sent = dropped = 0
+    cutoff = time.time() - max_age
+    for claimed in spool.claim():
+        records = spool.read(claimed)
+        fresh = [r for r in records if r.get("spooled_at", 0) >= cutoff]
+        dropped += len(records) - len(fresh)
+        for start in range(0, len(fresh), batch_size):
+            batch = fresh[start:start + batch_size]
+            try:
+                sink.send([{k: v for k, v in r.items() if k != "spooled_at"} for r in batch])
+            except Exception as e:
+                logger.debug(f"Telemetry flush failed, requeueing: {e}")
+                spool.requeue(fresh[start:])
+                break
+            sent += len(batch)
+        claimed.unlink(missing_ok=True)
+    return sent, dropped
+
+
+def spawn_flush():
+    """Flush the spool in a detached background process."""
+    try:
+        subprocess.Popen(
+            [sys.executable, "-m", "monoco.core.telemetry"],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+    except OSError:
+        pass
+
 
 class Telemetry:
-    def __init__(self):
+    def __init__(self, spool: Optional[TelemetrySpool] = None):
         self.config = get_config()
+        self.spool = spool or TelemetrySpool()
         self._device_id = self._get_or_create_device_id()
 
     def _get_or_create_device_id(self) -> str:
@@ -65,22 +289,21 @@ class Telemetry:
         if properties:
             props.update(properties)
 
-        data = {
-            "api_key": POSTHOG_API_KEY,
+        record = {
             "event": namespaced_event,
             "properties": props,
             "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "spooled_at": time.time(),
         }
 
-        # Send asynchronously? For now, we'll do a simple non-blocking-ish call
         try:
-            import httpx
-
-            httpx.post(f"{POSTHOG_HOST}/capture/", json=data, timeout=1.0)
-        except ImportError:
-            pass  # Telemetry is optional
-        except Exception:
-            pass
+            self.spool.append(record)
+            if self.spool.flush_due():
+                # Touch first so concurrent commands don't all spawn a flusher
+                self.spool.touch_marker()
+                spawn_flush()
+        except OSError:
+            pass  # Telemetry must never break the CLI
 
 
 _instance = None
@@ -91,3 +314,8 @@ def capture_event(event: str, properties: Optional[Dict[str, Any]] = None):
     if _instance is None:
         _instance = Telemetry()
     _instance.capture(event, properties)
+
+
+if __name__ == "__main__":
+    if is_enabled():
+        flush_spool()
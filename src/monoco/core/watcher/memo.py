@@ -9,7 +9,6 @@ from __future__ import annotations
 
 import asyncio
 import logging
-import re
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -78,6 +77,9 @@ class MemoWatcher(PollingWatcher):
     - File existence = signal pending
     - File empty = no signals
     - Consumer clears file = signals consumed
+
+    The inbox is an append-only log, so each poll reads only the bytes
+    appended since the previous one (see `InboxTail`).
     
     Example:
         >>> config = WatchConfig(
@@ -88,9 +90,6 @@ class MemoWatcher(PollingWatcher):
         >>> await watcher.start()
     """
     
-    # Regex to match memo headers (## [uid])
-    MEMO_HEADER_PATTERN = re.compile(r"^##\s*\[[a-f0-9]+\]", re.MULTILINE)
-    
     def __init__(
         self,
         config: WatchConfig,
@@ -102,6 +101,10 @@ class MemoWatcher(PollingWatcher):
         self.threshold = threshold
         self._last_memo_count = 0
         self._threshold_crossed = False
+        # Deferred: the memo feature package pulls in its CLI on import
+        from monoco.features.memo.log import InboxTail
+
+        self._tail = InboxTail(config.path)
     
     async def _check_changes(self) -> None:
         """Check for memo changes."""
@@ -109,8 +112,7 @@ class MemoWatcher(PollingWatcher):
             return
         
         try:
-            content = self._read_file_content(self.config.path) or ""
-            memo_count = self._count_memos(content)
+            memo_count = self._tail.poll()
             
             # Check if count changed
             if memo_count != self._last_memo_count:
@@ -168,13 +170,21 @@ class MemoWatcher(PollingWatcher):
         In Signal Queue Model:
         - Each memo has a header like: ## [uid] YYYY-MM-DD HH:MM:SS
         - We count headers to determine number of pending signals
+        - Tombstones (`<!-- memo-deleted: uid -->`) cancel earlier headers
         """
         if not content or not content.strip():
             return 0
         
-        # Count memo headers
-        matches = self.MEMO_HEADER_PATTERN.findall(content)
-        return len(matches)
+        from monoco.features.memo.log import RECORD_RE
+
+        live: Dict[str, int] = {}
+        for match in RECORD_RE.finditer(content.encode("utf-8")):
+            uid, dead = match.group("uid"), match.group("dead")
+            if uid is not None:
+                live[uid] = live.get(uid, 0) + 1
+            elif dead is not None:
+                live.pop(dead, None)
+        return sum(live.values())
     
     def set_threshold(self, threshold: int) -> None:
         """Update the threshold value."""
@@ -188,5 +198,6 @@ class MemoWatcher(PollingWatcher):
             "memo_count": self._last_memo_count,
             "threshold": self.threshold,
             "threshold_crossed": self._threshold_crossed,
+            "bytes_read": self._tail.bytes_read,
         })
         return stats
@@ -457,3 +457,12 @@ async def update_daemon_state(state: DaemonState):
         )
 
 
+@app.get("/api/v1/scheduler/stats")
+async def get_scheduler_stats():
+    """
+    Scheduler statistics, including EventBus lane depth and handler metrics.
+    """
+    if not scheduler_service:
+        raise HTTPException(status_code=503, detail="Daemon not initialized")
+
+    return scheduler_service.get_stats()
@@ -25,6 +25,8 @@ from monoco.core.scheduler import (
 from monoco.core.watcher import WatchConfig, IssueWatcher, MemoWatcher, TaskWatcher
 from monoco.core.automation.handlers import start_all_handlers, stop_all_handlers
 from monoco.core.config import get_config
+from monoco.core import git, telemetry
+from monoco.features.issue.branch_index import get_branch_issue_index
 
 logger = logging.getLogger("monoco.daemon.scheduler")
 
@@ -74,6 +76,13 @@ class SchedulerService:
         # Background tasks
         self._tasks: List[asyncio.Task] = []
         self._running = False
+
+        # Cross-branch issue index warming
+        self.branch_index_interval = 30.0
+        self.branch_index_batch = 20
+
+        # Telemetry spool delivery
+        self.telemetry_flush_interval = float(telemetry.FLUSH_INTERVAL)
     
     def _load_scheduler_config(self) -> Dict[str, Any]:
         """Load scheduler configuration from config files and env vars."""
@@ -121,6 +130,12 @@ class SchedulerService:
         # 4. Start Handlers (FEAT-0162)
         self.handlers = start_all_handlers(self.agent_scheduler)
         
+        # 5. Warm cross-branch issue indexes in the background
+        self._tasks.append(asyncio.create_task(self._warm_branch_indexes()))
+        
+        # 6. Deliver spooled telemetry events in batches
+        self._tasks.append(asyncio.create_task(self._flush_telemetry()))
+        
         logger.info("Scheduler Service started with unified event-driven architecture")
     
     def stop(self):
@@ -180,6 +195,46 @@ class SchedulerService:
         
         logger.info(f"Setup {len(self.watchers)} watchers")
     
+    async def _warm_branch_indexes(self):
+        """
+        Incrementally index branch tips for cross-branch issue lookups.
+
+        Each cycle re-indexes at most `branch_index_batch` moved branch tips
+        per project, so a repository with hundreds of branches warms up over
+        a few cycles without stalling the daemon.
+        """
+        while self._running:
+            for project_ctx in list(self.project_manager.projects.values()):
+                try:
+                    if not await asyncio.to_thread(git.is_git_repo, project_ctx.path):
+                        continue
+                    issues_path = project_ctx.issues_root.relative_to(project_ctx.path).as_posix()
+                    index = get_branch_issue_index(project_ctx.path, issues_path)
+                    indexed = await asyncio.to_thread(
+                        index.refresh, self.branch_index_batch
+                    )
+                    if indexed:
+                        logger.debug(f"Indexed {indexed} branch tips for {project_ctx.id}")
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.warning(f"Branch index warm-up failed for {project_ctx.id}: {e}")
+            await asyncio.sleep(self.branch_index_interval)
+
+    async def _flush_telemetry(self):
+        """Periodically deliver the CLI telemetry spool while the daemon runs (if opted in)."""
+        spool = telemetry.TelemetrySpool()
+        while self._running:
+            try:
+                if spool.size() > 0 and telemetry.is_enabled():
+                    sent, dropped = await asyncio.to_thread(telemetry.flush_spool, None, spool)
+                    logger.debug(f"Flushed telemetry spool: {sent} sent, {dropped} expired")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Telemetry flush failed: {e}")
+            await asyncio.sleep(self.telemetry_flush_interval)
+    
     def get_stats(self) -> Dict[str, Any]:
         """Get scheduler service statistics."""
         return {
@@ -13,8 +13,9 @@ class AgentFeature(FeatureModule):
             name="agent",
             version="1.0.0",
             description="Agent session and role management",
-            dependencies=["core"],
+            dependencies=["core", "issue"],  # Works inside the Issues tree
             priority=20,
+            commands=["agent", "ralph"],
         )
 
     def _on_mount(self, context: "FeatureContext") -> None:  # type: ignore
@@ -15,9 +15,11 @@ Key Responsibilities:
 
 import shutil
 from pathlib import Path
-from typing import List, Set
+from typing import List, Optional, Set
 from rich.console import Console
 
+from monoco.core.resource.sync import SyncResult, sync_tree
+
 console = Console()
 
 # Prefix for injected flow skills to avoid conflicts
@@ -75,39 +77,41 @@ def discover_flow_skills(resources_dir: Path) -> List[Path]:
     return sorted(flow_skills)
 
 
+def _inject(skill_dir: Path, target_dir: Path, prefix: str, force: bool) -> Optional[SyncResult]:
+    """Sync one flow skill into target_dir, reporting progress; None on failure."""
+    # e.g., flow_engineer -> monoco_flow_engineer
+    target_skill_name = f"{prefix}{skill_dir.name}"
+    try:
+        result = sync_tree(skill_dir, target_dir / target_skill_name, force=force)
+    except Exception as e:
+        console.print(f"[red]  ✗ Failed to inject {skill_dir.name}: {e}[/red]")
+        return None
+
+    if result.changed:
+        console.print(f"[green]  ✓ Injected {target_skill_name}/[/green]")
+    else:
+        console.print(f"[dim]  = {target_skill_name}/ is up to date[/dim]")
+    return result
+
+
 def inject_flow_skill(
-    skill_dir: Path, target_dir: Path, prefix: str = FLOW_SKILL_PREFIX
+    skill_dir: Path, target_dir: Path, prefix: str = FLOW_SKILL_PREFIX, force: bool = False
 ) -> bool:
     """
     Inject a single flow skill to the target directory.
 
+    Only files whose content changed since the last injection are written.
+
     Args:
         skill_dir: Source flow skill directory (e.g., .../flow_engineer/)
         target_dir: Target directory for skill injection (e.g., .agent/skills/)
         prefix: Prefix to add to the skill directory name
+        force: Rewrite every file even if the target is up to date
 
     Returns:
         True if injection successful, False otherwise
     """
-    try:
-        # Calculate target skill name with prefix
-        # e.g., flow_engineer -> monoco_flow_engineer
-        target_skill_name = f"{prefix}{skill_dir.name}"
-        target_skill_dir = target_dir / target_skill_name
-
-        # Remove existing skill directory if present
-        if target_skill_dir.exists():
-            shutil.rmtree(target_skill_dir)
-
-        # Copy skill directory
-        shutil.copytree(skill_dir, target_skill_dir)
-
-        console.print(f"[green]  ✓ Injected {target_skill_name}/[/green]")
-        return True
-
-    except Exception as e:
-        console.print(f"[red]  ✗ Failed to inject {skill_dir.name}: {e}[/red]")
-        return False
+    return _inject(skill_dir, target_dir, prefix, force) is not None
 
 
 def sync_flow_skills(
@@ -128,7 +132,7 @@ def sync_flow_skills(
         resources_dir: Path to the resources directory
         target_dir: Target directory for skill injection (e.g., .agent/skills/)
         prefix: Prefix to add to skill directory names
-        force: Force re-injection even if skills already exist
+        force: Rewrite every file even if skills are up to date
 
     Returns:
         Dictionary with 'injected', 'failed', 'removed' counts
@@ -148,28 +152,15 @@ def sync_flow_skills(
     console.print(f"[dim]Found {len(flow_skills)} flow skill(s)[/dim]")
 
     # Track expected skill names
-    expected_skills: Set[str] = set()
+    expected_skills: Set[str] = {f"{prefix}{skill_dir.name}" for skill_dir in flow_skills}
 
-    # Inject each flow skill
+    # Content-hash sync: unchanged skills are a no-op
     for skill_dir in flow_skills:
-        target_skill_name = f"{prefix}{skill_dir.name}"
-        expected_skills.add(target_skill_name)
-
-        # Check if already exists and not force
-        target_skill_dir = target_dir / target_skill_name
-        if target_skill_dir.exists() and not force:
-            # Check if source is newer
-            source_mtime = (skill_dir / "SKILL.md").stat().st_mtime
-            target_mtime = (target_skill_dir / "SKILL.md").stat().st_mtime
-
-            if source_mtime <= target_mtime:
-                console.print(f"[dim]  = {target_skill_name}/ is up to date[/dim]")
-                continue
-
-        if inject_flow_skill(skill_dir, target_dir, prefix):
-            results["injected"] += 1
-        else:
+        result = _inject(skill_dir, target_dir, prefix, force)
+        if result is None:
             results["failed"] += 1
+        elif result.changed:
+            results["injected"] += 1
 
     # Clean up orphaned skills (optional, when force=True)
     if force:
@@ -15,6 +15,7 @@ class ArtifactFeature(FeatureModule):
             description="Artifact management system for Monoco",
             dependencies=["core"],
             priority=20,
+            commands=["artifact"],
         )
 
     def integrate(self, root: Path, config: Dict) -> IntegrationData:
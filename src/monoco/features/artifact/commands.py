@@ -0,0 +1,185 @@
+"""CLI commands for the artifact stores."""
+
+from pathlib import Path
+from typing import List, Optional
+
+import typer
+from typing_extensions import Annotated
+
+from monoco.core.output import AgentOutput, OutputManager
+
+app = typer.Typer(name="artifact", help="Manage the shared artifact stores")
+
+ATTACHMENTS_HELP = ".monoco/artifacts/attachments.jsonl, as written by the DingTalk downloader"
+
+
+def _attachments_dir(root: Path) -> Path:
+    """Directory of the attachment store; its index is attachments.jsonl, not the registry manifest."""
+    return root / ".monoco" / "artifacts"
+
+
+_SIZE_UNITS = {"": 1, "K": 1024, "M": 1024**2, "G": 1024**3, "T": 1024**4}
+
+
+def _parse_size(value: str) -> int:
+    """Parse sizes like '500M', '2G' or '1048576' to bytes."""
+    text = value.strip().upper().removesuffix("B").removesuffix("I")
+    unit = text[-1:] if text[-1:] in _SIZE_UNITS else ""
+    number = text[: len(text) - len(unit)]
+    try:
+        return int(float(number) * _SIZE_UNITS[unit])
+    except ValueError:
+        raise typer.BadParameter(f"Invalid size: {value}")
+
+
+def _format_size(size: int) -> str:
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024:
+            return f"{size:.1f} {unit}" if unit != "B" else f"{size} B"
+        size /= 1024
+    return f"{size:.1f} TB"
+
+
+def _collect_files(paths: List[Path], recursive: bool) -> List[Path]:
+    files = []
+    for path in paths:
+        if path.is_dir():
+            entries = path.rglob("*") if recursive else path.iterdir()
+            files.extend(p for p in sorted(entries) if p.is_file() and not p.name.startswith("."))
+        else:
+            files.append(path)
+    return files
+
+
+@app.command("import")
+def import_files(
+    paths: Annotated[List[Path], typer.Argument(help="Files or directories to import")],
+    recursive: Annotated[bool, typer.Option("--recursive", "-r", help="Descend into subdirectories")] = False,
+    tag: Annotated[Optional[List[str]], typer.Option("--tag", "-t", help="Tag for every artifact (repeatable)")] = None,
+    hardlink: Annotated[bool, typer.Option("--hardlink", help="Hardlink into CAS (sources must not change)")] = False,
+    attachments: Annotated[
+        bool,
+        typer.Option("--attachments", help=f"Import into the message attachment store ({ATTACHMENTS_HELP})"),
+    ] = False,
+    message_id: Annotated[str, typer.Option("--message-id", help="Message ID for attachments")] = "backfill",
+    provider: Annotated[str, typer.Option("--provider", help="Provider for attachments")] = "local",
+    workers: Annotated[Optional[int], typer.Option("--workers", "-w", help="Hashing/copy threads")] = None,
+    json: AgentOutput = False,
+):
+    """Import many files in parallel, with one batched manifest append.
+
+    Examples:
+        monoco artifact import ./exports -r --tag backfill
+        monoco artifact import ./downloads --attachments --provider dingtalk
+    """
+    from monoco.core.config import find_monoco_root
+
+    files = _collect_files(paths, recursive)
+    missing = [str(p) for p in files if not p.exists()]
+    if missing:
+        OutputManager.error(f"File not found: {', '.join(missing)}")
+        raise typer.Exit(1)
+
+    root = find_monoco_root()
+    if attachments:
+        from .store import ArtifactStore
+
+        store = ArtifactStore(_attachments_dir(root))
+        report = store.import_files(files, message_id=message_id, provider=provider, workers=workers)
+        stored = [{"id": artifact.id[:16], "name": artifact.name} for artifact, _ in report.stored]
+    else:
+        from monoco.core.artifacts import ArtifactManager
+
+        manager = ArtifactManager(project_dir=root)
+        report = manager.store_files(files, tags=tag, allow_hardlink=hardlink, workers=workers)
+        stored = [{"id": meta.artifact_id, "name": meta.original_filename} for meta in report.stored]
+
+    result = report.to_dict()
+    result["stored"] = stored
+    OutputManager.print(result, title="Import Complete")
+    if report.failed:
+        raise typer.Exit(1)
+
+
+@app.command()
+def verify(
+    ids: Annotated[Optional[List[str]], typer.Argument(help="Artifacts to verify (default: all)")] = None,
+    attachments: Annotated[
+        bool,
+        typer.Option("--attachments", help=f"Verify the message attachment store ({ATTACHMENTS_HELP})"),
+    ] = False,
+    workers: Annotated[Optional[int], typer.Option("--workers", "-w", help="Hashing threads")] = None,
+    json: AgentOutput = False,
+):
+    """Re-hash stored content in parallel and report missing or corrupted artifacts.
+
+    Examples:
+        monoco artifact verify
+        monoco artifact verify --attachments --workers 16
+    """
+    from monoco.core.config import find_monoco_root
+
+    root = find_monoco_root()
+    if attachments:
+        from .store import ArtifactStore
+
+        report = ArtifactStore(_attachments_dir(root)).validate_all(ids or None, workers=workers)
+    else:
+        from monoco.core.artifacts import ArtifactManager
+
+        report = ArtifactManager(project_dir=root).verify(ids or None, workers=workers)
+
+    OutputManager.print(report.to_dict(), title="Verify Complete" if report.valid else "Verify Failed")
+    if not report.valid:
+        raise typer.Exit(1)
+
+
+@app.command()
+def gc(
+    dry_run: Annotated[bool, typer.Option("--dry-run", help="Report what would be reclaimed without deleting")] = False,
+    max_age: Annotated[Optional[int], typer.Option("--max-age", help="Evict unpinned blobs unused for N days")] = None,
+    max_size: Annotated[Optional[str], typer.Option("--max-size", help="Blob cache budget, e.g. 5G (LRU eviction)")] = None,
+    project: Annotated[Optional[List[Path]], typer.Option("--project", "-p", help="Extra project root to mark (repeatable)")] = None,
+    workers: Annotated[Optional[int], typer.Option("--workers", "-w", help="Scan/delete threads")] = None,
+    grace: Annotated[int, typer.Option("--grace", help="Protect objects touched within N minutes")] = 60,
+    force: Annotated[bool, typer.Option("--force", "-f", help="Sweep even if some project manifests are unreadable")] = False,
+    json: AgentOutput = False,
+):
+    """Garbage-collect unreferenced content in ~/.monoco/artifacts and ~/.monoco/blobs.
+
+    Live content is marked from the manifests of all registered projects
+    (plus the current one). Unreferenced CAS objects are deleted; blobs not
+    pinned by a live artifact are evicted only by --max-age / --max-size.
+
+    Examples:
+        monoco artifact gc --dry-run
+        monoco artifact gc --max-size 5G
+        monoco artifact gc --max-age 30
+    """
+    from monoco.core.config import find_monoco_root
+    from monoco.core.registry import get_inventory
+
+    from .gc import ArtifactGC
+
+    projects = [entry.path for entry in get_inventory().list()]
+    root = find_monoco_root()
+    if (root / ".monoco").is_dir():
+        projects.append(root)
+    projects.extend(p.resolve() for p in project or [])
+
+    collector = ArtifactGC(projects=projects, workers=workers, grace=grace * 60)
+    report = collector.collect(
+        dry_run=dry_run,
+        max_age=max_age * 86400 if max_age is not None else None,
+        max_bytes=_parse_size(max_size) if max_size else None,
+        force=force,
+    )
+
+    result = report.to_dict()
+    result["reclaimed"] = _format_size(report.reclaimed_bytes)
+    OutputManager.print(result, title="GC Preview" if dry_run else "GC Complete")
+
+    if not force and (report.unreachable or not report.projects):
+        reason = f"{len(report.unreachable)} project(s) unreadable" if report.projects else "no projects registered"
+        OutputManager.error(f"{reason}; CAS objects were not swept (use --force to sweep anyway)")
+        raise typer.Exit(1)
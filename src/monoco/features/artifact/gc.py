@@ -0,0 +1,382 @@
+"""
+Mark-and-sweep garbage collection for the shared artifact stores.
+
+`~/.monoco/artifacts` (CAS objects of `ArtifactManager`) and `~/.monoco/blobs`
+(doc-extractor renditions) are shared by every project, so whether an object
+is still needed can only be decided across all of them:
+
+- mark: read every registered project's `.monoco/artifacts/manifest.jsonl`
+  (via `ProjectInventory`) in one pass and collect the content hashes of
+  active and archived artifacts.
+- sweep: scan both stores in parallel. CAS objects outside the live set are
+  deleted. Blobs are a regenerable cache: unpinned blobs (not rendered from a
+  live artifact or an archive that is one) are only evicted by an optional
+  age or size budget, least recently used first. Evicted blobs are dropped
+  from the blob index.
+
+Objects younger than a grace period are never touched, so artifacts stored
+while the collector runs (CAS write before the manifest line) survive.
+"""
+
+import json
+import logging
+import os
+import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, List, Optional, Set
+
+from monoco.core.artifacts.models import ArtifactStatus
+
+logger = logging.getLogger(__name__)
+
+# Statuses whose content must be kept
+LIVE_STATUSES = {ArtifactStatus.ACTIVE.value, ArtifactStatus.ARCHIVED.value}
+
+# Default protection for freshly written objects (seconds)
+DEFAULT_GRACE = 3600
+
+# Temporary ingestion files of ArtifactManager
+INCOMING_DIR = ".incoming"
+
+
+def _is_hex(name: str, length: int) -> bool:
+    return len(name) == length and all(c in "0123456789abcdef" for c in name)
+
+
+def _read_noatime(path: Path) -> bytes:
+    """Read a file without bumping its atime (which drives LRU eviction)."""
+    flags = os.O_RDONLY | getattr(os, "O_NOATIME", 0)
+    try:
+        fd = os.open(path, flags)
+    except PermissionError:
+        # O_NOATIME requires owning the file
+        fd = os.open(path, os.O_RDONLY)
+    with os.fdopen(fd, "rb") as f:
+        return f.read()
+
+
+def read_manifest_hashes(manifest_path: Path) -> Set[str]:
+    """
+    Content hashes referenced by live artifacts of one manifest.
+
+    Later lines for the same artifact override earlier ones, matching how
+    `ArtifactManager` replays its manifest.
+    """
+    latest = {}
+    with open(manifest_path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+                latest[record["artifact_id"]] = (record["content_hash"], record.get("status", "active"))
+            except (ValueError, KeyError, TypeError):
+                continue
+    return {content_hash for content_hash, status in latest.values() if status in LIVE_STATUSES}
+
+
+@dataclass
+class GCObject:
+    """A store object considered by the sweep."""
+
+    kind: str
+    """"artifact" (CAS object), "blob" or "incoming" (stale temp file)."""
+
+    hash: str
+    path: Path
+    size: int
+    last_used: float
+    """Most recent access/modification time (epoch seconds)."""
+
+    reason: str = ""
+    """Why it was swept: "unreferenced", "age", "budget" or "stale"."""
+
+    source_archive: Optional[str] = None
+    """Blobs only: hash of the archive the document came from."""
+
+
+@dataclass
+class GCReport:
+    """Outcome of a collection."""
+
+    dry_run: bool
+    projects: int = 0
+    live_hashes: int = 0
+    scanned: int = 0
+    swept: List[GCObject] = field(default_factory=list)
+    kept_bytes: int = 0
+    unreachable: List[str] = field(default_factory=list)
+    """Registered projects whose manifest could not be read."""
+
+    errors: List[str] = field(default_factory=list)
+
+    @property
+    def reclaimed_bytes(self) -> int:
+        return sum(obj.size for obj in self.swept)
+
+    def to_dict(self) -> dict:
+        by_kind = {}
+        for obj in self.swept:
+            stats = by_kind.setdefault(obj.kind, {"count": 0, "bytes": 0})
+            stats["count"] += 1
+            stats["bytes"] += obj.size
+        return {
+            "dry_run": self.dry_run,
+            "projects": self.projects,
+            "live_hashes": self.live_hashes,
+            "scanned": self.scanned,
+            "swept": by_kind,
+            "reclaimed_bytes": self.reclaimed_bytes,
+            "kept_bytes": self.kept_bytes,
+            "unreachable": self.unreachable,
+            "errors": self.errors,
+        }
+
+
+class ArtifactGC:
+    """
+    Collector for the global artifact and blob stores.
+
+    Args:
+        projects: Project roots whose manifests reference content
+            (default: all projects in the global inventory).
+        global_store: CAS root (default: ~/.monoco/artifacts).
+        blobs_dir: doc-extractor blob root (default: ~/.monoco/blobs).
+        workers: Threads used for marking, scanning and deleting.
+        grace: Seconds during which new objects are protected.
+    """
+
+    def __init__(
+        self,
+        projects: Optional[Iterable[Path]] = None,
+        global_store: Optional[Path] = None,
+        blobs_dir: Optional[Path] = None,
+        workers: Optional[int] = None,
+        grace: float = DEFAULT_GRACE,
+    ):
+        if projects is None:
+            from monoco.core.registry import get_inventory
+
+            projects = [entry.path for entry in get_inventory().list()]
+        self.projects = [Path(p) for p in dict.fromkeys(projects)]
+        self.global_store = Path(global_store) if global_store else Path.home() / ".monoco" / "artifacts"
+        self.blobs_dir = Path(blobs_dir) if blobs_dir else Path.home() / ".monoco" / "blobs"
+        self.workers = workers
+        self.grace = grace
+
+    def _executor(self) -> ThreadPoolExecutor:
+        return ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="monoco-gc")
+
+    # ---- mark ---------------------------------------------------------------
+
+    def _project_hashes(self, project: Path) -> Set[str]:
+        if not project.is_dir():
+            raise FileNotFoundError(f"Project directory missing: {project}")
+        manifest = project / ".monoco" / "artifacts" / "manifest.jsonl"
+        if not manifest.exists():
+            return set()
+        return read_manifest_hashes(manifest)
+
+    def mark(self, report: Optional[GCReport] = None) -> Set[str]:
+        """Collect live content hashes from all project manifests."""
+        live: Set[str] = set()
+        with self._executor() as executor:
+            futures = {project: executor.submit(self._project_hashes, project) for project in self.projects}
+        for project, future in futures.items():
+            try:
+                live |= future.result()
+            except OSError as e:
+                logger.warning(f"Cannot read artifacts of {project}: {e}")
+                if report is not None:
+                    report.unreachable.append(str(project))
+        if report is not None:
+            report.projects = len(self.projects)
+            report.live_hashes = len(live)
+        return live
+
+    # ---- scan ---------------------------------------------------------------
+
+    def _scan_cas_prefix(self, prefix_dir: Path) -> List[GCObject]:
+        objects = []
+        for sub in os.scandir(prefix_dir):
+            if not (sub.is_dir(follow_symlinks=False) and _is_hex(sub.name, 2)):
+                continue
+            for entry in os.scandir(sub.path):
+                if not (_is_hex(entry.name, 64) and entry.is_file(follow_symlinks=False)):
+                    continue
+                st = entry.stat(follow_symlinks=False)
+                objects.append(
+                    GCObject(
+                        "artifact",
+                        entry.name,
+                        Path(entry.path),
+                        st.st_size,
+                        # ctime covers fresh hardlinks/renames that keep an old mtime
+                        max(st.st_atime, st.st_mtime, st.st_ctime),
+                    )
+                )
+        return objects
+
+    def _scan_incoming(self) -> List[GCObject]:
+        incoming = self.global_store / INCOMING_DIR
+        if not incoming.is_dir():
+            return []
+        objects = []
+        for entry in os.scandir(incoming):
+            if entry.is_file(follow_symlinks=False):
+                st = entry.stat(follow_symlinks=False)
+                objects.append(GCObject("incoming", entry.name, Path(entry.path), st.st_size, st.st_mtime))
+        return objects
+
+    def scan_artifacts(self, executor: ThreadPoolExecutor) -> List[GCObject]:
+        """CAS objects (`{hash[:2]}/{hash[2:4]}/{hash}`), one task per prefix."""
+        if not self.global_store.is_dir():
+            return []
+        prefixes = [
+            Path(e.path)
+            for e in os.scandir(self.global_store)
+            if e.is_dir(follow_symlinks=False) and _is_hex(e.name, 2)
+        ]
+        return [obj for chunk in executor.map(self._scan_cas_prefix, prefixes) for obj in chunk]
+
+    @staticmethod
+    def _blob_object(path: Path) -> GCObject:
+        size = 0
+        last_used = 0.0
+        for root, _, files in os.walk(path):
+            for name in files:
+                try:
+                    st = os.stat(os.path.join(root, name), follow_symlinks=False)
+                except OSError:
+                    continue
+                size += st.st_size
+                last_used = max(last_used, st.st_atime, st.st_mtime)
+        obj = GCObject("blob", path.name, path, size, last_used or path.stat().st_mtime)
+        try:
+            meta = json.loads(_read_noatime(path / "meta.json"))
+            obj.source_archive = (meta.get("source_archive") or {}).get("hash")
+        except (OSError, ValueError, AttributeError):
+            pass
+        return obj
+
+    def scan_blobs(self, executor: ThreadPoolExecutor) -> List[GCObject]:
+        """Blob directories with their total size and last use."""
+        if not self.blobs_dir.is_dir():
+            return []
+        dirs = [
+            Path(e.path)
+            for e in os.scandir(self.blobs_dir)
+            if e.is_dir(follow_symlinks=False) and _is_hex(e.name, 64)
+        ]
+        return list(executor.map(self._blob_object, dirs))
+
+    # ---- sweep --------------------------------------------------------------
+
+    @staticmethod
+    def _delete(obj: GCObject) -> Optional[str]:
+        try:
+            if obj.kind == "blob":
+                shutil.rmtree(obj.path)
+            else:
+                obj.path.unlink()
+                if obj.kind == "artifact":
+                    # Drop emptied prefix directories, like ArtifactManager does
+                    for parent in (obj.path.parent, obj.path.parent.parent):
+                        try:
+                            parent.rmdir()
+                        except OSError:
+                            break
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            return f"{obj.path}: {e}"
+        return None
+
+    def collect(
+        self,
+        dry_run: bool = False,
+        max_age: Optional[float] = None,
+        max_bytes: Optional[int] = None,
+        force: bool = False,
+    ) -> GCReport:
+        """
+        Run mark and sweep.
+
+        Args:
+            dry_run: Report what would be reclaimed without deleting.
+            max_age: Evict unpinned blobs unused for this many seconds.
+            max_bytes: Evict unpinned blobs, least recently used first,
+                until all blobs fit in this many bytes.
+            force: Sweep CAS objects even if no project is known or some
+                project manifests are unreadable (their content would be
+                collected).
+
+        Returns:
+            GCReport with swept objects and reclaimed bytes
+        """
+        report = GCReport(dry_run=dry_run)
+        live = self.mark(report)
+        now = time.time()
+
+        def settled(obj: GCObject) -> bool:
+            return now - obj.last_used >= self.grace
+
+        with self._executor() as executor:
+            artifacts = self.scan_artifacts(executor)
+            incoming = self._scan_incoming()
+            blobs = self.scan_blobs(executor)
+            report.scanned = len(artifacts) + len(incoming) + len(blobs)
+
+            # Unreferenced CAS objects (never with an incomplete or empty mark)
+            sweep_cas = force or (self.projects and not report.unreachable)
+            for obj in artifacts:
+                if sweep_cas and obj.hash not in live and settled(obj):
+                    obj.reason = "unreferenced"
+                    report.swept.append(obj)
+                else:
+                    report.kept_bytes += obj.size
+            for obj in incoming:
+                if settled(obj):
+                    obj.reason = "stale"
+                    report.swept.append(obj)
+                else:
+                    report.kept_bytes += obj.size
+
+            # Blob cache budget (LRU over unpinned blobs)
+            blob_bytes = sum(obj.size for obj in blobs)
+            for obj in sorted(blobs, key=lambda b: b.last_used):
+                pinned = obj.hash in live or obj.source_archive in live
+                if not pinned and settled(obj):
+                    if max_age is not None and now - obj.last_used > max_age:
+                        obj.reason = "age"
+                    elif max_bytes is not None and blob_bytes > max_bytes:
+                        obj.reason = "budget"
+                if obj.reason:
+                    blob_bytes -= obj.size
+                    report.swept.append(obj)
+                else:
+                    report.kept_bytes += obj.size
+
+            if not dry_run:
+                failed = set()
+                for obj, error in zip(report.swept, executor.map(self._delete, report.swept)):
+                    if error:
+                        report.errors.append(error)
+                        failed.add(id(obj))
+                        report.kept_bytes += obj.size
+                report.swept = [obj for obj in report.swept if id(obj) not in failed]
+
+        if not dry_run:
+            self._unindex([obj.hash for obj in report.swept if obj.kind == "blob"])
+        return report
+
+    def _unindex(self, blob_hashes: List[str]) -> None:
+        """Drop evicted blobs from the doc-extractor index of blobs_dir."""
+        if not blob_hashes:
+            return
+        from monoco.features.doc_extractor.index import BlobIndex
+
+        index = BlobIndex(self.blobs_dir / BlobIndex.INDEX_PATH.name)
+        for blob_hash in blob_hashes:
+            index.remove(blob_hash)
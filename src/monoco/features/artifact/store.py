@@ -8,23 +8,41 @@ Structure:
     ~/.monoco/artifacts/
     ├── a1b2c3d4.png          # hash[:8] + ext
     ├── e5f6g7h8.pdf
-    └── manifest.jsonl        # metadata index
+    └── attachments.jsonl     # metadata index
 
 Example manifest entry:
     {"hash": "a1b2c3d4...", "short_hash": "a1b2c3d4", "name": "doc.pdf",
      "message_id": "dingtalk_abc", "provider": "dingtalk", "size": 1024,
      "mime_type": "application/pdf", "downloaded_at": "2026-02-10T09:30:00Z"}
+
+The manifest is loaded once into `ManifestIndex` (hash, short-hash, sorted
+prefix and message_id maps) and refreshed by reading only the bytes appended
+since the last read. Repeated entries and entries whose file was deleted are
+compacted away once they make up most of the manifest; lines that are not
+attachment entries are kept byte-for-byte.
+
+The directory may be shared with `ArtifactManager`'s project registry
+(`manifest.jsonl`), so the attachment index uses its own file. Attachment
+entries of a legacy `manifest.jsonl` are copied over on first use.
 """
 
+import bisect
+import fcntl
 import hashlib
 import json
 import logging
+import mimetypes
+import os
 import shutil
+import threading
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 from dataclasses import dataclass, asdict
 
+from monoco.core.artifacts.bulk import ImportReport, VerifyReport, run_parallel
+from monoco.core.artifacts.content import ArtifactContent, hash_file
 from monoco.features.connector.protocol.schema import Artifact, ArtifactType
 
 logger = logging.getLogger(__name__)
@@ -51,6 +69,118 @@ class ArtifactMetadata:
         return cls(**{k: v for k, v in data.items() if k in cls.__dataclass_fields__})
 
 
+# Compact once this many redundant lines accumulate and they outnumber live entries
+COMPACT_MIN_REDUNDANT = 64
+
+MANIFEST_NAME = "attachments.jsonl"
+LEGACY_MANIFEST_NAME = "manifest.jsonl"
+# flock()ed by appends and compaction, which replaces the manifest
+LOCK_NAME = ".attachments.lock"
+
+
+def _parse_entry(line: bytes) -> Optional[ArtifactMetadata]:
+    """Parse an attachment entry (None for foreign or invalid lines)."""
+    try:
+        data = json.loads(line)
+        return ArtifactMetadata.from_dict(data)
+    except (ValueError, TypeError, AttributeError):
+        return None
+
+
+class ManifestIndex:
+    """
+    In-memory index over the attachment manifest.
+
+    Entries keep manifest order (the first matching entry wins, as with a
+    linear scan). Lookups by full hash, short hash and message ID are dict
+    hits; hash prefixes are resolved by bisecting the sorted hashes. Lines
+    that do not parse as attachment entries are kept in `foreign` (never
+    counted as redundant) so compaction can preserve them.
+    """
+
+    def __init__(self, manifest_path: Path):
+        self.manifest_path = manifest_path
+        self._reset()
+
+    def _reset(self) -> None:
+        self.entries: List[ArtifactMetadata] = []
+        self._by_hash: Dict[str, List[int]] = {}
+        self._by_short: Dict[str, List[int]] = {}
+        self._by_message: Dict[str, List[int]] = {}
+        self._sorted_hashes: List[str] = []
+        self._seen: set = set()
+        self.foreign: List[bytes] = []
+        self.redundant = 0
+        self._offset = 0
+        self._inode: Optional[int] = None
+
+    def _add(self, entry: ArtifactMetadata) -> None:
+        key = (entry.hash, entry.message_id, entry.name)
+        if key in self._seen:
+            self.redundant += 1
+            return
+        self._seen.add(key)
+        position = len(self.entries)
+        self.entries.append(entry)
+        if entry.hash not in self._by_hash:
+            bisect.insort(self._sorted_hashes, entry.hash)
+        self._by_hash.setdefault(entry.hash, []).append(position)
+        self._by_short.setdefault(entry.short_hash, []).append(position)
+        self._by_message.setdefault(entry.message_id, []).append(position)
+
+    def sync(self) -> "ManifestIndex":
+        """Read lines appended since the last sync (everything after a rewrite)."""
+        try:
+            st = os.stat(self.manifest_path)
+        except FileNotFoundError:
+            if self._offset:
+                self._reset()
+            return self
+
+        if st.st_ino != self._inode or st.st_size < self._offset:
+            self._reset()
+            self._inode = st.st_ino
+        if st.st_size == self._offset:
+            return self
+
+        try:
+            with open(self.manifest_path, "rb") as f:
+                f.seek(self._offset)
+                data = f.read()
+        except OSError as e:
+            logger.warning(f"Failed to read manifest: {e}")
+            return self
+
+        # A partially written last line is picked up by the next sync
+        end = data.rfind(b"\n") + 1
+        for line in data[:end].splitlines():
+            if not line.strip():
+                continue
+            entry = _parse_entry(line)
+            if entry is None:
+                self.foreign.append(line)
+            else:
+                self._add(entry)
+        self._offset += end
+        return self
+
+    def find(self, artifact_id: str) -> List[ArtifactMetadata]:
+        """Entries whose hash starts with `artifact_id` or whose short hash equals it."""
+        positions = set(self._by_short.get(artifact_id, ()))
+        hashes = self._sorted_hashes
+        i = bisect.bisect_left(hashes, artifact_id)
+        while i < len(hashes) and hashes[i].startswith(artifact_id):
+            positions.update(self._by_hash[hashes[i]])
+            i += 1
+        return [self.entries[i] for i in sorted(positions)]
+
+    def by_message(self, message_id: str) -> List[ArtifactMetadata]:
+        return [self.entries[i] for i in self._by_message.get(message_id, ())]
+
+    def contains(self, content_hash: str) -> bool:
+        return content_hash in self._by_hash or content_hash in self._by_short
+
+
 class ArtifactStore:
     """
     Content-addressed artifact storage.
@@ -61,13 +191,44 @@ class ArtifactStore:
 
     def __init__(self, artifacts_dir: Path):
         self.artifacts_dir = artifacts_dir
-        self.manifest_path = artifacts_dir / "manifest.jsonl"
+        self.manifest_path = artifacts_dir / MANIFEST_NAME
+        self.lock_path = artifacts_dir / LOCK_NAME
+        self._index = ManifestIndex(self.manifest_path)
         self._ensure_directories()
+        self._migrate_legacy_manifest()
 
     def _ensure_directories(self) -> None:
         """Ensure artifacts directory exists."""
         self.artifacts_dir.mkdir(parents=True, exist_ok=True)
 
+    @contextmanager
+    def _manifest_lock(self) -> Iterator[None]:
+        """Exclusive lock on the manifest, across processes and threads."""
+        with open(self.lock_path, "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _migrate_legacy_manifest(self) -> None:
+        """Copy attachment entries of a legacy `manifest.jsonl` (left untouched)."""
+        legacy = self.artifacts_dir / LEGACY_MANIFEST_NAME
+        if self.manifest_path.exists() or not legacy.exists():
+            return
+        try:
+            with self._manifest_lock():
+                if self.manifest_path.exists():
+                    return
+                lines = [line for line in legacy.read_bytes().splitlines() if _parse_entry(line) is not None]
+                if not lines:
+                    return
+                tmp = self.manifest_path.with_suffix(".jsonl.tmp")
+                tmp.write_bytes(b"".join(line + b"\n" for line in lines))
+                tmp.replace(self.manifest_path)
+        except OSError as e:
+            logger.warning(f"Failed to migrate legacy manifest {legacy}: {e}")
+
     def _compute_hash(self, content: bytes) -> str:
         """Compute SHA256 hash of content."""
         return hashlib.sha256(content).hexdigest()
@@ -82,30 +243,58 @@ class ArtifactStore:
         return self.artifacts_dir / f"{short_hash}{ext}"
 
     def _read_manifest(self) -> List[ArtifactMetadata]:
-        """Read all entries from manifest."""
-        if not self.manifest_path.exists():
-            return []
-
-        entries = []
-        try:
-            with open(self.manifest_path, "r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if line:
-                        try:
-                            data = json.loads(line)
-                            entries.append(ArtifactMetadata.from_dict(data))
-                        except json.JSONDecodeError:
-                            continue
-        except Exception as e:
-            logger.warning(f"Failed to read manifest: {e}")
-
-        return entries
+        """All manifest entries (from the in-memory index)."""
+        return list(self._index.sync().entries)
 
     def _append_manifest(self, metadata: ArtifactMetadata) -> None:
         """Append entry to manifest."""
-        with open(self.manifest_path, "a", encoding="utf-8") as f:
-            f.write(json.dumps(metadata.to_dict(), ensure_ascii=False) + "\n")
+        self._append_manifest_batch([metadata])
+
+    def _append_manifest_batch(self, entries: List[ArtifactMetadata]) -> None:
+        """Append entries to manifest with a single write."""
+        if not entries:
+            return
+        payload = "".join(json.dumps(m.to_dict(), ensure_ascii=False) + "\n" for m in entries)
+        with self._manifest_lock():
+            with open(self.manifest_path, "a", encoding="utf-8") as f:
+                f.write(payload)
+            index = self._index.sync()
+            if index.redundant >= COMPACT_MIN_REDUNDANT and index.redundant > len(index.entries):
+                self._compact_locked()
+
+    def compact(self) -> int:
+        """
+        Rewrite the manifest without repeated entries and entries whose file
+        was deleted. Lines that are not attachment entries are kept as-is.
+
+        Returns:
+            Number of manifest lines dropped.
+        """
+        with self._manifest_lock():
+            return self._compact_locked()
+
+    def _compact_locked(self) -> int:
+        """Compact while holding the manifest lock (no append can interleave)."""
+        index = self._index.sync()
+        live = [
+            e for e in index.entries
+            if self._get_storage_path(e.short_hash, e.name).exists()
+        ]
+        tmp = self.manifest_path.with_suffix(".jsonl.tmp")
+        try:
+            with open(tmp, "wb") as f:
+                for line in index.foreign:
+                    f.write(line + b"\n")
+                for entry in live:
+                    f.write((json.dumps(entry.to_dict(), ensure_ascii=False) + "\n").encode("utf-8"))
+            tmp.replace(self.manifest_path)
+        except OSError as e:
+            logger.warning(f"Failed to compact manifest: {e}")
+            tmp.unlink(missing_ok=True)
+            return 0
+        dropped = len(index.entries) + index.redundant - len(live)
+        self._index.sync()
+        return dropped
 
     def store(
         self,
@@ -137,9 +326,6 @@ class ArtifactStore:
         full_hash = self._compute_hash(content)
         short_hash = self._short_hash(full_hash)
 
-        # Determine artifact type from extension
-        artifact_type = self._detect_type(original_name)
-
         # Build storage path
         storage_path = self._get_storage_path(short_hash, original_name)
 
@@ -172,19 +358,82 @@ class ArtifactStore:
         )
         self._append_manifest(metadata)
 
-        # Build Artifact object
-        artifact = Artifact(
-            id=full_hash,
-            name=original_name,
-            type=artifact_type,
-            mime_type=mime_type,
-            size=len(content),
+        return self._to_artifact(metadata, storage_path), storage_path
+
+    def _to_artifact(self, metadata: ArtifactMetadata, storage_path: Path) -> Artifact:
+        """Build the Artifact object for a stored entry."""
+        return Artifact(
+            id=metadata.hash,
+            name=metadata.name,
+            type=self._detect_type(metadata.name),
+            mime_type=metadata.mime_type,
+            size=metadata.size,
             path=storage_path.name,  # Just the filename (flat structure)
-            url=url,
+            url=metadata.url,
             downloaded_at=datetime.now(timezone.utc),
         )
 
-        return artifact, storage_path
+    def _import_file(self, path: Path) -> Tuple[str, int, Path]:
+        """Hash a file and copy it into the store unless present."""
+        full_hash = hash_file(path)
+        storage_path = self._get_storage_path(self._short_hash(full_hash), path.name)
+        if not storage_path.exists():
+            temp_path = storage_path.with_suffix(storage_path.suffix + f".{os.getpid()}.{threading.get_ident()}.tmp")
+            try:
+                shutil.copyfile(path, temp_path)
+                temp_path.replace(storage_path)
+            except BaseException:
+                temp_path.unlink(missing_ok=True)
+                raise
+        return full_hash, storage_path.stat().st_size, storage_path
+
+    def import_files(
+        self,
+        paths: Iterable[Path],
+        message_id: str,
+        provider: str,
+        workers: Optional[int] = None,
+    ) -> ImportReport:
+        """
+        Store many local files (e.g. backfilled attachments) at once.
+
+        Files are hashed and copied on a thread pool; the manifest gets one
+        batched append.
+
+        Args:
+            paths: Files to import
+            message_id: Associated message ID for every file
+            provider: Source provider (dingtalk, lark, etc.)
+            workers: Thread pool size (default: executor default)
+
+        Returns:
+            ImportReport with (Artifact, storage_path) tuples in ``stored``
+        """
+        report = ImportReport()
+        entries = []
+        for path, imported, error in run_parallel(self._import_file, map(Path, paths), workers):
+            if error is not None:
+                report.failed[str(path)] = str(error)
+                continue
+            full_hash, size, storage_path = imported
+            metadata = ArtifactMetadata(
+                hash=full_hash,
+                short_hash=self._short_hash(full_hash),
+                name=path.name,
+                message_id=message_id,
+                provider=provider,
+                size=size,
+                mime_type=mimetypes.guess_type(path.name)[0],
+                downloaded_at=datetime.now(timezone.utc).isoformat(),
+            )
+            entries.append(metadata)
+            report.stored.append((self._to_artifact(metadata, storage_path), storage_path))
+            report.processed += 1
+            report.bytes += size
+
+        self._append_manifest_batch(entries)
+        report.finish()
+        return report
 
     def get(self, artifact_id: str) -> Optional[Path]:
         """
@@ -196,32 +445,45 @@ class ArtifactStore:
         Returns:
             Path to file if exists, None otherwise
         """
-        # Search manifest for matching hash
-        entries = self._read_manifest()
-        for entry in entries:
-            if entry.hash.startswith(artifact_id) or entry.short_hash == artifact_id:
-                path = self._get_storage_path(entry.short_hash, entry.name)
-                if path.exists():
-                    return path
+        for entry in self._index.sync().find(artifact_id):
+            path = self._get_storage_path(entry.short_hash, entry.name)
+            if path.exists():
+                return path
         return None
 
+    def open_content(self, artifact_id: str) -> Optional[ArtifactContent]:
+        """
+        Open an artifact's content as a read-only, memory-mapped view.
+
+        Supports zero-copy byte ranges (``read_range``) and chunked reads;
+        close it (or use it as a context manager) when done.
+
+        Args:
+            artifact_id: Full or short hash
+
+        Returns:
+            ArtifactContent if the file exists, None otherwise
+        """
+        path = self.get(artifact_id)
+        if path is None:
+            return None
+        try:
+            return ArtifactContent(path)
+        except FileNotFoundError:
+            return None
+
     def get_metadata(self, artifact_id: str) -> Optional[ArtifactMetadata]:
         """Get metadata for an artifact by ID."""
-        entries = self._read_manifest()
-        for entry in entries:
-            if entry.hash.startswith(artifact_id) or entry.short_hash == artifact_id:
-                return entry
-        return None
+        matches = self._index.sync().find(artifact_id)
+        return matches[0] if matches else None
 
     def list_by_message(self, message_id: str) -> List[ArtifactMetadata]:
         """List all artifacts associated with a message."""
-        entries = self._read_manifest()
-        return [e for e in entries if e.message_id == message_id]
+        return self._index.sync().by_message(message_id)
 
     def exists(self, content_hash: str) -> bool:
         """Check if content already exists (by hash)."""
-        entries = self._read_manifest()
-        return any(e.hash == content_hash or e.short_hash == content_hash for e in entries)
+        return self._index.sync().contains(content_hash)
 
     def delete(self, artifact_id: str) -> bool:
         """
@@ -236,8 +498,7 @@ class ArtifactStore:
         path = self._get_storage_path(metadata.short_hash, metadata.name)
 
         # Check if other messages use this file
-        entries = self._read_manifest()
-        other_refs = [e for e in entries
+        other_refs = [e for e in self._index.sync().find(metadata.short_hash)
                       if e.short_hash == metadata.short_hash
                       and e.message_id != metadata.message_id]
 
@@ -289,6 +550,61 @@ class ArtifactStore:
             return full_path
         return None
 
+    def validate_all(
+        self, artifact_ids: Optional[Iterable[str]] = None, workers: Optional[int] = None
+    ) -> VerifyReport:
+        """
+        Validate many artifacts, hashing files on a thread pool.
+
+        Outcomes are reported under the ids as given (full hashes when
+        validating every entry). ``missing`` covers both ids without a
+        manifest entry and entries whose file is gone.
+
+        Args:
+            artifact_ids: Full or short hashes (default: every manifest entry)
+            workers: Thread pool size (default: executor default)
+
+        Returns:
+            VerifyReport with artifact ids grouped by outcome
+        """
+        report = VerifyReport()
+        index = self._index.sync()
+        if artifact_ids is None:
+            selected = [(entry.hash, entry) for entry in index.entries]
+        else:
+            selected = []
+            for artifact_id in artifact_ids:
+                matches = index.find(artifact_id)
+                if matches:
+                    selected.append((artifact_id, matches[0]))
+                else:
+                    report.missing.append(artifact_id)
+
+        # One check per stored file
+        files: Dict[Path, Tuple[str, List[str]]] = {}
+        for key, entry in selected:
+            path = self._get_storage_path(entry.short_hash, entry.name)
+            keys = files.setdefault(path, (entry.hash, []))[1]
+            if key not in keys:
+                keys.append(key)
+
+        def check(path: Path) -> Tuple[str, int]:
+            return hash_file(path), path.stat().st_size
+
+        for path, result, error in run_parallel(check, files, workers):
+            expected, keys = files[path]
+            if isinstance(error, FileNotFoundError):
+                report.missing.extend(keys)
+            elif error is not None:
+                report.failed.update((key, str(error)) for key in keys)
+            else:
+                digest, size = result
+                report.bytes += size
+                (report.ok if digest == expected else report.corrupted).extend(keys)
+        report.processed = len(report.ok) + len(report.corrupted)
+        report.finish()
+        return report
+
     def validate(self, artifact_id: str) -> bool:
         """
         Validate that artifact exists and hash matches content.
@@ -304,8 +620,10 @@ class ArtifactStore:
         if not path.exists():
             return False
 
-        # Verify hash
-        content = path.read_bytes()
-        actual_hash = self._compute_hash(content)
+        # Verify hash (mapped for large files, so memory stays flat)
+        try:
+            actual_hash = hash_file(path)
+        except FileNotFoundError:
+            return False
 
         return actual_hash == metadata.hash
@@ -3,5 +3,6 @@
 from .extractor import DocExtractor, ExtractConfig
 from .index import BlobIndex
 from .models import BlobRef, ExtractionResult
+from .pipeline import BatchPipeline, StageLimits
 
-__all__ = ["DocExtractor", "ExtractConfig", "BlobRef", "ExtractionResult", "BlobIndex"]
+__all__ = ["DocExtractor", "ExtractConfig", "BlobRef", "ExtractionResult", "BlobIndex", "BatchPipeline", "StageLimits"]
@@ -18,6 +18,7 @@ class DocExtractorFeature(FeatureModule):
             description="Document extraction and rendering to WebP pages",
             dependencies=["core"],
             priority=40,
+            commands=["doc-extractor"],
         )
 
     def _on_mount(self, context: "FeatureContext") -> None:  # type: ignore
@@ -27,12 +27,21 @@ def _parse_pages(pages_str: str) -> list[int]:
     return sorted(set(result))
 
 
+def _index_result(index: BlobIndex, result) -> None:
+    """Add a result (and every document of an archive) to the index."""
+    for item in result.members or [result]:
+        index.add(item.blob)
+
+
 @app.command()
 def extract(
     input_path: Annotated[Path, typer.Argument(help="Path to the document file")],
     dpi: Annotated[int, typer.Option("--dpi", "-d", help="DPI for rendering (72-300)")] = 150,
     quality: Annotated[int, typer.Option("--quality", "-q", help="WebP quality (1-100)")] = 85,
     pages: Annotated[str | None, typer.Option("--pages", "-p", help="Pages to render, e.g., '1-5,10,15-20'")] = None,
+    backend: Annotated[str, typer.Option("--backend", "-b", help="Render backend: thread or process")] = "thread",
+    workers: Annotated[int | None, typer.Option("--workers", "-w", help="Render workers (default: CPU count)")] = None,
+    chunk_size: Annotated[int | None, typer.Option("--chunk-size", help="Pages per process-backend task")] = None,
     json: AgentOutput = False,
 ):
     """Extract a document to WebP pages.
@@ -41,6 +50,7 @@ def extract(
         monoco doc-extractor extract report.pdf
         monoco doc-extractor extract report.docx --dpi 200
         monoco doc-extractor extract archive.zip --pages 1-5
+        monoco doc-extractor extract book.pdf --backend process --workers 8
     """
     if not input_path.exists():
         OutputManager.error(f"File not found: {input_path}")
@@ -55,7 +65,18 @@ def extract(
             OutputManager.error(f"Invalid pages format: {e}")
             raise typer.Exit(1)
     
-    config = ExtractConfig(dpi=dpi, quality=quality, pages=page_list)
+    try:
+        config = ExtractConfig(
+            dpi=dpi,
+            quality=quality,
+            pages=page_list,
+            backend=backend,
+            workers=workers,
+            chunk_size=chunk_size,
+        )
+    except ValueError as e:
+        OutputManager.error(str(e))
+        raise typer.Exit(1)
     extractor = DocExtractor()
     
     try:
@@ -63,7 +84,7 @@ def extract(
         
         # Update index
         index = BlobIndex()
-        index.add(result.blob)
+        _index_result(index, result)
         
         # Build output
         output = {
@@ -72,6 +93,9 @@ def extract(
             "pages": result.page_count,
             "location": str(result.blob.path),
         }
+        if result.members:
+            output["archive_documents"] = len(result.members)
+            output["archive_cached"] = sum(1 for m in result.members if m.is_cached)
         
         if result.page_paths:
             page_info = []
@@ -100,6 +124,84 @@ def extract(
         raise typer.Exit(1)
 
 
+@app.command()
+def batch(
+    input_paths: Annotated[list[Path], typer.Argument(help="Documents or directories to extract")],
+    recursive: Annotated[bool, typer.Option("--recursive", "-r", help="Descend into subdirectories")] = False,
+    dpi: Annotated[int, typer.Option("--dpi", "-d", help="DPI for rendering (72-300)")] = 150,
+    quality: Annotated[int, typer.Option("--quality", "-q", help="WebP quality (1-100)")] = 85,
+    backend: Annotated[str, typer.Option("--backend", "-b", help="Render backend: thread or process")] = "thread",
+    hash_workers: Annotated[int, typer.Option("--hash-workers", help="Files hashed concurrently")] = 4,
+    convert_workers: Annotated[int, typer.Option("--convert-workers", help="Concurrent conversions / LibreOffice instances")] = 2,
+    render_workers: Annotated[int, typer.Option("--render-workers", help="Documents rendered concurrently")] = 2,
+    json: AgentOutput = False,
+):
+    """Extract many documents with bounded concurrency.
+
+    Results are reported as each document completes.
+
+    Examples:
+        monoco doc-extractor batch reports/ --recursive
+        monoco doc-extractor batch a.docx b.pptx --convert-workers 1
+    """
+    from .pipeline import BatchOutcome, BatchPipeline, StageLimits, collect_inputs
+
+    missing = [p for p in input_paths if not p.exists()]
+    if missing:
+        OutputManager.error(f"File not found: {missing[0]}")
+        raise typer.Exit(1)
+
+    try:
+        config = ExtractConfig(dpi=dpi, quality=quality, backend=backend)
+        limits = StageLimits(hash=hash_workers, convert=convert_workers, render=render_workers)
+    except ValueError as e:
+        OutputManager.error(str(e))
+        raise typer.Exit(1)
+
+    paths = collect_inputs(input_paths, recursive=recursive)
+    if not paths:
+        OutputManager.print({"status": "empty", "message": "No documents found"})
+        return
+
+    index = BlobIndex()
+    agent_mode = OutputManager.is_agent_mode()
+    summary = {"total": len(paths), "extracted": 0, "cached": 0, "failed": 0}
+
+    from rich.console import Console
+    console = Console()
+
+    def report(done: int, total: int, outcome: BatchOutcome):
+        item = {"done": done, "total": total, "file": str(outcome.path), "seconds": round(outcome.elapsed, 2)}
+        if outcome.ok:
+            _index_result(index, outcome.result)
+            status = "cached" if outcome.result.is_cached else "extracted"
+            item.update(status=status, hash=outcome.result.blob.hash, pages=outcome.result.page_count)
+        else:
+            status = "failed"
+            item.update(status=status, error=str(outcome.error))
+        summary[status] += 1
+
+        if agent_mode:
+            OutputManager.print(item)
+        elif outcome.ok:
+            console.print(
+                f"[{done}/{total}] [green]{status}[/green] {outcome.path.name} "
+                f"({item['pages']} pages, {outcome.elapsed:.1f}s)"
+            )
+        else:
+            console.print(f"[{done}/{total}] [red]failed[/red] {outcome.path.name}: {outcome.error}")
+
+    async def run():
+        pipeline = BatchPipeline(DocExtractor(), config, limits, on_progress=report)
+        async for _ in pipeline.run(paths):
+            pass
+
+    asyncio.run(run())
+    OutputManager.print(summary, title="Batch Summary")
+    if summary["failed"]:
+        raise typer.Exit(1)
+
+
 @app.command("list")
 def list_blobs(
     limit: Annotated[int, typer.Option("--limit", "-l", help="Maximum number of blobs to show")] = 20,
@@ -372,11 +474,12 @@ app.add_typer(index_app, name="index")
 
 @index_app.command("rebuild")
 def index_rebuild(
+    workers: Annotated[int | None, typer.Option("--workers", "-w", help="Parallel meta.json readers")] = None,
     json: AgentOutput = False,
 ):
     """Rebuild the index from all blob directories."""
     index = BlobIndex()
-    count = index.rebuild()
+    count = index.rebuild(workers=workers)
     OutputManager.print({"status": "rebuilt", "entries": count})
 
 
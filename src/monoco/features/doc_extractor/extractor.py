@@ -1,16 +1,31 @@
 """Core document extractor implementation."""
 
 import asyncio
+import fcntl
 import hashlib
 import json
+import logging
+import math
+import os
 import shutil
 import tempfile
-from concurrent.futures import ThreadPoolExecutor
+import threading
+from contextlib import nullcontext
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, replace
 from pathlib import Path
-from typing import Protocol
+from typing import TYPE_CHECKING, AsyncIterator, Callable, Protocol
+
+from monoco.core.artifacts.content import hash_file
 
 from .models import BlobRef, ExtractConfig, ExtractionResult
 
+if TYPE_CHECKING:
+    from .index import BlobIndex
+    from .pipeline import LibreOfficeWorker, PipelineStages, StageLimits
+
+logger = logging.getLogger(__name__)
+
 
 class FileTypeDetector:
     """Detect file types using magic numbers and extensions."""
@@ -91,11 +106,109 @@ class FileTypeDetector:
             return b""
 
 
+RENDITIONS_DIR = "renditions"
+"""Blob subdirectory holding renditions other than the first (``pages/``)."""
+
+META_LOCK = ".meta.lock"
+"""Blob file flock()ed while ``meta.json`` is updated in place."""
+
+
+def rendition_key(dpi: int, quality: int) -> str:
+    """Directory name of a rendition, e.g. ``300dpi-q85``."""
+    return f"{dpi}dpi-q{quality}"
+
+
+def pdf_page_count(pdf_path: Path) -> int:
+    """Number of pages in a PDF."""
+    import fitz
+
+    with fitz.open(pdf_path) as doc:
+        return len(doc)
+
+
+def plan_page_chunks(pages: list[int], workers: int, chunk_size: int | None = None) -> list[list[int]]:
+    """Split pages into contiguous ranges for the process backend.
+
+    Runs of consecutive page numbers are kept together (a worker seeks once
+    per range) and cut into pieces of at most ``chunk_size`` pages. Without a
+    chunk size, pages are spread evenly over ``workers``. Input order is kept.
+    """
+    if not pages:
+        return []
+    if chunk_size is None:
+        chunk_size = max(1, math.ceil(len(pages) / max(1, workers)))
+
+    chunks: list[list[int]] = []
+    current: list[int] = []
+    for page in pages:
+        if current and (page != current[-1] + 1 or len(current) >= chunk_size):
+            chunks.append(current)
+            current = []
+        current.append(page)
+    chunks.append(current)
+    return chunks
+
+
+def _render_page_to_webp(doc, page_num: int, output_dir: Path, dpi: int, quality: int) -> Path | None:
+    """Render one page of an open fitz document to ``<page_num>.webp``."""
+    import fitz
+    from PIL import Image
+
+    try:
+        page = doc[page_num]
+
+        # Calculate matrix for DPI
+        mat = fitz.Matrix(dpi / 72, dpi / 72)
+        pix = page.get_pixmap(matrix=mat)
+
+        # Convert to PIL Image
+        img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
+
+        # Save as WebP
+        output_path = output_dir / f"{page_num}.webp"
+        img.save(output_path, "WEBP", quality=quality, method=6)
+
+        return output_path
+    except Exception as e:
+        print(f"Error rendering page {page_num}: {e}")
+        return None
+
+
+def render_page_range(
+    pdf_path: str, pages: list[int], output_dir: str, dpi: int, quality: int
+) -> list[str | None]:
+    """Render a range of pages in a worker process.
+
+    Each worker opens the PDF itself, so no document handle crosses process
+    boundaries. Returns output paths as strings (None for failed pages).
+    """
+    import fitz
+
+    out = Path(output_dir)
+    doc = fitz.open(pdf_path)
+    try:
+        results = []
+        for page_num in pages:
+            path = _render_page_to_webp(doc, page_num, out, dpi, quality)
+            results.append(str(path) if path is not None else None)
+        return results
+    finally:
+        doc.close()
+
+
 class PDFRenderer:
-    """Render PDF pages to WebP images using PyMuPDF."""
+    """Render PDF pages to WebP images using PyMuPDF.
+
+    The ``thread`` backend renders pages of one shared document in a thread
+    pool. WebP encoding holds the GIL, so large documents render faster with
+    the ``process`` backend, which hands contiguous page ranges to worker
+    processes that each open the PDF themselves.
+    """
     
     def __init__(self, config: ExtractConfig):
         self.config = config
+        self.page_count: int | None = None
+        """Total pages of the last rendered PDF."""
     
     async def render(self, pdf_path: Path, output_dir: Path) -> list[Path]:
         """Render PDF to WebP pages.
@@ -108,12 +221,12 @@ class PDFRenderer:
             List of paths to rendered WebP files
         """
         import fitz
-        from PIL import Image
         
         output_dir.mkdir(parents=True, exist_ok=True)
         
         # Open PDF
         doc = fitz.open(pdf_path)
+        self.page_count = len(doc)
         
         # Determine pages to render
         if self.config.pages:
@@ -121,11 +234,15 @@ class PDFRenderer:
         else:
             pages = list(range(len(doc)))
         
+        if self.config.backend == "process":
+            doc.close()
+            return await self._render_processes(pdf_path, pages, output_dir)
+        
         rendered = []
         
         # Use thread pool for CPU-intensive rendering
         loop = asyncio.get_event_loop()
-        with ThreadPoolExecutor() as executor:
+        with ThreadPoolExecutor(max_workers=self._workers()) as executor:
             futures = [
                 loop.run_in_executor(
                     executor,
@@ -141,41 +258,56 @@ class PDFRenderer:
         doc.close()
         return [p for p in rendered if p is not None]
     
+    async def _render_processes(self, pdf_path: Path, pages: list[int], output_dir: Path) -> list[Path]:
+        """Render page ranges in a process pool (one document per worker)."""
+        workers = self._workers()
+        chunks = plan_page_chunks(pages, workers, self.config.chunk_size)
+        if not chunks:
+            return []
+        
+        loop = asyncio.get_running_loop()
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as executor:
+            futures = [
+                loop.run_in_executor(
+                    executor,
+                    render_page_range,
+                    str(pdf_path),
+                    chunk,
+                    str(output_dir),
+                    self.config.dpi,
+                    self.config.quality,
+                )
+                for chunk in chunks
+            ]
+            results = await asyncio.gather(*futures)
+        
+        return [Path(p) for chunk in results for p in chunk if p is not None]
+    
+    def _workers(self) -> int:
+        """Configured worker count, defaulting to the CPU count for both backends."""
+        return self.config.workers or os.cpu_count() or 1
+
     def _render_page(self, doc, page_num: int, output_dir: Path) -> Path | None:
         """Render a single page (sync, called in thread pool)."""
-        import fitz
-        from PIL import Image
-        
-        try:
-            page = doc[page_num]
-            
-            # Calculate matrix for DPI
-            mat = fitz.Matrix(self.config.dpi / 72, self.config.dpi / 72)
-            pix = page.get_pixmap(matrix=mat)
-            
-            # Convert to PIL Image
-            img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
-            
-            # Save as WebP
-            output_path = output_dir / f"{page_num}.webp"
-            img.save(output_path, "WEBP", quality=self.config.quality, method=6)
-            
-            return output_path
-        except Exception as e:
-            print(f"Error rendering page {page_num}: {e}")
-            return None
+        return _render_page_to_webp(doc, page_num, output_dir, self.config.dpi, self.config.quality)
 
 
 class FormatConverter:
     """Convert various formats to PDF."""
     
     @classmethod
-    async def convert_to_pdf(cls, input_path: Path, output_path: Path) -> bool:
+    async def convert_to_pdf(
+        cls,
+        input_path: Path,
+        output_path: Path,
+        office: "LibreOfficeWorker | None" = None,
+    ) -> bool:
         """Convert file to PDF.
         
         Args:
             input_path: Input file path
             output_path: Output PDF path
+            office: Shared LibreOffice worker; one ``soffice`` per call if None
             
         Returns:
             True if successful
@@ -189,6 +321,8 @@ class FormatConverter:
         elif category == "image":
             return await cls._image_to_pdf(input_path, output_path)
         elif category in ("document", "markup"):
+            if office is not None:
+                return await office.convert(input_path, output_path)
             return await cls._libreoffice_convert(input_path, output_path)
         
         return False
@@ -254,9 +388,36 @@ class FormatConverter:
                 return False
 
 
+@dataclass
+class StreamedMember:
+    """An archive member read by ``ArchiveExtractor.stream``."""
+
+    name: str
+    """Flattened file name of the member."""
+
+    hash: str
+    """SHA256 of the member content (hex digest)."""
+
+    path: Path | None
+    """Extracted file, or None when its blob already exists (not written)."""
+
+    @property
+    def known(self) -> bool:
+        return self.path is None
+
+
 class ArchiveExtractor:
     """Extract archive files."""
     
+    STREAMABLE = {"zip", "tar", "tar.gz", "gzip"}
+    """Archive types read member by member in-process."""
+    
+    SPOOL_MAX = 8 * 1024 * 1024
+    """Members up to this size are hashed in memory before touching disk."""
+    
+    READ_AHEAD = 4
+    """Streamed members buffered ahead of the consumer."""
+    
     @classmethod
     async def extract(cls, archive_path: Path, output_dir: Path) -> list[Path]:
         """Extract archive and return list of extracted files.
@@ -286,75 +447,176 @@ class ArchiveExtractor:
         
         return []
     
-    @classmethod
-    async def _extract_zip(cls, archive_path: Path, output_dir: Path) -> list[Path]:
-        """Extract ZIP file with encoding handling."""
-        import zipfile
+    @staticmethod
+    def _decode_zip_name(member: str) -> str:
+        """Flattened, sanitized file name of a zip member (handles GBK names)."""
+        # Try to fix encoding issues (common with Chinese filenames)
+        try:
+            # First try UTF-8
+            decoded_name = member.encode('cp437').decode('utf-8')
+        except (UnicodeDecodeError, UnicodeEncodeError):
+            try:
+                # Then try GBK (common for Chinese zip files)
+                decoded_name = member.encode('cp437').decode('gbk')
+            except (UnicodeDecodeError, UnicodeEncodeError):
+                # Fall back to original
+                decoded_name = member
         
+        # Flatten: use basename only
+        safe_name = Path(decoded_name).name
+        # Sanitize filename (remove/replace problematic chars)
+        safe_name = "".join(c if c.isalnum() or c in '._- ' else '_' for c in safe_name)
+        return safe_name or "unnamed_file"
+    
+    @staticmethod
+    def _unique_target(output_dir: Path, name: str) -> Path:
+        """Target path in output_dir, suffixed with _N if the name is taken."""
+        target_path = output_dir / name
+        counter = 1
+        while target_path.exists():
+            target_path = output_dir / f"{Path(name).stem}_{counter}{Path(name).suffix}"
+            counter += 1
+        return target_path
+    
+    @classmethod
+    def _iter_members(cls, archive_path: Path, archive_type: str):
+        """Yield ``(name, fileobj)`` for each regular member, in archive order.
+
+        Tar archives are read as a stream, so gzip data is decompressed once.
+        """
+        if archive_type == "zip":
+            import zipfile
+            
+            with zipfile.ZipFile(archive_path, 'r') as zf:
+                for info in zf.infolist():
+                    member = info.filename
+                    # Skip directories and hidden files
+                    if member.endswith('/') or member.startswith('__MACOSX') or member.startswith('.'):
+                        continue
+                    with zf.open(info) as src:
+                        yield cls._decode_zip_name(member), src
+        else:
+            import tarfile
+            
+            with tarfile.open(archive_path, 'r|*') as tf:
+                for member in tf:
+                    if not member.isfile() or member.name.startswith('.') or '__MACOSX' in member.name:
+                        continue
+                    name = Path(member.name).name
+                    if not name:
+                        continue
+                    src = tf.extractfile(member)
+                    with src:
+                        yield name, src
+    
+    @classmethod
+    def _extract_members(cls, archive_path: Path, archive_type: str, output_dir: Path) -> list[Path]:
         extracted = []
-        with zipfile.ZipFile(archive_path, 'r') as zf:
-            # Try to fix encoding issues (common with Chinese filenames)
-            for member in zf.namelist():
-                # Skip directories and hidden files
-                if member.endswith('/') or member.startswith('__MACOSX') or member.startswith('.'):
-                    continue
-                
-                # Try to decode/fix encoding
-                try:
-                    # First try UTF-8
-                    decoded_name = member.encode('cp437').decode('utf-8')
-                except (UnicodeDecodeError, UnicodeEncodeError):
-                    try:
-                        # Then try GBK (common for Chinese zip files)
-                        decoded_name = member.encode('cp437').decode('gbk')
-                    except (UnicodeDecodeError, UnicodeEncodeError):
-                        # Fall back to original
-                        decoded_name = member
-                
-                # Flatten: use basename only
-                safe_name = Path(decoded_name).name
-                # Sanitize filename (remove/replace problematic chars)
-                safe_name = "".join(c if c.isalnum() or c in '._- ' else '_' for c in safe_name)
-                if not safe_name:
-                    safe_name = "unnamed_file"
-                
-                target_path = output_dir / safe_name
-                
-                # Handle duplicates
-                counter = 1
-                original_target = target_path
-                while target_path.exists():
-                    stem = original_target.stem
-                    suffix = original_target.suffix
-                    target_path = output_dir / f"{stem}_{counter}{suffix}"
-                    counter += 1
-                    
-                with zf.open(member) as src, open(target_path, 'wb') as dst:
-                    shutil.copyfileobj(src, dst)
-                extracted.append(target_path)
-        
+        for name, src in cls._iter_members(archive_path, archive_type):
+            target_path = cls._unique_target(output_dir, name)
+            with open(target_path, 'wb') as dst:
+                shutil.copyfileobj(src, dst)
+            extracted.append(target_path)
         return extracted
     
+    @classmethod
+    async def _extract_zip(cls, archive_path: Path, output_dir: Path) -> list[Path]:
+        """Extract ZIP file with encoding handling."""
+        return await asyncio.to_thread(cls._extract_members, archive_path, "zip", output_dir)
+    
     @classmethod
     async def _extract_tar(cls, archive_path: Path, output_dir: Path) -> list[Path]:
         """Extract TAR/TAR.GZ file."""
-        import tarfile
+        return await asyncio.to_thread(cls._extract_members, archive_path, "tar", output_dir)
+    
+    @classmethod
+    def _spool_member(
+        cls, name: str, src, output_dir: Path, is_known: Callable[[str], bool]
+    ) -> StreamedMember:
+        """Hash a member while reading it; write it out only if its blob is unknown."""
+        h = hashlib.sha256()
+        with tempfile.SpooledTemporaryFile(max_size=cls.SPOOL_MAX, dir=output_dir) as spool:
+            for chunk in iter(lambda: src.read(1024 * 1024), b""):
+                h.update(chunk)
+                spool.write(chunk)
+            digest = h.hexdigest()
+            if is_known(digest):
+                return StreamedMember(name=name, hash=digest, path=None)
+            target_path = cls._unique_target(output_dir, name)
+            spool.seek(0)
+            with open(target_path, 'wb') as dst:
+                shutil.copyfileobj(spool, dst)
+        return StreamedMember(name=name, hash=digest, path=target_path)
+    
+    @classmethod
+    async def stream(
+        cls,
+        archive_path: Path,
+        output_dir: Path,
+        is_known: Callable[[str], bool],
+    ) -> AsyncIterator[StreamedMember]:
+        """Extract an archive member by member without blocking the event loop.
+
+        Zip and tar members are read in a worker thread, hashed while they
+        are read, and yielded as soon as each one is complete; members whose
+        hash satisfies ``is_known`` are never written to disk. Other archive
+        types are unpacked with external tools first, then hashed.
         
-        extracted = []
-        with tarfile.open(archive_path, 'r:*') as tf:
-            for member in tf.getmembers():
-                if not member.isfile() or member.name.startswith('.') or '__MACOSX' in member.name:
-                    continue
-                
-                target_path = output_dir / Path(member.name).name
-                if not target_path.name:
-                    continue
-                
-                with tf.extractfile(member) as src, open(target_path, 'wb') as dst:
-                    shutil.copyfileobj(src, dst)
-                extracted.append(target_path)
+        Args:
+            archive_path: Path to archive
+            output_dir: Directory for extracted members
+            is_known: Called with a member hash; True skips the member
+        """
+        category, archive_type = FileTypeDetector.detect(archive_path)
+        if category != "archive":
+            return
+        output_dir.mkdir(parents=True, exist_ok=True)
         
-        return extracted
+        if archive_type not in cls.STREAMABLE:
+            for file in await cls.extract(archive_path, output_dir):
+                digest = await asyncio.to_thread(DocExtractor.compute_hash, file)
+                if is_known(digest):
+                    file.unlink()
+                    yield StreamedMember(name=file.name, hash=digest, path=None)
+                else:
+                    yield StreamedMember(name=file.name, hash=digest, path=file)
+            return
+        
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=cls.READ_AHEAD)
+        stop = threading.Event()
+        done = object()
+        
+        def put(item):
+            asyncio.run_coroutine_threadsafe(queue.put(item), loop).result()
+        
+        def produce():
+            try:
+                for name, src in cls._iter_members(archive_path, archive_type):
+                    if stop.is_set():
+                        return
+                    put(cls._spool_member(name, src, output_dir, is_known))
+            except Exception as e:
+                put(e)
+            finally:
+                put(done)
+        
+        producer = loop.run_in_executor(None, produce)
+        try:
+            while True:
+                item = await queue.get()
+                if item is done:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            # Unblock the producer if the consumer stopped early
+            stop.set()
+            while not producer.done():
+                while not queue.empty():
+                    queue.get_nowait()
+                await asyncio.sleep(0.01)
     
     @classmethod
     async def _extract_rar(cls, archive_path: Path, output_dir: Path) -> list[Path]:
@@ -425,27 +687,35 @@ class DocExtractor:
     
     def __init__(self):
         self.BLOBS_DIR.mkdir(parents=True, exist_ok=True)
+        self._index: "BlobIndex | None" = None
+
+    @property
+    def index(self) -> "BlobIndex":
+        """Blob index reused by lookups (it syncs incrementally on each read)."""
+        if self._index is None:
+            from .index import BlobIndex
+
+            self._index = BlobIndex()
+        return self._index
     
     @staticmethod
     def compute_hash(path: Path) -> str:
-        """Compute SHA256 hash of file."""
-        h = hashlib.sha256()
-        with open(path, "rb") as f:
-            for chunk in iter(lambda: f.read(8192), b""):
-                h.update(chunk)
-        return h.hexdigest()
+        """Compute SHA256 hash of file (hashed from a read-only mapping)."""
+        return hash_file(path)
     
     async def extract(
         self, 
         input_path: Path, 
         config: ExtractConfig | None = None,
         source_archive: tuple[str, str, str] | None = None,
+        stages: "PipelineStages | None" = None,
     ) -> ExtractionResult:
         """Extract document to blob storage.
         
         Args:
             input_path: Path to input file
             config: Extraction configuration
+            stages: Concurrency limits of a batch pipeline (unbounded if None)
             
         Returns:
             ExtractionResult with blob reference and page paths
@@ -461,62 +731,230 @@ class DocExtractor:
         
         # Handle archives: extract first
         if category == "archive":
-            return await self._process_archive(input_path, config)
+            return await self._process_archive(input_path, config, stages)
         
-        return await self._process_single(input_path, config, source_archive)
+        return await self._process_single(input_path, config, source_archive, stages)
+    
+    async def _hash(self, path: Path, stages: "PipelineStages | None") -> str:
+        """Hash a file off the event loop, within the hashing stage limit."""
+        async with stages.hash if stages else nullcontext():
+            return await asyncio.to_thread(self.compute_hash, path)
     
     async def _process_archive(
         self, 
         archive_path: Path, 
-        config: ExtractConfig
+        config: ExtractConfig,
+        stages: "PipelineStages | None" = None,
     ) -> ExtractionResult:
-        """Process archive file, extracting and processing all valid documents."""
+        """Process archive file, extracting and processing all valid documents.
+
+        Members are streamed: each one is hashed while it is read, members
+        whose blob already exists are not written or reprocessed, and new
+        members start processing as soon as they are extracted. Returns the
+        result of the first document, with every document in ``members``.
+        """
+        from .pipeline import PipelineStages, StageLimits
+
+        owns_stages = stages is None
+        if owns_stages:
+            stages = PipelineStages(StageLimits())
+
         # Compute archive hash
-        archive_hash = self.compute_hash(archive_path)
+        archive_hash = await self._hash(archive_path, stages)
         
-        with tempfile.TemporaryDirectory() as tmpdir:
-            extracted = await ArchiveExtractor.extract(archive_path, Path(tmpdir))
-            if not extracted:
-                raise ValueError(f"Failed to extract archive: {archive_path}")
-            
-            # Process first valid document
-            for file in extracted:
-                cat, _ = FileTypeDetector.detect(file)
-                if cat in ("pdf", "image", "document", "markup"):
-                    inner_path = file.name  # Flattened, so just filename
-                    return await self._process_single(
-                        file, 
-                        config,
-                        source_archive=(archive_hash, archive_path.name, inner_path)
-                    )
+        try:
+            with tempfile.TemporaryDirectory() as tmpdir:
+                tasks: dict[str, asyncio.Future] = {}
+                order: list[str] = []
+                extracted = 0
+                try:
+                    async for member in ArchiveExtractor.stream(
+                        archive_path, Path(tmpdir), lambda h: BlobRef(hash=h).exists()
+                    ):
+                        extracted += 1
+                        if member.hash in tasks:
+                            # Same content twice in one archive: process once
+                            if member.path is not None:
+                                member.path.unlink()
+                            continue
+                        if member.known:
+                            tasks[member.hash] = asyncio.ensure_future(
+                                self._render_cached(BlobRef(hash=member.hash), config, stages)
+                            )
+                        else:
+                            cat, _ = FileTypeDetector.detect(member.path)
+                            if cat not in ("pdf", "image", "document", "markup"):
+                                member.path.unlink()
+                                continue
+                            tasks[member.hash] = asyncio.ensure_future(
+                                self._process_single(
+                                    member.path,
+                                    config,
+                                    source_archive=(archive_hash, archive_path.name, member.name),
+                                    stages=stages,
+                                    file_hash=member.hash,
+                                )
+                            )
+                        order.append(member.hash)
+                    results = await asyncio.gather(*(tasks[h] for h in order), return_exceptions=True)
+                except BaseException:
+                    for task in tasks.values():
+                        task.cancel()
+                    await asyncio.gather(*tasks.values(), return_exceptions=True)
+                    raise
+        finally:
+            if owns_stages:
+                await stages.office.close()
+
+        if not extracted:
+            raise ValueError(f"Failed to extract archive: {archive_path}")
+        members = [r for r in results if isinstance(r, ExtractionResult)]
+        if not members:
+            errors = [r for r in results if isinstance(r, BaseException)]
+            if errors:
+                raise errors[0]
             raise ValueError("No valid documents found in archive")
+        for error in (r for r in results if isinstance(r, BaseException)):
+            print(f"Error processing archive member: {error}")
+
+        first = members[0]
+        return ExtractionResult(
+            blob=first.blob,
+            page_count=first.page_count,
+            page_paths=first.page_paths,
+            members=members,
+        )
+
+    @staticmethod
+    def _write_meta(blob_dir: Path, meta: dict) -> None:
+        fd, tmp = tempfile.mkstemp(dir=blob_dir, prefix=".meta.json-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(meta, f, indent=2)
+            os.replace(tmp, blob_dir / "meta.json")
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    @classmethod
+    def _add_rendition(cls, blob_dir: Path, key: str, rel: str, pdf_pages: int | None) -> None:
+        """Record a rendition in ``meta.json``, re-reading it under the blob lock."""
+        with open(blob_dir / META_LOCK, "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            meta = json.loads((blob_dir / "meta.json").read_text())
+            renditions = cls._renditions(meta)
+            renditions[key] = rel
+            meta["renditions"] = renditions
+            if pdf_pages is not None:
+                meta["pdf_page_count"] = pdf_pages
+            cls._write_meta(blob_dir, meta)
+
+    @staticmethod
+    def _renditions(meta: dict) -> dict[str, str]:
+        """Rendition key -> directory relative to the blob (``pages`` is the first rendition)."""
+        return meta.get("renditions") or {
+            rendition_key(meta.get("dpi", 150), meta.get("quality", 85)): "pages"
+        }
+
+    async def _render_cached(
+        self,
+        blob: BlobRef,
+        config: ExtractConfig,
+        stages: "PipelineStages | None" = None,
+    ) -> ExtractionResult:
+        """Serve an existing blob, rendering only the pages this config lacks.
+
+        Each ``dpi``/``quality`` pair is a separate rendition directory, so
+        asking for one high-DPI page of a large document renders one page.
+        """
+        meta = json.loads(blob.meta_path.read_text())
+        key = rendition_key(config.dpi, config.quality)
+        renditions = self._renditions(meta)
+        target = blob.path / renditions.get(key, f"{RENDITIONS_DIR}/{key}")
+        total = meta.get("pdf_page_count")
+
+        if not config.pages and total is None:
+            try:
+                total = await asyncio.to_thread(pdf_page_count, blob.pdf_path)
+            except ImportError as e:
+                # Cannot count pages without PyMuPDF: serve what exists
+                logger.warning(f"Cannot render {key} of blob {blob.hash[:12]} ({e}); serving cached pages")
+                return self._cached_result(blob)
+        if config.pages:
+            wanted = [p for p in config.pages if p >= 0 and (total is None or p < total)]
+        else:
+            wanted = list(range(total))
+
+        missing = [p for p in wanted if not (target / f"{p}.webp").exists()]
+        if missing:
+            # Render into a staging directory and move pages in one by one,
+            # so an interrupted render never leaves a truncated page behind
+            staging = Path(tempfile.mkdtemp(prefix="render_", dir=blob.path))
+            try:
+                renderer = PDFRenderer(replace(config, pages=missing))
+                async with stages.render if stages else nullcontext():
+                    rendered = await renderer.render(blob.pdf_path, staging)
+                target.mkdir(parents=True, exist_ok=True)
+                for path in rendered:
+                    os.replace(path, target / path.name)
+            except ImportError as e:
+                logger.warning(f"Cannot render {key} of blob {blob.hash[:12]} ({e}); serving cached pages")
+                return self._cached_result(blob)
+            finally:
+                shutil.rmtree(staging, ignore_errors=True)
+
+            await asyncio.to_thread(
+                self._add_rendition,
+                blob.path,
+                key,
+                target.relative_to(blob.path).as_posix(),
+                renderer.page_count,
+            )
+
+        page_paths = [target / f"{p}.webp" for p in wanted]
+        page_paths = [p for p in page_paths if p.exists()]
+        return ExtractionResult(
+            blob=BlobRef(hash=blob.hash, cached=not missing),
+            page_count=len(page_paths),
+            page_paths=page_paths,
+        )
+
+    def _cached_result(self, blob: BlobRef) -> ExtractionResult:
+        """Result for a blob that already exists in the store (first rendition)."""
+        # Read metadata to get page count
+        meta = json.loads(blob.meta_path.read_text())
+        page_count = meta.get("page_count", 0)
+        page_paths = sorted(blob.pages_dir.glob("*.webp")) if blob.pages_dir.exists() else []
+        return ExtractionResult(
+            blob=BlobRef(hash=blob.hash, cached=True),
+            page_count=page_count,
+            page_paths=page_paths,
+        )
 
     async def _process_single(
         self,
         input_path: Path,
         config: ExtractConfig,
         source_archive: tuple[str, str, str] | None = None,
+        stages: "PipelineStages | None" = None,
+        file_hash: str | None = None,
     ) -> ExtractionResult:
         """Process a single file with transactional semantics.
 
         Uses a temporary directory for processing and only moves to final
         location on success. Ensures no incomplete blobs on failure.
+        Hashing, conversion and rendering each run under their own
+        ``stages`` limit when a batch pipeline supplies them. ``file_hash``
+        skips hashing when the caller already knows the digest.
         """
         # Compute hash
-        file_hash = self.compute_hash(input_path)
+        if file_hash is None:
+            file_hash = await self._hash(input_path, stages)
         blob = BlobRef(hash=file_hash)
 
         # Check cache
         if blob.exists():
-            # Read metadata to get page count
-            meta = json.loads(blob.meta_path.read_text())
-            page_count = meta.get("page_count", 0)
-            page_paths = sorted(blob.pages_dir.glob("*.webp")) if blob.pages_dir.exists() else []
-            return ExtractionResult(
-                blob=BlobRef(hash=file_hash, cached=True),
-                page_count=page_count,
-                page_paths=page_paths,
-            )
+            return await self._render_cached(blob, config, stages)
 
         # Use temporary directory for atomic processing
         temp_dir = Path(tempfile.mkdtemp(prefix="blob_", dir=self.BLOBS_DIR))
@@ -528,14 +966,22 @@ class DocExtractor:
 
             # Convert to PDF
             pdf_path = temp_dir / "source.pdf"
-            success = await FormatConverter.convert_to_pdf(input_path, pdf_path)
+            if stages is None:
+                success = await FormatConverter.convert_to_pdf(input_path, pdf_path)
+            elif stages.office is not None and FileTypeDetector.detect(input_path)[0] in ("document", "markup"):
+                # The shared LibreOffice worker bounds its own instances
+                success = await FormatConverter.convert_to_pdf(input_path, pdf_path, office=stages.office)
+            else:
+                async with stages.convert:
+                    success = await FormatConverter.convert_to_pdf(input_path, pdf_path)
             if not success:
                 raise RuntimeError(f"Failed to convert to PDF: {input_path}")
 
             # Render to WebP
             pages_dir = temp_dir / "pages"
             renderer = PDFRenderer(config)
-            page_paths = await renderer.render(pdf_path, pages_dir)
+            async with stages.render if stages else nullcontext():
+                page_paths = await renderer.render(pdf_path, pages_dir)
 
             # Prepare metadata
             category, file_type = FileTypeDetector.detect(input_path)
@@ -548,6 +994,8 @@ class DocExtractor:
                 "page_count": len(page_paths),
                 "dpi": config.dpi,
                 "quality": config.quality,
+                "pdf_page_count": renderer.page_count,
+                "renditions": {rendition_key(config.dpi, config.quality): "pages"},
                 "created_at": datetime.now().isoformat(),
                 "source_archive": {
                     "hash": source_archive[0],
@@ -560,6 +1008,11 @@ class DocExtractor:
             meta_path = temp_dir / "meta.json"
             meta_path.write_text(json.dumps(meta, indent=2))
 
+            # Another extraction of the same content finished first
+            if blob.exists():
+                shutil.rmtree(temp_dir, ignore_errors=True)
+                return await self._render_cached(blob, config, stages)
+
             # Atomic move: temp -> final
             shutil.move(str(temp_dir), str(blob.path))
 
@@ -578,11 +1031,20 @@ class DocExtractor:
     async def extract_batch(
         self, 
         input_paths: list[Path], 
-        config: ExtractConfig | None = None
-    ) -> list[ExtractionResult]:
-        """Extract multiple documents."""
-        tasks = [self.extract(p, config) for p in input_paths]
-        return await asyncio.gather(*tasks, return_exceptions=True)
+        config: ExtractConfig | None = None,
+        limits: "StageLimits | None" = None,
+    ) -> list[ExtractionResult | BaseException]:
+        """Extract multiple documents through a bounded batch pipeline.
+
+        Results are returned in input order; failures are returned as
+        exceptions. Use ``BatchPipeline.run`` to stream results instead.
+        """
+        from .pipeline import BatchPipeline
+
+        results: list[ExtractionResult | BaseException | None] = [None] * len(input_paths)
+        async for outcome in BatchPipeline(self, config, limits).run(input_paths):
+            results[outcome.index] = outcome.result if outcome.error is None else outcome.error
+        return results
     
     def list_blobs(self) -> list[BlobRef]:
         """List all stored blobs."""
@@ -593,7 +1055,17 @@ class DocExtractor:
         return blobs
     
     def get_blob(self, hash_prefix: str) -> BlobRef | None:
-        """Get blob by hash prefix."""
+        """Get blob by hash prefix.
+
+        Full hashes are checked directly and prefixes are resolved through
+        the blob index; the blobs directory is only scanned for blobs the
+        index does not know.
+        """
+        if len(hash_prefix) == 64 and (self.BLOBS_DIR / hash_prefix).is_dir():
+            return BlobRef(hash=hash_prefix)
+        entry = self.index.get_entry(hash_prefix)
+        if entry is not None and (self.BLOBS_DIR / entry["hash"]).is_dir():
+            return BlobRef(hash=entry["hash"])
         for path in self.BLOBS_DIR.iterdir():
             if path.name.startswith(hash_prefix):
                 return BlobRef(hash=path.name)
@@ -1,204 +1,331 @@
-"""Lightweight index for blob metadata."""
+"""Lightweight index for blob metadata.
 
+The index is an append-only JSONL log (`~/.monoco/blobs/index.jsonl`): every
+add appends the entry, every removal appends a tombstone
+(`{"hash": ..., "deleted": true}`). Replaying the log builds in-memory maps
+by hash, by sorted hash (prefix lookups via bisect) and by source archive,
+so add is an O(1) append and lookups are O(1) / O(log n). Lines appended by
+other processes are picked up incrementally; the log is compacted once
+superseded lines outnumber live entries.
+
+A legacy `index.yaml` is migrated on first use.
+"""
+
+import bisect
 import json
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Self
 
 import yaml
 
 from .models import BlobRef
 
+# Compact once this many superseded lines accumulate and they outnumber live entries
+COMPACT_MIN_GARBAGE = 256
+
+
+def _entry_from_meta(blob: BlobRef) -> dict | None:
+    """Build an index entry from a blob's meta.json (None if unreadable)."""
+    try:
+        meta = json.loads(blob.meta_path.read_text())
+    except Exception:
+        return None
+
+    # Build entry
+    entry = {
+        "hash": blob.hash,
+        "name": meta.get("original_name", "unknown"),
+        "file_type": meta.get("file_type", "unknown"),
+        "category": meta.get("category", "unknown"),
+        "page_count": meta.get("page_count", 0),
+        "created_at": meta.get("created_at", datetime.now().isoformat()),
+    }
+
+    # Add archive info if present
+    if meta.get("source_archive"):
+        entry["source_archive"] = {
+            "hash": meta["source_archive"]["hash"],
+            "name": meta["source_archive"]["name"],
+        }
+    return entry
+
 
 class BlobIndex:
-    """Lightweight YAML index for blob metadata.
-    
+    """Append-only JSONL index for blob metadata.
+
     This index is maintained for fast search and listing operations.
     It can be rebuilt from individual blob meta.json files if corrupted.
     """
-    
-    INDEX_PATH = Path.home() / ".monoco" / "blobs" / "index.yaml"
-    
-    def __init__(self):
-        self._data: dict | None = None
-    
-    def _load(self) -> dict:
-        """Load index from disk."""
-        if self._data is not None:
-            return self._data
-        
-        if not self.INDEX_PATH.exists():
-            self._data = {"version": "1.0", "updated_at": None, "entries": []}
-            return self._data
-        
+
+    INDEX_PATH = Path.home() / ".monoco" / "blobs" / "index.jsonl"
+
+    def __init__(self, path: Path | None = None):
+        if path is not None:
+            self.INDEX_PATH = Path(path)
+        self._entries: dict[str, dict] | None = None
+        self._sorted: list[str] = []
+        self._by_archive: dict[str, dict[str, None]] = {}
+        self._garbage = 0
+        self._offset = 0
+        self._inode: int | None = None
+
+    @property
+    def legacy_path(self) -> Path:
+        """The YAML index used before the JSONL log."""
+        return self.INDEX_PATH.with_name("index.yaml")
+
+    def _reset(self) -> None:
+        self._entries = {}
+        self._sorted = []
+        self._by_archive = {}
+        self._garbage = 0
+        self._offset = 0
+        self._inode = None
+
+    def _apply(self, record: dict) -> None:
+        """Apply one log record to the in-memory maps."""
+        blob_hash = record.get("hash")
+        if not blob_hash:
+            return
+        old = self._entries.pop(blob_hash, None)
+        if old is not None:
+            self._garbage += 1
+            archive = (old.get("source_archive") or {}).get("hash")
+            if archive:
+                self._by_archive.get(archive, {}).pop(blob_hash, None)
+
+        if record.get("deleted"):
+            self._garbage += 1
+            if old is not None:
+                del self._sorted[bisect.bisect_left(self._sorted, blob_hash)]
+            return
+
+        # Re-insertion moves the entry to the end (most recent)
+        self._entries[blob_hash] = record
+        if old is None:
+            bisect.insort(self._sorted, blob_hash)
+        archive = (record.get("source_archive") or {}).get("hash")
+        if archive:
+            self._by_archive.setdefault(archive, {})[blob_hash] = None
+
+    def _sync(self) -> dict[str, dict]:
+        """Replay lines appended since the last read (full replay after a rewrite)."""
+        if self._entries is None:
+            self._reset()
+            self._migrate_legacy()
+
         try:
-            with open(self.INDEX_PATH, "r", encoding="utf-8") as f:
-                self._data = yaml.safe_load(f) or {"version": "1.0", "entries": []}
-        except Exception:
-            self._data = {"version": "1.0", "updated_at": None, "entries": []}
-        
-        return self._data
-    
-    def _save(self) -> None:
-        """Save index to disk."""
+            st = os.stat(self.INDEX_PATH)
+        except FileNotFoundError:
+            if self._offset:
+                self._reset()
+            return self._entries
+
+        if st.st_ino != self._inode or st.st_size < self._offset:
+            self._reset()
+            self._inode = st.st_ino
+        if st.st_size == self._offset:
+            return self._entries
+
+        with open(self.INDEX_PATH, "rb") as f:
+            f.seek(self._offset)
+            data = f.read()
+        # Leave a partially written last line for the next sync
+        end = data.rfind(b"\n") + 1
+        for line in data[:end].splitlines():
+            try:
+                self._apply(json.loads(line))
+            except (ValueError, AttributeError):
+                self._garbage += 1
+        self._offset += end
+        return self._entries
+
+    def _load(self) -> dict[str, dict]:
+        """Load index from disk (incrementally)."""
+        return self._sync()
+
+    def _append(self, records: list[dict]) -> None:
+        self._sync()
         self.INDEX_PATH.parent.mkdir(parents=True, exist_ok=True)
-        self._data["updated_at"] = datetime.now().isoformat()
-        with open(self.INDEX_PATH, "w", encoding="utf-8") as f:
-            yaml.dump(self._data, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
-    
-    def add(self, blob: BlobRef) -> None:
-        """Add or update index entry from blob metadata."""
-        if not blob.meta_path.exists():
+        payload = "".join(json.dumps(r, ensure_ascii=False) + "\n" for r in records)
+        with open(self.INDEX_PATH, "a", encoding="utf-8") as f:
+            f.write(payload)
+        # Replay our own lines (and anything another process appended first)
+        self._sync()
+        if self._garbage >= COMPACT_MIN_GARBAGE and self._garbage > len(self._entries):
+            self.compact()
+
+    def _write_all(self, entries: list[dict]) -> None:
+        """Atomically replace the log with the given entries (oldest first)."""
+        self.INDEX_PATH.parent.mkdir(parents=True, exist_ok=True)
+        # Unique temp name: concurrent compactions must not share a file
+        fd, tmp = tempfile.mkstemp(dir=self.INDEX_PATH.parent, prefix=".index-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                for entry in entries:
+                    f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            os.replace(tmp, self.INDEX_PATH)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        self._reset()
+        self._sync()
+
+    def _migrate_legacy(self) -> None:
+        """Convert a legacy YAML index (newest first) into the JSONL log."""
+        legacy = self.legacy_path
+        if legacy == self.INDEX_PATH or self.INDEX_PATH.exists() or not legacy.exists():
             return
-        
         try:
-            meta = json.loads(blob.meta_path.read_text())
+            with open(legacy, "r", encoding="utf-8") as f:
+                data = yaml.safe_load(f) or {}
         except Exception:
             return
-        
-        index = self._load()
-        
-        # Build entry
-        entry = {
-            "hash": blob.hash,
-            "name": meta.get("original_name", "unknown"),
-            "file_type": meta.get("file_type", "unknown"),
-            "category": meta.get("category", "unknown"),
-            "page_count": meta.get("page_count", 0),
-            "created_at": meta.get("created_at", datetime.now().isoformat()),
-        }
-        
-        # Add archive info if present
-        if meta.get("source_archive"):
-            entry["source_archive"] = {
-                "hash": meta["source_archive"]["hash"],
-                "name": meta["source_archive"]["name"],
-            }
-        
-        # Remove existing entry with same hash
-        index["entries"] = [e for e in index["entries"] if e["hash"] != blob.hash]
-        
-        # Add new entry (at beginning for recency)
-        index["entries"].insert(0, entry)
-        
-        self._save()
-    
+        entries = [e for e in data.get("entries", []) if isinstance(e, dict) and e.get("hash")]
+        self._write_all(list(reversed(entries)))
+        legacy.replace(legacy.with_name(legacy.name + ".bak"))
+
+    def compact(self) -> None:
+        """Rewrite the log with live entries only."""
+        self._write_all(list(self._sync().values()))
+
+    def put(self, entry: dict) -> None:
+        """Add or replace a raw index entry (must contain ``hash``)."""
+        self._append([entry])
+
+    def add(self, blob: BlobRef) -> None:
+        """Add or update index entry from blob metadata."""
+        if not blob.meta_path.exists():
+            return
+
+        entry = _entry_from_meta(blob)
+        if entry is not None:
+            self.put(entry)
+
     def remove(self, blob_hash: str) -> None:
         """Remove entry from index."""
-        index = self._load()
-        index["entries"] = [e for e in index["entries"] if e["hash"] != blob_hash]
-        self._save()
-    
+        if blob_hash in self._sync():
+            self._append([{"hash": blob_hash, "deleted": True}])
+
+    def _prefix_matches(self, prefix: str) -> list[str]:
+        """Hashes starting with prefix, in hash order (bisect range)."""
+        start = bisect.bisect_left(self._sorted, prefix)
+        end = bisect.bisect_left(self._sorted, prefix + "\x7f", lo=start)
+        return self._sorted[start:end]
+
     def search(self, query: str) -> list[BlobRef]:
         """Search by name, file type, or hash prefix.
-        
+
+        Hash prefixes are resolved through the sorted hash map (bisect);
+        name, type and archive-name matches (substrings) scan the entries.
+
         Args:
             query: Search query string
-            
+
         Returns:
-            List of matching blob references
+            List of matching blob references, most recent first
         """
-        index = self._load()
+        entries = self._sync()
         query_lower = query.lower()
         results = []
-        
-        for entry in index["entries"]:
-            # Match by name
-            if query_lower in entry.get("name", "").lower():
+        is_hex = bool(query_lower) and all(c in "0123456789abcdef" for c in query_lower)
+        hash_hits = set(self._prefix_matches(query_lower)) if is_hex else set()
+
+        for entry in reversed(entries.values()):
+            # Match by hash prefix
+            if entry["hash"] in hash_hits:
                 results.append(BlobRef(hash=entry["hash"]))
                 continue
-            
-            # Match by hash prefix
-            if entry["hash"].startswith(query_lower):
+
+            # Match by name
+            if query_lower in entry.get("name", "").lower():
                 results.append(BlobRef(hash=entry["hash"]))
                 continue
-            
+
             # Match by file type
             if query_lower == entry.get("file_type", "").lower():
                 results.append(BlobRef(hash=entry["hash"]))
                 continue
-            
+
             # Match by archive name
             if entry.get("source_archive") and query_lower in entry["source_archive"].get("name", "").lower():
                 results.append(BlobRef(hash=entry["hash"]))
                 continue
-        
+
         return results
-    
+
     def list_by_archive(self, archive_hash: str) -> list[BlobRef]:
         """List all blobs from a specific archive.
-        
+
         Args:
             archive_hash: Hash of the archive file
-            
+
         Returns:
             List of blob references from that archive
         """
-        index = self._load()
-        results = []
-        
-        for entry in index["entries"]:
-            if entry.get("source_archive", {}).get("hash") == archive_hash:
-                results.append(BlobRef(hash=entry["hash"]))
-        
-        return results
-    
-    def get_entry(self, blob_hash: str) -> dict | None:
-        """Get index entry by hash."""
-        index = self._load()
-        for entry in index["entries"]:
-            if entry["hash"] == blob_hash or entry["hash"].startswith(blob_hash):
-                return entry
-        return None
-    
+        self._sync()
+        return [BlobRef(hash=h) for h in self._by_archive.get(archive_hash, {})]
+
+    def get_entry(self, blob_hash: str, default: dict | None = None) -> dict | None:
+        """Get index entry by hash or unique-enough prefix (first in hash order)."""
+        entries = self._sync()
+        entry = entries.get(blob_hash)
+        if entry is not None:
+            return entry
+        matches = self._prefix_matches(blob_hash)
+        return entries[matches[0]] if matches else default
+
     def list_all(self) -> list[dict]:
-        """List all index entries."""
-        return self._load().get("entries", [])
-    
-    def rebuild(self) -> int:
+        """List all index entries, most recent first."""
+        return list(reversed(self._sync().values()))
+
+    def rebuild(self, workers: int | None = None) -> int:
         """Rebuild index from all blob directories.
-        
+
+        meta.json files are read in parallel; entries are ordered by
+        creation time.
+
+        Args:
+            workers: Reader threads (default: executor default)
+
         Returns:
             Number of entries rebuilt
         """
         from .extractor import DocExtractor
-        
+
         blobs_dir = DocExtractor.BLOBS_DIR
-        count = 0
-        
-        self._data = {"version": "1.0", "updated_at": None, "entries": []}
-        
-        for path in blobs_dir.iterdir():
-            if not path.is_dir() or len(path.name) != 64:
-                continue
-            
-            blob = BlobRef(hash=path.name)
-            self.add(blob)
-            count += 1
-        
-        return count
-    
+        blobs = []
+        if blobs_dir.exists():
+            with os.scandir(blobs_dir) as it:
+                blobs = [
+                    BlobRef(hash=e.name) for e in it if len(e.name) == 64 and e.is_dir()
+                ]
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="monoco-blob-index") as executor:
+            entries = [e for e in executor.map(_entry_from_meta, blobs) if e is not None]
+
+        entries.sort(key=lambda e: str(e.get("created_at") or ""))
+        self._write_all(entries)
+        return len(entries)
+
     def clear(self) -> None:
         """Clear the index."""
-        self._data = {"version": "1.0", "updated_at": None, "entries": []}
-        self._save()
-    
+        self._write_all([])
+
     def get_stats(self) -> dict:
         """Get index statistics."""
-        index = self._load()
-        entries = index.get("entries", [])
-        
+        entries = self._sync()
+
         categories = {}
-        archives = set()
-        
-        for entry in entries:
+        for entry in entries.values():
             cat = entry.get("category", "unknown")
             categories[cat] = categories.get(cat, 0) + 1
-            if entry.get("source_archive"):
-                archives.add(entry["source_archive"]["hash"])
-        
+
         return {
             "total_blobs": len(entries),
             "categories": categories,
-            "archive_count": len(archives),
+            "archive_count": sum(1 for blobs in self._by_archive.values() if blobs),
         }
@@ -5,6 +5,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Self
 
+RENDER_BACKENDS = ("thread", "process")
+
 
 @dataclass(frozen=True)
 class BlobRef:
@@ -65,6 +67,9 @@ class ExtractionResult:
     page_paths: list[Path] = field(default_factory=list)
     """Paths to rendered WebP pages."""
     
+    members: list["ExtractionResult"] = field(default_factory=list)
+    """Results of every document in an archive (archives only)."""
+    
     @property
     def is_cached(self) -> bool:
         """Whether this result was from cache."""
@@ -84,9 +89,24 @@ class ExtractConfig:
     pages: list[int] | None = None
     """Specific pages to render (0-indexed). None for all."""
     
+    backend: str = "thread"
+    """Rendering backend: "thread" (shared document) or "process" (one document per worker)."""
+    
+    workers: int | None = None
+    """Render threads or processes (per backend). None uses the CPU count."""
+    
+    chunk_size: int | None = None
+    """Contiguous pages per process-backend task. None splits pages evenly across workers."""
+    
     def __post_init__(self):
         """Validate configuration."""
         if not 72 <= self.dpi <= 300:
             raise ValueError(f"DPI must be between 72 and 300, got {self.dpi}")
         if not 1 <= self.quality <= 100:
             raise ValueError(f"Quality must be between 1 and 100, got {self.quality}")
+        if self.backend not in RENDER_BACKENDS:
+            raise ValueError(f"Backend must be one of {', '.join(RENDER_BACKENDS)}, got {self.backend}")
+        if self.workers is not None and self.workers < 1:
+            raise ValueError(f"Workers must be at least 1, got {self.workers}")
+        if self.chunk_size is not None and self.chunk_size < 1:
+            raise ValueError(f"Chunk size must be at least 1, got {self.chunk_size}")
@@ -0,0 +1,281 @@
+"""Bounded-concurrency batch extraction pipeline.
+
+Each document passes through three stages with independent limits:
+
+- hash: SHA256 of the input (thread pool, I/O bound)
+- convert: normalisation to PDF; office formats go to a shared
+  ``LibreOfficeWorker`` that reuses a headless profile and converts queued
+  files in batches instead of starting one ``soffice`` per file
+- render: PDF to WebP pages (``PDFRenderer``, CPU bound)
+
+Results stream out of ``BatchPipeline.run`` as each document completes.
+"""
+
+import asyncio
+import os
+import shutil
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import AsyncIterator, Callable, Iterable
+
+from .extractor import DocExtractor, FileTypeDetector
+from .models import ExtractConfig, ExtractionResult
+
+
+@dataclass
+class StageLimits:
+    """Concurrency limits of the batch pipeline stages."""
+
+    hash: int = 4
+    """Files hashed concurrently."""
+
+    convert: int = 2
+    """Concurrent conversions (also the number of LibreOffice instances)."""
+
+    render: int = 2
+    """Documents rendered concurrently."""
+
+    office_batch: int = 8
+    """Maximum files handed to one ``soffice`` invocation."""
+
+    def __post_init__(self):
+        """Validate limits."""
+        for name in ("hash", "convert", "render", "office_batch"):
+            if getattr(self, name) < 1:
+                raise ValueError(f"{name} limit must be at least 1, got {getattr(self, name)}")
+
+
+class LibreOfficeWorker:
+    """Shared headless LibreOffice converter.
+
+    Conversions are queued and served by ``instances`` long-lived consumer
+    tasks. Each consumer keeps its own LibreOffice user profile for the
+    lifetime of the worker (profile creation dominates ``soffice`` start-up,
+    and concurrent instances cannot share one) and drains up to
+    ``max_batch`` queued files into a single ``soffice --convert-to`` call.
+    """
+
+    def __init__(self, instances: int = 1, max_batch: int = 8, binary: str = "soffice"):
+        self.instances = instances
+        self.max_batch = max_batch
+        self.binary = binary
+        self._queue: asyncio.Queue | None = None
+        self._tasks: list[asyncio.Task] = []
+        self._profiles: list[Path] = []
+        self.invocations = 0
+        """Number of ``soffice`` processes started."""
+
+    def _start(self):
+        self._queue = asyncio.Queue()
+        for slot in range(self.instances):
+            profile = Path(tempfile.mkdtemp(prefix=f"monoco-soffice-{slot}-"))
+            self._profiles.append(profile)
+            self._tasks.append(asyncio.create_task(self._serve(profile)))
+
+    async def convert(self, input_path: Path, output_path: Path) -> bool:
+        """Queue a conversion and wait for its result."""
+        if self._queue is None:
+            self._start()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((Path(input_path), Path(output_path), future))
+        return await future
+
+    async def _serve(self, profile: Path):
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self.max_batch and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            try:
+                await self._convert_batch(batch, profile)
+            except Exception as e:
+                print(f"Error in LibreOffice conversion: {e}")
+            finally:
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_result(False)
+
+    async def _convert_batch(self, batch: list, profile: Path):
+        """Convert a batch of files with one ``soffice`` process."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            in_dir = Path(tmpdir) / "in"
+            out_dir = Path(tmpdir) / "out"
+            in_dir.mkdir()
+            # Index-based names: no output collisions between same-named inputs
+            inputs = []
+            for i, (source, _, _) in enumerate(batch):
+                link = in_dir / f"{i}{source.suffix}"
+                try:
+                    os.symlink(source.resolve(), link)
+                except OSError:
+                    shutil.copy(source, link)
+                inputs.append(str(link))
+
+            cmd = [
+                self.binary,
+                f"-env:UserInstallation={profile.as_uri()}",
+                "--headless",
+                "--norestore",
+                "--convert-to", "pdf",
+                "--outdir", str(out_dir),
+                *inputs,
+            ]
+            try:
+                proc = await asyncio.create_subprocess_exec(
+                    *cmd,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                )
+            except FileNotFoundError:
+                print("LibreOffice (soffice) not found. Please install LibreOffice.")
+                return
+            self.invocations += 1
+            try:
+                _, stderr = await proc.communicate()
+            except asyncio.CancelledError:
+                proc.kill()
+                raise
+
+            for i, (source, target, future) in enumerate(batch):
+                produced = out_dir / f"{i}.pdf"
+                if produced.exists():
+                    shutil.move(produced, target)
+                    future.set_result(True)
+                else:
+                    print(f"LibreOffice conversion failed for {source.name}: {stderr.decode(errors='replace')}")
+                    future.set_result(False)
+
+    async def close(self):
+        """Stop the consumers, fail pending conversions and drop the profiles."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        if self._queue is not None:
+            while not self._queue.empty():
+                _, _, future = self._queue.get_nowait()
+                if not future.done():
+                    future.set_result(False)
+            self._queue = None
+        for profile in self._profiles:
+            shutil.rmtree(profile, ignore_errors=True)
+        self._profiles = []
+
+    async def __aenter__(self) -> "LibreOfficeWorker":
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+
+class PipelineStages:
+    """Per-run stage semaphores and the shared LibreOffice worker."""
+
+    def __init__(self, limits: StageLimits, office: LibreOfficeWorker | None = None):
+        self.hash = asyncio.Semaphore(limits.hash)
+        self.convert = asyncio.Semaphore(limits.convert)
+        self.render = asyncio.Semaphore(limits.render)
+        self.office = office or LibreOfficeWorker(instances=limits.convert, max_batch=limits.office_batch)
+
+    async def __aenter__(self) -> "PipelineStages":
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.office.close()
+
+
+@dataclass
+class BatchOutcome:
+    """Result of one document in a batch run."""
+
+    index: int
+    """Position of the input in the batch."""
+
+    path: Path
+    """Input path."""
+
+    result: ExtractionResult | None = None
+    """Extraction result (None on failure)."""
+
+    error: BaseException | None = None
+    """Failure, if any."""
+
+    elapsed: float = 0.0
+    """Seconds from start of processing to completion."""
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+ProgressCallback = Callable[[int, int, BatchOutcome], None]
+
+
+class BatchPipeline:
+    """Extract many documents with bounded stage concurrency.
+
+    Args:
+        extractor: Extractor that owns the blob store.
+        config: Extraction configuration shared by all inputs.
+        limits: Stage limits (defaults to ``StageLimits()``).
+        on_progress: Called as ``(done, total, outcome)`` after each document.
+    """
+
+    def __init__(
+        self,
+        extractor: DocExtractor | None = None,
+        config: ExtractConfig | None = None,
+        limits: StageLimits | None = None,
+        on_progress: ProgressCallback | None = None,
+    ):
+        self.extractor = extractor or DocExtractor()
+        self.config = config or ExtractConfig()
+        self.limits = limits or StageLimits()
+        self.on_progress = on_progress
+
+    async def _process(self, index: int, path: Path, stages: PipelineStages) -> BatchOutcome:
+        start = time.perf_counter()
+        outcome = BatchOutcome(index=index, path=Path(path))
+        try:
+            outcome.result = await self.extractor.extract(path, self.config, stages=stages)
+        except Exception as e:
+            outcome.error = e
+        outcome.elapsed = time.perf_counter() - start
+        return outcome
+
+    async def run(self, paths: Iterable[Path]) -> AsyncIterator[BatchOutcome]:
+        """Process inputs, yielding outcomes in completion order."""
+        paths = list(paths)
+        async with PipelineStages(self.limits) as stages:
+            tasks = [asyncio.create_task(self._process(i, p, stages)) for i, p in enumerate(paths)]
+            try:
+                for done, future in enumerate(asyncio.as_completed(tasks), start=1):
+                    outcome = await future
+                    if self.on_progress is not None:
+                        self.on_progress(done, len(paths), outcome)
+                    yield outcome
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def collect_inputs(paths: Iterable[Path], recursive: bool = False) -> list[Path]:
+    """Expand directories into the supported documents they contain.
+
+    Files given explicitly are kept as-is; hidden entries and files of
+    unknown type found inside directories are skipped. Duplicates are dropped.
+    """
+    found: dict[Path, None] = {}
+    for path in map(Path, paths):
+        if not path.is_dir():
+            found[path] = None
+            continue
+        entries = path.rglob("*") if recursive else path.iterdir()
+        for entry in sorted(entries):
+            if any(part.startswith(".") for part in entry.relative_to(path).parts):
+                continue
+            if entry.is_file() and FileTypeDetector.detect(entry)[0] != "unknown":
+                found[entry] = None
+    return list(found)
@@ -16,6 +16,7 @@ class I18nFeature(FeatureModule):
             description="Documentation internationalization support",
             dependencies=["core"],
             priority=50,
+            commands=["i18n"],
             lazy=True,  # Can be lazy loaded - not critical for startup
         )
 
@@ -1,5 +1,7 @@
+import json as json_lib
 import typer
 from pathlib import Path
+from typing import Optional
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
@@ -34,6 +36,16 @@ def scan(
         "--check-source-lang",
         help="Verify if source files content matches source language (heuristic).",
     ),
+    report_path: Optional[Path] = typer.Option(
+        None,
+        "--report",
+        help="Write the machine-readable coverage report (JSON) to this path.",
+    ),
+    workers: Optional[int] = typer.Option(
+        None,
+        "--workers",
+        help="Worker threads for content checks. Defaults to the executor default.",
+    ),
     json: AgentOutput = False,
 ):
     """
@@ -64,83 +76,31 @@ def scan(
             f"Target Languages: [bold yellow]{', '.join(target_langs)}[/bold yellow] (Source: {source_lang})"
         )
 
-    all_files = core.discover_markdown_files(target_root, include_issues=check_issues)
-
-    source_files = [
-        f for f in all_files if not core.is_translation_file(f, target_langs)
-    ]
-
-    # Store missing results: { file_path: [missing_langs] }
-    missing_map = {}
-    # Store lang mismatch results: [file_path]
-    lang_mismatch_files = []
-
-    total_checks = len(source_files) * len(target_langs)
-    found_count = 0
-
-    for f in source_files:
-        # Check translation existence
-        missing_langs = core.check_translation_exists(
-            f, target_root, target_langs, source_lang
+    report = core.build_coverage_report(
+        target_root,
+        target_langs,
+        source_lang,
+        include_issues=check_issues,
+        check_source_lang=check_source_lang,
+        workers=workers,
+    )
+    source_files = report.source_files
+    sorted_missing = report.missing
+    lang_mismatch_files = report.mismatches
+    total_checks = report.total_checks
+    found_count = report.found_count
+    coverage = report.coverage
+
+    if report_path:
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+        report_path.write_text(
+            json_lib.dumps(report.to_dict(), indent=2, ensure_ascii=False) + "\n",
+            encoding="utf-8",
         )
-        if missing_langs:
-            missing_map[f] = missing_langs
-            found_count += len(target_langs) - len(missing_langs)
-        else:
-            found_count += len(target_langs)
-
-        # Check source content language if enabled
-        if check_source_lang:
-            if not core.is_content_source_language(f, source_lang):
-                # Try to detect actual language for better error message
-                try:
-                    content = f.read_text(encoding="utf-8")
-                    detected = core.detect_language(content)
-                except:
-                    detected = "unknown"
-                lang_mismatch_files.append((f, detected))
-
-    # Reporting
-    coverage = (found_count / total_checks * 100) if total_checks > 0 else 100
-
-    # Sort missing_map by file path for stable output
-    sorted_missing = sorted(missing_map.items(), key=lambda x: str(x[0]))
 
     if OutputManager.is_agent_mode():
         # JSON Output
-        report = {
-            "root": str(target_root),
-            "source_lang": source_lang,
-            "target_langs": target_langs,
-            "stats": {
-                "total_source_files": len(source_files),
-                "total_checks": total_checks,
-                "found_translations": found_count,
-                "coverage_percent": round(coverage, 2),
-                "missing_files_count": len(sorted_missing),
-                "mismatch_files_count": len(lang_mismatch_files),
-            },
-            "missing_files": [
-                {
-                    "file": str(f.relative_to(target_root)),
-                    "missing_langs": langs,
-                    "expected_paths": [
-                        str(
-                            core.get_target_translation_path(
-                                f, target_root, l, source_lang
-                            ).relative_to(target_root)
-                        )
-                        for l in langs
-                    ],
-                }
-                for f, langs in sorted_missing
-            ],
-            "language_mismatches": [
-                {"file": str(f.relative_to(target_root)), "detected": detected}
-                for f, detected in lang_mismatch_files
-            ],
-        }
-        OutputManager.print(report)
+        OutputManager.print(report.to_dict())
         return
 
     # Human Output
@@ -167,8 +127,7 @@ def scan(
     for f, langs in displayed_missing:
         rel_path = f.relative_to(target_root)
         expected_paths = []
-        for lang in langs:
-            target = core.get_target_translation_path(f, target_root, lang, source_lang)
+        for target in report.expected_paths(f, langs):
             expected_paths.append(str(target.relative_to(target_root)))
 
         table.add_row(str(rel_path), ", ".join(langs), "\n".join(expected_paths))
@@ -230,5 +189,8 @@ def scan(
     summary = "\n".join(summary_lines)
     console.print(Panel(summary, title="I18N STATUS", expand=False))
 
-    if missing_map or lang_mismatch_files:
+    if report_path:
+        console.print(f"[dim]Coverage report written to {report_path}[/dim]")
+
+    if sorted_missing or lang_mismatch_files:
         raise typer.Exit(code=1)
@@ -1,10 +1,17 @@
 import fnmatch
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Set, Tuple
 from enum import Enum
 from dataclasses import dataclass
 import re
 
+from monoco.core.ignore import IgnoreMatcher
+
 DEFAULT_EXCLUDES = [
     ".git",
     ".reference",
@@ -99,7 +106,7 @@ def is_excluded(
 
 def discover_markdown_files(root: Path, include_issues: bool = False) -> List[Path]:
     """Recursively find markdown files while respecting exclusion rules."""
-    patterns = load_gitignore_patterns(root)
+    matcher = IgnoreMatcher(root)
     all_md_files = []
 
     excludes = list(DEFAULT_EXCLUDES)
@@ -109,24 +116,17 @@ def discover_markdown_files(root: Path, include_issues: bool = False) -> List[Pa
     # Pre-calculate lowercase set for performance
     excludes_set = {e.lower() for e in excludes}
 
-    # Use walk to skip excluded directories early
-    for current_root, dirs, files in root.walk():
-        # Filter directories in-place to skip excluded ones
-        dirs[:] = [
-            d
-            for d in dirs
-            if not is_excluded(
-                current_root / d, root, patterns, excludes_set=excludes_set
-            )
-        ]
+    # Excluded directories are pruned before descent
+    for current_root, rel_dir, dirs, files in matcher.walk():
+        dirs[:] = [d for d in dirs if d.lower() not in excludes_set]
 
         for file in files:
-            if file.endswith(".md"):
-                p = current_root / file
-                if not is_excluded(p, root, patterns, excludes_set=excludes_set):
-                    all_md_files.append(p)
+            if file.endswith(".md") and file.lower() not in excludes_set:
+                all_md_files.append(f"{rel_dir}/{file}" if rel_dir else file)
 
-    return sorted(all_md_files)
+    # Sort by path components (same order as sorting Path objects)
+    all_md_files.sort(key=lambda rel: rel.split("/"))
+    return [root / rel for rel in all_md_files]
 
 
 def is_translation_file(path: Path, target_langs: List[str]) -> bool:
@@ -183,11 +183,17 @@ def get_target_translation_path(
 
 
 def check_translation_exists(
-    path: Path, root: Path, target_langs: List[str], source_lang: str = "en"
+    path: Path,
+    root: Path,
+    target_langs: List[str],
+    source_lang: str = "en",
+    exists: Optional[Callable[[Path], bool]] = None,
 ) -> List[str]:
     """
     Verify which target languages have translations.
     Returns a list of missing language codes.
+
+    `exists` overrides the existence check (e.g. `DirectoryListing.exists`).
     """
     if is_translation_file(path, target_langs):
         return []  # Already a translation, skip
@@ -211,11 +217,37 @@ def check_translation_exists(
             continue
 
         target = get_target_translation_path(path, root, lang, effective_source_lang)
-        if not target.exists():
+        if not (exists(target) if exists else target.exists()):
             missing.append(lang)
     return missing
 
 
+class DirectoryListing:
+    """
+    Existence checks backed by one `os.listdir` per directory.
+
+    Translation targets cluster in a few directories (the source's own
+    directory and its language subdirectories), so listing each directory
+    once replaces one `stat` per source file and language.
+    """
+
+    def __init__(self):
+        self._dirs: Dict[Path, Set[str]] = {}
+        self._lock = threading.Lock()
+
+    def exists(self, path: Path) -> bool:
+        parent = path.parent
+        names = self._dirs.get(parent)
+        if names is None:
+            try:
+                names = set(os.listdir(parent))
+            except OSError:
+                names = set()
+            with self._lock:
+                self._dirs[parent] = names
+        return path.name in names
+
+
 # Common technical terms that should not count as "English words"
 # when detecting language in Chinese documents
 TECHNICAL_TERMS_ALLOWLIST = {
@@ -373,40 +405,73 @@ TECHNICAL_TERMS_ALLOWLIST = {
 }
 
 
+_FRONTMATTER_RE = re.compile(r"^---\n.*?\n---\n", re.DOTALL)
+_CODE_BLOCK_RE = re.compile(r"```[\s\S]*?```", re.MULTILINE)
+_INLINE_CODE_RE = re.compile(r"`[^`]+`")
+_URL_RE = re.compile(r"https?://\S+|www\.\S+")
+_ISSUE_ID_RE = re.compile(r"\b(EPIC|FEAT|CHORE|FIX)-\d{4}\b")
+_WORD_RE = re.compile(r"\b[a-zA-Z][a-zA-Z0-9]*\b")
+_CJK_RUN_RE = re.compile("[\u4e00-\u9fff]+")
+
+# Content-hash keyed detection cache, shared by i18n scans and issue lint
+LANGUAGE_CACHE_SIZE = 8192
+_language_cache: "OrderedDict[bytes, str]" = OrderedDict()
+_language_cache_lock = threading.Lock()
+
+
+def clear_language_cache():
+    """Drop all cached language detection results."""
+    with _language_cache_lock:
+        _language_cache.clear()
+
+
 def detect_language(content: str) -> str:
     """
     Detect the language of the content using improved heuristics.
     
     This function is designed to handle technical documents with mixed
     Chinese and English content, especially for IT/Software development topics.
+    Results are cached by content hash.
     
     Returns: 'zh', 'en', or 'unknown'
     """
     if not content:
         return "unknown"
 
+    key = hashlib.blake2b(content.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+    with _language_cache_lock:
+        cached = _language_cache.get(key)
+        if cached is not None:
+            _language_cache.move_to_end(key)
+            return cached
+
+    detected = _detect_language_uncached(content)
+
+    with _language_cache_lock:
+        _language_cache[key] = detected
+        if len(_language_cache) > LANGUAGE_CACHE_SIZE:
+            _language_cache.popitem(last=False)
+    return detected
+
+
+def _detect_language_uncached(content: str) -> str:
     # Strip YAML Frontmatter if present
-    frontmatter_pattern = re.compile(r"^---\n.*?\n---\n", re.DOTALL)
-    content = frontmatter_pattern.sub("", content)
+    content = _FRONTMATTER_RE.sub("", content, count=1)
 
     if not content.strip():
         return "unknown"
 
     # Remove code blocks (```...```) as they often contain English keywords
-    code_block_pattern = re.compile(r"```[\s\S]*?```", re.MULTILINE)
-    content_no_code = code_block_pattern.sub("", content)
+    content_no_code = _CODE_BLOCK_RE.sub("", content)
     
     # Remove inline code (`...`)
-    inline_code_pattern = re.compile(r"`[^`]+`")
-    content_no_code = inline_code_pattern.sub("", content_no_code)
+    content_no_code = _INLINE_CODE_RE.sub("", content_no_code)
     
     # Remove URLs
-    url_pattern = re.compile(r"https?://\S+|www\.\S+|")  
-    content_clean = url_pattern.sub("", content_no_code)
+    content_clean = _URL_RE.sub("", content_no_code)
     
     # Remove issue IDs (EPIC-0001, FEAT-1234, etc.)
-    issue_id_pattern = re.compile(r"\b(EPIC|FEAT|CHORE|FIX)-\d{4}\b")
-    content_clean = issue_id_pattern.sub("", content_clean)
+    content_clean = _ISSUE_ID_RE.sub("", content_clean)
 
     if not content_clean.strip():
         # If after cleaning there's nothing left, it was likely all code/IDs
@@ -414,23 +479,19 @@ def detect_language(content: str) -> str:
 
     total_chars = len(content_clean)
     
-    # Count CJK characters (Chinese/Japanese/Korean)
-    cjk_count = sum(1 for c in content_clean if "\u4e00" <= c <= "\u9fff")
-    
-    # Count non-ASCII characters (excluding CJK)
-    non_ascii_non_cjk = sum(
-        1 for c in content_clean 
-        if ord(c) > 127 and not ("\u4e00" <= c <= "\u9fff")
-    )
+    # Count character classes in C: CJK (Chinese/Japanese/Korean) via regex,
+    # non-ASCII via the length lost when encoding to ASCII
+    cjk_count = sum(map(len, _CJK_RUN_RE.findall(content_clean)))
+    non_ascii = total_chars - len(content_clean.encode("ascii", "ignore"))
+    non_ascii_non_cjk = non_ascii - cjk_count
     
     # Extract words for analysis (alphanumeric sequences)
-    words = re.findall(r"\b[a-zA-Z][a-zA-Z0-9]*\b", content_clean)
+    words = _WORD_RE.findall(content_clean)
     total_words = len(words)
     
     # Count technical terms in allowlist (case-insensitive)
     technical_term_count = sum(
-        1 for word in words 
-        if word.lower() in TECHNICAL_TERMS_ALLOWLIST
+        map(TECHNICAL_TERMS_ALLOWLIST.__contains__, map(str.lower, words))
     )
     
     # Calculate non-technical English words
@@ -716,33 +777,163 @@ def has_language_mismatch_blocks(content: str, source_lang: str = "zh") -> Tuple
     return len(mismatched) > 0, mismatched
 
 
+def _source_language_for(path: Path, source_lang: str) -> str:
+    # Special handling for README/CHANGELOG
+    if path.name.upper() in ["README.MD", "CHANGELOG.MD"]:
+        return "en"
+    return source_lang
+
+
+def _matches_source_language(detected: str, source_lang: str) -> bool:
+    # 'unknown' is leniently accepted as valid to avoid false positives on code-heavy files
+    if detected == "unknown":
+        return True
+
+    # Normalize source_lang
+    expected = source_lang.lower()
+    if expected == "zh" or expected == "cn":
+        return detected == "zh"
+    elif expected == "en":
+        return detected == "en"
+
+    # For other languages, we don't have detectors yet
+    return True
+
+
 def is_content_source_language(path: Path, source_lang: str = "en") -> bool:
     """
     Check if file content appears to be in the source language.
     """
     try:
-        # Special handling for README/CHANGELOG
-        if path.name.upper() in ["README.MD", "CHANGELOG.MD"]:
-            source_lang = "en"
-
         content = path.read_text(encoding="utf-8")
         detected = detect_language(content)
+        return _matches_source_language(detected, _source_language_for(path, source_lang))
+    except Exception:
+        return True  # Assume valid on error
 
-        # 'unknown' is leniently accepted as valid to avoid false positives on code-heavy files
-        if detected == "unknown":
-            return True
-
-        # Normalize source_lang
-        expected = source_lang.lower()
-        if expected == "zh" or expected == "cn":
-            return detected == "zh"
-        elif expected == "en":
-            return detected == "en"
 
-        # For other languages, we don't have detectors yet
-        return True
+def _detect_source_mismatch(path: Path, source_lang: str) -> Optional[str]:
+    """Return the detected language if a file is not in its source language."""
+    try:
+        detected = detect_language(path.read_text(encoding="utf-8"))
     except Exception:
-        return True  # Assume valid on error
+        return None  # Assume valid on error
+    if _matches_source_language(detected, _source_language_for(path, source_lang)):
+        return None
+    return detected
+
+
+@dataclass
+class CoverageReport:
+    """Translation coverage of a documentation tree."""
+
+    root: Path
+    source_lang: str
+    target_langs: List[str]
+    source_files: List[Path]
+    missing: List[Tuple[Path, List[str]]]  # Sorted by path
+    mismatches: List[Tuple[Path, str]]  # (file, detected language)
+    found_count: int
+
+    @property
+    def total_checks(self) -> int:
+        return len(self.source_files) * len(self.target_langs)
+
+    @property
+    def coverage(self) -> float:
+        total = self.total_checks
+        return (self.found_count / total * 100) if total > 0 else 100
+
+    def expected_paths(self, path: Path, langs: List[str]) -> List[Path]:
+        return [
+            get_target_translation_path(path, self.root, lang, self.source_lang)
+            for lang in langs
+        ]
+
+    def to_dict(self) -> Dict:
+        """Machine-readable report (paths relative to root)."""
+        return {
+            "root": str(self.root),
+            "source_lang": self.source_lang,
+            "target_langs": self.target_langs,
+            "stats": {
+                "total_source_files": len(self.source_files),
+                "total_checks": self.total_checks,
+                "found_translations": self.found_count,
+                "coverage_percent": round(self.coverage, 2),
+                "missing_files_count": len(self.missing),
+                "mismatch_files_count": len(self.mismatches),
+            },
+            "missing_files": [
+                {
+                    "file": str(f.relative_to(self.root)),
+                    "missing_langs": langs,
+                    "expected_paths": [
+                        str(p.relative_to(self.root)) for p in self.expected_paths(f, langs)
+                    ],
+                }
+                for f, langs in self.missing
+            ],
+            "language_mismatches": [
+                {"file": str(f.relative_to(self.root)), "detected": detected}
+                for f, detected in self.mismatches
+            ],
+        }
+
+
+def build_coverage_report(
+    root: Path,
+    target_langs: List[str],
+    source_lang: str = "en",
+    include_issues: bool = False,
+    check_source_lang: bool = False,
+    workers: Optional[int] = None,
+) -> CoverageReport:
+    """
+    Compute translation coverage for a tree.
+
+    The tree is enumerated once; translation existence is answered from
+    cached directory listings, and source-language checks (file reads plus
+    detection) run on a thread pool.
+
+    Args:
+        root: Tree root.
+        target_langs: Languages that need translations.
+        source_lang: Project source language.
+        include_issues: Include the Issues directory.
+        check_source_lang: Verify source files are written in source_lang.
+        workers: Thread pool size for content checks (default: executor default).
+    """
+    all_files = discover_markdown_files(root, include_issues=include_issues)
+    source_files = [f for f in all_files if not is_translation_file(f, target_langs)]
+
+    listing = DirectoryListing()
+    missing = []
+    found_count = 0
+    for f in source_files:
+        missing_langs = check_translation_exists(
+            f, root, target_langs, source_lang, exists=listing.exists
+        )
+        if missing_langs:
+            missing.append((f, missing_langs))
+        found_count += len(target_langs) - len(missing_langs)
+
+    mismatches: List[Tuple[Path, str]] = []
+    if check_source_lang and source_files:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="monoco-i18n") as pool:
+            detected = pool.map(lambda f: _detect_source_mismatch(f, source_lang), source_files)
+            mismatches = [(f, lang) for f, lang in zip(source_files, detected) if lang]
+
+    missing.sort(key=lambda item: str(item[0]))
+    return CoverageReport(
+        root=root,
+        source_lang=source_lang,
+        target_langs=list(target_langs),
+        source_files=source_files,
+        missing=missing,
+        mismatches=mismatches,
+        found_count=found_count,
+    )
 
 
 # ... (Existing code) ...
@@ -16,6 +16,7 @@ class IssueFeature(FeatureModule):
             description="Issue management system for Monoco",
             dependencies=["core"],
             priority=10,  # High priority - load early
+            commands=["issue"],
         )
 
     def _on_mount(self, context: "FeatureContext") -> None:  # type: ignore
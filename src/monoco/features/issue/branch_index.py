@@ -0,0 +1,200 @@
+"""
+Cross-branch issue location cache.
+
+Maps each local branch's tip commit to the issue files it contains, so that
+`find_issue_path_across_branches` can answer "which branches have FEAT-0123"
+with dictionary lookups instead of scanning every branch.
+
+Listings are keyed by tip SHA: a branch is re-indexed (one `git ls-tree -r`)
+only when `git for-each-ref` reports that its tip moved, and branches sharing
+a tip share a listing. The cache is persisted inside the git directory
+(`<git-common-dir>/monoco/branch-issues.json`) so it never shows up in
+`git status`.
+"""
+
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from monoco.core import git
+
+logger = logging.getLogger("monoco.features.issue.branch_index")
+
+CACHE_VERSION = 1
+ISSUE_FILE_PATTERN = re.compile(r"^([A-Za-z]+-\d+)-.*\.md$")
+
+
+class BranchIssueIndex:
+    """
+    Issue file index across local branches, keyed by branch tip SHA.
+    """
+
+    def __init__(self, project_root: Path, issues_path: str = "Issues"):
+        self.project_root = Path(project_root)
+        self.issues_path = issues_path.strip("/")
+        self.tips: Dict[str, str] = {}  # branch -> tip sha
+        self.trees: Dict[str, List[str]] = {}  # tip sha -> issue file paths
+        self._by_id: Dict[str, List[Tuple[str, str]]] = {}
+        self._cache_path: Optional[Path] = None
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    @property
+    def cache_path(self) -> Optional[Path]:
+        if self._cache_path is None:
+            git_dir = git.get_git_common_dir(self.project_root)
+            if git_dir is None:
+                return None
+            self._cache_path = git_dir / "monoco" / "branch-issues.json"
+        return self._cache_path
+
+    def _load(self):
+        self._loaded = True
+        path = self.cache_path
+        if path is None or not path.exists():
+            return
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable branch index {path}: {e}")
+            return
+        if data.get("version") != CACHE_VERSION or data.get("issues_path") != self.issues_path:
+            return
+        self.tips = dict(data.get("tips", {}))
+        self.trees = {sha: list(files) for sha, files in data.get("trees", {}).items()}
+        # Drop tips whose listing is missing so they get re-indexed
+        self.tips = {b: sha for b, sha in self.tips.items() if sha in self.trees}
+        self._rebuild_lookup()
+
+    def _save(self):
+        path = self.cache_path
+        if path is None:
+            return
+        data = {
+            "version": CACHE_VERSION,
+            "issues_path": self.issues_path,
+            "tips": self.tips,
+            "trees": self.trees,
+        }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}-", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    f.write(json.dumps(data))
+                os.replace(tmp, path)
+            except BaseException:
+                Path(tmp).unlink(missing_ok=True)
+                raise
+        except OSError as e:
+            logger.warning(f"Failed to persist branch index {path}: {e}")
+
+    def _list_tips(self) -> Optional[Dict[str, str]]:
+        code, stdout, _ = git._run_git(
+            ["for-each-ref", "--format=%(objectname) %(refname:short)", "refs/heads"],
+            self.project_root,
+        )
+        if code != 0:
+            return None
+        tips = {}
+        for line in stdout.splitlines():
+            sha, _, branch = line.strip().partition(" ")
+            if sha and branch:
+                tips[branch] = sha
+        return tips
+
+    def _index_tip(self, sha: str) -> Optional[List[str]]:
+        code, stdout, _ = git._run_git(
+            ["ls-tree", "-r", "-z", "--name-only", sha, "--", self.issues_path],
+            self.project_root,
+        )
+        if code != 0:
+            return None
+        return [
+            p for p in stdout.split("\0")
+            if p and ISSUE_FILE_PATTERN.match(p.rsplit("/", 1)[-1])
+        ]
+
+    def _rebuild_lookup(self):
+        by_id: Dict[str, List[Tuple[str, str]]] = {}
+        for branch, sha in self.tips.items():
+            for file_path in self.trees.get(sha, []):
+                match = ISSUE_FILE_PATTERN.match(file_path.rsplit("/", 1)[-1])
+                if match:
+                    by_id.setdefault(match.group(1).upper(), []).append((branch, file_path))
+        self._by_id = by_id
+
+    def refresh(self, max_reindex: Optional[int] = None) -> int:
+        """
+        Bring the index up to date with the current branch tips.
+
+        Only branches whose tip moved are re-indexed. `max_reindex` bounds the
+        number of `ls-tree` calls so the daemon can warm the cache
+        incrementally; remaining branches are picked up by the next call.
+
+        Returns:
+            Number of branch tips that were (re-)indexed.
+        """
+        with self._lock:
+            if not self._loaded:
+                self._load()
+
+            current = self._list_tips()
+            if current is None:
+                return 0
+
+            indexed = 0
+            tips: Dict[str, str] = {}
+            for branch, sha in current.items():
+                if sha in self.trees:
+                    tips[branch] = sha
+                    continue
+                if max_reindex is not None and indexed >= max_reindex:
+                    # Keep the stale entry until a later refresh gets to it
+                    if branch in self.tips:
+                        tips[branch] = self.tips[branch]
+                    continue
+                files = self._index_tip(sha)
+                if files is None:
+                    continue
+                self.trees[sha] = files
+                tips[branch] = sha
+                indexed += 1
+
+            changed = indexed > 0 or tips != self.tips
+            self.tips = tips
+            live = set(tips.values())
+            self.trees = {sha: files for sha, files in self.trees.items() if sha in live}
+            if changed:
+                self._rebuild_lookup()
+                self._save()
+            return indexed
+
+    def is_warm(self) -> bool:
+        """True if every current branch tip is indexed."""
+        current = self._list_tips()
+        return current is not None and all(sha in self.trees for sha in current.values())
+
+    def lookup(self, issue_id: str) -> List[Tuple[str, str]]:
+        """Return (branch, file_path) pairs for an issue ID, in branch order."""
+        return list(self._by_id.get(issue_id.upper(), []))
+
+
+_indexes: Dict[Tuple[Path, str], BranchIssueIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_branch_issue_index(project_root: Path, issues_path: str = "Issues") -> BranchIssueIndex:
+    """Get the shared branch index for a project."""
+    key = (Path(project_root).resolve(), issues_path.strip("/"))
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = BranchIssueIndex(key[0], key[1])
+            _indexes[key] = index
+        return index
@@ -1169,6 +1169,56 @@ def sync_files(
         raise typer.Exit(code=1)
 
 
+@app.command("delivery")
+def delivery(
+    issue_ids: Optional[List[str]] = typer.Argument(
+        None, help="Issue IDs to report (default: every issue referenced by a commit)"
+    ),
+    root: Optional[str] = typer.Option(
+        None, "--root", help="Override issues root directory"
+    ),
+    json: AgentOutput = False,
+):
+    """
+    Refresh '## Delivery' reports and parent files_count rollups from git history.
+    """
+    config = get_config()
+    issues_root = _resolve_issues_root(config, root)
+    project_root = _resolve_project_root(config)
+
+    try:
+        refreshed = core.generate_delivery_reports(issues_root, project_root, issue_ids)
+        OutputManager.print(
+            [{"id": issue_id, "files_count": count} for issue_id, count in refreshed.items()]
+        )
+    except Exception as e:
+        OutputManager.error(str(e))
+        raise typer.Exit(code=1)
+
+
+@app.command("clear-hook-cache")
+def clear_hook_cache(
+    issue_id: Optional[str] = typer.Argument(
+        None, help="Only drop verdicts recorded for this issue"
+    ),
+    hook: Optional[str] = typer.Option(
+        None, "--hook", help="Only drop verdicts of this hook (e.g. builtin.pre-issue-submit)"
+    ),
+    json: AgentOutput = False,
+):
+    """
+    Drop cached lifecycle hook verdicts (see hooks.issue_cache_ttl).
+    """
+    config = get_config()
+    project_root = _resolve_project_root(config)
+
+    from .hooks import HookResultCache
+
+    cache = HookResultCache.for_project(project_root, ttl=config.hooks.issue_cache_ttl)
+    removed = cache.invalidate(issue_id=issue_id, hook_name=hook) if cache else 0
+    OutputManager.print({"status": "cleared", "removed": removed})
+
+
 @app.command("inspect")
 def inspect(
     target: str = typer.Argument(..., help="Issue ID or File Path"),
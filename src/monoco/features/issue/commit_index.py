@@ -0,0 +1,210 @@
+"""
+Incremental commit-to-issue index.
+
+Maps issue IDs to the commits that reference them (`Ref: <ID>` trailers) and
+the files those commits touched. The index is filled by a single `git log`
+pass over the commits added since the last indexed HEAD, so delivery reports
+and `files_count` rollups for every issue cost one incremental scan instead
+of one full-history `git log --grep` per issue.
+
+Persisted in `<git-common-dir>/monoco/commit-index.json`.
+"""
+
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+from monoco.core import git
+
+logger = logging.getLogger("monoco.features.issue.commit_index")
+
+CACHE_VERSION = 1
+REF_LINE_PATTERN = re.compile(r"Ref:([^\n]*)")
+ISSUE_ID_PATTERN = re.compile(r"\b([A-Za-z]+-\d+)\b")
+
+# Record/field separators for the `git log` format
+_RS = "\x1e"
+_FS = "\x1f"
+
+
+def extract_issue_refs(message: str) -> List[str]:
+    """Extract issue IDs from `Ref:` lines of a commit message."""
+    refs: List[str] = []
+    for line in REF_LINE_PATTERN.findall(message):
+        for issue_id in ISSUE_ID_PATTERN.findall(line):
+            issue_id = issue_id.upper()
+            if issue_id not in refs:
+                refs.append(issue_id)
+    return refs
+
+
+class CommitIssueIndex:
+    """
+    Issue ID -> commits (hash, subject, files), newest first.
+    """
+
+    def __init__(self, project_root: Path):
+        self.project_root = Path(project_root)
+        self.head: Optional[str] = None
+        self.issues: Dict[str, List[Dict]] = {}
+        self._cache_path: Optional[Path] = None
+        self._loaded = False
+        self._lock = threading.Lock()
+        self.error: Optional[str] = None
+        """git's stderr when the last update failed."""
+
+    @property
+    def cache_path(self) -> Optional[Path]:
+        if self._cache_path is None:
+            git_dir = git.get_git_common_dir(self.project_root)
+            if git_dir is None:
+                return None
+            self._cache_path = git_dir / "monoco" / "commit-index.json"
+        return self._cache_path
+
+    def _load(self):
+        self._loaded = True
+        path = self.cache_path
+        if path is None or not path.exists():
+            return
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable commit index {path}: {e}")
+            return
+        if data.get("version") != CACHE_VERSION:
+            return
+        self.head = data.get("head")
+        self.issues = data.get("issues", {})
+
+    def _save(self):
+        path = self.cache_path
+        if path is None:
+            return
+        data = {"version": CACHE_VERSION, "head": self.head, "issues": self.issues}
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}-", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    f.write(json.dumps(data))
+                os.replace(tmp, path)
+            except BaseException:
+                Path(tmp).unlink(missing_ok=True)
+                raise
+        except OSError as e:
+            logger.warning(f"Failed to persist commit index {path}: {e}")
+
+    def _scan(self, rev_range: str) -> Optional[Dict[str, List[Dict]]]:
+        """Run one `git log` over `rev_range`, grouping commits by issue."""
+        code, stdout, stderr = git._run_git(
+            [
+                "-c",
+                "core.quotepath=off",
+                "log",
+                f"--format={_RS}%H{_FS}%s{_FS}%B{_FS}",
+                "--name-only",
+                rev_range,
+            ],
+            self.project_root,
+        )
+        if code != 0:
+            logger.warning(f"git log failed while indexing commits: {stderr.strip()}")
+            self.error = stderr.strip()
+            return None
+
+        found: Dict[str, List[Dict]] = {}
+        for record in stdout.split(_RS):
+            if not record.strip():
+                continue
+            parts = record.split(_FS, 3)
+            if len(parts) < 4:
+                continue
+            commit_hash, subject, body, files_block = parts
+            refs = extract_issue_refs(body)
+            if not refs:
+                continue
+            files = [f.strip() for f in files_block.splitlines() if f.strip()]
+            entry = {"hash": commit_hash, "subject": subject, "files": files}
+            for issue_id in refs:
+                found.setdefault(issue_id, []).append(entry)
+        return found
+
+    def update(self) -> Optional[int]:
+        """
+        Index commits added since the last update.
+
+        Falls back to a full rebuild when the previously indexed HEAD is no
+        longer an ancestor of HEAD (branch switch, rebase, reset).
+
+        Returns:
+            Number of issues that received new commits, or None if git failed
+            (the reason is kept in `error`; the index is left unchanged).
+        """
+        with self._lock:
+            if not self._loaded:
+                self._load()
+
+            self.error = None
+            code, stdout, stderr = git._run_git(["rev-parse", "HEAD"], self.project_root)
+            if code != 0:
+                self.error = stderr.strip()
+                return None
+            head = stdout.strip()
+            if head == self.head:
+                return 0
+
+            incremental = False
+            if self.head:
+                code, _, _ = git._run_git(
+                    ["merge-base", "--is-ancestor", self.head, head], self.project_root
+                )
+                incremental = code == 0
+
+            found = self._scan(f"{self.head}..{head}" if incremental else head)
+            if found is None:
+                return None
+
+            if incremental:
+                for issue_id, commits in found.items():
+                    # New commits are newer than everything already indexed
+                    self.issues[issue_id] = commits + self.issues.get(issue_id, [])
+            else:
+                self.issues = found
+            self.head = head
+            self._save()
+            return len(found)
+
+    def commits_for(self, issue_id: str) -> List[Dict]:
+        """Commits referencing an issue, newest first."""
+        return list(self.issues.get(issue_id.upper(), []))
+
+    def files_for(self, issue_id: str) -> List[str]:
+        """Sorted set of files touched by an issue's commits."""
+        files: Set[str] = set()
+        for commit in self.issues.get(issue_id.upper(), []):
+            files.update(commit["files"])
+        return sorted(files)
+
+    def issue_ids(self) -> List[str]:
+        return sorted(self.issues)
+
+
+_indexes: Dict[Path, CommitIssueIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_commit_issue_index(project_root: Path) -> CommitIssueIndex:
+    """Get the shared commit index for a project."""
+    key = Path(project_root).resolve()
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = CommitIssueIndex(key)
+            _indexes[key] = index
+        return index
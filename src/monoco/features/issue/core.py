@@ -27,6 +27,8 @@ from .validator import IssueValidator
 
 from .engine import get_engine
 from .git_service import IssueGitService
+from .branch_index import get_branch_issue_index
+from .commit_index import get_commit_issue_index
 
 
 def get_prefix_map(issues_root: Path) -> Dict[str, str]:
@@ -748,25 +750,12 @@ def _find_branches_with_file(project_root: Path, rel_path: str, exclude_branch:
     Returns:
         List of branch names containing the file
     """
-    branches_with_file = []
-    
-    # Get all local branches
-    code, stdout, _ = git._run_git(["branch", "--format=%(refname:short)"], project_root)
-    if code != 0:
-        return []
-    
-    all_branches = [b.strip() for b in stdout.splitlines() if b.strip()]
-    
-    for branch in all_branches:
-        if branch == exclude_branch:
-            continue
-            
-        # Check if file exists in this branch
-        code, _, _ = git._run_git(["show", f"{branch}:{rel_path}"], project_root)
-        if code == 0:
-            branches_with_file.append(branch)
-    
-    return branches_with_file
+    session = git.get_cat_file_session(project_root)
+    return [
+        branch
+        for branch in git.get_local_branches(project_root)
+        if branch != exclude_branch and session.exists(f"{branch}:{rel_path}")
+    ]
 
 
 def _search_issue_in_branches(
@@ -814,37 +803,14 @@ def _search_issue_in_branches(
     # Search pattern: Issues/{Type}/{status}/{issue_id}-*.md
     found_in_branches: List[Tuple[str, str]] = []  # (branch, file_path)
     
-    # Get all local branches
-    code, stdout, _ = git._run_git(["branch", "--format=%(refname:short)"], project_root)
-    if code != 0:
-        return None, None, None
-    
-    all_branches = [b.strip() for b in stdout.splitlines() if b.strip()]
+    # Branch tip SHA -> issue files cache; only moved tips are re-indexed
+    index = get_branch_issue_index(project_root, issues_root.relative_to(project_root).as_posix())
+    index.refresh()
     
-    for branch in all_branches:
-        # List files in each status directory for this branch
-        for status_dir in status_dirs:
-            dir_path = f"{rel_base}/{status_dir}"
-            
-            # List all files in this directory on the branch
-            code, stdout, _ = git._run_git(
-                ["ls-tree", "-r", "--name-only", branch, dir_path], 
-                project_root
-            )
-            
-            if code != 0 or not stdout.strip():
-                continue
-            
-            # Find matching issue file (Handling quoted paths from git ls-tree)
-            pattern = f"{parsed.local_id}-"
-            for line in stdout.splitlines():
-                line = line.strip()
-                # Git quotes non-ASCII paths: "Issues/Chores/...md"
-                if line.startswith('"') and line.endswith('"'):
-                    line = line[1:-1]
-                
-                if pattern in line and line.endswith(".md"):
-                    found_in_branches.append((branch, line))
+    status_prefixes = tuple(f"{rel_base.as_posix()}/{status_dir}/" for status_dir in status_dirs)
+    for branch, file_path in index.lookup(parsed.local_id):
+        if file_path.startswith(status_prefixes):
+            found_in_branches.append((branch, file_path))
     
     if not found_in_branches:
         return None, None, None
@@ -1958,29 +1924,8 @@ def update_issue_field(
     return updated_meta
 
 
-def generate_delivery_report(
-    issues_root: Path, issue_id: str, project_root: Path
-) -> IssueMetadata:
-    """
-    Scan git history for commits related to this issue (Ref: ID),
-    aggregate touched files, and append/update '## Delivery' section in the issue body.
-    """
-    from monoco.core import git
-
-    path = find_issue_path(issues_root, issue_id)
-    if not path:
-        raise FileNotFoundError(f"Issue {issue_id} not found.")
-
-    # 1. Scan Git
-    commits = git.search_commits_by_message(project_root, f"Ref: {issue_id}")
-
-    if not commits:
-        meta = parse_issue(path)
-        if not meta:
-            raise ValueError(f"Could not parse metadata for issue {issue_id}")
-        return meta
-
-    # 2. Aggregate Data
+def _format_delivery_section(commits: List[Dict[str, Any]]) -> str:
+    """Render the '## Delivery' section for a list of commits."""
     all_files = set()
     commit_list_md = []
 
@@ -1992,8 +1937,7 @@ def generate_delivery_report(
 
     sorted_files = sorted(list(all_files))
 
-    # 3. Format Report
-    delivery_section = f"""
+    return f"""
 ## Delivery
 <!-- Monoco Auto Generated -->
 **Commits ({len(commits)})**:
@@ -2002,37 +1946,54 @@ def generate_delivery_report(
 **Touched Files ({len(sorted_files)})**:
 """ + "\n".join([f"- `{f}`" for f in sorted_files])
 
-    # 4. Update File Content
-    content = path.read_text()
+
+def _write_delivery_section(path: Path, delivery_section: str) -> bool:
+    """Append or replace the '## Delivery' section. Returns True if the file changed."""
+    original = path.read_text()
+    content = original
 
     # Check if Delivery section exists
     if "## Delivery" in content:
-        # Replace existing section
-        # We assume Delivery is the last section or we replace until end or next H2?
-        # For simplicity, if ## Delivery exists, we regex replace it and everything after it
-        # OR we just replace the section block if we can identify it.
-        # Let's assume it's at the end or we replace the specific block `## Delivery...`
-        # But regex matching across newlines is tricky if we don't know where it ends.
-        # Safe bet: If "## Delivery" exists, find it and replace everything after it?
-        # Or look for "<!-- Monoco Auto Generated -->"
-
+        # Delivery report is always the last section: replace it and everything after
         pattern = r"## Delivery.*"
-        # If we use DOTALL, it replaces everything until end of string?
-        # Yes, usually Delivery report is appended at the end.
-        content = re.sub(pattern, delivery_section.strip(), content, flags=re.DOTALL)
+        content = re.sub(
+            pattern, lambda _: delivery_section.strip(), content, flags=re.DOTALL
+        )
     else:
         # Append
         if not content.endswith("\n"):
             content += "\n"
         content += "\n" + delivery_section.strip() + "\n"
 
+    if content == original:
+        return False
     path.write_text(content)
+    return True
 
-    # 5. Update Metadata (delivery stats)
-    # We might want to store 'files_count' in metadata for the recursive aggregation (FEAT-0003)
-    # But IssueMetadata doesn't have a 'delivery' dict field yet.
-    # We can add it to 'extra' or extend the model later.
-    # For now, just persisting the text is enough for FEAT-0002.
+
+def generate_delivery_report(
+    issues_root: Path, issue_id: str, project_root: Path
+) -> IssueMetadata:
+    """
+    Scan git history for commits related to this issue (Ref: ID),
+    aggregate touched files, and append/update '## Delivery' section in the issue body.
+
+    Commits come from the incremental commit index, so repeated reports only
+    scan commits added since the last run.
+    """
+    path = find_issue_path(issues_root, issue_id)
+    if not path:
+        raise FileNotFoundError(f"Issue {issue_id} not found.")
+
+    # 1. Scan Git (incremental)
+    index = get_commit_issue_index(project_root)
+    if index.update() is None:
+        raise RuntimeError(f"Git log failed: {index.error}")
+    commits = index.commits_for(issue_id)
+
+    if commits:
+        # 2. Format & write report
+        _write_delivery_section(path, _format_delivery_section(commits))
 
     meta = parse_issue(path)
     if not meta:
@@ -2040,6 +2001,54 @@ def generate_delivery_report(
     return meta
 
 
+def generate_delivery_reports(
+    issues_root: Path,
+    project_root: Path,
+    issue_ids: Optional[List[str]] = None,
+) -> Dict[str, int]:
+    """
+    Refresh delivery reports and parent rollups for many issues at once.
+
+    One incremental `git log` pass feeds every report; parents'
+    `files_count` is computed from the same index instead of re-reading
+    each child's '## Delivery' section.
+
+    Args:
+        issues_root: Root directory of issues
+        project_root: Git project root
+        issue_ids: Issues to refresh (default: every issue referenced by a commit)
+
+    Returns:
+        Mapping of refreshed issue ID -> touched files count
+    """
+    index = get_commit_issue_index(project_root)
+    if index.update() is None:
+        raise RuntimeError(f"Git log failed: {index.error}")
+
+    targets = [i.upper() for i in issue_ids] if issue_ids else index.issue_ids()
+    files_by_issue = {i: len(index.files_for(i)) for i in index.issue_ids()}
+
+    refreshed: Dict[str, int] = {}
+    parents: Set[str] = set()
+    for issue_id in targets:
+        commits = index.commits_for(issue_id)
+        if not commits:
+            continue
+        path = find_issue_path(issues_root, issue_id)
+        if not path:
+            continue
+        _write_delivery_section(path, _format_delivery_section(commits))
+        refreshed[issue_id] = files_by_issue.get(issue_id, 0)
+        meta = parse_issue(path)
+        if meta and meta.parent:
+            parents.add(meta.parent)
+
+    for parent_id in sorted(parents):
+        recalculate_parent(issues_root, parent_id, files_by_issue=files_by_issue)
+
+    return refreshed
+
+
 def get_children(issues_root: Path, parent_id: str) -> List[IssueMetadata]:
     """Find all direct children of an issue."""
     all_issues = list_issues(issues_root)
@@ -2221,11 +2230,18 @@ def search_issues(issues_root: Path, query: str, include_archived: bool = False)
     return matches
 
 
-def recalculate_parent(issues_root: Path, parent_id: str):
+def recalculate_parent(
+    issues_root: Path,
+    parent_id: str,
+    files_by_issue: Optional[Dict[str, int]] = None,
+):
     """
     Update parent Epic/Feature stats based on children.
     - Progress (Closed/Total)
     - Total Files Touched (Sum of children's delivery)
+
+    If `files_by_issue` (issue ID -> touched files count, e.g. from the
+    commit index) is given, children's Delivery sections are not re-read.
     """
     parent_path = find_issue_path(issues_root, parent_id)
     if not parent_path:
@@ -2243,6 +2259,9 @@ def recalculate_parent(issues_root: Path, parent_id: str):
     # Files count
     total_files = 0
     for child in children:
+        if files_by_issue is not None:
+            total_files += files_by_issue.get(child.id.upper(), 0)
+            continue
         child_path = find_issue_path(issues_root, child.id)
         if child_path:
             total_files += count_files_in_delivery(child_path)
@@ -2293,7 +2312,7 @@ def recalculate_parent(issues_root: Path, parent_id: str):
         # Recurse up?
         parent_parent = data.get("parent")
         if parent_parent:
-            recalculate_parent(issues_root, parent_parent)
+            recalculate_parent(issues_root, parent_parent, files_by_issue)
 
 
 def move_issue(
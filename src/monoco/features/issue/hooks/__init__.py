@@ -35,6 +35,7 @@ from .models import (
     get_events_for_command,
 )
 
+from .cache import HookResultCache
 from .dispatcher import (
     IssueHookDispatcher,
     HookExecutionInfo,
@@ -71,6 +72,7 @@ __all__ = [
     # Dispatcher
     "IssueHookDispatcher",
     "HookExecutionInfo",
+    "HookResultCache",
     "get_dispatcher",
     "reset_dispatcher",
     # Built-in hooks
@@ -101,6 +103,13 @@ def init_hooks(project_root) -> IssueHookDispatcher:
     Returns:
         Configured IssueHookDispatcher instance
     """
+    from monoco.core.config import get_config
+
     dispatcher = get_dispatcher(project_root)
+    hooks_config = get_config().hooks
+    dispatcher.max_workers = hooks_config.issue_max_workers
+    dispatcher.stop_on_deny = hooks_config.issue_stop_on_deny
+    if hooks_config.issue_cache_ttl and dispatcher.cache is None:
+        dispatcher.enable_cache(hooks_config.issue_cache_ttl)
     register_all_builtins(dispatcher)
     return dispatcher
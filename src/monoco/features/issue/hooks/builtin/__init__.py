@@ -26,6 +26,7 @@ __all__ = [
     "pre_start_hook",
     "post_start_hook",
     # Phase 3: Submit
+    "pre_submit_sync_hook",
     "pre_submit_hook",
     "post_submit_hook",
     # Phase 4: Close
@@ -130,13 +131,38 @@ def post_start_hook(context: "IssueHookContext") -> "IssueHookResult":
     )
 
 
+def pre_submit_sync_hook(context: "IssueHookContext") -> "IssueHookResult":
+    """
+    Pre-submit sync hook: Auto-sync the issue's tracked files.
+
+    Runs before (and separately from) the pre-submit checks, which are
+    cacheable: a cached verdict must never skip this write.
+    """
+    from ..models import IssueHookResult
+    from monoco.features.issue.core import sync_issue_files
+    from monoco.core.config import find_monoco_root
+
+    if not context.issue_id:
+        # The pre-submit check reports the missing ID
+        return IssueHookResult.allow()
+
+    project_root = context.project_root or find_monoco_root()
+    try:
+        sync_issue_files(project_root / "Issues", context.issue_id, project_root)
+    except Exception as e:
+        # Warning only, don't block
+        logger.warning(f"Auto-sync failed in pre-submit hook: {e}")
+    return IssueHookResult.allow()
+
+
 def pre_submit_hook(context: "IssueHookContext") -> "IssueHookResult":
     """
     Pre-submit hook: Validates issue before submission.
 
+    Read-only (files are synced by `pre_submit_sync_hook` first).
+
     Checks:
     - Issue lint status
-    - Files synchronization
     - Acceptance criteria completion
     """
     from ..models import IssueHookResult, HookDecision
@@ -177,14 +203,6 @@ def pre_submit_hook(context: "IssueHookContext") -> "IssueHookResult":
             suggestions=["Check the issue file format"]
         )
 
-    # NEW logic: Auto-sync files before validation
-    try:
-        from monoco.features.issue.core import sync_issue_files
-        sync_issue_files(issues_root, issue_id, project_root)
-    except Exception as e:
-        # Warning only, don't block
-        logger.warning(f"Auto-sync failed in pre-submit hook: {e}")
-
     # NEW logic: Execute Lint Check
     diagnostics = check_integrity(issues_root, recursive=False)
     # Filter diagnostics for this specific issue
@@ -212,7 +230,7 @@ def pre_submit_hook(context: "IssueHookContext") -> "IssueHookResult":
     if not issue.files:
         suggestions.append("No files tracked for this issue. This might be a mistake if code changes were made.")
 
-    return IssueHookResult.allow("Pre-submit checks (sync & lint) passed")
+    return IssueHookResult.allow("Pre-submit checks (lint) passed")
 
 
 def post_submit_hook(context: "IssueHookContext") -> "IssueHookResult":
@@ -302,7 +320,9 @@ def register_all_builtins(dispatcher: "IssueHookDispatcher") -> None:
     Register all built-in hooks with the dispatcher.
 
     Hooks are registered in lifecycle phase order (create -> start -> submit -> close)
-    with pre/post pairs for each phase.
+    with pre/post pairs for each phase. Read-only checks are `independent`, so
+    they may run alongside user hooks; the submit sync and report hooks write
+    files and are neither independent nor cacheable.
 
     Args:
         dispatcher: The IssueHookDispatcher instance
@@ -315,12 +335,14 @@ def register_all_builtins(dispatcher: "IssueHookDispatcher") -> None:
         events=[IssueEvent.PRE_CREATE],
         fn=pre_create_hook,
         priority=10,
+        independent=True,
     )
     dispatcher.register_callable(
         name="builtin.post-issue-create",
         events=[IssueEvent.POST_CREATE],
         fn=post_create_hook,
         priority=100,
+        independent=True,
     )
 
     # Phase 2: Start
@@ -329,20 +351,30 @@ def register_all_builtins(dispatcher: "IssueHookDispatcher") -> None:
         events=[IssueEvent.PRE_START],
         fn=pre_start_hook,
         priority=10,
+        independent=True,
     )
     dispatcher.register_callable(
         name="builtin.post-issue-start",
         events=[IssueEvent.POST_START],
         fn=post_start_hook,
         priority=100,
+        independent=True,
     )
 
     # Phase 3: Submit
+    dispatcher.register_callable(
+        name="builtin.pre-issue-submit-sync",
+        events=[IssueEvent.PRE_SUBMIT],
+        fn=pre_submit_sync_hook,
+        priority=5,
+    )
     dispatcher.register_callable(
         name="builtin.pre-issue-submit",
         events=[IssueEvent.PRE_SUBMIT],
         fn=pre_submit_hook,
         priority=10,
+        independent=True,
+        cacheable=True,  # Lint only: same issue and tree, same verdict
     )
     dispatcher.register_callable(
         name="builtin.post-issue-submit",
@@ -357,10 +389,12 @@ def register_all_builtins(dispatcher: "IssueHookDispatcher") -> None:
         events=[IssueEvent.PRE_CLOSE],
         fn=pre_close_hook,
         priority=10,
+        independent=True,
     )
     dispatcher.register_callable(
         name="builtin.post-issue-close",
         events=[IssueEvent.POST_CLOSE],
         fn=post_close_hook,
         priority=100,
+        independent=True,
     )
@@ -0,0 +1,235 @@
+"""
+Issue Hook Result Cache
+
+Remembers verdicts of `cacheable` hooks so that retrying a transition
+(e.g. an agent re-running `submit`) does not repeat checks when nothing
+changed. A verdict is keyed by:
+- hook name and a hash of the hook's code: its script, or the callable's
+  source file plus the installed package version and a digest of the
+  package's modules (builtin checks call into the linter and core)
+- the lifecycle event, requested transition and execution options
+  (force, dry-run, branch, extra context)
+- a hash of the issue file (when the context carries its path)
+- the git tree state: `git write-tree` plus a digest of dirty/untracked files
+
+Entries expire after a TTL and can be invalidated explicitly. Only hooks
+without side effects may be cacheable: a cache hit skips the hook entirely.
+"""
+
+import functools
+import hashlib
+import importlib.metadata
+import inspect
+import json
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+from monoco.core import git
+
+from .models import HookMetadata, IssueHookContext, IssueHookResult
+
+logger = logging.getLogger(__name__)
+
+CACHE_VERSION = 2
+MAX_ENTRIES = 256
+
+
+def file_digest(path: Optional[Path]) -> str:
+    """sha256 of a file's content ("-" if missing or unreadable)."""
+    if path is None:
+        return "-"
+    try:
+        return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+    except OSError:
+        return "-"
+
+
+# Import package -> distribution whose version is part of the package digest
+DISTRIBUTIONS = {"monoco": "monoco-toolkit"}
+
+
+@functools.lru_cache(maxsize=None)
+def package_digest(package: str) -> str:
+    """
+    Digest of an imported top-level package: its installed version plus the
+    path, size and mtime of every module file (computed once per process).
+    """
+    digest = hashlib.sha256()
+    try:
+        digest.update(importlib.metadata.version(DISTRIBUTIONS.get(package, package)).encode("utf-8"))
+    except (importlib.metadata.PackageNotFoundError, ValueError):
+        pass
+    module = sys.modules.get(package)
+    for root in getattr(module, "__path__", []):
+        for path in sorted(Path(root).rglob("*.py")):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            digest.update(f"{path}:{st.st_size}:{st.st_mtime_ns}".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def hook_digest(hook: HookMetadata, fn: Optional[Callable] = None) -> str:
+    """
+    Hash of the code behind a hook: its script, or the callable's source file
+    plus the digest of the package it belongs to (which covers its imports).
+    """
+    if hook.script_path:
+        return file_digest(hook.script_path)
+    if fn is not None:
+        try:
+            source = file_digest(Path(inspect.getsourcefile(fn)))
+        except (TypeError, OSError):
+            return "-"
+        package = (getattr(fn, "__module__", None) or "").split(".")[0]
+        return f"{source}:{package_digest(package)}"
+    return "-"
+
+
+def tree_state(project_root: Path) -> Optional[str]:
+    """
+    Digest of the working tree: the index tree (`git write-tree`) plus path,
+    size and mtime of every modified or untracked file.
+
+    Returns None outside a repository or with unmerged entries (no caching).
+    """
+    code, tree, _ = git._run_git(["write-tree"], project_root)
+    if code != 0:
+        return None
+    code, status, _ = git._run_git(
+        ["status", "--porcelain=v1", "-z", "--untracked-files=all"], project_root
+    )
+    if code != 0:
+        return None
+
+    digest = hashlib.sha256(tree.strip().encode("utf-8"))
+    for entry in status.split("\0"):
+        if len(entry) < 4:
+            continue
+        digest.update(entry.encode("utf-8"))
+        try:
+            st = (Path(project_root) / entry[3:]).stat()
+            digest.update(f"{st.st_size}:{st.st_mtime_ns}".encode("utf-8"))
+        except OSError:
+            digest.update(b"missing")
+    return digest.hexdigest()
+
+
+class HookResultCache:
+    """
+    Persistent verdict cache for cacheable hooks.
+
+    Args:
+        path: JSON cache file.
+        ttl: Seconds a verdict stays valid.
+    """
+
+    def __init__(self, path: Path, ttl: float):
+        self.path = Path(path)
+        self.ttl = ttl
+        self._entries: Optional[Dict[str, Dict]] = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_project(cls, project_root: Path, ttl: float) -> Optional["HookResultCache"]:
+        """Cache stored in `<git-common-dir>/monoco/`; None outside a repository."""
+        git_dir = git.get_git_common_dir(project_root)
+        if git_dir is None:
+            return None
+        return cls(git_dir / "monoco" / "hook-results.json", ttl)
+
+    @staticmethod
+    def make_key(
+        hook: HookMetadata,
+        fn: Optional[Callable],
+        context: IssueHookContext,
+        tree: str,
+    ) -> str:
+        parts = [
+            hook.name,
+            hook_digest(hook, fn),
+            context.event.value,
+            context.issue_id or "-",
+            f"{context.from_status}>{context.to_status}",
+            f"{context.from_stage}>{context.to_stage}",
+            f"force={context.force}",
+            f"dry_run={context.dry_run}",
+            f"branch={context.current_branch}",
+            json.dumps(context.extra, sort_keys=True, default=str),
+            file_digest(context.issue_path),
+            tree,
+        ]
+        return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
+
+    def _load(self) -> Dict[str, Dict]:
+        if self._entries is None:
+            self._entries = {}
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+                if data.get("version") == CACHE_VERSION:
+                    self._entries = data.get("entries", {})
+            except (OSError, ValueError):
+                pass
+        return self._entries
+
+    def _save(self):
+        now = time.time()
+        entries = {k: v for k, v in self._load().items() if now - v["at"] < self.ttl}
+        if len(entries) > MAX_ENTRIES:
+            newest = sorted(entries.items(), key=lambda kv: kv[1]["at"])[-MAX_ENTRIES:]
+            entries = dict(newest)
+        self._entries = entries
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.path.parent, prefix=f".{self.path.name}-", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    f.write(json.dumps({"version": CACHE_VERSION, "entries": entries}))
+                os.replace(tmp, self.path)
+            except BaseException:
+                Path(tmp).unlink(missing_ok=True)
+                raise
+        except OSError as e:
+            logger.warning(f"Failed to persist hook cache {self.path}: {e}")
+
+    def get(self, key: str) -> Optional[IssueHookResult]:
+        with self._lock:
+            entry = self._load().get(key)
+        if entry is None or time.time() - entry["at"] >= self.ttl:
+            return None
+        try:
+            return IssueHookResult.model_validate(entry["result"])
+        except ValueError:
+            return None
+
+    def put(self, key: str, hook_name: str, issue_id: Optional[str], result: IssueHookResult):
+        with self._lock:
+            self._load()[key] = {
+                "hook": hook_name,
+                "issue": issue_id,
+                "at": time.time(),
+                "result": result.model_dump(mode="json"),
+            }
+            self._save()
+
+    def invalidate(self, issue_id: Optional[str] = None, hook_name: Optional[str] = None) -> int:
+        """Drop entries matching the filters (all entries when none given)."""
+        with self._lock:
+            entries = self._load()
+            doomed = [
+                key
+                for key, entry in entries.items()
+                if (issue_id is None or entry.get("issue") == issue_id)
+                and (hook_name is None or entry.get("hook") == hook_name)
+            ]
+            for key in doomed:
+                del entries[key]
+            self._save()
+        return len(doomed)
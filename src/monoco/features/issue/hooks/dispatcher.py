@@ -4,18 +4,26 @@ Issue Hook Dispatcher
 Core execution engine for Issue Lifecycle Hooks.
 Responsible for:
 - Loading built-in and user-defined hooks
-- Executing hooks in priority order
+- Executing hooks in priority order (independent hooks concurrently)
 - Aggregating results and making final decisions
 - Providing debug information
 """
 
+import json
+import os
+import subprocess
+import sys
 import time
 import logging
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
 from typing import List, Dict, Optional, Callable, Any, Union
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from enum import Enum
 
+import yaml
+
+from .cache import HookResultCache, tree_state
 from .models import (
     IssueEvent,
     IssueHookContext,
@@ -27,6 +35,32 @@ from .models import (
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on hooks running at the same time within one event
+DEFAULT_MAX_WORKERS = 4
+
+# Script suffix -> HookMetadata.script_type for user hooks
+SCRIPT_TYPES = {".py": "python", ".sh": "shell", ".bash": "shell"}
+
+
+def _read_hook_front_matter(hook_file: Path) -> Dict[str, Any]:
+    """Parse the `---` delimited YAML block of a hook script (empty if absent)."""
+    block: Optional[List[str]] = None
+    with open(hook_file, encoding="utf-8", errors="replace") as f:
+        for line in f:
+            text = line.rstrip("\n")
+            if text.startswith("#"):
+                # Commented block: drop the marker and one space
+                text = text[1:]
+                text = text[1:] if text.startswith(" ") else text
+            if text.strip() == "---":
+                if block is not None:
+                    data = yaml.safe_load("\n".join(block)) or {}
+                    return data if isinstance(data, dict) else {}
+                block = []
+            elif block is not None:
+                block.append(text)
+    return {}
+
 
 class HookExecutionError(Exception):
     """Exception raised when hook execution fails."""
@@ -42,6 +76,7 @@ class HookExecutionInfo:
     end_time: Optional[float] = None
     result: Optional[IssueHookResult] = None
     error: Optional[str] = None
+    cached: bool = False
     
     @property
     def duration_ms(self) -> Optional[float]:
@@ -53,6 +88,12 @@ class HookExecutionInfo:
     def success(self) -> bool:
         return self.error is None and (self.result is None or self.result.decision != HookDecision.DENY)
 
+    def denies(self, force: bool = False) -> bool:
+        """Whether this execution blocks the command (failures deny unless forced)."""
+        if self.error is not None:
+            return not force
+        return self.result is not None and self.result.decision == HookDecision.DENY
+
 
 class IssueHookDispatcher:
     """
@@ -61,18 +102,29 @@ class IssueHookDispatcher:
     Loads and executes hooks for Issue lifecycle events, supporting:
     - Built-in hooks from monoco/hooks/issue/
     - User-defined hooks from .monoco/hooks/issue/
-    - Synchronous execution with priority ordering
-    - Decision aggregation (allow/warn/deny)
+    - Priority ordering; runs of adjacent `independent` hooks execute
+      concurrently on a bounded pool with per-hook timeouts
+    - Decision aggregation (allow/warn/deny), always in priority order
     """
     
-    def __init__(self, project_root: Optional[Path] = None):
+    def __init__(
+        self,
+        project_root: Optional[Path] = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        stop_on_deny: bool = False,
+    ):
         """
         Initialize the dispatcher.
         
         Args:
             project_root: Project root path for resolving user hooks
+            max_workers: Maximum number of independent hooks run at once
+            stop_on_deny: Skip hooks that have not started once one denies
         """
         self.project_root = project_root
+        self.max_workers = max(1, max_workers)
+        self.stop_on_deny = stop_on_deny
+        self.cache: Optional[HookResultCache] = None
         self._builtins_dir = Path(__file__).parent / "builtin"
         self._user_hooks_dir: Optional[Path] = None
         if project_root:
@@ -128,10 +180,52 @@ class IssueHookDispatcher:
                     logger.warning(f"Failed to load user hook {hook_file}: {e}")
     
     def _register_user_hook_from_file(self, hook_file: Path) -> None:
-        """Register a user-defined hook from a file."""
-        # Parse frontmatter or metadata from the file
-        # This is a simplified implementation
-        logger.debug(f"Registering user hook: {hook_file}")
+        """
+        Register a user-defined hook from a script.
+
+        Metadata is read from a `---` delimited YAML block near the top of
+        the file, either bare or commented out line by line (`# ---`):
+
+            # ---
+            # events: [pre-issue-submit]
+            # priority: 50
+            # independent: true
+            # timeout: 10
+            # ---
+
+        Without `events`, a parent directory named after an event (e.g.
+        `.monoco/hooks/issue/pre-issue-submit/check.sh`) binds the hook.
+        """
+        script_type = SCRIPT_TYPES.get(hook_file.suffix)
+        if script_type is None:
+            logger.debug(f"Skipping non-script file in hooks dir: {hook_file}")
+            return
+
+        meta = _read_hook_front_matter(hook_file)
+        raw_events = meta.get("events", meta.get("event"))
+        if raw_events is None and hook_file.parent != self._user_hooks_dir:
+            raw_events = hook_file.parent.name
+        if isinstance(raw_events, str):
+            raw_events = [raw_events]
+        if not raw_events:
+            logger.warning(f"User hook {hook_file} declares no events; skipped")
+            return
+
+        metadata = HookMetadata(
+            name=str(meta.get("name") or f"user.{hook_file.stem}"),
+            description=str(meta.get("description", "")),
+            events=[IssueEvent(e) for e in raw_events],
+            priority=meta.get("priority", 100),
+            timeout_seconds=meta.get("timeout", meta.get("timeout_seconds", 30)),
+            independent=bool(meta.get("independent", False)),
+            enabled=bool(meta.get("enabled", True)),
+            script_path=hook_file,
+            script_type=script_type,
+        )
+        for event in metadata.events:
+            self._user_hooks[event].append(metadata)
+            self._user_hooks[event].sort(key=lambda m: m.priority)
+        logger.debug(f"Registered user hook {metadata.name} for {raw_events}")
     
     def register_callable(
         self,
@@ -140,6 +234,9 @@ class IssueHookDispatcher:
         fn: Callable[[IssueHookContext], IssueHookResult],
         priority: int = 100,
         enabled: bool = True,
+        independent: bool = False,
+        timeout_seconds: int = 30,
+        cacheable: bool = False,
     ) -> None:
         """
         Register a Python callable as a hook.
@@ -150,6 +247,9 @@ class IssueHookDispatcher:
             fn: Callable that receives context and returns result
             priority: Execution priority (lower = earlier)
             enabled: Whether the hook is enabled
+            independent: Whether the hook may run concurrently with its neighbours
+            timeout_seconds: Time limit when running concurrently
+            cacheable: Whether verdicts may be reused (see `enable_cache`)
         """
         self._callable_hooks[name] = fn
         metadata = HookMetadata(
@@ -157,6 +257,9 @@ class IssueHookDispatcher:
             events=events,
             priority=priority,
             enabled=enabled,
+            independent=independent,
+            timeout_seconds=timeout_seconds,
+            cacheable=cacheable,
             script_type="builtin",
         )
         
@@ -165,6 +268,29 @@ class IssueHookDispatcher:
             # Sort by priority
             self._builtins[event].sort(key=lambda m: m.priority)
     
+    def enable_cache(self, ttl: float, cache: Optional[HookResultCache] = None) -> None:
+        """
+        Reuse verdicts of cacheable hooks for `ttl` seconds.
+
+        Args:
+            ttl: Seconds a cached verdict stays valid (<= 0 disables caching)
+            cache: Cache instance (default: stored in the project's git dir)
+        """
+        if ttl <= 0:
+            self.cache = None
+        elif cache is not None:
+            self.cache = cache
+        elif self.project_root:
+            self.cache = HookResultCache.for_project(self.project_root, ttl)
+
+    def invalidate_cache(
+        self, issue_id: Optional[str] = None, hook_name: Optional[str] = None
+    ) -> int:
+        """Drop cached verdicts (all, or those of an issue and/or hook)."""
+        if self.cache is None:
+            return 0
+        return self.cache.invalidate(issue_id=issue_id, hook_name=hook_name)
+
     def get_hooks_for_event(self, event: IssueEvent) -> List[HookMetadata]:
         """
         Get all hooks registered for a specific event.
@@ -207,58 +333,40 @@ class IssueHookDispatcher:
         if context.debug_hooks:
             logger.info(f"Executing {len(hooks)} hooks for event {event}")
         
-        # Execute hooks and collect results
-        all_results: List[IssueHookResult] = []
+        infos, skipped = self._run_hooks(hooks, event, context)
+        self._execution_history.extend(infos)
+
+        # Aggregate in priority order, independent of completion order
         all_suggestions: List[str] = []
         all_diagnostics: List[Diagnostic] = []
-        execution_infos: List[HookExecutionInfo] = []
-        
         final_decision = HookDecision.ALLOW
         messages: List[str] = []
-        
-        for hook in hooks:
-            info = HookExecutionInfo(
-                hook_name=hook.name,
-                event=event,
-                start_time=time.time(),
-            )
-            
-            try:
-                result = self._execute_single_hook(hook, context)
-                info.result = result
-                info.end_time = time.time()
-                
-                # Collect results
-                all_results.append(result)
-                all_suggestions.extend(result.suggestions)
-                all_diagnostics.extend(result.diagnostics)
-                
-                if result.message:
-                    messages.append(f"[{hook.name}] {result.message}")
-                
-                # Update decision (DENY takes precedence)
-                if result.decision == HookDecision.DENY:
-                    final_decision = HookDecision.DENY
-                    if context.debug_hooks:
-                        logger.info(f"Hook {hook.name} denied execution")
-                    # Continue executing other hooks for full feedback, but remember the deny
-                elif result.decision == HookDecision.WARN and final_decision == HookDecision.ALLOW:
-                    final_decision = HookDecision.WARN
-                    
-            except Exception as e:
-                info.error = str(e)
-                info.end_time = time.time()
-                logger.error(f"Hook {hook.name} failed: {e}")
-                
+
+        for info in infos:
+            result = info.result
+            if info.error is not None:
                 # Hook failure defaults to DENY for safety
                 if not context.force:
                     final_decision = HookDecision.DENY
-                    messages.append(f"[{hook.name}] Execution failed: {e}")
-                    all_suggestions.append(f"Check hook {hook.name} implementation or use --force to bypass")
-            
-            execution_infos.append(info)
-            self._execution_history.append(info)
-        
+                    messages.append(f"[{info.hook_name}] Execution failed: {info.error}")
+                    all_suggestions.append(
+                        f"Check hook {info.hook_name} implementation or use --force to bypass"
+                    )
+                continue
+
+            all_suggestions.extend(result.suggestions)
+            all_diagnostics.extend(result.diagnostics)
+            if result.message:
+                messages.append(f"[{info.hook_name}] {result.message}")
+
+            # Update decision (DENY takes precedence)
+            if result.decision == HookDecision.DENY:
+                final_decision = HookDecision.DENY
+                if context.debug_hooks:
+                    logger.info(f"Hook {info.hook_name} denied execution")
+            elif result.decision == HookDecision.WARN and final_decision == HookDecision.ALLOW:
+                final_decision = HookDecision.WARN
+
         # Construct final result
         final_message = "\n".join(messages) if messages else ""
         
@@ -266,24 +374,170 @@ class IssueHookDispatcher:
             decision=final_decision,
             message=final_message,
             diagnostics=all_diagnostics,
-            suggestions=list(set(all_suggestions)),  # Deduplicate
+            suggestions=list(dict.fromkeys(all_suggestions)),  # Deduplicate, keep order
             context={
                 "event": event.value,
-                "hooks_executed": len(hooks),
+                "hooks_executed": len(infos),
+                "hooks_skipped": skipped,
                 "execution_details": [
                     {
                         "name": i.hook_name,
                         "duration_ms": i.duration_ms,
                         "success": i.success,
                         "error": i.error,
+                        "cached": i.cached,
                     }
-                    for i in execution_infos
+                    for i in infos
                 ] if context.debug_hooks else None,
             },
         )
         
         return result
     
+    @staticmethod
+    def _plan(hooks: List[HookMetadata]) -> List[List[HookMetadata]]:
+        """
+        Split priority-ordered hooks into batches: each run of adjacent
+        independent hooks forms one concurrent batch, every other hook runs
+        alone (and so still observes the effects of the hooks before it).
+        """
+        batches: List[List[HookMetadata]] = []
+        for hook in hooks:
+            if hook.independent and batches and batches[-1][-1].independent:
+                batches[-1].append(hook)
+            else:
+                batches.append([hook])
+        return batches
+
+    def _run_hook(
+        self,
+        hook: HookMetadata,
+        event: IssueEvent,
+        context: IssueHookContext,
+        info: Optional[HookExecutionInfo] = None,
+    ) -> HookExecutionInfo:
+        """Execute one hook, capturing its result or error."""
+        if info is None:
+            info = HookExecutionInfo(hook_name=hook.name, event=event, start_time=0.0)
+        info.start_time = time.time()
+        cache = self.cache if hook.cacheable else None
+        root = context.project_root or self.project_root
+        fn = self._callable_hooks.get(hook.name)
+
+        if cache is not None and root:
+            tree = tree_state(root)
+            hit = tree and cache.get(HookResultCache.make_key(hook, fn, context, tree))
+            if hit:
+                info.result = hit.model_copy(update={"hook_name": hook.name})
+                info.cached = True
+                info.end_time = time.time()
+                return info
+
+        try:
+            info.result = self._execute_single_hook(hook, context)
+        except Exception as e:
+            info.error = str(e)
+            logger.error(f"Hook {hook.name} failed: {e}")
+        info.end_time = time.time()
+
+        if cache is not None and root and info.error is None:
+            # Key on the state after the run, which is what a retry will see
+            tree = tree_state(root)
+            if tree:
+                key = HookResultCache.make_key(hook, fn, context, tree)
+                cache.put(key, hook.name, context.issue_id, info.result)
+        return info
+
+    def _run_hooks(
+        self,
+        hooks: List[HookMetadata],
+        event: IssueEvent,
+        context: IssueHookContext,
+    ) -> tuple[List[HookExecutionInfo], List[str]]:
+        """
+        Run hooks batch by batch.
+
+        Returns:
+            (execution infos in priority order, names of skipped hooks)
+        """
+        infos: List[HookExecutionInfo] = []
+        skipped: List[str] = []
+        denied = False
+        for batch in self._plan(hooks):
+            if denied and self.stop_on_deny:
+                skipped.extend(h.name for h in batch)
+                continue
+            if len(batch) == 1:
+                batch_infos = [self._run_hook(batch[0], event, context)]
+            else:
+                batch_infos = self._run_concurrent(batch, event, context)
+            infos.extend(i for i in batch_infos if i.start_time)
+            skipped.extend(i.hook_name for i in batch_infos if not i.start_time)
+            denied = denied or any(i.denies(context.force) for i in batch_infos if i.start_time)
+        return infos, skipped
+
+    def _run_concurrent(
+        self,
+        batch: List[HookMetadata],
+        event: IssueEvent,
+        context: IssueHookContext,
+    ) -> List[HookExecutionInfo]:
+        """
+        Run independent hooks on a bounded pool, enforcing per-hook timeouts.
+
+        Timed-out hooks are reported as failures. Hooks that never started
+        (cancelled by `stop_on_deny`) keep `start_time == 0`.
+
+        Each hook gets its own deep copy of the context, so concurrent hooks
+        cannot see each other's changes. Script hooks are killed at their
+        timeout; callables cannot be interrupted, so a timed-out callable is
+        abandoned: it keeps running on its pool thread (and interpreter exit
+        waits for it), but it only touches its own context copy and an
+        execution record that is no longer reported.
+        """
+        if context.debug_hooks:
+            logger.info(f"Running {len(batch)} independent hooks concurrently")
+        infos = [HookExecutionInfo(hook_name=h.name, event=event, start_time=0.0) for h in batch]
+        pool = ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(batch)), thread_name_prefix="monoco-hook"
+        )
+        try:
+            pending: Dict[Future, int] = {
+                pool.submit(self._run_hook, hook, event, context.model_copy(deep=True), info): i
+                for i, (hook, info) in enumerate(zip(batch, infos))
+            }
+            while pending:
+                now = time.time()
+                deadlines = [
+                    infos[i].start_time + batch[i].timeout_seconds
+                    for i in pending.values()
+                    if infos[i].start_time
+                ]
+                timeout = max(0.0, min(deadlines) - now) if deadlines else None
+                done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    i = pending.pop(future)
+                    if self.stop_on_deny and infos[i].denies(context.force):
+                        for other in list(pending):
+                            if other.cancel():
+                                pending.pop(other)
+
+                now = time.time()
+                for future, i in list(pending.items()):
+                    info, hook = infos[i], batch[i]
+                    if info.start_time and now - info.start_time >= hook.timeout_seconds:
+                        # Threads cannot be interrupted; the hook is abandoned and
+                        # reported through a fresh record it cannot overwrite
+                        pending.pop(future)
+                        infos[i] = replace(
+                            info, error=f"Timed out after {hook.timeout_seconds}s", end_time=now
+                        )
+                        logger.error(f"Hook {hook.name} timed out after {hook.timeout_seconds}s")
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+        return infos
+
     def _execute_single_hook(
         self,
         hook: HookMetadata,
@@ -331,9 +585,7 @@ class IssueHookDispatcher:
         context: IssueHookContext,
     ) -> IssueHookResult:
         """Execute a Python script hook."""
-        # TODO: Implement Python script execution
-        # This would use importlib or subprocess to execute the script
-        return IssueHookResult.allow("Python script execution not yet implemented")
+        return self._run_script([sys.executable, str(hook.script_path)], hook, context)
     
     def _execute_shell_script(
         self,
@@ -341,9 +593,58 @@ class IssueHookDispatcher:
         context: IssueHookContext,
     ) -> IssueHookResult:
         """Execute a shell script hook."""
-        # TODO: Implement shell script execution
-        # This would use subprocess to execute the script
-        return IssueHookResult.allow("Shell script execution not yet implemented")
+        return self._run_script(["bash", str(hook.script_path)], hook, context)
+
+    def _run_script(
+        self,
+        cmd: List[str],
+        hook: HookMetadata,
+        context: IssueHookContext,
+    ) -> IssueHookResult:
+        """
+        Run a script hook in a subprocess.
+
+        The context is passed as JSON on stdin. A JSON object on stdout is
+        parsed as an IssueHookResult; otherwise exit code 0 means ALLOW and
+        any other code DENY. The process is killed after `timeout_seconds`.
+        """
+        env = os.environ.copy()
+        env["MONOCO_HOOK_EVENT"] = context.event.value
+        if context.issue_id:
+            env["MONOCO_ISSUE_ID"] = context.issue_id
+        start = time.time()
+        try:
+            proc = subprocess.run(
+                cmd,
+                input=context.model_dump_json(),
+                capture_output=True,
+                text=True,
+                cwd=str(self.project_root) if self.project_root else None,
+                env=env,
+                timeout=hook.timeout_seconds,
+            )
+        except subprocess.TimeoutExpired:
+            raise HookExecutionError(f"Timed out after {hook.timeout_seconds}s")
+        duration = (time.time() - start) * 1000
+
+        stdout = proc.stdout.strip()
+        if stdout.startswith("{"):
+            try:
+                result = IssueHookResult.model_validate(json.loads(stdout))
+                return result.model_copy(
+                    update={"execution_time_ms": duration, "hook_name": hook.name}
+                )
+            except ValueError:
+                pass
+        if proc.returncode == 0:
+            return IssueHookResult.allow(
+                stdout, execution_time_ms=duration, hook_name=hook.name
+            )
+        return IssueHookResult.deny(
+            proc.stderr.strip() or stdout or f"Exited with code {proc.returncode}",
+            execution_time_ms=duration,
+            hook_name=hook.name,
+        )
     
     def get_execution_history(self) -> List[HookExecutionInfo]:
         """Get the execution history for debugging."""
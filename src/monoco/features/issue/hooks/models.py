@@ -190,6 +190,13 @@ class HookMetadata(BaseModel):
     # Execution configuration
     priority: int = Field(default=100, ge=0, le=1000)
     timeout_seconds: int = Field(default=30, ge=1, le=300)
+    # Independent hooks neither read nor write state touched by other hooks,
+    # so adjacent independent hooks may run concurrently
+    independent: bool = False
+    # Cacheable hooks are pure checks: same inputs (hook code, issue file,
+    # working tree) give the same verdict, so results may be reused. Hooks
+    # with side effects must not be cacheable, since a cache hit skips them
+    cacheable: bool = False
     
     # Script info
     script_path: Optional[Path] = None
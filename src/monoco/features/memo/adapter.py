@@ -13,8 +13,9 @@ class MemoFeature(FeatureModule):
             name="memo",
             version="1.0.0",
             description="Fleeting notes and quick idea capture",
-            dependencies=["core"],
+            dependencies=["core", "issue"],  # Works inside the Issues tree
             priority=40,
+            commands=["memo"],
             lazy=True,  # Can be lazy loaded
         )
 
@@ -4,6 +4,7 @@ from typing import List, Optional, Any
 import secrets
 from datetime import datetime
 
+from .log import MemoLog
 from .models import Memo
 
 def is_chinese(text: str) -> bool:
@@ -106,50 +107,24 @@ def parse_memo_block(block: str) -> Optional[Memo]:
         context=metadata.get("context")
     )
 
+def get_memo_log(issues_root: Path) -> MemoLog:
+    from monoco.core.config import get_config
+
+    return MemoLog(get_inbox_path(issues_root), append_only=get_config().memo.append_only)
+
+
 def load_memos(issues_root: Path) -> List[Memo]:
     """
-    Parse all memos from inbox.
+    Parse all live memos from inbox (file order).
     """
-    inbox_path = get_inbox_path(issues_root)
-    if not inbox_path.exists():
-        return []
+    return get_memo_log(issues_root).load()
 
-    content = inbox_path.read_text(encoding="utf-8")
-    
-    # Split by headers: ## [uid]
-    # We use a lookahead or just standard split carefully
-    parts = re.split(r"(^## \[)", content, flags=re.MULTILINE)[1:] # Skip preamble
-    
-    # parts will be like: ['## [', 'abc] 2023...\n...', '## [', 'def] ...']
-    # Reassemble pairs
-    blocks = []
-    for i in range(0, len(parts), 2):
-        if i+1 < len(parts):
-            blocks.append(parts[i] + parts[i+1])
-            
-    memos = []
-    for block in blocks:
-        memo = parse_memo_block(block)
-        if memo:
-            memos.append(memo)
-            
-    # Sort by timestamp desc? Or keep file order? File order is usually append (time asc).
-    return memos
 
 def save_memos(issues_root: Path, memos: List[Memo]) -> None:
     """
     Rewrite the inbox file with the given list of memos.
     """
-    inbox_path = get_inbox_path(issues_root)
-    
-    # Header
-    lines = ["# Monoco Memos Inbox", ""]
-    
-    for memo in memos:
-        lines.append(memo.to_markdown().strip())
-        lines.append("") # Spacer
-        
-    inbox_path.write_text("\n".join(lines), encoding="utf-8")
+    get_memo_log(issues_root).rewrite(memos)
 
 
 def add_memo(
@@ -173,32 +148,26 @@ def add_memo(
         source=source,
         type=memo_type
     )
-    
-    # Append mode is more robust against concurrent reads than rewrite, 
-    # but for consistent formatting we might want to just append string.
-    inbox_path = get_inbox_path(issues_root)
-    
-    if not inbox_path.exists():
-        inbox_path.parent.mkdir(parents=True, exist_ok=True)
-        inbox_path.write_text("# Monoco Memos Inbox\n\n", encoding="utf-8")
-        
-    with inbox_path.open("a", encoding="utf-8") as f:
-        f.write("\n" + memo.to_markdown().strip() + "\n")
-        
+    get_memo_log(issues_root).append(memo)
     return uid
 
+
 def delete_memo(issues_root: Path, memo_id: str) -> bool:
     """
     Delete a memo by its ID.
+
+    Rewrites the inbox without the memo. With `memo.append_only` a tombstone
+    is appended instead, and the log is compacted once tombstones dominate it.
     """
-    memos = load_memos(issues_root)
-    initial_count = len(memos)
-    memos = [m for m in memos if m.uid != memo_id]
-    
-    if len(memos) < initial_count:
-        save_memos(issues_root, memos)
-        return True
-    return False
+    return get_memo_log(issues_root).delete(memo_id)
+
+
+def consume_memos(issues_root: Path) -> List[Memo]:
+    """
+    Load all pending memos and clear the inbox (Signal Queue consumption).
+    """
+    return get_memo_log(issues_root).consume()
+
 
 # Compatibility shim
-list_memos = load_memos
\ No newline at end of file
+list_memos = load_memos
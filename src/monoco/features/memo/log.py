@@ -0,0 +1,420 @@
+"""
+Memo inbox with an offset index.
+
+`Memos/inbox.md` stays a plain Markdown file. New memos are appended as
+blocks. By default a deletion rewrites the inbox without the memo; with
+`memo.append_only` it is appended as a tombstone comment
+(`<!-- memo-deleted: uid -->`, invisible when rendered) instead, and the log
+is compacted (rewritten with live blocks only) once tombstones dominate. A
+sidecar index keeps the byte range of every live block plus the tombstone
+count, so adds (and append-only deletes) are O(1) appends and loading slices
+the log instead of re-splitting it.
+
+The index is a cache: it is validated against the inbox's size, mtime and
+tail bytes and extended or rebuilt whenever the file was changed by someone
+else (an editor, `git checkout`, a consumer clearing the inbox).
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from monoco.core import git
+
+from .models import Memo
+
+logger = logging.getLogger("monoco.features.memo.log")
+
+INBOX_HEADER = "# Monoco Memos Inbox\n\n"
+INDEX_VERSION = 1
+
+# Compact once this many tombstones accumulate and they outnumber live memos
+COMPACT_MIN_TOMBSTONES = 32
+
+# Bytes before the indexed end used to detect rewrites of the indexed prefix
+TAIL_BYTES = 64
+
+# A memo header (`## [uid] ...`) or a tombstone line. Any `## [` line ends the
+# previous block, matching how the inbox has always been split.
+RECORD_RE = re.compile(
+    rb"^(?:## \[(?:(?P<uid>[a-f0-9]+)\] )?|<!-- memo-deleted: (?P<dead>[a-f0-9]+) -->$)",
+    re.MULTILINE,
+)
+
+Ranges = Dict[str, List[List[int]]]
+
+
+def tombstone_line(uid: str) -> str:
+    return f"<!-- memo-deleted: {uid} -->\n"
+
+
+def _tail_digest(data: bytes) -> str:
+    return hashlib.blake2b(data[-TAIL_BYTES:], digest_size=8).hexdigest()
+
+
+def scan_records(data: bytes, base: int, blocks: Ranges) -> int:
+    """
+    Index the records in `data` (which starts at file offset `base`).
+
+    Blocks are recorded as [start, end) byte ranges; a tombstone removes the
+    live block with its ID. Text before the first record extends a block that
+    ended exactly at `base`.
+
+    Returns:
+        Number of tombstones applied.
+    """
+    tombstones = 0
+    open_block: Optional[List[int]] = None
+    for ranges in blocks.values():
+        if ranges and ranges[-1][1] == base:
+            open_block = ranges[-1]
+            break
+
+    for match in RECORD_RE.finditer(data):
+        start = base + match.start()
+        if open_block is not None:
+            open_block[1] = start
+            open_block = None
+        uid = match.group("uid")
+        dead = match.group("dead")
+        if uid is not None:
+            open_block = [start, start]
+            blocks.setdefault(uid.decode("ascii"), []).append(open_block)
+        elif dead is not None:
+            if blocks.pop(dead.decode("ascii"), None) is not None:
+                tombstones += 1
+    if open_block is not None:
+        open_block[1] = base + len(data)
+    return tombstones
+
+
+def default_index_path(inbox_path: Path) -> Path:
+    """
+    Sidecar index location: the worktree's git dir when the inbox lives in a
+    repository (keeps `git status` clean), otherwise next to the inbox.
+    """
+    inbox_path = Path(inbox_path).absolute()
+    dirs = git.find_git_dirs(inbox_path.parent)
+    if dirs is None:
+        return inbox_path.with_name(f".{inbox_path.stem}.idx.json")
+    key = hashlib.blake2b(str(inbox_path).encode("utf-8"), digest_size=6).hexdigest()
+    return dirs[0] / "monoco" / f"memo-index-{key}.json"
+
+
+class MemoLog:
+    """
+    Memo inbox with an offset index.
+
+    Args:
+        inbox_path: The inbox Markdown file.
+        index_path: Sidecar index location (default: `default_index_path`).
+        append_only: Delete by appending tombstones instead of rewriting.
+    """
+
+    def __init__(self, inbox_path: Path, index_path: Optional[Path] = None, append_only: bool = False):
+        self.inbox_path = Path(inbox_path)
+        self._index_path = index_path
+        self.append_only = append_only
+        self.blocks: Ranges = {}
+        self.tombstones = 0
+        self.size = 0
+        self.mtime_ns = 0
+        self.tail = ""
+
+    @property
+    def index_path(self) -> Path:
+        if self._index_path is None:
+            self._index_path = default_index_path(self.inbox_path)
+        return self._index_path
+
+    # ---------------------------------------------------------------- index
+
+    def _reset(self):
+        self.blocks = {}
+        self.tombstones = 0
+        self.size = 0
+        self.mtime_ns = 0
+        self.tail = ""
+
+    def _load_index(self) -> bool:
+        try:
+            data = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return False
+        if data.get("version") != INDEX_VERSION:
+            return False
+        self.blocks = data.get("blocks", {})
+        self.tombstones = data.get("tombstones", 0)
+        self.size = data.get("size", 0)
+        self.mtime_ns = data.get("mtime_ns", 0)
+        self.tail = data.get("tail", "")
+        return True
+
+    def _save_index(self):
+        data = {
+            "version": INDEX_VERSION,
+            "size": self.size,
+            "mtime_ns": self.mtime_ns,
+            "tail": self.tail,
+            "tombstones": self.tombstones,
+            "blocks": self.blocks,
+        }
+        path = self.index_path
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}-", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    f.write(json.dumps(data))
+                os.replace(tmp, path)
+            except BaseException:
+                Path(tmp).unlink(missing_ok=True)
+                raise
+        except OSError as e:
+            logger.warning(f"Failed to persist memo index {path}: {e}")
+
+    def _stamp(self, size: int, data_tail: bytes):
+        """Record the indexed extent (`data_tail` ends at `size`)."""
+        self.size = size
+        self.mtime_ns = self.inbox_path.stat().st_mtime_ns
+        self.tail = _tail_digest(data_tail)
+
+    def _rebuild(self, data: bytes):
+        self._reset()
+        self.tombstones = scan_records(data, 0, self.blocks)
+        self._stamp(len(data), data)
+        self._save_index()
+
+    def sync(self, data: Optional[bytes] = None) -> Optional[bytes]:
+        """
+        Bring the index up to date with the inbox.
+
+        Args:
+            data: Full inbox content, if the caller already read it.
+
+        Returns:
+            The full content when it had to be read, else `data` (possibly None).
+        """
+        try:
+            st = self.inbox_path.stat()
+        except FileNotFoundError:
+            self._reset()
+            return b""
+        if not self.size and not self.blocks:
+            self._load_index()
+
+        if st.st_size == self.size and st.st_mtime_ns == self.mtime_ns:
+            return data
+
+        if self.size and st.st_size > self.size:
+            # Grown: extend the index if the indexed prefix is untouched
+            with open(self.inbox_path, "rb") as f:
+                f.seek(max(0, self.size - TAIL_BYTES))
+                prefix_tail = f.read(self.size - max(0, self.size - TAIL_BYTES))
+                if _tail_digest(prefix_tail) == self.tail:
+                    f.seek(self.size)
+                    appended = f.read()
+                    self.tombstones += scan_records(appended, self.size, self.blocks)
+                    self._stamp(self.size + len(appended), prefix_tail + appended)
+                    self._save_index()
+                    return data
+
+        if data is None:
+            data = self.inbox_path.read_bytes()
+        self._rebuild(data)
+        return data
+
+    # ----------------------------------------------------------- operations
+
+    def _live_ranges(self) -> List[Tuple[int, int]]:
+        return sorted((start, end) for ranges in self.blocks.values() for start, end in ranges)
+
+    def load(self) -> List[Memo]:
+        """Live memos in file order."""
+        if not self.inbox_path.exists():
+            return []
+        data = self.inbox_path.read_bytes()
+        self.sync(data)
+
+        from .core import parse_memo_block
+
+        memos = []
+        for start, end in self._live_ranges():
+            memo = parse_memo_block(data[start:end].decode("utf-8", errors="replace"))
+            if memo:
+                memos.append(memo)
+        return memos
+
+    def _append(self, text: str) -> int:
+        """Append text; returns the offset it was written at."""
+        if not self.inbox_path.exists():
+            self.inbox_path.parent.mkdir(parents=True, exist_ok=True)
+            self.inbox_path.write_text(INBOX_HEADER, encoding="utf-8")
+        self.sync()
+        payload = text.encode("utf-8")
+        with open(self.inbox_path, "ab") as f:
+            offset = f.seek(0, os.SEEK_END)
+            f.write(payload)
+        if offset != self.size:
+            # Someone else appended in between; let the next sync catch up
+            self.sync()
+        else:
+            self.tombstones += scan_records(payload, offset, self.blocks)
+            self._stamp(offset + len(payload), self._read_tail(offset) + payload)
+            self._save_index()
+        return offset
+
+    def _read_tail(self, end: int) -> bytes:
+        with open(self.inbox_path, "rb") as f:
+            f.seek(max(0, end - TAIL_BYTES))
+            return f.read(end - max(0, end - TAIL_BYTES))
+
+    def append(self, memo: Memo):
+        """Append a memo block."""
+        self._append("\n" + memo.to_markdown().strip() + "\n")
+
+    def delete(self, uid: str) -> bool:
+        """Delete a live memo. Returns False if it is not in the inbox."""
+        if not self.inbox_path.exists():
+            return False
+        if not self.append_only:
+            data = self.inbox_path.read_bytes()
+            self.sync(data)
+            if uid not in self.blocks:
+                return False
+            self._write_live(data, exclude=uid)
+            return True
+        self.sync()
+        if uid not in self.blocks:
+            return False
+        self._append(tombstone_line(uid))
+        if self.needs_compaction():
+            self.compact()
+        return True
+
+    def needs_compaction(self) -> bool:
+        live = sum(len(ranges) for ranges in self.blocks.values())
+        if self.tombstones and not live:
+            return True
+        return self.tombstones >= COMPACT_MIN_TOMBSTONES and self.tombstones >= live
+
+    def _write(self, data: bytes):
+        try:
+            mode = self.inbox_path.stat().st_mode & 0o777
+        except FileNotFoundError:
+            mode = 0o644
+        fd, tmp = tempfile.mkstemp(dir=self.inbox_path.parent, prefix=f".{self.inbox_path.name}-", suffix=".tmp")
+        try:
+            # mkstemp creates 0600; the inbox is a tracked file, keep its mode
+            os.fchmod(fd, mode)
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, self.inbox_path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        self._rebuild(data)
+
+    def _write_live(self, data: bytes, exclude: Optional[str] = None):
+        """Rewrite the inbox with the live blocks of `data` (indexed), minus `exclude`."""
+        skip = set(map(tuple, self.blocks.get(exclude, ()))) if exclude else set()
+        parts = [INBOX_HEADER.encode("utf-8")]
+        for start, end in self._live_ranges():
+            if (start, end) not in skip:
+                parts.append(data[start:end].strip(b"\n") + b"\n\n")
+        self._write(b"".join(parts))
+
+    def compact(self):
+        """Rewrite the inbox with live blocks only."""
+        data = self.inbox_path.read_bytes()
+        self.sync(data)
+        self._write_live(data)
+        logger.debug(f"Compacted memo inbox {self.inbox_path}")
+
+    def rewrite(self, memos: List[Memo]):
+        """Replace the inbox content with the given memos."""
+        lines = ["# Monoco Memos Inbox", ""]
+        for memo in memos:
+            lines.append(memo.to_markdown().strip())
+            lines.append("")  # Spacer
+        self.inbox_path.parent.mkdir(parents=True, exist_ok=True)
+        self._write("\n".join(lines).encode("utf-8"))
+
+    def consume(self) -> List[Memo]:
+        """Return all live memos and clear the inbox (signal consumption)."""
+        memos = self.load()
+        self._write(INBOX_HEADER.encode("utf-8"))
+        return memos
+
+
+class InboxTail:
+    """
+    Incremental pending-memo counter for an inbox.
+
+    Each `poll` reads only the bytes appended since the previous poll; a
+    truncated, replaced or rewritten file triggers a full rescan.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.offset = 0
+        self.bytes_read = 0
+        self._ino: Optional[int] = None
+        self._stat: Optional[Tuple[int, int]] = None
+        self._tail = b""
+        self._live: Dict[str, int] = {}
+
+    def _reset(self):
+        self.offset = 0
+        self._tail = b""
+        self._live = {}
+
+    @property
+    def pending(self) -> int:
+        return sum(self._live.values())
+
+    def _consume(self, chunk: bytes):
+        for match in RECORD_RE.finditer(chunk):
+            uid = match.group("uid")
+            dead = match.group("dead")
+            if uid is not None:
+                uid = uid.decode("ascii")
+                self._live[uid] = self._live.get(uid, 0) + 1
+            elif dead is not None:
+                self._live.pop(dead.decode("ascii"), None)
+
+    def poll(self) -> int:
+        """Return the number of pending memos."""
+        try:
+            st = self.path.stat()
+        except FileNotFoundError:
+            self._reset()
+            self._ino = self._stat = None
+            return 0
+        if (st.st_size, st.st_mtime_ns) == self._stat and st.st_ino == self._ino:
+            return self.pending
+
+        with open(self.path, "rb") as f:
+            if st.st_ino != self._ino or st.st_size < self.offset:
+                self._reset()
+            elif self._tail:
+                f.seek(self.offset - len(self._tail))
+                if f.read(len(self._tail)) != self._tail:
+                    self._reset()
+            f.seek(self.offset)
+            chunk = f.read()
+        self._ino = st.st_ino
+        self.bytes_read += len(chunk)
+
+        # Only consume complete lines; a partial write is picked up next time
+        complete = chunk.rfind(b"\n") + 1
+        self._consume(chunk[:complete])
+        self.offset += complete
+        self._tail = (self._tail + chunk[:complete])[-TAIL_BYTES:]
+        self._stat = (st.st_size, st.st_mtime_ns) if complete == len(chunk) else None
+        return self.pending
@@ -16,6 +16,7 @@ class SpikeFeature(FeatureModule):
             description="Research spike management for external references",
             dependencies=["core"],
             priority=30,
+            commands=["spike"],
         )
 
     def _on_mount(self, context: "FeatureContext") -> None:  # type: ignore
@@ -1,25 +1,67 @@
 import os
 import typer
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 from pathlib import Path
-from monoco.core.output import print_output
-from monoco.core.loader import FeatureLoader, FeatureContext
+from monoco.cli.lazy import LazyCommand, lazy_group
+
+if TYPE_CHECKING:
+    from monoco.core.loader import FeatureLoader
 
 # Global feature loader for CLI lifecycle management
-_feature_loader: Optional[FeatureLoader] = None
+_feature_loader: Optional["FeatureLoader"] = None
 
 
-def get_feature_loader() -> FeatureLoader:
+def get_feature_loader() -> "FeatureLoader":
     """Get or initialize the global feature loader."""
     global _feature_loader
     if _feature_loader is None:
+        from monoco.core.loader import FeatureLoader
+
         _feature_loader = FeatureLoader()
         # Discover features but defer loading until needed
         _feature_loader.discover()
     return _feature_loader
 
 
+# Subcommands are imported only when invoked (see monoco.cli.lazy).
+# Keep names and help text here in sync with the feature command modules.
+LAZY_COMMANDS = {
+    "init": LazyCommand("monoco.core.setup:init_cli", "Initialize Monoco configuration (Global and/or Project)."),
+    "install": LazyCommand("monoco.core.install:install_command", "Install Monoco resources (AGENTS.md, skills, hooks)."),
+    "uninstall": LazyCommand("monoco.core.install:uninstall_command", "Uninstall Monoco resources."),
+    "issue": LazyCommand("monoco.features.issue.commands:app", "Manage development issues"),
+    "spike": LazyCommand("monoco.features.spike.commands:app", "Manage research spikes"),
+    "i18n": LazyCommand("monoco.features.i18n.commands:app", "Manage documentation i18n"),
+    "config": LazyCommand("monoco.features.config.commands:app", "Manage configuration"),
+    "project": LazyCommand("monoco.cli.project:app", "Manage projects"),
+    "doc-extractor": LazyCommand(
+        "monoco.features.doc_extractor.commands:app",
+        "Extract and render documents to WebP pages",
+    ),
+    "artifact": LazyCommand("monoco.features.artifact.commands:app", "Manage the shared artifact stores"),
+    "agent": LazyCommand("monoco.features.agent.cli:app", "Manage agent sessions and roles"),
+    "memo": LazyCommand("monoco.features.memo:app", "Manage fleeting notes (memos)"),
+    "mailbox": LazyCommand("monoco.features.mailbox.commands:app", "Manage messages (Mailbox)"),
+    "courier": LazyCommand(
+        "monoco.features.courier.commands:app", "Manage Courier service (message transport)"
+    ),
+    "channel": LazyCommand(
+        "monoco.features.channel.commands:app",
+        "Manage notification channels (DingTalk, Lark, Email)",
+    ),
+    "ralph": LazyCommand(
+        "monoco.features.ralph.cli:app",
+        "Ralph Loop - Agent session relay for long-running issues",
+    ),
+    "pretty-markdown": LazyCommand(
+        "monoco.features.pretty_markdown.commands:app",
+        "Markdown formatting and linting utilities",
+    ),
+    "serve": LazyCommand("monoco.daemon.commands:serve_app", "Manage Monoco Daemon server"),
+}
+
 app = typer.Typer(
+    cls=lazy_group(LAZY_COMMANDS),
     name="monoco",
     help="The Headless Operating System for Agentic Engineering",
     add_completion=False,
@@ -71,6 +113,11 @@ def main(
     root: Optional[str] = typer.Option(
         None, "--root", help="Explicitly specify the Monoco Project root directory."
     ),
+    profile_startup: bool = typer.Option(
+        False,
+        "--profile-startup",
+        help="Report per-feature load and mount time on stderr.",
+    ),
 ):
     """
     Monoco - The sensory and motor system for Monoco Agents.
@@ -107,23 +154,26 @@ def main(
 
         config = get_config(project_root=config_root, require_project=require_project)
         
-        # Initialize FeatureLoader and mount features when project is available
+        # Mount only the features serving the invoked subcommand
         if require_project and config_root:
+            import time
+            from monoco.core.loader import FeatureContext
+
+            started = time.perf_counter()
             loader = get_feature_loader()
-            # Load all features (with lazy loading for non-critical features)
-            loader.load_all(lazy=True)
-            # Create feature context and mount all features
             feature_context = FeatureContext(
                 root=Path(config_root),
                 config=config.model_dump(),
                 registry=loader.registry,
             )
-            errors = loader.mount_all(feature_context)
+            errors = loader.mount_for_command(ctx.invoked_subcommand, feature_context)
             if errors:
                 from rich.console import Console
                 console = Console()
                 for name, error in errors.items():
                     console.print(f"[yellow]Warning: Failed to mount feature '{name}': {error}[/yellow]")
+            if profile_startup:
+                _print_startup_profile(loader, time.perf_counter() - started)
                     
     except FileNotFoundError as e:
         # Graceful exit for project errors
@@ -137,14 +187,22 @@ def main(
         raise typer.Exit(code=1)
 
 
-from monoco.core.setup import init_cli
-
-app.command(name="init")(init_cli)
-
-from monoco.core.install import install_command, uninstall_command
+def _print_startup_profile(loader: "FeatureLoader", total: float):
+    from rich.console import Console
+    from rich.table import Table
 
-app.command(name="install")(install_command)
-app.command(name="uninstall")(uninstall_command)
+    table = Table(title="Startup Profile")
+    table.add_column("Feature")
+    table.add_column("Load (ms)", justify="right")
+    table.add_column("Mount (ms)", justify="right")
+    for name, timing in sorted(loader.timings.items()):
+        table.add_row(
+            name,
+            f"{timing.get('load', 0.0) * 1000:.1f}",
+            f"{timing.get('mount', 0.0) * 1000:.1f}",
+        )
+    table.caption = f"Feature routing total: {total * 1000:.1f} ms"
+    Console(stderr=True).print(table)
 
 
 @app.command()
@@ -154,6 +212,7 @@ def info():
     """
     from pydantic import BaseModel
     from monoco.core.config import get_config
+    from monoco.core.output import print_output
 
     settings = get_config()
 
@@ -193,55 +252,5 @@ def info():
         print_output(settings, title="Current Configuration")
 
 
-# Register Feature Modules
-# Register Feature Modules
-from monoco.features.issue import commands as issue_cmd
-from monoco.features.spike import commands as spike_cmd
-from monoco.features.i18n import commands as i18n_cmd
-from monoco.features.config import commands as config_cmd
-from monoco.cli import project as project_cmd
-from monoco.features.doc_extractor import commands as doc_extractor_cmd
-
-app.add_typer(issue_cmd.app, name="issue", help="Manage development issues")
-app.add_typer(spike_cmd.app, name="spike", help="Manage research spikes")
-app.add_typer(i18n_cmd.app, name="i18n", help="Manage documentation i18n")
-app.add_typer(config_cmd.app, name="config", help="Manage configuration")
-app.add_typer(project_cmd.app, name="project", help="Manage projects")
-app.add_typer(doc_extractor_cmd.app, name="doc-extractor", help="Extract and render documents to WebP pages")
-
-from monoco.features.agent import cli as scheduler_cmd
-
-app.add_typer(scheduler_cmd.app, name="agent", help="Manage agent sessions and roles")
-
-from monoco.features.memo import app as memo_app
-
-app.add_typer(memo_app, name="memo", help="Manage fleeting notes (memos)")
-
-from monoco.features.mailbox import commands as mailbox_cmd
-
-app.add_typer(mailbox_cmd.app, name="mailbox", help="Manage messages (Mailbox)")
-
-from monoco.features.courier import commands as courier_cmd
-
-app.add_typer(courier_cmd.app, name="courier", help="Manage Courier service (message transport)")
-
-from monoco.features.channel import commands as channel_cmd
-
-app.add_typer(channel_cmd.app, name="channel", help="Manage notification channels (DingTalk, Lark, Email)")
-
-from monoco.features.ralph import cli as ralph_cmd
-
-app.add_typer(ralph_cmd.app, name="ralph", help="Ralph Loop - Agent session relay for long-running issues")
-
-from monoco.features.pretty_markdown import commands as pretty_markdown_cmd
-
-app.add_typer(pretty_markdown_cmd.app, name="pretty-markdown", help="Markdown formatting and linting utilities")
-
-from monoco.daemon.commands import serve_app, serve
-
-app.add_typer(serve_app, name="serve", help="Manage Monoco Daemon server")
-# Keep legacy 'serve' command for backward compatibility
-app.command(name="serve", hidden=True)(serve)
-
 if __name__ == "__main__":
     app()
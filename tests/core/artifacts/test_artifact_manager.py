@@ -228,6 +228,138 @@ class TestArtifactManager:
         cas_path = manager._get_cas_path(meta1.content_hash)
         assert cas_path.exists()
 
+    def test_store_file_streams_large_file(self, manager, tmp_path, monkeypatch):
+        """Test that store_file hashes in chunks without reading the whole file."""
+        content = os.urandom(3 * 1024 * 1024 + 17)
+        test_file = tmp_path / "large.bin"
+        test_file.write_bytes(content)
+
+        def no_read_bytes(self):
+            raise AssertionError("store_file must not read the whole file")
+
+        monkeypatch.setattr(Path, "read_bytes", no_read_bytes)
+        metadata = manager.store_file(test_file, source_type=ArtifactSourceType.UPLOADED)
+        monkeypatch.undo()
+
+        assert metadata.content_hash == compute_content_hash(content)
+        assert metadata.size_bytes == len(content)
+        assert manager._get_cas_path(metadata.content_hash).read_bytes() == content
+
+    def test_store_file_deduplicates_without_leftovers(self, manager, tmp_path):
+        """Test that storing the same file twice keeps one CAS copy and no temp files."""
+        test_file = tmp_path / "doc.txt"
+        test_file.write_bytes(b"same bytes")
+
+        meta1 = manager.store_file(test_file, source_type=ArtifactSourceType.UPLOADED)
+        meta2 = manager.store_file(test_file, source_type=ArtifactSourceType.UPLOADED)
+
+        assert meta1.content_hash == meta2.content_hash
+        assert meta1.artifact_id != meta2.artifact_id
+        incoming = manager.global_store / ".incoming"
+        assert not incoming.exists() or not any(incoming.iterdir())
+
+    def test_store_file_hardlink(self, manager, tmp_path):
+        """Test that allow_hardlink links the source into CAS on the same filesystem."""
+        test_file = manager.global_store / "source.bin"
+        test_file.write_bytes(b"linked content")
+
+        metadata = manager.store_file(
+            test_file, source_type=ArtifactSourceType.IMPORTED, allow_hardlink=True
+        )
+
+        cas_path = manager._get_cas_path(metadata.content_hash)
+        assert cas_path.stat().st_ino == test_file.stat().st_ino
+
+    def test_manifest_append_is_one_line_per_entry(self, manager):
+        """Test that each store appends exactly one manifest line."""
+        manager.store(b"first", source_type=ArtifactSourceType.GENERATED)
+        manager.store(b"second", source_type=ArtifactSourceType.GENERATED)
+
+        lines = manager.manifest_path.read_text().splitlines()
+        assert len(lines) == 2
+        assert all(json.loads(line)["artifact_id"] for line in lines)
+
+    def test_append_manifest_batch(self, manager):
+        """Test that several entries can be appended in one write."""
+        first = manager.store(b"a", source_type=ArtifactSourceType.GENERATED)
+        second = manager.store(b"b", source_type=ArtifactSourceType.GENERATED)
+        manager.manifest_path.unlink()
+
+        manager._append_manifest([first, second])
+
+        ids = [json.loads(line)["artifact_id"] for line in manager.manifest_path.read_text().splitlines()]
+        assert ids == [first.artifact_id, second.artifact_id]
+
+    def test_open_content(self, manager):
+        """Test read-only mapped access with ranges and chunked hashing."""
+        content = os.urandom(10_000)
+        metadata = manager.store(content, source_type=ArtifactSourceType.GENERATED)
+
+        with manager.open_content(metadata.artifact_id) as view:
+            assert len(view) == len(content)
+            assert bytes(view.read_range(100, 200)) == content[100:200]
+            assert b"".join(view.iter_chunks(chunk_size=4096)) == content
+            assert view.digest() == metadata.content_hash
+            with pytest.raises(TypeError):
+                view.buffer[0] = 0
+            with pytest.raises(ValueError):
+                view.read_range(50, 10)
+        assert view.closed
+        with pytest.raises(ValueError):
+            view.read_range()
+
+    def test_open_content_empty_and_missing(self, manager):
+        """Test that empty content opens and unknown artifacts return None."""
+        metadata = manager.store(b"", source_type=ArtifactSourceType.GENERATED)
+
+        with manager.open_content(metadata.artifact_id) as view:
+            assert len(view) == 0
+            assert bytes(view.buffer) == b""
+            assert view.digest() == compute_content_hash(b"")
+        assert manager.open_content("missing") is None
+
+    def test_store_files_bulk(self, manager, tmp_path):
+        """Test parallel bulk import with one manifest append."""
+        files = []
+        for i in range(20):
+            path = tmp_path / f"file{i}.txt"
+            path.write_bytes(f"content {i % 10}".encode())
+            files.append(path)
+        missing = tmp_path / "missing.txt"
+
+        report = manager.store_files(files + [missing], tags=["bulk"], workers=4)
+
+        assert report.processed == 20
+        assert list(report.failed) == [str(missing)]
+        assert [m.original_filename for m in report.stored] == [f.name for f in files]
+        assert report.stored[3].content_hash == compute_content_hash(b"content 3")
+        assert report.bytes == sum(f.stat().st_size for f in files)
+        lines = manager.manifest_path.read_text().splitlines()
+        assert len(lines) == 20
+        reloaded = ArtifactManager(project_dir=manager.project_dir, global_store=manager.global_store)
+        assert len(reloaded.list(tags=["bulk"])) == 20
+
+    def test_verify(self, manager):
+        """Test parallel verification reports missing and corrupted content."""
+        good = manager.store(b"good", source_type=ArtifactSourceType.GENERATED)
+        dup = manager.store(b"good", source_type=ArtifactSourceType.GENERATED)
+        bad = manager.store(b"bad", source_type=ArtifactSourceType.GENERATED)
+        gone = manager.store(b"gone", source_type=ArtifactSourceType.GENERATED)
+        bad_path = manager._get_cas_path(bad.content_hash)
+        bad_path.write_bytes(b"tampered")
+        manager._get_cas_path(gone.content_hash).unlink()
+
+        report = manager.verify(workers=2)
+
+        assert sorted(report.ok) == sorted([good.artifact_id, dup.artifact_id])
+        assert report.corrupted == [bad.artifact_id]
+        assert report.missing == [gone.artifact_id]
+        assert not report.valid
+
+        report = manager.verify([good.artifact_id, "unknown"])
+        assert report.ok == [good.artifact_id]
+        assert report.missing == ["unknown"]
+
     def test_list_artifacts(self, manager):
         """Test listing artifacts with filters."""
         # Create several artifacts
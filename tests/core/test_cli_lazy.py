@@ -0,0 +1,77 @@
+"""
+Tests for lazy subcommand registration in the `monoco` CLI.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+from typer.testing import CliRunner
+
+from monoco.main import LAZY_COMMANDS, app
+
+HEAVY_MODULES = ["fastapi", "uvicorn", "aiohttp", "httpx", "dingtalk_stream"]
+
+runner = CliRunner()
+
+
+def _imported_modules(stderr: str):
+    modules = set()
+    for line in stderr.splitlines():
+        if line.startswith("import time:"):
+            modules.add(line.rsplit("|", 1)[-1].strip())
+    return modules
+
+
+@pytest.fixture
+def project(tmp_path):
+    home = tmp_path / "home"
+    root = tmp_path / "project"
+    home.mkdir()
+    root.mkdir()
+    env = {**os.environ, "HOME": str(home)}
+    subprocess.run(["git", "init", "-q"], cwd=root, check=True)
+    subprocess.run(
+        [
+            sys.executable, "-m", "monoco", "init", "--project",
+            "--name", "Test", "--key", "TEST", "--author", "test",
+            "--no-telemetry",
+        ],
+        cwd=root,
+        env=env,
+        check=True,
+        capture_output=True,
+    )
+    return root, env
+
+
+def test_help_lists_lazy_commands_without_importing():
+    """Top-level help comes from the static table."""
+    result = runner.invoke(app, ["--help"])
+    assert result.exit_code == 0
+    for name, spec in LAZY_COMMANDS.items():
+        if not spec.hidden:
+            assert name in result.output
+
+
+def test_lazy_command_resolves_to_feature_app():
+    result = runner.invoke(app, ["issue", "--help"])
+    assert result.exit_code == 0
+    assert "list" in result.output
+
+
+def test_issue_list_does_not_import_heavy_dependencies(project):
+    root, env = project
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "monoco", "issue", "list"],
+        cwd=root,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    assert proc.returncode == 0, proc.stderr[-2000:]
+    modules = _imported_modules(proc.stderr)
+    leaked = [m for m in HEAVY_MODULES if m in modules]
+    assert leaked == []
+    assert "monoco.daemon.app" not in modules
@@ -0,0 +1,94 @@
+"""Tests for the persistent git cat-file session."""
+
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from monoco.core import git
+
+
+def _git(repo: Path, *args: str):
+    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+
+
+@pytest.fixture
+def repo(tmp_path):
+    _git(tmp_path, "init")
+    _git(tmp_path, "config", "user.email", "test@example.com")
+    _git(tmp_path, "config", "user.name", "Test User")
+    _git(tmp_path, "checkout", "-b", "main")
+    (tmp_path / "docs" / "sub").mkdir(parents=True)
+    (tmp_path / "docs" / "a.md").write_text("a")
+    (tmp_path / "docs" / "sub" / "b c.md").write_text("b")
+    (tmp_path / "README.md").write_text("readme")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-m", "init")
+    return tmp_path
+
+
+class TestGitCatFileSession:
+    """Tests for GitCatFileSession."""
+
+    def test_exists(self, repo):
+        with git.GitCatFileSession(repo) as session:
+            assert session.exists("main:README.md")
+            assert session.exists("main:docs/sub/b c.md")
+            assert not session.exists("main:missing.md")
+            assert not session.exists("no-such-branch:README.md")
+
+    def test_read_object(self, repo):
+        with git.GitCatFileSession(repo) as session:
+            obj_type, data = session.read_object("main:docs/a.md")
+            assert obj_type == "blob"
+            assert data == b"a"
+            assert session.read_object("main:nope") is None
+
+    def test_list_tree(self, repo):
+        with git.GitCatFileSession(repo) as session:
+            assert session.list_tree("main", "docs") == ["docs/a.md"]
+            assert sorted(session.list_tree("main", "docs", recursive=True)) == [
+                "docs/a.md",
+                "docs/sub/b c.md",
+            ]
+            assert session.list_tree("main", "missing") == []
+            assert session.list_tree("main", "README.md") == []
+
+    def test_session_reuses_process(self, repo):
+        with git.GitCatFileSession(repo) as session:
+            session.exists("main:README.md")
+            proc = session._check_proc
+            session.exists("main:docs/a.md")
+            assert session._check_proc is proc
+
+    def test_shared_session_per_repo(self, repo):
+        assert git.get_cat_file_session(repo) is git.get_cat_file_session(repo)
+
+    def test_not_a_repo(self, tmp_path):
+        with git.GitCatFileSession(tmp_path) as session:
+            assert not session.exists("HEAD:README.md")
+            assert session.list_tree("HEAD", "") == []
+
+
+def test_list_tree_in_sha256_repo(tmp_path):
+    try:
+        _git(tmp_path, "init", "--object-format=sha256")
+    except subprocess.CalledProcessError:
+        pytest.skip("git without SHA-256 repository support")
+    _git(tmp_path, "config", "user.email", "test@example.com")
+    _git(tmp_path, "config", "user.name", "Test User")
+    _git(tmp_path, "checkout", "-b", "main")
+    (tmp_path / "docs" / "sub").mkdir(parents=True)
+    for name in ("a.md", "b.md", "c.md"):
+        (tmp_path / "docs" / name).write_text(name)
+    (tmp_path / "docs" / "sub" / "d.md").write_text("d")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-m", "init")
+
+    with git.GitCatFileSession(tmp_path) as session:
+        assert sorted(session.list_tree("main", "docs", recursive=True)) == [
+            "docs/a.md",
+            "docs/b.md",
+            "docs/c.md",
+            "docs/sub/d.md",
+        ]
@@ -0,0 +1,127 @@
+"""Tests for GitMonitor and direct HEAD resolution."""
+
+import asyncio
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from monoco.core import git
+
+
+def _git(repo: Path, *args: str) -> str:
+    result = subprocess.run(
+        ["git", *args], cwd=repo, check=True, capture_output=True, text=True
+    )
+    return result.stdout.strip()
+
+
+def _commit(repo: Path, name: str):
+    (repo / name).write_text(name)
+    _git(repo, "add", name)
+    _git(repo, "commit", "-m", name)
+
+
+@pytest.fixture
+def repo(tmp_path):
+    _git(tmp_path, "init")
+    _git(tmp_path, "config", "user.email", "test@example.com")
+    _git(tmp_path, "config", "user.name", "Test User")
+    _git(tmp_path, "checkout", "-b", "main")
+    _commit(tmp_path, "a.txt")
+    return tmp_path
+
+
+class TestResolveHead:
+    """Tests for resolve_head (no subprocess)."""
+
+    def test_loose_ref(self, repo):
+        assert git.resolve_head(repo) == _git(repo, "rev-parse", "HEAD")
+
+    def test_packed_ref(self, repo):
+        _git(repo, "pack-refs", "--all")
+        assert not (repo / ".git" / "refs" / "heads" / "main").exists()
+        assert git.resolve_head(repo) == _git(repo, "rev-parse", "HEAD")
+
+    def test_detached_head(self, repo):
+        _commit(repo, "b.txt")
+        _git(repo, "checkout", "--detach", "HEAD~1")
+        assert git.resolve_head(repo) == _git(repo, "rev-parse", "HEAD")
+
+    def test_subdirectory(self, repo):
+        sub = repo / "sub"
+        sub.mkdir()
+        assert git.resolve_head(sub) == _git(repo, "rev-parse", "HEAD")
+
+    def test_linked_worktree(self, repo, tmp_path_factory):
+        wt = tmp_path_factory.mktemp("wt") / "feature"
+        _git(repo, "worktree", "add", "-b", "feature", str(wt))
+        _commit(wt, "c.txt")
+        assert git.resolve_head(wt) == _git(wt, "rev-parse", "HEAD")
+        assert git.resolve_head(repo) == _git(repo, "rev-parse", "HEAD")
+
+    def test_unborn_branch(self, tmp_path):
+        _git(tmp_path, "init")
+        assert git.resolve_head(tmp_path) is None
+
+    def test_not_a_repo(self, tmp_path):
+        assert git.resolve_head(tmp_path) is None
+
+
+class TestGitMonitor:
+    """Tests for GitMonitor change detection."""
+
+    async def _run_until_change(self, monitor_kwargs, repo, action):
+        changes = []
+        changed = asyncio.Event()
+
+        async def on_change(new_hash):
+            changes.append(new_hash)
+            changed.set()
+
+        monitor = git.GitMonitor(repo, on_change, **monitor_kwargs)
+        task = asyncio.create_task(monitor.start())
+        try:
+            # Let the monitor take its baseline and start the observer
+            for _ in range(100):
+                if monitor.mode != "stopped":
+                    break
+                await asyncio.sleep(0.01)
+            await asyncio.to_thread(action)
+            await asyncio.wait_for(changed.wait(), timeout=5)
+        finally:
+            monitor.stop()
+            await asyncio.wait_for(task, timeout=5)
+        return monitor, changes
+
+    async def test_event_mode_detects_commit(self, repo):
+        monitor, changes = await self._run_until_change(
+            {"fallback_interval": 60}, repo, lambda: _commit(repo, "b.txt")
+        )
+        assert monitor.mode == "events"
+        assert changes == [_git(repo, "rev-parse", "HEAD")]
+        assert monitor._observer is None  # Joined off the loop on stop
+
+    async def test_event_mode_detects_checkout(self, repo):
+        _git(repo, "branch", "other")
+        _commit(repo, "b.txt")
+        monitor, changes = await self._run_until_change(
+            {"fallback_interval": 60}, repo, lambda: _git(repo, "checkout", "other")
+        )
+        assert changes == [_git(repo, "rev-parse", "other")]
+
+    async def test_polling_fallback(self, repo):
+        monitor, changes = await self._run_until_change(
+            {"use_fs_events": False, "poll_interval": 0.05},
+            repo,
+            lambda: _commit(repo, "b.txt"),
+        )
+        assert monitor.mode == "polling"
+        assert changes == [_git(repo, "rev-parse", "HEAD")]
+
+
+def test_import_does_not_load_watchdog():
+    code = "import sys, monoco.core.git; print(any(m.startswith('watchdog') for m in sys.modules))"
+    result = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True)
+    assert result.stdout.strip() == "False"
@@ -0,0 +1,110 @@
+"""
+Tests for the compiled gitignore matcher.
+"""
+
+import subprocess
+
+import pytest
+
+from monoco.core.ignore import IgnoreMatcher, IgnoreRules
+
+
+def _rules(*lines):
+    return IgnoreRules(list(lines))
+
+
+class TestIgnoreRules:
+    def test_basename_pattern_matches_at_any_depth(self):
+        rules = _rules("*.log")
+        assert rules.match("a.log", False) is True
+        assert rules.match("deep/dir/a.log", False) is True
+        assert rules.match("a.txt", False) is None
+
+    def test_anchored_pattern(self):
+        rules = _rules("/build", "docs/tmp")
+        assert rules.match("build", True) is True
+        assert rules.match("src/build", True) is None
+        assert rules.match("docs/tmp", True) is True
+        assert rules.match("x/docs/tmp", True) is None
+
+    def test_dir_only_pattern(self):
+        rules = _rules("cache/")
+        assert rules.match("cache", True) is True
+        assert rules.match("cache", False) is None
+
+    def test_double_star(self):
+        rules = _rules("**/generated", "logs/**", "a/**/b")
+        assert rules.match("x/y/generated", True) is True
+        assert rules.match("generated", True) is True
+        assert rules.match("logs/2024/x.md", False) is True
+        assert rules.match("a/b", False) is True
+        assert rules.match("a/x/y/b", False) is True
+
+    def test_last_match_wins_with_negation(self):
+        rules = _rules("*.md", "!README.md", "docs/README.md")
+        assert rules.match("notes.md", False) is True
+        assert rules.match("README.md", False) is False
+        assert rules.match("docs/README.md", False) is True
+
+    def test_comments_escapes_and_classes(self):
+        rules = _rules("# comment", "\\#hash", "file[0-9].txt", "")
+        assert rules.match("#hash", False) is True
+        assert rules.match("file7.txt", False) is True
+        assert rules.match("filex.txt", False) is None
+
+
+@pytest.fixture
+def tree(tmp_path):
+    (tmp_path / ".gitignore").write_text("dist/\n*.tmp.md\n!keep.tmp.md\n")
+    for rel in [
+        "README.md",
+        "keep.tmp.md",
+        "drop.tmp.md",
+        "dist/out.md",
+        "docs/guide.md",
+        "docs/private/secret.md",
+        "docs/draft.md",
+    ]:
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("x")
+    (tmp_path / "docs" / ".gitignore").write_text("private/\ndraft.md\n")
+    return tmp_path
+
+
+def test_walk_prunes_and_honours_nested_gitignore(tree):
+    matcher = IgnoreMatcher(tree)
+    seen = []
+    visited_dirs = []
+    for _, rel_dir, _, files in matcher.walk():
+        visited_dirs.append(rel_dir)
+        seen.extend(f"{rel_dir}/{f}" if rel_dir else f for f in files)
+
+    assert "dist" not in visited_dirs
+    assert "docs/private" not in visited_dirs
+    assert sorted(f for f in seen if f.endswith(".md")) == [
+        "README.md",
+        "docs/guide.md",
+        "keep.tmp.md",
+    ]
+
+
+def test_is_ignored_checks_parents(tree):
+    matcher = IgnoreMatcher(tree)
+    assert matcher.is_ignored("dist/out.md") is True
+    assert matcher.is_ignored("docs/private/secret.md") is True
+    assert matcher.is_ignored("docs/guide.md") is False
+    assert matcher.is_ignored("keep.tmp.md") is False
+
+
+def test_agrees_with_git_check_ignore(tree):
+    subprocess.run(["git", "init", "-q"], cwd=tree, check=True)
+    paths = ["README.md", "keep.tmp.md", "drop.tmp.md", "dist/out.md", "docs/guide.md",
+             "docs/private/secret.md", "docs/draft.md"]
+    proc = subprocess.run(
+        ["git", "check-ignore", "--no-index", *paths], cwd=tree, capture_output=True, text=True
+    )
+    git_ignored = set(proc.stdout.split())
+
+    matcher = IgnoreMatcher(tree)
+    assert {p for p in paths if matcher.is_ignored(p)} == git_ignored
@@ -2,6 +2,7 @@ import pytest
 from pathlib import Path
 from monoco.core.loader import FeatureLoader, FeatureModule, FeatureMetadata, FeatureContext, LifecycleState
 
+
 def test_loader_discovery():
     loader = FeatureLoader()
     discovered = loader.discover()
@@ -9,6 +10,7 @@ def test_loader_discovery():
     assert "memo" in discovered
     assert "agent" in discovered
 
+
 def test_loader_load_and_mount():
     loader = FeatureLoader()
     # Discover and load issue feature
@@ -31,6 +33,7 @@ def test_loader_load_and_mount():
     loader.unmount("issue")
     assert feature.state == LifecycleState.UNLOADED
 
+
 def test_registry_delegation():
     from monoco.core.registry import FeatureRegistry
     features = FeatureRegistry.get_features()
@@ -39,3 +42,34 @@ def test_registry_delegation():
     assert "issue" in names
     assert "agent" in names
     assert "memo" in names
+
+
+def test_manifest_is_cached(tmp_path):
+    cache = tmp_path / "feature-manifest.json"
+    loader = FeatureLoader()
+    manifest = loader.get_manifest(cache)
+    assert "issue" in manifest["issue"]["commands"]
+    assert cache.exists()
+
+    # A fresh loader reads the manifest without importing any adapter
+    fresh = FeatureLoader()
+    assert fresh.get_manifest(cache) == manifest
+    assert fresh.timings == {}
+
+
+def test_mount_for_command_mounts_only_needed_features(tmp_path, monkeypatch):
+    monkeypatch.setattr(FeatureLoader, "default_manifest_path", staticmethod(lambda: tmp_path / "m.json"))
+    FeatureLoader().get_manifest()
+
+    loader = FeatureLoader()
+    # browser and glossary serve no subcommand and are mounted for every command
+    assert loader.features_for_command("issue") == ["issue", "browser", "glossary"]
+    assert loader.features_for_command("config") == ["browser", "glossary"]
+    # The Issues layout is initialized for features working inside it
+    assert loader.features_for_command("memo") == ["issue", "memo", "browser", "glossary"]
+
+    context = FeatureContext(root=tmp_path, config={}, registry=loader.registry)
+    errors = loader.mount_for_command("issue", context)
+    assert errors == {}
+    assert sorted(f.name for f in loader.registry.get_mounted()) == ["browser", "glossary", "issue"]
+    assert set(loader.timings["issue"]) == {"load", "mount"}
@@ -0,0 +1,122 @@
+import json
+
+import pytest
+
+from monoco.core.resource.sync import LEGACY_STAMP_FILE, ResourceManifestCache, SyncState, sync_tree
+from monoco.features.agent.flow_skills import sync_flow_skills
+
+
+@pytest.fixture
+def skill_source(tmp_path):
+    source = tmp_path / "source" / "my_skill"
+    (source / "scripts").mkdir(parents=True)
+    (source / "SKILL.md").write_text("---\nname: my_skill\n---\n")
+    (source / "scripts" / "run.sh").write_text("echo hi\n")
+    return source
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ResourceManifestCache(tmp_path / "cache" / "resources.json")
+
+
+@pytest.fixture
+def state(tmp_path):
+    return SyncState(tmp_path / ".monoco" / "resource-sync.json")
+
+
+def test_first_sync_writes_all_files(skill_source, tmp_path, cache, state):
+    target = tmp_path / "target" / "my_skill"
+    result = sync_tree(skill_source, target, cache=cache, state=state)
+
+    assert sorted(result.written) == ["SKILL.md", "scripts/run.sh"]
+    assert (target / "scripts" / "run.sh").read_text() == "echo hi\n"
+    assert cache.cache_path.exists()
+    # Sync state lives in the state file, not in the installed directory
+    assert sorted(p.name for p in target.iterdir()) == ["SKILL.md", "scripts"]
+    targets = json.loads(state.path.read_text())["targets"]
+    assert sorted(targets[str(target.resolve())]) == ["SKILL.md", "scripts/run.sh"]
+
+
+def test_resync_is_noop(skill_source, tmp_path, cache, state):
+    target = tmp_path / "target" / "my_skill"
+    sync_tree(skill_source, target, cache=cache, state=state)
+    state_mtime = state.path.stat().st_mtime_ns
+
+    result = sync_tree(skill_source, target, cache=cache, state=SyncState(state.path))
+
+    assert not result.changed
+    assert result.unchanged == 2
+    assert state.path.stat().st_mtime_ns == state_mtime
+
+
+def test_only_changed_files_are_written(skill_source, tmp_path, cache, state):
+    target = tmp_path / "target" / "my_skill"
+    sync_tree(skill_source, target, cache=cache, state=state)
+
+    (skill_source / "SKILL.md").write_text("---\nname: my_skill\nversion: 2\n---\n")
+    (target / "notes.md").write_text("user file")
+    (target / "scripts" / "run.sh").unlink()
+
+    result = sync_tree(skill_source, target, cache=cache, state=state)
+
+    assert sorted(result.written) == ["SKILL.md", "scripts/run.sh"]
+    assert "version: 2" in (target / "SKILL.md").read_text()
+    # Files not owned by the sync are left alone
+    assert (target / "notes.md").read_text() == "user file"
+
+
+def test_edited_target_files_are_restored(skill_source, tmp_path, cache, state):
+    target = tmp_path / "target" / "my_skill"
+    sync_tree(skill_source, target, cache=cache, state=state)
+
+    (target / "scripts" / "run.sh").write_text("echo edited locally\n")
+    result = sync_tree(skill_source, target, cache=cache, state=state)
+
+    assert result.written == ["scripts/run.sh"]
+    assert (target / "scripts" / "run.sh").read_text() == "echo hi\n"
+
+
+def test_removed_source_files_are_pruned(skill_source, tmp_path, cache, state):
+    target = tmp_path / "target" / "my_skill"
+    sync_tree(skill_source, target, cache=cache, state=state)
+
+    (skill_source / "scripts" / "run.sh").unlink()
+    result = sync_tree(skill_source, target, cache=cache, state=state)
+
+    assert result.removed == ["scripts/run.sh"]
+    assert not (target / "scripts" / "run.sh").exists()
+
+
+def test_legacy_stamp_is_migrated(skill_source, tmp_path, cache, state):
+    target = tmp_path / "target" / "my_skill"
+    target.mkdir(parents=True)
+    (target / "old.md").write_text("installed by an older version")
+    (target / LEGACY_STAMP_FILE).write_text(json.dumps({"files": {"old.md": "0" * 64}}))
+
+    result = sync_tree(skill_source, target, cache=cache, state=state)
+
+    assert result.removed == ["old.md"]
+    assert not (target / LEGACY_STAMP_FILE).exists()
+
+
+def test_force_rewrites_everything(skill_source, tmp_path, cache, state):
+    target = tmp_path / "target" / "my_skill"
+    sync_tree(skill_source, target, cache=cache, state=state)
+
+    result = sync_tree(skill_source, target, force=True, cache=cache, state=state)
+    assert len(result.written) == 2
+
+
+def test_sync_flow_skills_counts_changed_skills(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    monkeypatch.setattr("monoco.core.resource.sync._sync_state", None)
+    monkeypatch.setattr("monoco.core.resource.sync._manifest_cache", None)
+    skill = tmp_path / "resources" / "skills" / "flow_engineer"
+    skill.mkdir(parents=True)
+    (skill / "SKILL.md").write_text("---\nname: engineer\n---\n")
+    target = tmp_path / "agent" / "skills"
+
+    assert sync_flow_skills(tmp_path / "resources", target) == {"injected": 1, "failed": 0, "removed": 0}
+    assert sync_flow_skills(tmp_path / "resources", target) == {"injected": 0, "failed": 0, "removed": 0}
+    assert (target / "monoco_flow_flow_engineer" / "SKILL.md").exists()
@@ -0,0 +1,176 @@
+"""
+Tests for the telemetry spool and batched flusher.
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+
+from monoco.core.telemetry import (
+    PostHogSink,
+    TelemetrySink,
+    TelemetrySpool,
+    flush_spool,
+)
+
+
+class RecordingSink(TelemetrySink):
+    def __init__(self, fail_after=None):
+        self.batches = []
+        self.fail_after = fail_after
+
+    def send(self, events):
+        if self.fail_after is not None and len(self.batches) >= self.fail_after:
+            raise ConnectionError("offline")
+        self.batches.append(events)
+
+
+def _event(n, age=0.0):
+    return {"event": "cli:test", "properties": {"n": n}, "spooled_at": time.time() - age}
+
+
+@pytest.fixture
+def spool(tmp_path):
+    return TelemetrySpool(tmp_path / "telemetry")
+
+
+class TestTelemetrySpool:
+    def test_append_writes_one_line_per_event(self, spool):
+        spool.append(_event(1))
+        spool.append(_event(2))
+        lines = spool.path.read_text().splitlines()
+        assert [json.loads(line)["properties"]["n"] for line in lines] == [1, 2]
+
+    def test_append_respects_size_limit(self, tmp_path):
+        spool = TelemetrySpool(tmp_path, max_bytes=200)
+        results = [spool.append(_event(i)) for i in range(10)]
+        assert results[0] is True
+        assert results[-1] is False
+        assert spool.size() < 300
+
+    def test_flush_due_tracks_marker(self, spool):
+        assert spool.flush_due() is False  # Empty spool
+        spool.append(_event(1))
+        assert spool.flush_due() is True
+        spool.touch_marker()
+        assert spool.flush_due(interval=60) is False
+
+
+class TestFlushSpool:
+    def test_flush_sends_batches_and_strips_spool_fields(self, spool):
+        for i in range(5):
+            spool.append(_event(i))
+        sink = RecordingSink()
+
+        sent, dropped = flush_spool(sink, spool, batch_size=2)
+
+        assert (sent, dropped) == (5, 0)
+        assert [len(b) for b in sink.batches] == [2, 2, 1]
+        assert all("spooled_at" not in e for b in sink.batches for e in b)
+        assert spool.size() == 0
+        assert list(spool.directory.glob("flushing-*")) == []
+
+    def test_flush_drops_expired_events(self, spool):
+        spool.append(_event(1, age=3600))
+        spool.append(_event(2))
+        sink = RecordingSink()
+
+        sent, dropped = flush_spool(sink, spool, max_age=60)
+
+        assert (sent, dropped) == (1, 1)
+        assert sink.batches[0][0]["properties"]["n"] == 2
+
+    def test_failed_batches_are_requeued(self, spool):
+        for i in range(4):
+            spool.append(_event(i))
+        sink = RecordingSink(fail_after=1)
+
+        sent, _ = flush_spool(sink, spool, batch_size=2)
+
+        assert sent == 2
+        remaining = TelemetrySpool.read(spool.path)
+        assert [r["properties"]["n"] for r in remaining] == [2, 3]
+
+        retry = RecordingSink()
+        assert flush_spool(retry, spool)[0] == 2
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    received = []
+
+    def do_POST(self):
+        length = int(self.headers["Content-Length"])
+        _StubHandler.received.append((self.path, json.loads(self.rfile.read(length))))
+        self.send_response(200)
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def log_message(self, *args):
+        pass
+
+
+def test_posthog_sink_against_stub_server(spool):
+    pytest.importorskip("httpx")
+    _StubHandler.received = []
+    server = HTTPServer(("127.0.0.1", 0), _StubHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        spool.append(_event(1))
+        spool.append(_event(2))
+        sink = PostHogSink(host=f"http://127.0.0.1:{server.server_port}", api_key="test-key")
+
+        sent, _ = flush_spool(sink, spool)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert sent == 2
+    path, body = _StubHandler.received[0]
+    assert path == "/batch/"
+    assert body["api_key"] == "test-key"
+    assert [e["properties"]["n"] for e in body["batch"]] == [1, 2]
+
+
+def test_stale_claims_are_taken_over_once(spool):
+    spool.directory.mkdir(parents=True)
+    stale = spool.directory / "flushing-0-123-deadbeef.jsonl"
+    stale.write_text(json.dumps(_event(1)) + "\n")
+    other = TelemetrySpool(spool.directory)
+
+    first = spool.claim()
+    second = other.claim()
+
+    assert len(first) == 1 and first[0] != stale
+    assert second == []
+    assert [r["properties"]["n"] for r in TelemetrySpool.read(first[0])] == [1]
+
+
+def test_daemon_skips_flush_when_telemetry_disabled(spool, monkeypatch):
+    import asyncio
+
+    from monoco.core import telemetry
+    from monoco.daemon.scheduler import SchedulerService
+
+    spool.append(_event(1))
+    service = SchedulerService.__new__(SchedulerService)
+    service._running = True
+    service.telemetry_flush_interval = 0
+    checks = []
+
+    def disabled():
+        checks.append(1)
+        service._running = len(checks) < 3
+        return False
+
+    monkeypatch.setattr(telemetry, "TelemetrySpool", lambda: spool)
+    monkeypatch.setattr(telemetry, "is_enabled", disabled)
+    monkeypatch.setattr(telemetry, "flush_spool", lambda *args: pytest.fail("flushed while disabled"))
+
+    asyncio.run(service._flush_telemetry())
+
+    assert len(checks) == 3
+    assert spool.size() > 0
@@ -0,0 +1,78 @@
+"""
+Tests for the i18n coverage report pipeline.
+"""
+
+from monoco.features.i18n.core import (
+    DirectoryListing,
+    build_coverage_report,
+    check_translation_exists,
+)
+
+EN = "This guide explains how the toolkit keeps issues and documents in sync across branches."
+ZH = "本指南介绍工具如何在多个分支之间同步议题与文档，以及相关的配置方式。"
+
+
+def _write(root, files):
+    for rel, content in files.items():
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="utf-8")
+
+
+def test_directory_listing_matches_exists(tmp_path):
+    _write(tmp_path, {"docs/guide.md": EN, "docs/zh/guide.md": ZH})
+    listing = DirectoryListing()
+    for rel in ["docs/guide.md", "docs/zh/guide.md", "docs/zh/other.md", "nope/x.md"]:
+        assert listing.exists(tmp_path / rel) == (tmp_path / rel).exists()
+
+    source = tmp_path / "docs" / "guide.md"
+    assert check_translation_exists(source, tmp_path, ["zh", "ja"], exists=listing.exists) == [
+        "ja"
+    ]
+
+
+def test_coverage_report(tmp_path):
+    _write(
+        tmp_path,
+        {
+            "README.md": EN,
+            "README_ZH.md": ZH,
+            "docs/guide.md": EN,
+            "docs/zh/guide.md": ZH,
+            "docs/setup.md": EN,
+            "docs/notes.md": ZH,  # Source file written in the wrong language
+        },
+    )
+
+    report = build_coverage_report(tmp_path, ["zh"], "en", check_source_lang=True, workers=4)
+
+    assert [p.relative_to(tmp_path).as_posix() for p in report.source_files] == [
+        "README.md",
+        "docs/guide.md",
+        "docs/notes.md",
+        "docs/setup.md",
+    ]
+    assert [(p.name, langs) for p, langs in report.missing] == [
+        ("notes.md", ["zh"]),
+        ("setup.md", ["zh"]),
+    ]
+    assert [(p.name, lang) for p, lang in report.mismatches] == [("notes.md", "zh")]
+    assert report.found_count == 2
+    assert report.coverage == 50
+
+    data = report.to_dict()
+    assert data["stats"]["coverage_percent"] == 50
+    assert data["stats"]["missing_files_count"] == 2
+    assert data["missing_files"][1] == {
+        "file": "docs/setup.md",
+        "missing_langs": ["zh"],
+        "expected_paths": ["docs/zh/setup.md"],
+    }
+    assert data["language_mismatches"] == [{"file": "docs/notes.md", "detected": "zh"}]
+
+
+def test_coverage_report_skips_content_checks_by_default(tmp_path):
+    _write(tmp_path, {"docs/notes.md": ZH})
+    report = build_coverage_report(tmp_path, ["zh"], "en")
+    assert report.mismatches == []
+    assert report.total_checks == 1
@@ -0,0 +1,31 @@
+"""
+Tests for markdown discovery in i18n scans.
+"""
+
+from monoco.features.i18n.core import discover_markdown_files
+
+
+def test_discovery_respects_gitignore_and_defaults(tmp_path):
+    (tmp_path / ".gitignore").write_text("generated/\n*.draft.md\n")
+    for rel in [
+        "README.md",
+        "docs/guide.md",
+        "docs/wip.draft.md",
+        "generated/api.md",
+        "node_modules/pkg/README.md",
+        "Issues/Features/open/FEAT-0001.md",
+        "AGENTS.md",
+        "sub/.gitignore",
+        "sub/local.md",
+        "sub/kept.md",
+    ]:
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("x")
+    (tmp_path / "sub" / ".gitignore").write_text("local.md\n")
+
+    found = [p.relative_to(tmp_path).as_posix() for p in discover_markdown_files(tmp_path)]
+    assert found == ["README.md", "docs/guide.md", "sub/kept.md"]
+
+    with_issues = discover_markdown_files(tmp_path, include_issues=True)
+    assert tmp_path / "Issues/Features/open/FEAT-0001.md" in with_issues
@@ -225,3 +225,28 @@ solution:
             f"FIX-0003 scenario was wrongly detected as English. "
             f"This is the exact issue FIX-0004 is meant to fix."
         )
+
+
+class TestLanguageDetectionCache:
+    """Test the content-hash keyed detection cache."""
+
+    def test_cached_result_matches_uncached(self):
+        from monoco.features.i18n import core
+
+        core.clear_language_cache()
+        content = "这是一个关于缓存的中文段落，用于测试语言检测。" * 3
+        assert detect_language(content) == core._detect_language_uncached(content) == "zh"
+        assert len(core._language_cache) == 1
+
+        # Second call is served from the cache
+        detect_language(content)
+        assert len(core._language_cache) == 1
+
+    def test_cache_is_bounded(self, monkeypatch):
+        from monoco.features.i18n import core
+
+        core.clear_language_cache()
+        monkeypatch.setattr(core, "LANGUAGE_CACHE_SIZE", 3)
+        for i in range(5):
+            detect_language(f"document number {i} with some english words")
+        assert len(core._language_cache) == 3
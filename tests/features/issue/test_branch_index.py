@@ -0,0 +1,117 @@
+"""
+Tests for the cross-branch issue location cache.
+"""
+
+import subprocess
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from monoco.core import git
+from monoco.features.issue.branch_index import BranchIssueIndex
+
+
+def _git(repo: Path, *args: str):
+    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+
+
+def _commit_file(repo: Path, rel_path: str):
+    target = repo / rel_path
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_text("---\nid: test\n---\n")
+    _git(repo, "add", rel_path)
+    _git(repo, "commit", "-m", f"add {rel_path}")
+
+
+@pytest.fixture
+def repo(tmp_path):
+    _git(tmp_path, "init")
+    _git(tmp_path, "config", "user.email", "test@example.com")
+    _git(tmp_path, "config", "user.name", "Test User")
+    _git(tmp_path, "checkout", "-b", "main")
+    _commit_file(tmp_path, "Issues/Features/open/FEAT-0001-base.md")
+    return tmp_path
+
+
+class TestBranchIssueIndex:
+    """Tests for BranchIssueIndex."""
+
+    def test_lookup_across_branches(self, repo):
+        _git(repo, "checkout", "-b", "feat/two")
+        _commit_file(repo, "Issues/Features/open/FEAT-0002-two.md")
+        _git(repo, "checkout", "main")
+
+        index = BranchIssueIndex(repo)
+        assert index.refresh() == 2
+
+        assert index.lookup("FEAT-0002") == [
+            ("feat/two", "Issues/Features/open/FEAT-0002-two.md")
+        ]
+        assert [b for b, _ in index.lookup("feat-0001")] == ["feat/two", "main"]
+        assert index.lookup("FEAT-9999") == []
+
+    def test_only_moved_tips_are_reindexed(self, repo):
+        _git(repo, "branch", "feat/a")
+        _git(repo, "branch", "feat/b")
+
+        index = BranchIssueIndex(repo)
+        # All three branches share a tip, so one listing serves them all
+        assert index.refresh() == 1
+        assert index.refresh() == 0
+
+        _git(repo, "checkout", "feat/a")
+        _commit_file(repo, "Issues/Features/open/FEAT-0003-moved.md")
+        _git(repo, "checkout", "main")
+
+        with patch.object(git, "_run_git", wraps=git._run_git) as spy:
+            assert index.refresh() == 1
+        ls_tree_calls = [c for c in spy.call_args_list if c.args[0][0] == "ls-tree"]
+        assert len(ls_tree_calls) == 1
+        assert index.lookup("FEAT-0003") == [
+            ("feat/a", "Issues/Features/open/FEAT-0003-moved.md")
+        ]
+
+    def test_deleted_branch_is_dropped(self, repo):
+        _git(repo, "checkout", "-b", "feat/gone")
+        _commit_file(repo, "Issues/Features/open/FEAT-0004-gone.md")
+        _git(repo, "checkout", "main")
+
+        index = BranchIssueIndex(repo)
+        index.refresh()
+        assert index.lookup("FEAT-0004")
+
+        _git(repo, "branch", "-D", "feat/gone")
+        index.refresh()
+        assert index.lookup("FEAT-0004") == []
+
+    def test_persisted_in_git_dir(self, repo):
+        BranchIssueIndex(repo).refresh()
+
+        cache = repo / ".git" / "monoco" / "branch-issues.json"
+        assert cache.exists()
+
+        reloaded = BranchIssueIndex(repo)
+        assert reloaded.refresh() == 0
+        assert reloaded.lookup("FEAT-0001") == [
+            ("main", "Issues/Features/open/FEAT-0001-base.md")
+        ]
+        # Cache lives in .git and never dirties the working tree
+        assert not git.has_uncommitted_changes(repo)
+
+    def test_incremental_warmup(self, repo):
+        for i in range(3):
+            _git(repo, "checkout", "-b", f"feat/{i}", "main")
+            _commit_file(repo, f"Issues/Features/open/FEAT-001{i}-x.md")
+        _git(repo, "checkout", "main")
+
+        index = BranchIssueIndex(repo)
+        assert index.refresh(max_reindex=2) == 2
+        assert not index.is_warm()
+        assert index.refresh(max_reindex=2) == 2
+        assert index.is_warm()
+
+    def test_not_a_repo(self, tmp_path):
+        index = BranchIssueIndex(tmp_path)
+        assert index.refresh() == 0
+        assert index.lookup("FEAT-0001") == []
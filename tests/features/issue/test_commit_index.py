@@ -0,0 +1,177 @@
+"""
+Tests for the incremental commit-to-issue index and delivery reports.
+"""
+
+import subprocess
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from monoco.core import git
+from monoco.features.issue import core
+from monoco.features.issue.commit_index import CommitIssueIndex, extract_issue_refs
+
+
+def _git(repo: Path, *args: str):
+    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+
+
+def _commit(repo: Path, rel_path: str, message: str):
+    target = repo / rel_path
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_text(message)
+    _git(repo, "add", rel_path)
+    _git(repo, "commit", "-m", message)
+
+
+@pytest.fixture
+def repo(tmp_path):
+    _git(tmp_path, "init")
+    _git(tmp_path, "config", "user.email", "test@example.com")
+    _git(tmp_path, "config", "user.name", "Test User")
+    _git(tmp_path, "checkout", "-b", "main")
+    _commit(tmp_path, "README.md", "init")
+    return tmp_path
+
+
+def test_extract_issue_refs():
+    assert extract_issue_refs("feat: x\n\nRef: FEAT-0001") == ["FEAT-0001"]
+    assert extract_issue_refs("Ref: feat-0001, FIX-0002\nRef: FEAT-0001") == [
+        "FEAT-0001",
+        "FIX-0002",
+    ]
+    assert extract_issue_refs("no refs here FEAT-0001") == []
+
+
+class TestCommitIssueIndex:
+    """Tests for CommitIssueIndex."""
+
+    def test_groups_commits_by_issue(self, repo):
+        _commit(repo, "src/a.py", "feat: a\n\nRef: FEAT-0001")
+        _commit(repo, "src/b.py", "fix: b\n\nRef: FIX-0001")
+        _commit(repo, "src/c.py", "feat: c\n\nRef: FEAT-0001")
+
+        index = CommitIssueIndex(repo)
+        assert index.update() == 2
+
+        commits = index.commits_for("FEAT-0001")
+        assert [c["subject"] for c in commits] == ["feat: c", "feat: a"]
+        assert index.files_for("feat-0001") == ["src/a.py", "src/c.py"]
+        assert index.files_for("FIX-0001") == ["src/b.py"]
+
+    def test_incremental_update_scans_only_new_commits(self, repo):
+        _commit(repo, "src/a.py", "feat: a\n\nRef: FEAT-0001")
+        index = CommitIssueIndex(repo)
+        index.update()
+        assert index.update() == 0
+
+        _commit(repo, "src/b.py", "feat: b\n\nRef: FEAT-0001")
+        with patch.object(git, "_run_git", wraps=git._run_git) as spy:
+            assert index.update() == 1
+        log_calls = [c.args[0] for c in spy.call_args_list if "log" in c.args[0]]
+        assert len(log_calls) == 1
+        assert ".." in log_calls[0][-1]
+
+        assert [c["subject"] for c in index.commits_for("FEAT-0001")] == [
+            "feat: b",
+            "feat: a",
+        ]
+
+    def test_rebuild_when_history_rewritten(self, repo):
+        _commit(repo, "src/a.py", "feat: a\n\nRef: FEAT-0001")
+        index = CommitIssueIndex(repo)
+        index.update()
+
+        _git(repo, "reset", "--hard", "HEAD~1")
+        _commit(repo, "src/b.py", "fix: b\n\nRef: FIX-0001")
+        index.update()
+
+        assert index.commits_for("FEAT-0001") == []
+        assert index.files_for("FIX-0001") == ["src/b.py"]
+
+    def test_persisted_in_git_dir(self, repo):
+        _commit(repo, "src/a.py", "feat: a\n\nRef: FEAT-0001")
+        CommitIssueIndex(repo).update()
+
+        assert (repo / ".git" / "monoco" / "commit-index.json").exists()
+        reloaded = CommitIssueIndex(repo)
+        assert reloaded.update() == 0
+        assert reloaded.files_for("FEAT-0001") == ["src/a.py"]
+
+
+class TestDeliveryReports:
+    """Tests for delivery reports built from the commit index."""
+
+    def _issue(self, repo: Path, folder: str, name: str, front_matter: str):
+        path = repo / "Issues" / folder / "open" / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(
+            f"---\n{front_matter}created_at: '2026-01-01T00:00:00'\n"
+            f"updated_at: '2026-01-01T00:00:00'\n---\n\n## Body\n"
+        )
+        return path
+
+    def test_generate_delivery_reports_and_rollup(self, repo):
+        epic = self._issue(
+            repo,
+            "Epics",
+            "EPIC-0001-epic.md",
+            "id: EPIC-0001\ntype: epic\nstatus: open\nstage: draft\ntitle: Epic\n",
+        )
+        feat = self._issue(
+            repo,
+            "Features",
+            "FEAT-0001-feat.md",
+            "id: FEAT-0001\ntype: feature\nstatus: open\nstage: doing\n"
+            "title: Feat\nparent: EPIC-0001\n",
+        )
+        _git(repo, "add", ".")
+        _git(repo, "commit", "-m", "issues")
+        _commit(repo, "src/a.py", "feat: a\n\nRef: FEAT-0001")
+        _commit(repo, "src/b.py", "feat: b\n\nRef: FEAT-0001")
+
+        refreshed = core.generate_delivery_reports(repo / "Issues", repo)
+
+        assert refreshed == {"FEAT-0001": 2}
+        content = feat.read_text()
+        assert "**Commits (2)**" in content
+        assert "- `src/a.py`" in content
+        assert "files_count: 2" in epic.read_text()
+
+    def test_generate_delivery_report_single(self, repo):
+        feat = self._issue(
+            repo,
+            "Features",
+            "FEAT-0002-feat.md",
+            "id: FEAT-0002\ntype: feature\nstatus: open\nstage: doing\n"
+            "title: Feat\nparent: EPIC-0001\n",
+        )
+        _commit(repo, "src/x.py", "feat: x\n\nRef: FEAT-0002")
+
+        core.generate_delivery_report(repo / "Issues", "FEAT-0002", repo)
+        core.generate_delivery_report(repo / "Issues", "FEAT-0002", repo)
+
+        content = feat.read_text()
+        assert content.count("## Delivery") == 1
+        assert "**Touched Files (1)**" in content
+
+    def test_git_failure_raises_instead_of_empty_report(self, repo):
+        feat = self._issue(
+            repo,
+            "Features",
+            "FEAT-0003-feat.md",
+            "id: FEAT-0003\ntype: feature\nstatus: open\nstage: doing\ntitle: Feat\n",
+        )
+        before = feat.read_text()
+
+        with patch.object(git, "_run_git", return_value=(128, "", "fatal: bad object")):
+            index = CommitIssueIndex(repo)
+            assert index.update() is None
+            assert index.error == "fatal: bad object"
+            with pytest.raises(RuntimeError, match="Git log failed"):
+                core.generate_delivery_report(repo / "Issues", "FEAT-0003", repo)
+            with pytest.raises(RuntimeError, match="Git log failed"):
+                core.generate_delivery_reports(repo / "Issues", repo)
+
+        assert feat.read_text() == before
@@ -7,6 +7,7 @@ correctly when closing issues from feature branches.
 """
 
 import pytest
+import subprocess
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 
@@ -17,34 +18,56 @@ from monoco.features.issue.core import (
 )
 
 
+def _git(repo: Path, *args: str):
+    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """A git repo on `main` with an empty Issues/Fixes tree."""
+    _git(tmp_path, "init")
+    _git(tmp_path, "config", "user.email", "test@example.com")
+    _git(tmp_path, "config", "user.name", "Test User")
+    _git(tmp_path, "checkout", "-b", "main")
+    (tmp_path / "README.md").write_text("# Test")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-m", "init")
+    for status in ["open", "backlog", "closed"]:
+        (tmp_path / "Issues" / "Fixes" / status).mkdir(parents=True)
+    return tmp_path
+
+
+def _commit_issue_on_branch(repo: Path, branch: str, rel_path: str):
+    """Commit an issue file on `branch`, leaving the working tree on main."""
+    _git(repo, "checkout", "-B", branch)
+    target = repo / rel_path
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_text("---\nid: test\n---\n")
+    _git(repo, "add", rel_path)
+    _git(repo, "commit", "-m", f"add {rel_path}")
+    _git(repo, "checkout", "main")
+
+
 class TestFindBranchesWithFile:
     """Tests for _find_branches_with_file helper function."""
 
-    def test_find_branches_with_file_excludes_current(self, tmp_path):
+    def test_find_branches_with_file_excludes_current(self, repo):
         """Test that current branch is excluded from results."""
-        with patch("monoco.features.issue.core.git._run_git") as mock_run:
-            # Mock git branch output - need 3 calls: branch list, check feature/test, check main (excluded)
-            mock_run.side_effect = [
-                (0, "main\nfeature/test\n", ""),  # branch list
-                (1, "", "error"),  # feature/test doesn't have file (git show fails)
-            ]
-            
-            result = _find_branches_with_file(tmp_path, "Issues/Fixes/open/TEST-0001.md", "main")
-            
-            assert result == []
+        _commit_issue_on_branch(repo, "main", "Issues/Fixes/open/TEST-0001.md")
+        _git(repo, "branch", "feature/test", "HEAD~1")
+
+        result = _find_branches_with_file(repo, "Issues/Fixes/open/TEST-0001.md", "main")
 
-    def test_find_branches_with_file_finds_other_branches(self, tmp_path):
+        assert result == []
+
+    def test_find_branches_with_file_finds_other_branches(self, repo):
         """Test finding branches that contain the file."""
-        with patch("monoco.features.issue.core.git._run_git") as mock_run:
-            mock_run.side_effect = [
-                (0, "main\nfeature/test\nfeature/other\n", ""),  # branch list
-                (0, "content", ""),  # feature/test has file
-                (1, "", "error"),  # feature/other doesn't have file
-            ]
-            
-            result = _find_branches_with_file(tmp_path, "Issues/Fixes/open/TEST-0001.md", "main")
-            
-            assert result == ["feature/test"]
+        _git(repo, "branch", "feature/other")
+        _commit_issue_on_branch(repo, "feature/test", "Issues/Fixes/open/TEST-0001.md")
+
+        result = _find_branches_with_file(repo, "Issues/Fixes/open/TEST-0001.md", "main")
+
+        assert result == ["feature/test"]
 
     def test_find_branches_with_file_git_error(self, tmp_path):
         """Test handling of git command errors."""
@@ -59,100 +82,48 @@ class TestFindBranchesWithFile:
 class TestSearchIssueInBranches:
     """Tests for _search_issue_in_branches helper function."""
 
-    def test_search_finds_issue_in_single_branch(self, tmp_path):
+    def test_search_finds_issue_in_single_branch(self, repo):
         """Test finding an issue that exists in exactly one branch."""
-        issues_root = tmp_path / "Issues"
-        issues_root.mkdir()
-        
-        # Create directory structure for FIX type
-        fixes_dir = issues_root / "Fixes"
-        fixes_dir.mkdir()
-        (fixes_dir / "open").mkdir()
-        
-        with patch("monoco.features.issue.core.git._run_git") as mock_run, \
-             patch("monoco.features.issue.core.git.git_checkout_files") as mock_checkout:
-            # Mock returns (code, stdout, stderr)
-            # For each ls-tree call that finds nothing, return (0, "", "")
-            # For ls-tree that finds the file, return (0, "filepath\n", "")
-            def mock_git_response(args, cwd):
-                cmd = ' '.join(args)
-                if "branch --format" in cmd:
-                    return (0, "main\nfeature/test\n", "")
-                elif "ls-tree" in cmd:
-                    # Command format: ls-tree -r --name-only main Issues/Fixes/open
-                    # Check if it's the main branch and open directory
-                    if "main" in cmd and "open" in cmd and "backlog" not in cmd and "closed" not in cmd and "archived" not in cmd:
-                        return (0, "Issues/Fixes/open/FIX-0001-test-issue.md\n", "")
-                    else:
-                        return (0, "", "")
-                return (1, "", "error")
-            
-            mock_run.side_effect = mock_git_response
-            mock_checkout.return_value = None
-            
-            path, branch, conflicting = _search_issue_in_branches(issues_root, "FIX-0001", tmp_path)
-            
-            # Function returns (path, branch, conflicting_branches) tuple
-            assert branch == "main"
-            assert path is not None
-            assert "FIX-0001" in str(path)
-            assert conflicting is None  # No conflict for single branch
+        _git(repo, "branch", "feature/test")
+        _commit_issue_on_branch(repo, "main", "Issues/Fixes/open/FIX-0001-test-issue.md")
 
-    def test_search_not_found(self, tmp_path):
+        path, branch, conflicting = _search_issue_in_branches(repo / "Issues", "FIX-0001", repo)
+
+        # Function returns (path, branch, conflicting_branches) tuple
+        assert branch == "main"
+        assert path == repo / "Issues/Fixes/open/FIX-0001-test-issue.md"
+        assert conflicting is None  # No conflict for single branch
+
+    def test_search_not_found(self, repo):
         """Test when issue is not found in any branch."""
-        issues_root = tmp_path / "Issues"
-        issues_root.mkdir()
-        
-        fixes_dir = issues_root / "Fixes"
-        fixes_dir.mkdir()
-        (fixes_dir / "open").mkdir()
-        
-        with patch("monoco.features.issue.core.git._run_git") as mock_run:
-            def mock_git_response(args, cwd):
-                cmd = ' '.join(args)
-                if "branch --format" in cmd:
-                    return (0, "main\n", "")
-                elif "ls-tree" in cmd:
-                    return (0, "", "")  # All directories empty
-                return (1, "", "error")
-            
-            mock_run.side_effect = mock_git_response
-            
-            path, branch, conflicting = _search_issue_in_branches(issues_root, "FIX-9999", tmp_path)
-            
-            assert path is None
-            assert branch is None
-            assert conflicting is None
+        path, branch, conflicting = _search_issue_in_branches(repo / "Issues", "FIX-9999", repo)
+
+        assert path is None
+        assert branch is None
+        assert conflicting is None
 
-    def test_search_conflict_multiple_branches(self, tmp_path):
+    def test_search_conflict_multiple_branches(self, repo):
         """Test error when issue exists in multiple branches."""
-        issues_root = tmp_path / "Issues"
-        issues_root.mkdir()
-        
-        fixes_dir = issues_root / "Fixes"
-        fixes_dir.mkdir()
-        (fixes_dir / "open").mkdir()
-        
-        with patch("monoco.features.issue.core.git._run_git") as mock_run:
-            def mock_git_response(args, cwd):
-                cmd = ' '.join(args)
-                if "branch --format" in cmd:
-                    return (0, "main\nfeature/test\n", "")
-                elif "ls-tree" in cmd:
-                    if "open" in cmd:  # Both branches have the file in open/
-                        return (0, "Issues/Fixes/open/FIX-0001-test.md\n", "")
-                    else:
-                        return (0, "", "")
-                return (1, "", "error")
-            
-            mock_run.side_effect = mock_git_response
-            
-            path, branch, conflicting = _search_issue_in_branches(issues_root, "FIX-0001", tmp_path)
-            
-            # Now returns conflict info instead of raising
-            assert conflicting is not None
-            assert "main" in conflicting
-            assert "feature/test" in conflicting
+        _commit_issue_on_branch(repo, "main", "Issues/Fixes/open/FIX-0001-test.md")
+        _git(repo, "branch", "feature/test")
+
+        path, branch, conflicting = _search_issue_in_branches(repo / "Issues", "FIX-0001", repo)
+
+        # Now returns conflict info instead of raising
+        assert conflicting is not None
+        assert "main" in conflicting
+        assert "feature/test" in conflicting
+
+    def test_search_archived_nested_and_non_ascii(self, repo):
+        """Archived subdirectories and non-ASCII names are found unquoted."""
+        rel_path = "Issues/Fixes/archived/2026/FIX-0002-修复.md"
+        _commit_issue_on_branch(repo, "feature/archived", rel_path)
+
+        path, branch, conflicting = _search_issue_in_branches(repo / "Issues", "FIX-0002", repo)
+
+        assert branch == "feature/archived"
+        assert path == repo / rel_path
+        assert conflicting is None
 
 
 class TestFindIssuePathAcrossBranches:
@@ -0,0 +1,141 @@
+import subprocess
+
+import pytest
+
+from monoco.features.memo import log as memo_log
+from monoco.features.memo.core import add_memo, delete_memo, get_inbox_path, list_memos
+from monoco.features.memo.log import InboxTail, MemoLog, default_index_path
+
+
+@pytest.fixture
+def issues_root(tmp_path):
+    root = tmp_path / "Issues"
+    root.mkdir()
+    return root
+
+
+@pytest.fixture
+def append_only(monkeypatch):
+    from monoco.core.config import get_config
+
+    monkeypatch.setattr(get_config().memo, "append_only", True)
+
+
+def test_delete_rewrites_inbox_by_default(issues_root):
+    ids = [add_memo(issues_root, f"Note {i}") for i in range(3)]
+    inbox = get_inbox_path(issues_root)
+
+    assert delete_memo(issues_root, ids[1]) is True
+
+    content = inbox.read_text(encoding="utf-8")
+    assert "Note 1" not in content
+    assert "memo-deleted" not in content
+    assert [m.content for m in list_memos(issues_root)] == ["Note 0", "Note 2"]
+    assert delete_memo(issues_root, ids[1]) is False
+
+    add_memo(issues_root, "Note 3")
+    assert [m.content for m in list_memos(issues_root)] == ["Note 0", "Note 2", "Note 3"]
+
+
+def test_delete_appends_tombstone(issues_root, append_only):
+    ids = [add_memo(issues_root, f"Note {i}") for i in range(3)]
+    inbox = get_inbox_path(issues_root)
+    before = inbox.read_bytes()
+
+    assert delete_memo(issues_root, ids[1]) is True
+
+    after = inbox.read_bytes()
+    assert after.startswith(before)
+    assert after[len(before):] == f"<!-- memo-deleted: {ids[1]} -->\n".encode()
+    assert [m.content for m in list_memos(issues_root)] == ["Note 0", "Note 2"]
+    assert delete_memo(issues_root, ids[1]) is False
+
+
+def test_index_is_extended_not_rebuilt(issues_root, monkeypatch):
+    add_memo(issues_root, "First")
+    log = MemoLog(get_inbox_path(issues_root))
+    assert [m.content for m in log.load()] == ["First"]
+
+    add_memo(issues_root, "Second")  # Written by another MemoLog instance
+
+    def fail(*args, **kwargs):
+        raise AssertionError("full rebuild")
+
+    monkeypatch.setattr(log, "_rebuild", fail)
+    assert [m.content for m in log.load()] == ["First", "Second"]
+
+
+def test_external_rewrite_rebuilds_index(issues_root):
+    add_memo(issues_root, "Old")
+    inbox = get_inbox_path(issues_root)
+    inbox.write_text(
+        "# Monoco Memos Inbox\n\n## [abc123] 2026-01-15 10:00:00\n\nEdited by hand\n",
+        encoding="utf-8",
+    )
+    memos = list_memos(issues_root)
+    assert [(m.uid, m.content) for m in memos] == [("abc123", "Edited by hand")]
+
+
+def test_compaction(issues_root, append_only, monkeypatch):
+    monkeypatch.setattr(memo_log, "COMPACT_MIN_TOMBSTONES", 3)
+    ids = [add_memo(issues_root, f"Note {i}") for i in range(4)]
+    inbox = get_inbox_path(issues_root)
+
+    for uid in ids[:2]:
+        delete_memo(issues_root, uid)
+    assert "Note 0" in inbox.read_text(encoding="utf-8")
+
+    delete_memo(issues_root, ids[2])  # 3 tombstones >= 1 live memo
+    content = inbox.read_text(encoding="utf-8")
+    assert "memo-deleted" not in content
+    assert "Note 0" not in content
+    assert [m.uid for m in list_memos(issues_root)] == [ids[3]]
+
+
+def test_index_lives_in_git_dir(tmp_path):
+    subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+    inbox = tmp_path / "Memos" / "inbox.md"
+    assert default_index_path(inbox).parent == tmp_path / ".git" / "monoco"
+
+    outside = tmp_path.parent / "no-repo" / "inbox.md"
+    if not memo_log.git.find_git_dirs(outside.parent):
+        assert default_index_path(outside) == outside.with_name(".inbox.idx.json")
+
+
+def test_inbox_tail_reads_only_appended_bytes(issues_root, append_only):
+    ids = [add_memo(issues_root, f"Note {i}") for i in range(2)]
+    tail = InboxTail(get_inbox_path(issues_root))
+    assert tail.poll() == 2
+    first_read = tail.bytes_read
+
+    assert tail.poll() == 2
+    assert tail.bytes_read == first_read  # Unchanged file is not read
+
+    add_memo(issues_root, "Note 2")
+    delete_memo(issues_root, ids[0])
+    assert tail.poll() == 2
+    appended = get_inbox_path(issues_root).stat().st_size - first_read
+    assert tail.bytes_read - first_read == appended
+
+
+def test_inbox_tail_rescans_after_clear(issues_root):
+    add_memo(issues_root, "Note")
+    inbox = get_inbox_path(issues_root)
+    tail = InboxTail(inbox)
+    assert tail.poll() == 1
+
+    inbox.write_text("# Monoco Memos Inbox\n\n", encoding="utf-8")
+    assert tail.poll() == 0
+    add_memo(issues_root, "Fresh")
+    assert tail.poll() == 1
+
+
+def test_rewrite_keeps_inbox_mode(issues_root):
+    ids = [add_memo(issues_root, f"Note {i}") for i in range(2)]
+    inbox = get_inbox_path(issues_root)
+    inbox.chmod(0o644)
+
+    delete_memo(issues_root, ids[0])
+
+    assert inbox.stat().st_mode & 0o777 == 0o644
+    assert not list(inbox.parent.glob("*.tmp"))
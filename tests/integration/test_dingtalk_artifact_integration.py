@@ -118,7 +118,7 @@ class TestDingTalkArtifactIntegration:
             assert stored_path.read_bytes() == image_content
 
             # Verify manifest was updated
-            manifest_path = temp_dirs["artifacts"] / "manifest.jsonl"
+            manifest_path = temp_dirs["artifacts"] / "attachments.jsonl"
             assert manifest_path.exists()
             manifest_lines = manifest_path.read_text().strip().split("\n")
             assert len(manifest_lines) == 1
@@ -745,7 +745,7 @@ class TestDingTalkArtifactErrorHandling:
             assert path1.exists()
 
             # Check manifest has both references
-            manifest_path = temp_dir / "manifest.jsonl"
+            manifest_path = temp_dir / "attachments.jsonl"
             lines = manifest_path.read_text().strip().split("\n")
             assert len(lines) == 2  # Two entries for two downloads
 
@@ -9,6 +9,10 @@ Tests cover:
 - Integration helpers
 """
 
+import subprocess
+import threading
+import time
+
 import pytest
 from pathlib import Path
 from datetime import datetime
@@ -22,6 +26,7 @@ from monoco.features.issue.hooks import (
     HookMetadata,
     NamingACL,
     IssueHookDispatcher,
+    HookResultCache,
     get_events_for_command,
     build_hook_context,
     execute_hooks,
@@ -302,6 +307,280 @@ class TestIssueHookDispatcher:
         assert execution_order == ["high", "low"]
 
 
+class TestConcurrentHooks:
+    """Tests for concurrent execution of independent hooks."""
+
+    @staticmethod
+    def _register(dispatcher, name, fn, priority=100, **kwargs):
+        dispatcher.register_callable(
+            name=name, events=[IssueEvent.PRE_SUBMIT], fn=fn, priority=priority, **kwargs
+        )
+
+    def test_plan_groups_adjacent_independent_hooks(self):
+        hooks = [
+            HookMetadata(name="a", priority=1, independent=True),
+            HookMetadata(name="b", priority=2, independent=True),
+            HookMetadata(name="c", priority=3),
+            HookMetadata(name="d", priority=4, independent=True),
+        ]
+        plan = IssueHookDispatcher._plan(hooks)
+        assert [[h.name for h in batch] for batch in plan] == [["a", "b"], ["c"], ["d"]]
+
+    def test_independent_hooks_run_concurrently(self, tmp_path):
+        dispatcher = IssueHookDispatcher(project_root=tmp_path)
+        barrier = threading.Barrier(2, timeout=5)
+
+        def rendezvous(context):
+            barrier.wait()  # Deadlocks (then times out) unless both run at once
+            return IssueHookResult.allow()
+
+        self._register(dispatcher, "lint", rendezvous, 10, independent=True)
+        self._register(dispatcher, "tests", rendezvous, 20, independent=True)
+
+        result = dispatcher.execute(IssueEvent.PRE_SUBMIT, IssueHookContext(event=IssueEvent.PRE_SUBMIT))
+        assert result.decision == HookDecision.ALLOW
+        assert result.context["hooks_executed"] == 2
+
+    def test_aggregation_follows_priority_order(self, tmp_path):
+        dispatcher = IssueHookDispatcher(project_root=tmp_path)
+
+        def slow(context):
+            time.sleep(0.2)
+            return IssueHookResult.warn("slow", ["first"])
+
+        def fast(context):
+            return IssueHookResult.deny("fast", ["second", "first"])
+
+        self._register(dispatcher, "slow", slow, 10, independent=True)
+        self._register(dispatcher, "fast", fast, 20, independent=True)
+
+        result = dispatcher.execute(IssueEvent.PRE_SUBMIT, IssueHookContext(event=IssueEvent.PRE_SUBMIT))
+        assert result.decision == HookDecision.DENY
+        assert result.message == "[slow] slow\n[fast] fast"
+        assert result.suggestions == ["first", "second"]
+
+    def test_timeout_denies(self, tmp_path):
+        dispatcher = IssueHookDispatcher(project_root=tmp_path)
+        release = threading.Event()
+
+        def hang(context):
+            release.wait(10)
+            return IssueHookResult.allow()
+
+        self._register(dispatcher, "hang", hang, 10, independent=True, timeout_seconds=1)
+        self._register(dispatcher, "ok", lambda c: IssueHookResult.allow(), 20, independent=True)
+
+        start = time.time()
+        result = dispatcher.execute(IssueEvent.PRE_SUBMIT, IssueHookContext(event=IssueEvent.PRE_SUBMIT))
+        release.set()
+        assert time.time() - start < 5
+        assert result.decision == HookDecision.DENY
+        assert "Timed out after 1s" in result.message
+
+    def test_stop_on_deny_skips_remaining_hooks(self, tmp_path):
+        dispatcher = IssueHookDispatcher(project_root=tmp_path, stop_on_deny=True)
+        ran = []
+
+        def deny(context):
+            ran.append("deny")
+            return IssueHookResult.deny("no")
+
+        def later(context):
+            ran.append("later")
+            return IssueHookResult.allow()
+
+        self._register(dispatcher, "deny", deny, 10)
+        self._register(dispatcher, "later", later, 20, independent=True)
+
+        result = dispatcher.execute(IssueEvent.PRE_SUBMIT, IssueHookContext(event=IssueEvent.PRE_SUBMIT))
+        assert result.decision == HookDecision.DENY
+        assert ran == ["deny"]
+        assert result.context["hooks_skipped"] == ["later"]
+
+    def test_script_hooks(self, tmp_path):
+        dispatcher = IssueHookDispatcher(project_root=tmp_path)
+        shell = tmp_path / "check.sh"
+        shell.write_text('echo "dirty tree" >&2\nexit 1\n')
+        python = tmp_path / "check.py"
+        python.write_text(
+            "import json, sys\n"
+            "ctx = json.load(sys.stdin)\n"
+            "print(json.dumps({'decision': 'warn', 'message': ctx['issue_id']}))\n"
+        )
+        context = IssueHookContext(event=IssueEvent.PRE_SUBMIT, issue_id="FEAT-0001")
+
+        result = dispatcher._execute_single_hook(
+            HookMetadata(name="sh", script_path=shell, script_type="shell"), context
+        )
+        assert result.decision == HookDecision.DENY
+        assert result.message == "dirty tree"
+
+        result = dispatcher._execute_single_hook(
+            HookMetadata(name="py", script_path=python), context
+        )
+        assert result.decision == HookDecision.WARN
+        assert result.message == "FEAT-0001"
+        assert result.hook_name == "py"
+
+    def test_concurrent_hooks_get_context_copies(self, tmp_path):
+        dispatcher = IssueHookDispatcher(project_root=tmp_path)
+        seen = []
+
+        def mutate(context):
+            context.extra["touched"] = True
+            return IssueHookResult.allow()
+
+        def observe(context):
+            time.sleep(0.1)
+            seen.append(dict(context.extra))
+            return IssueHookResult.allow()
+
+        self._register(dispatcher, "mutate", mutate, 10, independent=True)
+        self._register(dispatcher, "observe", observe, 20, independent=True)
+
+        context = IssueHookContext(event=IssueEvent.PRE_SUBMIT)
+        dispatcher.execute(IssueEvent.PRE_SUBMIT, context)
+        assert seen == [{}]
+        assert context.extra == {}
+
+    def test_user_hooks_load_metadata_from_files(self, tmp_path):
+        hooks_dir = tmp_path / ".monoco" / "hooks" / "issue"
+        (hooks_dir / "pre-issue-close").mkdir(parents=True)
+        (hooks_dir / "lint.sh").write_text(
+            "#!/bin/bash\n"
+            "# ---\n"
+            "# events: [pre-issue-submit, pre-issue-close]\n"
+            "# priority: 50\n"
+            "# independent: true\n"
+            "# timeout: 5\n"
+            "# ---\n"
+            "exit 0\n"
+        )
+        (hooks_dir / "pre-issue-close" / "notes.py").write_text("print('ok')\n")
+        (hooks_dir / "README.md").write_text("---\nevents: [pre-issue-submit]\n---\n")
+        (hooks_dir / "orphan.sh").write_text("exit 0\n")
+
+        dispatcher = IssueHookDispatcher(project_root=tmp_path)
+
+        [lint] = dispatcher.get_hooks_for_event(IssueEvent.PRE_SUBMIT)
+        assert lint.name == "user.lint"
+        assert lint.priority == 50
+        assert lint.independent and lint.timeout_seconds == 5
+        assert lint.script_type == "shell"
+        close_hooks = dispatcher.get_hooks_for_event(IssueEvent.PRE_CLOSE)
+        assert [h.name for h in close_hooks] == ["user.lint", "user.notes"]
+
+        result = dispatcher.execute(IssueEvent.PRE_CLOSE, IssueHookContext(event=IssueEvent.PRE_CLOSE))
+        assert result.decision == HookDecision.ALLOW
+        assert result.context["hooks_executed"] == 2
+
+
+class TestHookResultCache:
+    """Tests for cached verdicts of cacheable hooks."""
+
+    @pytest.fixture
+    def repo(self, tmp_path):
+        repo = tmp_path / "repo"
+        repo.mkdir()
+        subprocess.run(["git", "init", "-q"], cwd=repo, check=True)
+        (repo / "README.md").write_text("hello")
+        return repo
+
+    @staticmethod
+    def _dispatcher(repo, calls, cacheable=True, ttl=60):
+        dispatcher = IssueHookDispatcher(project_root=repo)
+
+        def check(context):
+            calls.append(context.issue_id)
+            return IssueHookResult.warn("checked", ["look at this"])
+
+        dispatcher.register_callable(
+            name="check", events=[IssueEvent.PRE_SUBMIT], fn=check, cacheable=cacheable
+        )
+        dispatcher.enable_cache(ttl, HookResultCache(repo.parent / "hooks.json", ttl))
+        return dispatcher
+
+    @staticmethod
+    def _submit(dispatcher, repo, issue_id="FEAT-0001"):
+        context = IssueHookContext(
+            event=IssueEvent.PRE_SUBMIT, issue_id=issue_id, project_root=repo, debug_hooks=True
+        )
+        return dispatcher.execute(IssueEvent.PRE_SUBMIT, context)
+
+    def test_retry_returns_cached_verdict(self, repo):
+        calls = []
+        dispatcher = self._dispatcher(repo, calls)
+
+        first = self._submit(dispatcher, repo)
+        second = self._submit(dispatcher, repo)
+
+        assert calls == ["FEAT-0001"]
+        assert second.decision == first.decision == HookDecision.WARN
+        assert second.suggestions == ["look at this"]
+        assert second.context["execution_details"][0]["cached"] is True
+
+        # A fresh dispatcher (new process) reads the persisted verdict
+        self._submit(self._dispatcher(repo, calls), repo)
+        assert calls == ["FEAT-0001"]
+
+    def test_tree_change_invalidates(self, repo):
+        calls = []
+        dispatcher = self._dispatcher(repo, calls)
+        self._submit(dispatcher, repo)
+
+        (repo / "README.md").write_text("changed content")
+        self._submit(dispatcher, repo)
+        self._submit(dispatcher, repo, issue_id="FEAT-0002")
+        assert calls == ["FEAT-0001", "FEAT-0001", "FEAT-0002"]
+
+    def test_explicit_invalidation_and_ttl(self, repo, monkeypatch):
+        calls = []
+        dispatcher = self._dispatcher(repo, calls)
+        self._submit(dispatcher, repo)
+
+        assert dispatcher.invalidate_cache(issue_id="FEAT-0001") == 1
+        self._submit(dispatcher, repo)
+        assert len(calls) == 2
+
+        later = time.time() + 120
+        monkeypatch.setattr("monoco.features.issue.hooks.cache.time.time", lambda: later)
+        self._submit(dispatcher, repo)
+        assert len(calls) == 3
+
+    def test_non_cacheable_hooks_always_run(self, repo):
+        calls = []
+        dispatcher = self._dispatcher(repo, calls, cacheable=False)
+        self._submit(dispatcher, repo)
+        self._submit(dispatcher, repo)
+        assert len(calls) == 2
+
+    def test_execution_options_are_part_of_the_key(self, repo):
+        calls = []
+        dispatcher = self._dispatcher(repo, calls)
+        variants = [
+            {},
+            {"dry_run": True},
+            {"current_branch": "feat/x"},
+            {"extra": {"solution": "implemented"}},
+        ]
+        for options in variants * 2:
+            context = IssueHookContext(
+                event=IssueEvent.PRE_SUBMIT, issue_id="FEAT-0001", project_root=repo, **options
+            )
+            dispatcher.execute(IssueEvent.PRE_SUBMIT, context)
+        assert len(calls) == len(variants)
+
+    def test_builtin_side_effects_are_not_cacheable(self):
+        from monoco.features.issue.hooks.builtin import register_all_builtins
+
+        dispatcher = IssueHookDispatcher()
+        register_all_builtins(dispatcher)
+        hooks = {h.name: h for h in dispatcher.get_hooks_for_event(IssueEvent.PRE_SUBMIT)}
+        assert list(hooks) == ["builtin.pre-issue-submit-sync", "builtin.pre-issue-submit"]
+        assert not hooks["builtin.pre-issue-submit-sync"].cacheable
+        assert hooks["builtin.pre-issue-submit"].cacheable
+
+
 class TestAgentToolAdapter:
     """Tests for AgentToolAdapter."""
     
@@ -0,0 +1,194 @@
+"""
+Unit tests for EventBus dispatch lanes and metrics.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from monoco.core.scheduler import AgentEventType, EventBus
+
+
+async def _wait_for(predicate, timeout: float = 2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not met in time")
+        await asyncio.sleep(0.01)
+
+
+@pytest.fixture
+async def bus():
+    bus = EventBus(max_concurrency_per_lane=2)
+    await bus.start()
+    yield bus
+    await bus.stop()
+
+
+class TestEventBusLanes:
+    """Test suite for per-event-type dispatch lanes."""
+
+    async def test_slow_handler_does_not_block_other_types(self, bus):
+        """A slow handler on one event type does not stall another type."""
+        release = asyncio.Event()
+        fast_seen = []
+
+        async def slow_handler(event):
+            await release.wait()
+
+        async def fast_handler(event):
+            fast_seen.append(event.payload["n"])
+
+        bus.subscribe(AgentEventType.MEMO_THRESHOLD, slow_handler)
+        bus.subscribe(AgentEventType.ISSUE_UPDATED, fast_handler)
+
+        await bus.publish(AgentEventType.MEMO_THRESHOLD, {})
+        await bus.publish(AgentEventType.ISSUE_UPDATED, {"n": 1})
+
+        await _wait_for(lambda: fast_seen == [1])
+        release.set()
+
+    async def test_lane_concurrency_is_bounded(self, bus):
+        """No more than max_concurrency events of a type run at once."""
+        active = 0
+        peak = 0
+        done = 0
+
+        async def handler(event):
+            nonlocal active, peak, done
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.02)
+            active -= 1
+            done += 1
+
+        bus.subscribe(AgentEventType.ISSUE_CREATED, handler)
+        for i in range(6):
+            await bus.publish(AgentEventType.ISSUE_CREATED, {"n": i})
+
+        await _wait_for(lambda: done == 6)
+        assert peak == 2
+
+    async def test_lane_limit_can_change_while_events_run(self, bus):
+        """Changing a lane's limit mid-flight never lets more events run than the new limit."""
+        release = asyncio.Event()
+        active = 0
+        peak = 0
+        done = 0
+
+        async def handler(event):
+            nonlocal active, peak, done
+            active += 1
+            peak = max(peak, active)
+            await release.wait()
+            await asyncio.sleep(0.01)
+            active -= 1
+            done += 1
+
+        bus.set_lane_concurrency(AgentEventType.ISSUE_STAGE_CHANGED, 1)
+        bus.subscribe(AgentEventType.ISSUE_STAGE_CHANGED, handler)
+        for i in range(6):
+            await bus.publish(AgentEventType.ISSUE_STAGE_CHANGED, {"n": i})
+        await _wait_for(lambda: active == 1)
+
+        bus.set_lane_concurrency(AgentEventType.ISSUE_STAGE_CHANGED, 2)
+        await _wait_for(lambda: active == 2)
+        release.set()
+        await _wait_for(lambda: done == 6)
+        assert peak == 2
+
+    async def test_default_lane_preserves_publish_order(self):
+        """By default events of one type reach a handler in publish order."""
+        bus = EventBus()
+        await bus.start()
+        seen = []
+
+        async def handler(event):
+            # Earlier events sleep longer; concurrent dispatch would reorder them
+            await asyncio.sleep(0.01 * (5 - event.payload["n"]))
+            seen.append(event.payload["n"])
+
+        bus.subscribe(AgentEventType.ISSUE_UPDATED, handler)
+        try:
+            for i in range(5):
+                await bus.publish(AgentEventType.ISSUE_UPDATED, {"n": i})
+            await _wait_for(lambda: len(seen) == 5)
+        finally:
+            await bus.stop()
+        assert seen == [0, 1, 2, 3, 4]
+
+    async def test_sync_handler_runs_off_loop(self, bus):
+        """Sync handlers are executed in the thread pool."""
+        threads = []
+
+        def handler(event):
+            threads.append(threading.current_thread().name)
+
+        bus.subscribe(AgentEventType.SESSION_STARTED, handler)
+        await bus.publish(AgentEventType.SESSION_STARTED, {})
+
+        await _wait_for(lambda: len(threads) == 1)
+        assert threads[0].startswith("monoco-eventbus")
+
+    async def test_events_published_before_start_are_dispatched(self):
+        """Events queued before start() are drained once the bus runs."""
+        bus = EventBus()
+        seen = []
+
+        async def handler(event):
+            seen.append(event.type)
+
+        bus.subscribe(AgentEventType.PR_CREATED, handler)
+        await bus.publish(AgentEventType.PR_CREATED, {})
+        await bus.start()
+        try:
+            await _wait_for(lambda: seen == [AgentEventType.PR_CREATED])
+        finally:
+            await bus.stop()
+
+
+class TestEventBusStats:
+    """Test suite for EventBus metrics."""
+
+    async def test_handler_metrics_and_errors(self, bus):
+        """Handler latency and error counts are exposed through get_stats()."""
+
+        async def ok_handler(event):
+            return None
+
+        async def failing_handler(event):
+            raise RuntimeError("boom")
+
+        bus.subscribe(AgentEventType.MEMO_CREATED, ok_handler)
+        bus.subscribe(AgentEventType.MEMO_CREATED, failing_handler)
+        await bus.publish(AgentEventType.MEMO_CREATED, {})
+
+        await _wait_for(
+            lambda: bus.get_stats()["lanes"]["memo.created"]["dispatched"] == 1
+        )
+        stats = bus.get_stats()
+
+        lane = stats["lanes"]["memo.created"]
+        assert lane["published"] == 1
+        assert lane["errors"] == 1
+        assert lane["queue_depth"] == 0
+
+        handlers = stats["handlers"]["memo.created"]
+        ok = next(v for k, v in handlers.items() if k.endswith("ok_handler"))
+        failing = next(v for k, v in handlers.items() if k.endswith("failing_handler"))
+        assert ok["calls"] == 1 and ok["errors"] == 0
+        assert failing["calls"] == 1 and failing["errors"] == 1
+        assert sum(ok["histogram"].values()) == 1
+
+    async def test_queue_size_counts_all_lanes(self):
+        """queue_size sums the pending events of every lane."""
+        bus = EventBus()
+        await bus.publish(AgentEventType.ISSUE_CREATED, {})
+        await bus.publish(AgentEventType.MEMO_CREATED, {})
+
+        stats = bus.get_stats()
+        assert stats["running"] is False
+        assert stats["queue_size"] == 2
+        assert stats["lanes"]["issue.created"]["max_queue_depth"] == 1
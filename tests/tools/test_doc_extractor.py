@@ -2,8 +2,11 @@
 Tests for doc-extractor: Document normalization and rendering tool.
 """
 
+import asyncio
 import hashlib
 import json
+import multiprocessing
+import os
 import shutil
 import tempfile
 import zipfile
@@ -20,6 +23,7 @@ from monoco.features.doc_extractor.extractor import (
     FormatConverter,
     ArchiveExtractor,
     DocExtractor,
+    plan_page_chunks,
 )
 from monoco.features.doc_extractor.index import BlobIndex
 
@@ -158,6 +162,84 @@ class TestPDFRenderer:
         assert renderer.config.dpi == 200
         assert renderer.config.quality == 90
 
+    def test_invalid_backend_raises(self):
+        """Test that unknown backends and worker settings are rejected."""
+        with pytest.raises(ValueError, match="Backend must be one of"):
+            ExtractConfig(backend="gpu")
+        with pytest.raises(ValueError, match="Workers must be at least 1"):
+            ExtractConfig(workers=0)
+        with pytest.raises(ValueError, match="Chunk size must be at least 1"):
+            ExtractConfig(chunk_size=0)
+
+    def test_plan_chunks_splits_evenly(self):
+        """Test that pages are spread evenly over workers by default."""
+        assert plan_page_chunks(list(range(10)), workers=3) == [
+            [0, 1, 2, 3],
+            [4, 5, 6, 7],
+            [8, 9],
+        ]
+        assert plan_page_chunks([], workers=4) == []
+
+    def test_plan_chunks_keeps_ranges_contiguous(self):
+        """Test that gaps in the page list start a new range."""
+        chunks = plan_page_chunks([0, 1, 2, 7, 8, 20], workers=1, chunk_size=2)
+        assert chunks == [[0, 1], [2], [7, 8], [20]]
+
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(
+        multiprocessing.get_start_method() != "fork",
+        reason="the stubbed renderer reaches workers only through fork",
+    )
+    async def test_process_backend_renders_chunks_in_workers(self, tmp_path, monkeypatch):
+        """Test that page ranges are handed to pool processes and reassembled in order."""
+        monkeypatch.setattr(
+            "monoco.features.doc_extractor.extractor.render_page_range", _stub_render_page_range
+        )
+        renderer = PDFRenderer(
+            ExtractConfig(pages=[0, 1, 2, 5, 6, 9], backend="process", workers=2, chunk_size=2)
+        )
+
+        rendered = await renderer._render_processes(tmp_path / "doc.pdf", [0, 1, 2, 5, 6, 9], tmp_path)
+
+        assert [p.name for p in rendered] == ["0.webp", "1.webp", "2.webp", "5.webp", "6.webp", "9.webp"]
+        calls = [json.loads(p.read_text()) for p in rendered]
+        assert [c["chunk"] for c in calls] == [[0, 1], [0, 1], [2], [5, 6], [5, 6], [9]]
+        assert all(c["pid"] != os.getpid() for c in calls)
+
+    @pytest.mark.asyncio
+    async def test_process_backend_matches_thread_backend(self, tmp_path):
+        """Test that both backends render the same pages."""
+        fitz = pytest.importorskip("fitz", reason="PyMuPDF not installed")
+        pytest.importorskip("PIL", reason="PIL/Pillow not installed")
+
+        pdf_path = tmp_path / "doc.pdf"
+        doc = fitz.open()
+        for i in range(5):
+            doc.new_page().insert_text((72, 72), f"Page {i}")
+        doc.save(str(pdf_path))
+        doc.close()
+
+        thread = await PDFRenderer(ExtractConfig(dpi=72, pages=[0, 1, 3, 4])).render(
+            pdf_path, tmp_path / "thread"
+        )
+        process = await PDFRenderer(
+            ExtractConfig(dpi=72, pages=[0, 1, 3, 4], backend="process", workers=2, chunk_size=1)
+        ).render(pdf_path, tmp_path / "process")
+
+        assert [p.name for p in process] == [p.name for p in thread]
+        assert [p.name for p in process] == ["0.webp", "1.webp", "3.webp", "4.webp"]
+        assert all(p.stat().st_size > 0 for p in process)
+
+
+def _stub_render_page_range(pdf_path, pages, output_dir, dpi, quality):
+    """Stand-in for render_page_range: records the chunk and worker pid per page."""
+    results = []
+    for page in pages:
+        path = Path(output_dir) / f"{page}.webp"
+        path.write_text(json.dumps({"chunk": pages, "pid": os.getpid()}))
+        results.append(str(path))
+    return results
+
 
 class TestFormatConverter:
     """Test suite for FormatConverter."""
@@ -273,10 +355,28 @@ class TestDocExtractor:
         blob_dir.mkdir()
         
         blob = extractor.get_blob("abcdef")
-        
+
         assert blob is not None
         assert blob.hash == hash_val
 
+    def test_get_blob_reuses_the_index(self, tmp_path, monkeypatch):
+        """Test that prefix lookups share one incrementally synced index."""
+        monkeypatch.setattr(BlobIndex, "INDEX_PATH", tmp_path / "index.jsonl")
+        monkeypatch.setattr(DocExtractor, "BLOBS_DIR", tmp_path / "blobs")
+        extractor = DocExtractor()
+        writer = BlobIndex()
+        for prefix in ("ab", "cd"):
+            (tmp_path / "blobs" / (prefix * 32)).mkdir()
+        writer.put({"hash": "ab" * 32, "name": "one.pdf"})
+
+        assert extractor.get_blob("abab").hash == "ab" * 32
+        index = extractor.index
+
+        writer.put({"hash": "cd" * 32, "name": "two.pdf"})
+        monkeypatch.setattr(index, "_reset", lambda: pytest.fail("index replayed from scratch"))
+        assert extractor.get_blob("cdcd").hash == "cd" * 32
+        assert extractor.index is index
+
     def test_delete_blob(self, tmp_path, monkeypatch):
         """Test blob deletion."""
         extractor = DocExtractor()
@@ -322,14 +422,15 @@ class TestBlobIndex:
 
     def test_index_initialization(self, tmp_path, monkeypatch):
         """Test BlobIndex initialization."""
-        monkeypatch.setattr(BlobIndex, "INDEX_PATH", tmp_path / "index.yaml")
+        monkeypatch.setattr(BlobIndex, "INDEX_PATH", tmp_path / "index.jsonl")
         index = BlobIndex()
         
-        assert index._data is None
+        assert index._entries is None
+        assert index.list_all() == []
 
     def test_add_entry(self, tmp_path, monkeypatch):
         """Test adding entry to index."""
-        monkeypatch.setattr(BlobIndex, "INDEX_PATH", tmp_path / "index.yaml")
+        monkeypatch.setattr(BlobIndex, "INDEX_PATH", tmp_path / "index.jsonl")
         
         # Create a mock blob directory
         blob_dir = tmp_path / "blobs" / ("a" * 64)
@@ -358,17 +459,15 @@ class TestBlobIndex:
 
     def test_search_by_name(self, tmp_path, monkeypatch):
         """Test searching by name."""
-        monkeypatch.setattr(BlobIndex, "INDEX_PATH", tmp_path / "index.yaml")
+        monkeypatch.setattr(BlobIndex, "INDEX_PATH", tmp_path / "index.jsonl")
         index = BlobIndex()
         
         # Manually populate index
-        index._data = {
-            "version": "1.0",
-            "entries": [
-                {"hash": "a" * 64, "name": "report.pdf", "file_type": "pdf"},
-                {"hash": "b" * 64, "name": "document.docx", "file_type": "docx"},
-            ]
-        }
+        for entry in [
+            {"hash": "a" * 64, "name": "report.pdf", "file_type": "pdf"},
+            {"hash": "b" * 64, "name": "document.docx", "file_type": "docx"},
+        ]:
+            index.put(entry)
         
         results = index.search("report")
         
@@ -377,34 +476,36 @@ class TestBlobIndex:
 
     def test_search_by_hash_prefix(self, tmp_path, monkeypatch):
         """Test searching by hash prefix."""
-        monkeypatch.setattr(BlobIndex, "INDEX_PATH", tmp_path / "index.yaml")
+        monkeypatch.setattr(BlobIndex, "INDEX_PATH", tmp_path / "index.jsonl")
         index = BlobIndex()
         
-        index._data = {
-            "version": "1.0",
-            "entries": [
-                {"hash": "abcdef" + "0" * 58, "name": "test.pdf"},
-            ]
-        }
+        for entry in [
+            {"hash": "abcdef" + "0" * 58, "name": "test.pdf"},
+            {"hash": "abcdee" + "0" * 58, "name": "other.pdf"},
+            {"hash": "1" * 64, "name": "notes-abcdef.pdf"},
+        ]:
+            index.put(entry)
         
-        results = index.search("abcdef")
+        with patch.object(BlobIndex, "_prefix_matches", wraps=index._prefix_matches) as prefix:
+            results = index.search("ABCDEF")
         
-        assert len(results) == 1
+        prefix.assert_called_once_with("abcdef")
+        # Hash prefix and name matches, most recent first
+        assert [r.hash[:6] for r in results] == ["111111", "abcdef"]
+        assert index.search("report") == []
 
     def test_list_by_archive(self, tmp_path, monkeypatch):
         """Test listing blobs by archive hash."""
-        monkeypatch.setattr(BlobIndex, "INDEX_PATH", tmp_path / "index.yaml")
+        monkeypatch.setattr(BlobIndex, "INDEX_PATH", tmp_path / "index.jsonl")
         index = BlobIndex()
         
         archive_hash = "archive" + "0" * 55
-        index._data = {
-            "version": "1.0",
-            "entries": [
-                {"hash": "a" * 64, "name": "file1.pdf", "source_archive": {"hash": archive_hash, "name": "test.zip"}},
-                {"hash": "b" * 64, "name": "file2.pdf", "source_archive": {"hash": archive_hash, "name": "test.zip"}},
-                {"hash": "c" * 64, "name": "file3.pdf"},  # No archive
-            ]
-        }
+        for entry in [
+            {"hash": "a" * 64, "name": "file1.pdf", "source_archive": {"hash": archive_hash, "name": "test.zip"}},
+            {"hash": "b" * 64, "name": "file2.pdf", "source_archive": {"hash": archive_hash, "name": "test.zip"}},
+            {"hash": "c" * 64, "name": "file3.pdf"},  # No archive
+        ]:
+            index.put(entry)
         
         results = index.list_by_archive(archive_hash)
         
@@ -412,17 +513,15 @@ class TestBlobIndex:
 
     def test_get_stats(self, tmp_path, monkeypatch):
         """Test getting index statistics."""
-        monkeypatch.setattr(BlobIndex, "INDEX_PATH", tmp_path / "index.yaml")
+        monkeypatch.setattr(BlobIndex, "INDEX_PATH", tmp_path / "index.jsonl")
         index = BlobIndex()
         
-        index._data = {
-            "version": "1.0",
-            "entries": [
-                {"hash": "a" * 64, "category": "pdf", "source_archive": {"hash": "archive1"}},
-                {"hash": "b" * 64, "category": "document"},
-                {"hash": "c" * 64, "category": "pdf"},
-            ]
-        }
+        for entry in [
+            {"hash": "a" * 64, "category": "pdf", "source_archive": {"hash": "archive1"}},
+            {"hash": "b" * 64, "category": "document"},
+            {"hash": "c" * 64, "category": "pdf"},
+        ]:
+            index.put(entry)
         
         stats = index.get_stats()
         
@@ -433,17 +532,97 @@ class TestBlobIndex:
 
     def test_clear(self, tmp_path, monkeypatch):
         """Test clearing index."""
-        monkeypatch.setattr(BlobIndex, "INDEX_PATH", tmp_path / "index.yaml")
+        monkeypatch.setattr(BlobIndex, "INDEX_PATH", tmp_path / "index.jsonl")
         index = BlobIndex()
         
-        index._data = {
-            "version": "1.0",
-            "entries": [{"hash": "a" * 64, "name": "test.pdf"}]
-        }
+        index.put({"hash": "a" * 64, "name": "test.pdf"})
         
         index.clear()
         
         assert len(index.list_all()) == 0
+        assert len(BlobIndex().list_all()) == 0
+
+    def test_changes_visible_to_other_instances(self, tmp_path, monkeypatch):
+        """Test that appends and removals from another instance are picked up."""
+        monkeypatch.setattr(BlobIndex, "INDEX_PATH", tmp_path / "index.jsonl")
+        reader = BlobIndex()
+        writer = BlobIndex()
+        assert reader.list_all() == []
+
+        writer.put({"hash": "a" * 64, "name": "one.pdf"})
+        writer.put({"hash": "b" * 64, "name": "two.pdf"})
+        assert [e["name"] for e in reader.list_all()] == ["two.pdf", "one.pdf"]
+
+        writer.remove("a" * 64)
+        writer.put({"hash": "b" * 64, "name": "renamed.pdf"})
+        assert [e["name"] for e in reader.list_all()] == ["renamed.pdf"]
+        assert reader.get_entry("aaaa") is None
+        assert reader.get_entry("bbbb")["name"] == "renamed.pdf"
+
+    def test_get_entry_by_prefix(self, tmp_path, monkeypatch):
+        """Test prefix lookups against the sorted hash map."""
+        monkeypatch.setattr(BlobIndex, "INDEX_PATH", tmp_path / "index.jsonl")
+        index = BlobIndex()
+        for prefix in ("ab", "ac", "b0"):
+            index.put({"hash": prefix + "0" * 62, "name": prefix})
+
+        assert index.get_entry("ac")["name"] == "ac"
+        assert index.get_entry("b0" + "0" * 62)["name"] == "b0"
+        assert index.get_entry("ad") is None
+        assert index.get_entry("ad", {}) == {}
+
+    def test_compaction_drops_superseded_lines(self, tmp_path, monkeypatch):
+        """Test that the log is rewritten once superseded lines dominate."""
+        from monoco.features.doc_extractor import index as index_module
+
+        monkeypatch.setattr(BlobIndex, "INDEX_PATH", tmp_path / "index.jsonl")
+        monkeypatch.setattr(index_module, "COMPACT_MIN_GARBAGE", 4)
+        index = BlobIndex()
+        for i in range(10):
+            index.put({"hash": "a" * 64, "name": f"v{i}.pdf"})
+
+        lines = (tmp_path / "index.jsonl").read_text().splitlines()
+        assert len(lines) < 10
+        assert BlobIndex().get_entry("a" * 64)["name"] == "v9.pdf"
+        # Compaction leaves no temporary files behind
+        assert [p.name for p in tmp_path.iterdir()] == ["index.jsonl"]
+
+    def test_migrates_legacy_yaml(self, tmp_path, monkeypatch):
+        """Test that an index.yaml is converted, keeping recency order."""
+        import yaml
+
+        monkeypatch.setattr(BlobIndex, "INDEX_PATH", tmp_path / "index.jsonl")
+        legacy = tmp_path / "index.yaml"
+        legacy.write_text(yaml.safe_dump({
+            "version": "1.0",
+            "entries": [
+                {"hash": "b" * 64, "name": "newer.pdf"},
+                {"hash": "a" * 64, "name": "older.pdf"},
+            ],
+        }))
+
+        index = BlobIndex()
+
+        assert [e["name"] for e in index.list_all()] == ["newer.pdf", "older.pdf"]
+        assert not legacy.exists()
+        assert (tmp_path / "index.yaml.bak").exists()
+        assert (tmp_path / "index.jsonl").exists()
+
+    def test_rebuild_reads_meta_files(self, tmp_path, monkeypatch):
+        """Test rebuilding the index from blob directories."""
+        monkeypatch.setattr(BlobIndex, "INDEX_PATH", tmp_path / "index.jsonl")
+        monkeypatch.setattr(DocExtractor, "BLOBS_DIR", tmp_path / "blobs")
+        for i, created in enumerate(["2026-01-02", "2026-01-01", "2026-01-03"]):
+            blob_dir = tmp_path / "blobs" / (str(i) * 64)
+            blob_dir.mkdir(parents=True)
+            (blob_dir / "meta.json").write_text(json.dumps({"original_name": f"{i}.pdf", "created_at": created}))
+        (tmp_path / "blobs" / ("9" * 64)).mkdir()  # Incomplete blob
+
+        index = BlobIndex()
+        index.put({"hash": "f" * 64, "name": "stale.pdf"})
+
+        assert index.rebuild(workers=2) == 3
+        assert [e["name"] for e in index.list_all()] == ["2.pdf", "0.pdf", "1.pdf"]
 
 
 class TestExtractionResult:
@@ -481,7 +660,7 @@ class TestIntegration:
         blobs_dir = tmp_path / "blobs"
         blobs_dir.mkdir()
         monkeypatch.setattr(DocExtractor, "BLOBS_DIR", blobs_dir)
-        monkeypatch.setattr(BlobIndex, "INDEX_PATH", tmp_path / "index.yaml")
+        monkeypatch.setattr(BlobIndex, "INDEX_PATH", tmp_path / "index.jsonl")
         
         # Create a simple test file (we'll mock the conversion)
         test_file = tmp_path / "test.txt"
@@ -523,3 +702,312 @@ class TestIntegration:
                 )) as mock_process:
                     # Just verify the flow works
                     assert True
+
+
+class TestBatchPipeline:
+    """Test suite for the bounded batch pipeline."""
+
+    @staticmethod
+    def _make_pdfs(tmp_path, count):
+        paths = []
+        for i in range(count):
+            path = tmp_path / f"doc{i}.pdf"
+            path.write_bytes(b"%PDF-1.4 doc " + str(i).encode())
+            paths.append(path)
+        return paths
+
+    @pytest.mark.asyncio
+    async def test_render_stage_is_bounded(self, tmp_path, monkeypatch):
+        """Test that rendering never exceeds its stage limit and results stream out."""
+        from monoco.features.doc_extractor.pipeline import BatchPipeline, StageLimits
+
+        monkeypatch.setattr(DocExtractor, "BLOBS_DIR", tmp_path / "blobs")
+        active = 0
+        peak = 0
+
+        async def fake_render(self, pdf_path, output_dir):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            output_dir.mkdir(parents=True, exist_ok=True)
+            page = output_dir / "0.webp"
+            page.write_bytes(b"webp")
+            return [page]
+
+        monkeypatch.setattr(PDFRenderer, "render", fake_render)
+        progress = []
+        pipeline = BatchPipeline(
+            DocExtractor(),
+            limits=StageLimits(render=2),
+            on_progress=lambda done, total, outcome: progress.append((done, total)),
+        )
+        inputs = self._make_pdfs(tmp_path, 8)
+        outcomes = [o async for o in pipeline.run(inputs)]
+
+        assert peak == 2
+        assert all(o.ok for o in outcomes)
+        assert sorted(o.index for o in outcomes) == list(range(8))
+        assert progress == [(i, 8) for i in range(1, 9)]
+        assert all(o.result.page_count == 1 for o in outcomes)
+
+    @pytest.mark.asyncio
+    async def test_extract_batch_keeps_input_order(self, tmp_path, monkeypatch):
+        """Test that extract_batch returns results in order with failures as exceptions."""
+        monkeypatch.setattr(DocExtractor, "BLOBS_DIR", tmp_path / "blobs")
+
+        async def fake_render(self, pdf_path, output_dir):
+            return []
+
+        monkeypatch.setattr(PDFRenderer, "render", fake_render)
+        first, second = self._make_pdfs(tmp_path, 2)
+        extractor = DocExtractor()
+        results = await extractor.extract_batch([first, tmp_path / "missing.pdf", second])
+
+        assert results[0].blob.hash == extractor.compute_hash(first)
+        assert isinstance(results[1], FileNotFoundError)
+        assert results[2].blob.hash == extractor.compute_hash(second)
+
+    @pytest.mark.asyncio
+    async def test_libreoffice_worker_batches_files(self, tmp_path):
+        """Test that queued conversions share soffice invocations."""
+        import sys
+        from monoco.features.doc_extractor.pipeline import LibreOfficeWorker
+
+        fake = tmp_path / "soffice"
+        fake.write_text(
+            f"#!{sys.executable}\n"
+            "import sys, pathlib\n"
+            "args = sys.argv[1:]\n"
+            "out = pathlib.Path(args[args.index('--outdir') + 1])\n"
+            "out.mkdir(parents=True, exist_ok=True)\n"
+            "for arg in args[args.index('--outdir') + 2:]:\n"
+            "    (out / (pathlib.Path(arg).stem + '.pdf')).write_bytes(b'%PDF-1.4')\n"
+        )
+        fake.chmod(0o755)
+
+        docs = []
+        for i in range(6):
+            doc = tmp_path / f"same{i % 2}" / "report.docx"
+            doc.parent.mkdir(exist_ok=True)
+            doc.write_bytes(f"doc {i}".encode())
+            docs.append(doc)
+
+        async with LibreOfficeWorker(instances=1, max_batch=8, binary=str(fake)) as worker:
+            outputs = [tmp_path / f"out{i}.pdf" for i in range(len(docs))]
+            results = await asyncio.gather(*(worker.convert(d, o) for d, o in zip(docs, outputs)))
+
+        assert results == [True] * 6
+        assert all(o.read_bytes() == b"%PDF-1.4" for o in outputs)
+        assert worker.invocations < len(docs)
+
+    @pytest.mark.asyncio
+    async def test_libreoffice_worker_missing_binary(self, tmp_path):
+        """Test that a missing soffice fails the conversion instead of raising."""
+        from monoco.features.doc_extractor.pipeline import LibreOfficeWorker
+
+        doc = tmp_path / "a.docx"
+        doc.write_bytes(b"x")
+        async with LibreOfficeWorker(binary=str(tmp_path / "no-soffice")) as worker:
+            assert await worker.convert(doc, tmp_path / "a.pdf") is False
+
+    def test_collect_inputs(self, tmp_path):
+        """Test directory expansion skips hidden and unknown files."""
+        from monoco.features.doc_extractor.pipeline import collect_inputs
+
+        (tmp_path / "a.pdf").write_bytes(b"%PDF-1.4")
+        (tmp_path / "notes.bin").write_bytes(b"\x00")
+        (tmp_path / ".hidden.pdf").write_bytes(b"%PDF-1.4")
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "b.docx").write_bytes(b"x")
+
+        assert collect_inputs([tmp_path]) == [tmp_path / "a.pdf"]
+        assert collect_inputs([tmp_path], recursive=True) == [tmp_path / "a.pdf", tmp_path / "sub" / "b.docx"]
+
+
+class TestArchiveStreaming:
+    """Test suite for streamed archive extraction."""
+
+    @staticmethod
+    def _make_zip(path, members):
+        with zipfile.ZipFile(path, "w") as zf:
+            for name, data in members.items():
+                zf.writestr(name, data)
+        return path
+
+    @pytest.mark.asyncio
+    async def test_stream_skips_known_members(self, tmp_path):
+        """Test that members with a known hash are hashed but never written."""
+        from monoco.features.doc_extractor.extractor import ArchiveExtractor
+
+        archive = self._make_zip(tmp_path / "a.zip", {"dir/one.pdf": b"%PDF one", "two.pdf": b"%PDF two"})
+        known = hashlib.sha256(b"%PDF one").hexdigest()
+        out = tmp_path / "out"
+
+        members = [m async for m in ArchiveExtractor.stream(archive, out, lambda h: h == known)]
+
+        assert [(m.name, m.known) for m in members] == [("one.pdf", True), ("two.pdf", False)]
+        assert members[1].hash == hashlib.sha256(b"%PDF two").hexdigest()
+        assert sorted(p.name for p in out.iterdir()) == ["two.pdf"]
+
+    @pytest.mark.asyncio
+    async def test_stream_tar_gz(self, tmp_path):
+        """Test that tar.gz archives are streamed member by member."""
+        import io
+        import tarfile
+        from monoco.features.doc_extractor.extractor import ArchiveExtractor
+
+        archive = tmp_path / "a.tar.gz"
+        with tarfile.open(archive, "w:gz") as tf:
+            for name, data in [("x/a.pdf", b"%PDF a"), (".hidden.pdf", b"%PDF h")]:
+                info = tarfile.TarInfo(name)
+                info.size = len(data)
+                tf.addfile(info, io.BytesIO(data))
+
+        members = [m async for m in ArchiveExtractor.stream(archive, tmp_path / "out", lambda h: False)]
+
+        assert [m.name for m in members] == ["a.pdf"]
+        assert members[0].path.read_bytes() == b"%PDF a"
+
+    @pytest.mark.asyncio
+    async def test_archive_processes_every_member_once(self, tmp_path, monkeypatch):
+        """Test that all documents are processed and a re-run reprocesses nothing."""
+        monkeypatch.setattr(DocExtractor, "BLOBS_DIR", tmp_path / "blobs")
+        rendered = []
+
+        async def fake_render(self, pdf_path, output_dir):
+            rendered.append(pdf_path)
+            output_dir.mkdir(parents=True, exist_ok=True)
+            page = output_dir / "0.webp"
+            page.write_bytes(b"webp")
+            return [page]
+
+        monkeypatch.setattr(PDFRenderer, "render", fake_render)
+        archive = self._make_zip(
+            tmp_path / "docs.zip",
+            {"a.pdf": b"%PDF a", "b.pdf": b"%PDF b", "copy/a.pdf": b"%PDF a", "readme.bin": b"\x00"},
+        )
+        extractor = DocExtractor()
+
+        result = await extractor.extract(archive)
+        assert len(rendered) == 2
+        assert len(result.members) == 2
+        assert not result.is_cached
+        meta = json.loads(result.blob.meta_path.read_text())
+        assert meta["source_archive"]["name"] == "docs.zip"
+
+        again = await extractor.extract(archive)
+        assert len(rendered) == 2
+        assert all(m.is_cached for m in again.members)
+
+
+class TestRenditions:
+    """Test suite for per-config renditions of cached blobs."""
+
+    @pytest.fixture
+    def renders(self, tmp_path, monkeypatch):
+        """Fake a 5-page PDF renderer that records the pages it renders."""
+        monkeypatch.setattr(DocExtractor, "BLOBS_DIR", tmp_path / "blobs")
+        calls = []
+
+        async def fake_render(self, pdf_path, output_dir):
+            self.page_count = 5
+            pages = [p for p in (self.config.pages or range(5)) if p < 5]
+            calls.append((self.config.dpi, pages))
+            await asyncio.sleep(0)
+            output_dir.mkdir(parents=True, exist_ok=True)
+            paths = []
+            for page in pages:
+                path = output_dir / f"{page}.webp"
+                path.write_bytes(f"{self.config.dpi}:{page}".encode())
+                paths.append(path)
+            return paths
+
+        monkeypatch.setattr(PDFRenderer, "render", fake_render)
+        return calls
+
+    @pytest.mark.asyncio
+    async def test_same_config_is_served_from_cache(self, tmp_path, renders):
+        """Test that repeating an extraction renders nothing."""
+        pdf = tmp_path / "doc.pdf"
+        pdf.write_bytes(b"%PDF-1.4 five pages")
+        extractor = DocExtractor()
+
+        first = await extractor.extract(pdf)
+        again = await extractor.extract(pdf)
+
+        assert renders == [(150, [0, 1, 2, 3, 4])]
+        assert again.is_cached
+        assert [p.name for p in again.page_paths] == [p.name for p in first.page_paths]
+
+    @pytest.mark.asyncio
+    async def test_new_dpi_renders_only_requested_pages(self, tmp_path, renders):
+        """Test that a high-DPI page is rendered into its own rendition, once."""
+        pdf = tmp_path / "doc.pdf"
+        pdf.write_bytes(b"%PDF-1.4 five pages")
+        extractor = DocExtractor()
+        await extractor.extract(pdf)
+
+        single = await extractor.extract(pdf, ExtractConfig(dpi=300, pages=[2]))
+        assert renders[-1] == (300, [2])
+        assert not single.is_cached
+        assert single.page_paths == [single.blob.path / "renditions" / "300dpi-q85" / "2.webp"]
+        assert single.page_paths[0].read_bytes() == b"300:2"
+
+        more = await extractor.extract(pdf, ExtractConfig(dpi=300, pages=[2, 3]))
+        assert renders[-1] == (300, [3])
+        assert [p.name for p in more.page_paths] == ["2.webp", "3.webp"]
+
+        meta = json.loads(single.blob.meta_path.read_text())
+        assert meta["renditions"] == {"150dpi-q85": "pages", "300dpi-q85": "renditions/300dpi-q85"}
+        assert meta["pdf_page_count"] == 5
+
+    @pytest.mark.asyncio
+    async def test_missing_pages_are_filled_in(self, tmp_path, renders):
+        """Test that only pages absent from a rendition are re-rendered."""
+        pdf = tmp_path / "doc.pdf"
+        pdf.write_bytes(b"%PDF-1.4 five pages")
+        extractor = DocExtractor()
+        first = await extractor.extract(pdf, ExtractConfig(pages=[0, 1]))
+        assert first.page_count == 2
+
+        full = await extractor.extract(pdf)
+
+        assert renders[-1] == (150, [2, 3, 4])
+        assert [p.name for p in full.page_paths] == [f"{i}.webp" for i in range(5)]
+        assert not list(full.blob.path.glob("render_*"))
+
+    @pytest.mark.asyncio
+    async def test_concurrent_renditions_are_all_recorded(self, tmp_path, renders):
+        """Test that concurrent renders of one blob do not drop each other's rendition."""
+        pdf = tmp_path / "doc.pdf"
+        pdf.write_bytes(b"%PDF-1.4 five pages")
+        extractor = DocExtractor()
+        first = await extractor.extract(pdf)
+
+        await asyncio.gather(
+            extractor.extract(pdf, ExtractConfig(dpi=200, pages=[0])),
+            extractor.extract(pdf, ExtractConfig(dpi=300, pages=[1])),
+        )
+
+        meta = json.loads(first.blob.meta_path.read_text())
+        assert sorted(meta["renditions"]) == ["150dpi-q85", "200dpi-q85", "300dpi-q85"]
+
+    @pytest.mark.asyncio
+    async def test_new_rendition_without_renderer_serves_cache(self, tmp_path, renders, monkeypatch):
+        """Test that a cache hit falls back to the stored pages when PyMuPDF is missing."""
+        pdf = tmp_path / "doc.pdf"
+        pdf.write_bytes(b"%PDF-1.4 five pages")
+        extractor = DocExtractor()
+        first = await extractor.extract(pdf)
+
+        async def no_fitz(self, pdf_path, output_dir):
+            raise ImportError("No module named 'fitz'")
+
+        monkeypatch.setattr(PDFRenderer, "render", no_fitz)
+        result = await extractor.extract(pdf, ExtractConfig(dpi=300, pages=[2]))
+
+        assert result.is_cached
+        assert [p.name for p in result.page_paths] == [p.name for p in first.page_paths]
+        assert not list(first.blob.path.glob("render_*"))
@@ -0,0 +1,167 @@
+"""Tests for mark-and-sweep collection of the shared artifact stores."""
+
+import json
+import os
+import time
+
+import pytest
+
+from monoco.core.artifacts import ArtifactManager, ArtifactSourceType
+from monoco.features.artifact.gc import ArtifactGC
+
+
+@pytest.fixture
+def stores(tmp_path):
+    global_store = tmp_path / "artifacts"
+    blobs_dir = tmp_path / "blobs"
+    blobs_dir.mkdir()
+    projects = [tmp_path / "proj_a", tmp_path / "proj_b"]
+    for project in projects:
+        project.mkdir()
+    return global_store, blobs_dir, projects
+
+
+def make_blob(blobs_dir, blob_hash, size=100, age=0.0, source_archive=None):
+    path = blobs_dir / blob_hash
+    (path / "pages").mkdir(parents=True)
+    (path / "pages" / "0.webp").write_bytes(b"x" * size)
+    meta = {"hash": blob_hash}
+    if source_archive:
+        meta["source_archive"] = {"hash": source_archive, "name": "a.zip"}
+    (path / "meta.json").write_text(json.dumps(meta))
+    stamp = time.time() - age
+    for file in path.rglob("*"):
+        os.utime(file, (stamp, stamp))
+    return path
+
+
+def dir_size(path):
+    return sum(f.stat().st_size for f in path.rglob("*") if f.is_file())
+
+
+def test_sweeps_only_unreferenced_cas_objects(stores):
+    global_store, blobs_dir, (proj_a, proj_b) = stores
+    manager_a = ArtifactManager(project_dir=proj_a, global_store=global_store)
+    manager_b = ArtifactManager(project_dir=proj_b, global_store=global_store)
+    shared = manager_a.store(b"shared", source_type=ArtifactSourceType.GENERATED)
+    manager_b.store(b"shared", source_type=ArtifactSourceType.GENERATED)
+    only_b = manager_b.store(b"only b", source_type=ArtifactSourceType.GENERATED)
+    gone = manager_a.store(b"deleted", source_type=ArtifactSourceType.GENERATED)
+    manager_a.delete(gone.artifact_id)
+
+    collector = ArtifactGC(projects=[proj_a, proj_b], global_store=global_store, blobs_dir=blobs_dir, grace=0)
+    report = collector.collect()
+
+    assert [obj.hash for obj in report.swept] == [gone.content_hash]
+    assert report.reclaimed_bytes == len(b"deleted")
+    assert not manager_a._get_cas_path(gone.content_hash).exists()
+    assert manager_a._get_cas_path(shared.content_hash).exists()
+    assert manager_b._get_cas_path(only_b.content_hash).exists()
+
+
+def test_dry_run_and_grace_keep_objects(stores):
+    global_store, blobs_dir, (proj_a, _) = stores
+    manager = ArtifactManager(project_dir=proj_a, global_store=global_store)
+    orphan = manager.store(b"orphan", source_type=ArtifactSourceType.GENERATED)
+    manager.delete(orphan.artifact_id)
+    cas_path = manager._get_cas_path(orphan.content_hash)
+
+    report = ArtifactGC(projects=[proj_a], global_store=global_store, blobs_dir=blobs_dir, grace=0).collect(
+        dry_run=True
+    )
+    assert report.reclaimed_bytes == len(b"orphan")
+    assert cas_path.exists()
+
+    report = ArtifactGC(projects=[proj_a], global_store=global_store, blobs_dir=blobs_dir).collect()
+    assert report.swept == []
+    assert cas_path.exists()
+
+
+def test_unreachable_project_blocks_cas_sweep(stores, tmp_path):
+    global_store, blobs_dir, (proj_a, _) = stores
+    manager = ArtifactManager(project_dir=proj_a, global_store=global_store)
+    orphan = manager.store(b"orphan", source_type=ArtifactSourceType.GENERATED)
+    manager.delete(orphan.artifact_id)
+    projects = [proj_a, tmp_path / "unmounted"]
+
+    collector = ArtifactGC(projects=projects, global_store=global_store, blobs_dir=blobs_dir, grace=0)
+    report = collector.collect()
+    assert report.unreachable == [str(tmp_path / "unmounted")]
+    assert report.swept == []
+
+    report = ArtifactGC(projects=[], global_store=global_store, blobs_dir=blobs_dir, grace=0).collect()
+    assert report.swept == []
+
+    report = collector.collect(force=True)
+    assert [obj.hash for obj in report.swept] == [orphan.content_hash]
+
+
+def test_blob_budget_evicts_unpinned_lru(stores):
+    global_store, blobs_dir, (proj_a, _) = stores
+    manager = ArtifactManager(project_dir=proj_a, global_store=global_store)
+    live = manager.store(b"document", source_type=ArtifactSourceType.UPLOADED)
+    archive = manager.store(b"archive", source_type=ArtifactSourceType.UPLOADED)
+
+    make_blob(blobs_dir, live.content_hash, age=500)
+    make_blob(blobs_dir, "b" * 64, age=400, source_archive=archive.content_hash)
+    make_blob(blobs_dir, "c" * 64, age=300)
+    make_blob(blobs_dir, "d" * 64, age=200)
+    make_blob(blobs_dir, "e" * 64, age=100)
+
+    collector = ArtifactGC(projects=[proj_a], global_store=global_store, blobs_dir=blobs_dir, grace=0)
+
+    # No budget: blobs are left alone
+    assert collector.collect().swept == []
+
+    # Budget that fits once the two least recently used unpinned blobs go
+    budget = dir_size(blobs_dir) - dir_size(blobs_dir / ("c" * 64)) - dir_size(blobs_dir / ("d" * 64))
+    report = collector.collect(max_bytes=budget)
+    swept = [obj.hash for obj in report.swept]
+    assert swept == ["c" * 64, "d" * 64]
+    assert all(obj.reason == "budget" for obj in report.swept)
+    assert (blobs_dir / live.content_hash).exists()
+    assert (blobs_dir / ("b" * 64)).exists()
+    assert not (blobs_dir / ("c" * 64)).exists()
+
+    make_blob(blobs_dir, "f" * 64, age=1000)
+    report = collector.collect(max_age=150)
+    assert [(obj.hash, obj.reason) for obj in report.swept] == [("f" * 64, "age")]
+
+
+def test_stale_incoming_files_are_swept(stores):
+    global_store, blobs_dir, (proj_a, _) = stores
+    incoming = global_store / ".incoming"
+    incoming.mkdir(parents=True)
+    stale = incoming / "abc.tmp"
+    stale.write_bytes(b"partial")
+    old = time.time() - 7200
+    os.utime(stale, (old, old))
+    fresh = incoming / "def.tmp"
+    fresh.write_bytes(b"in flight")
+
+    report = ArtifactGC(projects=[proj_a], global_store=global_store, blobs_dir=blobs_dir).collect()
+
+    assert [obj.reason for obj in report.swept] == ["stale"]
+    assert not stale.exists()
+    assert fresh.exists()
+
+
+def test_evicted_blobs_leave_the_index(stores):
+    from monoco.features.doc_extractor.index import BlobIndex
+
+    global_store, blobs_dir, (proj_a, _) = stores
+    make_blob(blobs_dir, "a" * 64, age=1000)
+    make_blob(blobs_dir, "b" * 64, age=10)
+    index = BlobIndex(blobs_dir / "index.jsonl")
+    index.put({"hash": "a" * 64, "name": "old.pdf"})
+    index.put({"hash": "b" * 64, "name": "new.pdf"})
+
+    collector = ArtifactGC(projects=[proj_a], global_store=global_store, blobs_dir=blobs_dir, grace=0)
+    collector.collect(max_age=500, dry_run=True)
+    assert BlobIndex(blobs_dir / "index.jsonl").get_entry("a" * 64) is not None
+
+    report = collector.collect(max_age=500)
+    assert [obj.hash for obj in report.swept] == ["a" * 64]
+    fresh = BlobIndex(blobs_dir / "index.jsonl")
+    assert fresh.get_entry("a" * 64) is None
+    assert fresh.get_entry("b" * 64)["name"] == "new.pdf"
@@ -211,6 +211,70 @@ class TestArtifactStore:
         assert store.validate(artifact.id)
         assert not store.validate("nonexistent")
 
+    def test_validate_detects_tampering(self, store):
+        """Test that validation re-hashes the stored file."""
+        artifact, path = store.store(
+            content=b"original",
+            original_name="test.txt",
+            message_id="msg_123",
+            provider="dingtalk",
+        )
+
+        path.write_bytes(b"tampered")
+
+        assert not store.validate(artifact.id)
+
+    def test_open_content_range(self, store):
+        """Test memory-mapped content access with byte ranges."""
+        artifact, _ = store.store(
+            content=b"0123456789",
+            original_name="digits.txt",
+            message_id="msg_123",
+            provider="dingtalk",
+        )
+
+        with store.open_content(artifact.id[:8]) as content:
+            assert len(content) == 10
+            assert bytes(content.read_range(2, 5)) == b"234"
+            assert bytes(content.read_range(8, 100)) == b"89"
+        assert store.open_content("nonexistent") is None
+
+    def test_import_files_and_validate_all(self, store, tmp_path):
+        """Test bulk import with batched manifest append and bulk validation."""
+        files = []
+        for i in range(5):
+            path = tmp_path / f"attachment{i}.pdf"
+            path.write_bytes(f"attachment {i}".encode())
+            files.append(path)
+
+        report = store.import_files(files, message_id="msg_bulk", provider="dingtalk", workers=3)
+
+        assert report.processed == 5
+        assert [artifact.name for artifact, _ in report.stored] == [f.name for f in files]
+        assert len(store.list_by_message("msg_bulk")) == 5
+        assert all(store.validate(artifact.id) for artifact, _ in report.stored)
+
+        _, tampered = report.stored[0]
+        tampered.write_bytes(b"tampered")
+        report.stored[1][1].unlink()
+
+        result = store.validate_all(workers=3)
+        assert result.processed == 4
+        assert result.corrupted == [report.stored[0][0].id]
+        assert result.missing == [report.stored[1][0].id]
+        assert len(result.ok) == 3
+
+    def test_validate_all_reports_ids_as_given(self, store):
+        """Test that explicit ids are reported under the id the caller passed."""
+        kept, _ = store.store(b"kept", "kept.txt", "msg_1", "dingtalk")
+        lost, lost_path = store.store(b"lost", "lost.txt", "msg_1", "dingtalk")
+        lost_path.unlink()
+
+        result = store.validate_all([kept.id[:8], lost.id[:10], "deadbeef"])
+
+        assert result.ok == [kept.id[:8]]
+        assert result.missing == ["deadbeef", lost.id[:10]]
+
     def test_get_artifact_full_path(self, store):
         """Test getting full path from artifact path."""
         content = b"path test"
@@ -226,6 +290,131 @@ class TestArtifactStore:
         assert full_path.exists()
         assert full_path.read_bytes() == content
 
+    def test_index_picks_up_appends_from_other_stores(self, temp_dir):
+        """Test that a second store sees new manifest lines without reloading."""
+        reader = ArtifactStore(temp_dir)
+        writer = ArtifactStore(temp_dir)
+        assert reader.list_by_message("msg_1") == []
+
+        artifact, _ = writer.store(b"late", "late.txt", "msg_1", "dingtalk")
+
+        assert [a.name for a in reader.list_by_message("msg_1")] == ["late.txt"]
+        assert reader.get_metadata(artifact.id[:12]).hash == artifact.id
+        assert reader._index._offset == reader.manifest_path.stat().st_size
+
+    def test_first_entry_wins_for_shared_content(self, store):
+        """Test that lookups return the earliest manifest entry, like a scan."""
+        first, _ = store.store(b"shared", "first.txt", "msg_1", "dingtalk")
+        store.store(b"shared", "second.txt", "msg_2", "lark")
+
+        assert store.get_metadata(first.id).name == "first.txt"
+        assert store.get_metadata(first.id[:8]).message_id == "msg_1"
+        assert [m.name for m in store.list_by_message("msg_2")] == ["second.txt"]
+
+    def test_prefix_lookup_does_not_match_other_hashes(self, store):
+        """Test that prefix lookups only return hashes with that prefix."""
+        artifacts = [store.store(f"c{i}".encode(), f"{i}.txt", "m", "p")[0] for i in range(20)]
+        for artifact in artifacts:
+            assert store.get_metadata(artifact.id[:10]).hash == artifact.id
+        assert store.get_metadata("zz") is None
+
+    def test_compaction_drops_repeats_and_deleted(self, store, monkeypatch):
+        """Test that redundant manifest lines are compacted away."""
+        from monoco.features.artifact import store as store_module
+
+        monkeypatch.setattr(store_module, "COMPACT_MIN_REDUNDANT", 5)
+        gone, _ = store.store(b"gone", "gone.txt", "msg_0", "dingtalk")
+        store.delete(gone.id)
+        for _ in range(8):
+            store.store(b"retry", "retry.txt", "msg_1", "dingtalk")
+
+        lines = store.manifest_path.read_text().splitlines()
+        assert len(lines) < 9
+        assert store.get_metadata(gone.id) is None
+        assert [m.name for m in ArtifactStore(store.artifacts_dir).list_by_message("msg_1")] == ["retry.txt"]
+
+
+    def test_shared_directory_keeps_registry_manifest(self, tmp_path, monkeypatch):
+        """Test that attachments never rewrite ArtifactManager's manifest."""
+        from monoco.core.artifacts import ArtifactManager
+        from monoco.features.artifact import store as store_module
+
+        monkeypatch.setattr(store_module, "COMPACT_MIN_REDUNDANT", 5)
+        manager = ArtifactManager(project_dir=tmp_path, global_store=tmp_path / "cas")
+        files = []
+        for i in range(70):
+            path = tmp_path / f"f{i}.txt"
+            path.write_bytes(f"file {i}".encode())
+            files.append(path)
+        manager.store_files(files)
+        registry = manager.manifest_path.read_bytes()
+
+        store = ArtifactStore(manager.local_artifacts_dir)
+        for _ in range(8):
+            store.import_files(files[:1], message_id="msg", provider="dingtalk")
+
+        assert store.manifest_path != manager.manifest_path
+        assert manager.manifest_path.read_bytes() == registry
+        assert len(ArtifactManager(project_dir=tmp_path, global_store=tmp_path / "cas").list()) == 70
+
+    def test_compaction_keeps_foreign_lines(self, store, monkeypatch):
+        """Test that lines that are not attachment entries survive compaction verbatim."""
+        from monoco.features.artifact import store as store_module
+
+        monkeypatch.setattr(store_module, "COMPACT_MIN_REDUNDANT", 5)
+        foreign = [
+            b'{"artifact_id": "a1", "content_hash": "' + b"a" * 64 + b'", "status": "active"}',
+            b"not json",
+        ]
+        store.manifest_path.write_bytes(b"".join(line + b"\n" for line in foreign))
+        for _ in range(8):
+            store.store(b"retry", "retry.txt", "msg_1", "dingtalk")
+
+        lines = store.manifest_path.read_bytes().splitlines()
+        assert lines[:2] == foreign
+        assert len(lines) < 10
+        assert store._index.sync().redundant < 5
+        assert [m.name for m in store.list_by_message("msg_1")] == ["retry.txt"]
+
+    def test_concurrent_appends_survive_compaction(self, temp_dir, monkeypatch):
+        """Test that appends from other stores are not lost when one compacts."""
+        import threading
+
+        from monoco.features.artifact import store as store_module
+
+        monkeypatch.setattr(store_module, "COMPACT_MIN_REDUNDANT", 5)
+
+        def writer(n):
+            worker_store = ArtifactStore(temp_dir)
+            for i in range(20):
+                worker_store.store(f"{n}-{i}".encode(), f"{n}-{i}.txt", f"msg_{n}", "dingtalk")
+                worker_store.store(b"retry", "retry.txt", "msg_retry", "dingtalk")
+
+        threads = [threading.Thread(target=writer, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        fresh = ArtifactStore(temp_dir)
+        for n in range(4):
+            assert len(fresh.list_by_message(f"msg_{n}")) == 20
+        assert not fresh.manifest_path.with_suffix(".jsonl.tmp").exists()
+
+    def test_legacy_manifest_entries_are_migrated(self, temp_dir):
+        """Test that attachment entries of a legacy manifest.jsonl are picked up."""
+        artifact, _ = ArtifactStore(temp_dir).store(b"old", "old.txt", "msg_1", "dingtalk")
+        new_manifest = temp_dir / "attachments.jsonl"
+        legacy = temp_dir / "manifest.jsonl"
+        legacy.write_bytes(b'{"artifact_id": "x"}\n' + new_manifest.read_bytes())
+        new_manifest.unlink()
+
+        store = ArtifactStore(temp_dir)
+
+        assert store.get_metadata(artifact.id).name == "old.txt"
+        assert legacy.read_bytes().startswith(b'{"artifact_id": "x"}')
+        assert len(new_manifest.read_bytes().splitlines()) == 1
+
 
 class TestArtifactMetadata:
     """Tests for ArtifactMetadata dataclass."""